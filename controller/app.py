@@ -6,6 +6,9 @@ import sys
 # 添加项目根目录到 Python 路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)).replace('/controller', ''))
 from dsvision.extend2_llm.llm_service import LLMService
+from dsvision.logger import get_logger
+
+logger = get_logger('controller.app')
 
 # 初始化LLM服务 (选择提供商)
 LLM_PROVIDER = os.getenv('LLM_PROVIDER', 'openai')
@@ -18,10 +21,10 @@ try:
         api_key=LLM_API_KEY,
         base_url=LLM_BASE_URL
     )
-    print(f"LLM服务已启用 - 提供商: {LLM_PROVIDER}")
+    logger.info(f"LLM服务已启用 - 提供商: {LLM_PROVIDER}")
 except Exception as e:
     llm_service = None
-    print(f"LLM服务未启用: {e}")
+    logger.warning(f"LLM服务未启用: {e}")
 
 
 def _convert_tree_value(value):
@@ -41,9 +44,15 @@ def _convert_tree_value(value):
         return str(value)
 
 
-from flask import Flask,jsonify,request
+from flask import Flask,jsonify,request,Response
 from flask_cors import CORS
 import uuid
+import logging
+import queue
+import threading
+import weakref
+from contextlib import contextmanager
+from itertools import islice
 from datetime import datetime
 import sys
 import os
@@ -56,16 +65,21 @@ root_dir = os.path.dirname(current_dir)  # DSVision/
 sys.path.insert(0, root_dir)
 
 from dsvision.tree.avl_tree import AVLTree
+from dsvision.tree.red_black_tree import RedBlackTree
 import json
 
 from dsvision.linear.sequential_list import SequentialList
 from dsvision.linear.linked_list import LinearLinkedList
+from dsvision.linear.doubly_linked_list import DoublyLinkedList
+from dsvision.linear.circular_linked_list import CircularLinkedList
+from dsvision.linear.capacity import CapacityPolicy
 from dsvision.operation.operation import OperationType
 from dsvision.linear.stack import SequentialStack
 from dsvision.linear.queue import SequentialQueue
 from dsvision.tree.binary_tree import BinaryTree
 from dsvision.tree.binary_search_tree import BinarySearchTree
-from dsvision.tree.huffman import HuffmanTree
+from dsvision.tree.huffman import HuffmanTree, HUFFMAN_BUILD_METHODS
+from dsvision.tree.heap import BinaryHeap, HEAP_KINDS
 
 
 app = Flask(__name__)
@@ -78,6 +92,143 @@ CORS(app)
 structures = {}
 structure_names = {}
 
+
+def _serialize_history(structure):
+    """
+    序列化结构的操作历史
+    delta 快照模式下默认返回增量；请求带 ?materialize=1 时还原为完整快照（兼容旧版前端）
+    """
+    materialize = request.args.get('materialize', '').lower() in ('1', 'true', 'yes')
+    return structure.history_to_dicts(materialize=materialize)
+
+
+def _apply_snapshot_mode(structure, data):
+    """创建结构时按请求体中的 snapshot_mode ('full' | 'delta') 设置快照模式，trace_level 设置默认记录级别"""
+    snapshot_mode = (data or {}).get('snapshot_mode')
+    if snapshot_mode:
+        structure.set_snapshot_mode(snapshot_mode)
+    trace_level = (data or {}).get('trace_level')
+    if trace_level:
+        structure.set_trace_level(trace_level)
+
+
+# 每个结构一把锁：流式操作在工作线程中执行期间，步骤 sink 装在结构上，
+# 其他请求对同一结构的操作必须等它结束，否则它们的步骤会被写进这条流里。
+# 路由从清空操作历史、执行操作到序列化操作历史全程持有这把锁，
+# 否则另一个请求可能在中间清空或追加这段历史（包括正在进行的流式操作的历史和增量编码状态）
+_structure_locks = weakref.WeakKeyDictionary()
+_structure_locks_guard = threading.Lock()
+
+
+def _structure_lock(structure):
+    """获取结构对应的锁（可重入）"""
+    with _structure_locks_guard:
+        lock = _structure_locks.get(structure)
+        if lock is None:
+            lock = _structure_locks[structure] = threading.RLock()
+        return lock
+
+
+def _trace_scope(structure, data=None):
+    """
+    单次操作的记录级别: ?trace=off|summary|full 或请求体 "trace"
+    未指定时沿用结构自身的级别
+    进入时持有结构锁（可重入：路由外层已持有时直接进入），同一结构上的操作依次执行
+    参数在调用时读取（需要请求上下文），锁在进入时获取（流式操作在工作线程中进入）
+    """
+    level = request.args.get('trace') or (data or {}).get('trace')
+    return _locked_trace_scope(structure, level)
+
+
+@contextmanager
+def _locked_trace_scope(structure, level):
+    with _structure_lock(structure):
+        if not level:
+            yield
+            return
+        with structure.trace_scope(level):
+            yield
+
+
+# 流式输出时步骤队列的上限：前端读得慢时工作线程在这里等待，服务端最多缓存这么多步
+STREAM_QUEUE_SIZE = 256
+STREAM_PUT_TIMEOUT = 30
+
+
+def _stream_format():
+    """请求带 ?stream=sse 或 ?stream=ndjson 时返回对应格式，否则返回 None"""
+    fmt = request.args.get('stream', '').lower()
+    if fmt in ('1', 'true', 'sse'):
+        return 'sse'
+    if fmt == 'ndjson':
+        return 'ndjson'
+    return None
+
+
+def _format_event(fmt, event, payload):
+    body = json.dumps(payload, ensure_ascii=False)
+    if fmt == 'ndjson':
+        return f'{{"event": "{event}", "data": {body}}}\n'
+    return f"event: {event}\ndata: {body}\n\n"
+
+
+def _stream_operation(structure, data, operation, final_state):
+    """
+    流式执行一次操作：每记录一个步骤就发送一条 step 事件，结束时发送 done 事件（final_state(结果)）
+    步骤不写入操作历史，服务端不持有整段 operation_history
+    事件格式: SSE (event: step / done / error) 或 NDJSON ({"event": ..., "data": ...} 每行一条)
+    """
+    fmt = _stream_format()
+    events = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+    scope = _trace_scope(structure, data)  # 需要在请求上下文中读取参数
+    state = {'dropped': False}
+
+    def sink(step):
+        if state['dropped']:
+            return
+        try:
+            events.put(('step', step.to_dict()), timeout=STREAM_PUT_TIMEOUT)
+        except queue.Full:
+            # 客户端已断开或长时间不读取：放弃后续步骤，但让操作本身执行完，避免结构停在中间状态
+            state['dropped'] = True
+
+    def put(item):
+        """done / error / 结束标记：客户端已断开时不再等待，避免工作线程永远阻塞在满队列上"""
+        if state['dropped']:
+            try:
+                events.put_nowait(item)
+            except queue.Full:
+                pass
+            return
+        try:
+            events.put(item, timeout=STREAM_PUT_TIMEOUT)
+        except queue.Full:
+            state['dropped'] = True
+
+    def worker():
+        try:
+            with scope, structure.stream_steps(sink):
+                result = operation()
+                payload = final_state(result)
+            put(('done', payload))
+        except Exception as e:
+            put(('error', {'error': str(e)}))
+        finally:
+            put(None)
+
+    threading.Thread(target=worker, daemon=True).start()
+
+    def generate():
+        while True:
+            item = events.get()
+            if item is None:
+                break
+            yield _format_event(fmt, *item)
+
+    mimetype = 'application/x-ndjson' if fmt == 'ndjson' else 'text/event-stream'
+    return Response(generate(), mimetype=mimetype,
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/', methods=['GET'])
 def index():
     """根路径 - 显示 API 信息"""
@@ -111,40 +262,60 @@ def structure_create():
     """
     创建新的数据结构
     请求体“{
-        "type":"sequential" | "linked" |"stack"|队列，树
+        "type":"sequential" | "linked" | "doubly" | "circular" |"stack"|队列，树
         “capacity":100(可选，仅顺序表需要
+        "circular": true(可选，仅队列；循环队列，front/rear 取模回绕)
+        "growth_factor" / "shrink_threshold" / "max_capacity"(可选，顺序表/栈/队列的容量策略)
+        "snapshot_mode": "full" | "delta"(可选，delta 模式只记录快照增量)
+        "trace_level": "off" | "summary" | "full"(可选，默认 full；单次操作也可用 ?trace= 覆盖)
+        "storage": "object" | "arena"(可选，仅 BST/AVL；arena 为紧凑的并行数组存储，适合大树)
     """
     try:
         data = request.json
         structure_type = data.get('type')
         capacity = data.get('capacity',100)
 
+        policy = CapacityPolicy.from_options(data)
+
         structure_id = str(uuid.uuid4())#生成唯一id
 
         if structure_type == 'sequential':
-            structures[structure_id] = SequentialList(capacity = capacity)
+            structures[structure_id] = SequentialList(capacity = capacity, policy=policy)
         elif structure_type == 'linked':
             structures[structure_id] = LinearLinkedList()
+        elif structure_type == 'doubly':
+            structures[structure_id] = DoublyLinkedList()
+        elif structure_type == 'circular':
+            structures[structure_id] = CircularLinkedList()
         elif structure_type == 'stack':
             # 容量为空则视为无限容量
             cap = None if capacity in [None, '', 0] else capacity
-            structures[structure_id] = SequentialStack(capacity=cap)
+            structures[structure_id] = SequentialStack(capacity=cap, policy=policy)
         elif structure_type == 'queue':
             # 队列容量可选，默认 5
             cap = 5 if capacity in [None, '', 0] else capacity
-            structures[structure_id] = SequentialQueue(capacity=cap)
+            structures[structure_id] = SequentialQueue(capacity=cap, circular=bool(data.get('circular')), policy=policy)
         elif structure_type == 'binary':
             structures[structure_id] = BinaryTree()
         elif structure_type == 'bst':
-            structures[structure_id] = BinarySearchTree()
+            structures[structure_id] = BinarySearchTree(storage=data.get('storage') or 'object')
         elif structure_type == 'avl':  # 添加AVL树支持
-            structures[structure_id] = AVLTree()
+            structures[structure_id] = AVLTree(storage=data.get('storage') or 'object')
+        elif structure_type == 'rbt':
+            structures[structure_id] = RedBlackTree()
         elif structure_type == 'huffman':
             structures[structure_id] = HuffmanTree()
+        elif structure_type in ('heap', 'maxheap'):
+            kind = 'max' if structure_type == 'maxheap' else data.get('kind') or 'min'
+            if kind not in HEAP_KINDS:
+                return jsonify({'error': f'未知的堆类型: {kind}'}), 400
+            structures[structure_id] = BinaryHeap(kind)
         ###此处可以扩展更多
         else:
             return jsonify({'error': f'未知的数据结构类型: {structure_type}'}), 400
 
+        _apply_snapshot_mode(structures[structure_id], data)
+
         # 记录默认名称（便于前端展示）；手动创建的名称可在未来扩展
         default_name = f"{structure_type}_{structure_id[:4]}"
         structure_names[structure_id] = default_name
@@ -173,17 +344,21 @@ def get_state(structure_id):
         structure = structures.get(structure_id)
         if not structure:
             return jsonify({'error':'结构不存在，请先创建'}),404
-        #调用类方法
-        return jsonify({
-            'data':structure.to_list(),
-            'size':structure.size(),
-            'is_empty':structure.is_empty(),
-            'operation_history':[step.to_dict() for step in structure.get_operation_history()],
-            'capacity':getattr(structure,'_capacity',None), #没懂getattr
-            'name': structure_names.get(structure_id),
-            'front_index': getattr(structure, 'get_front_index', lambda: None)(),
-            'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
-        })
+        with _structure_lock(structure):
+            #调用类方法
+            return jsonify({
+                'data':structure.to_list(),
+                'size':structure.size(),
+                'is_empty':structure.is_empty(),
+                'operation_history':_serialize_history(structure),
+                'capacity':getattr(structure,'_capacity',None), #没懂getattr
+                'circular': getattr(structure, 'is_circular', lambda: False)(),
+                'capacity_stats': getattr(structure, 'get_capacity_stats', lambda: None)(),
+                'node_ids': getattr(structure, 'get_node_ids', lambda: None)(),  # 链表节点 id，与 data 一一对应
+                'name': structure_names.get(structure_id),
+                'front_index': getattr(structure, 'get_front_index', lambda: None)(),
+                'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
+            })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -195,7 +370,10 @@ def init_batch(structure_id):
     批量初始化数据结构
     请求体: {
         "values": [1, 2, 3, 4, 5]  # 或 "1,2,3,4,5" 或 "1 2 3 4 5"
+        "append": true  # 可选：追加到现有元素之后（extend / 树的 bulk_insert），默认替换
+        "balanced": true  # 可选，仅 BST/AVL：排序去重后直接建成平衡树
     }
+    大批量数据配合 ?trace=summary：只记录一个汇总步骤
     """
     try:
         structure = structures.get(structure_id)
@@ -228,20 +406,46 @@ def init_batch(structure_id):
         else:
             return jsonify({'error': '无效的输入格式'}), 400
 
-        # 调用批量初始化方法
-        success = structure.initlist(values)
+        def state(success):
+            if not hasattr(structure, 'to_list'):
+                return {'success': success, 'size': structure.size(), 'tree_data': structure.get_tree_data()}
+            return {
+                'success': success,
+                'data': structure.to_list(),
+                'size': structure.size(),
+                'front_index': getattr(structure, 'get_front_index', lambda: None)(),
+                'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
+            }
 
-        return jsonify({
-            'success': success,
-            'data': structure.to_list(),
-            'size': structure.size(),
-            'operation_history': [step.to_dict() for step in structure.get_operation_history()],
-            'front_index': getattr(structure, 'get_front_index', lambda: None)(),
-            'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
-        })
+        if not hasattr(structure, 'to_list'):
+            values = [None if v is None else _convert_tree_value(v) for v in values]
+
+        if hasattr(structure, 'initlist'):
+            run = (lambda: structure.extend(values)) if data.get('append') else (lambda: structure.initlist(values))
+        else:
+            # 树结构：替换时先清空；普通二叉树的 None 空位只在层序构建时有意义
+            def run():
+                if not data.get('append'):
+                    structure.clear()
+                if data.get('balanced') and hasattr(structure, 'build_balanced'):
+                    return structure.build_balanced([v for v in values if v is not None])
+                if not data.get('append') and hasattr(structure, 'build_from_list'):
+                    return structure.build_from_list(values)
+                return structure.bulk_insert([v for v in values if v is not None])
+
+        with _structure_lock(structure):
+            # 🔥 ?stream=sse|ndjson：边执行边推送步骤
+            if _stream_format():
+                return _stream_operation(structure, data, run, state)
+
+            # 调用批量初始化方法
+            with _trace_scope(structure, data):
+                success = run()
+
+            return jsonify({**state(success), 'operation_history': _serialize_history(structure)})
 
     except Exception as e:
-        print(f"批量初始化错误: {e}")
+        logger.error(f"批量初始化错误: {e}")
         return jsonify({'error': str(e)}), 500
 
 
@@ -263,7 +467,7 @@ def insert_element(structure_id):
             return jsonify({'error':'结构不存在，请先创建'}),404
 
         data = request.json
-        print(f"收到插入请求: {data}")  # 调试输出
+        logger.debug(f"收到插入请求: {data}")
 
         index = data.get('index')
         value = data.get('value')
@@ -273,28 +477,33 @@ def insert_element(structure_id):
             index = structure.size()  #默认插入到末尾
         else:
             index = int(index)
-        print(f"插入参数 - index: {index}, value: {value}")  #调试输出
+        logger.debug(f"插入参数 - index: {index}, value: {value}")
+
+        with _structure_lock(structure):
+            # 清空历史，准备记录新的操作步骤
+            structure.clear_operation_history()
+
+            def state(success):
+                return {
+                    'success': success,
+                    'data': structure.to_list(),
+                    'size': structure.size(),
+                    'front_index': getattr(structure, 'get_front_index', lambda: None)(),
+                    'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
+                }
 
-        # 清空历史，准备记录新的操作步骤
-        structure.clear_operation_history()
+            if _stream_format():
+                return _stream_operation(structure, data, lambda: structure.insert(index, value), state)
 
-        # 执行插入
-        success = structure.insert(index, value)
+            # 执行插入
+            with _trace_scope(structure, data):
+                success = structure.insert(index, value)
 
-        #返回更新后的状态
-        return jsonify({
-            'success': success,
-            'data': structure.to_list(),
-            'size': structure.size(),
-            'operation_history':[step.to_dict() for step in structure.get_operation_history()],
-            'front_index': getattr(structure, 'get_front_index', lambda: None)(),
-            'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
-        })
+            #返回更新后的状态
+            return jsonify({**state(success), 'operation_history': _serialize_history(structure)})
 
     except Exception as e:
-        print(f"插入元素错误: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"插入元素错误: {e}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/structure/<structure_id>/delete',methods=['POST'])
@@ -315,23 +524,25 @@ def delete_element(structure_id):
         index = data.get('index')
         value = data.get('value')
 
-        # 清空历史
-        structure.clear_operation_history()
-        # 调用 delete 方法，优先尝试带 value 的调用，兼容只接受索引的结构
-        try:
-            deleted_value = structure.delete(index, value)
-        except TypeError:
-            deleted_value = structure.delete(index)
+        with _structure_lock(structure):
+            # 清空历史
+            structure.clear_operation_history()
+            # 调用 delete 方法，优先尝试带 value 的调用，兼容只接受索引的结构
+            with _trace_scope(structure, data):
+                try:
+                    deleted_value = structure.delete(index, value)
+                except TypeError:
+                    deleted_value = structure.delete(index)
 
-        return jsonify({
-            'success': deleted_value is not None,
-            'deleted_value': deleted_value,
-            'data': structure.to_list(),
-            'size': structure.size(),
-            'operation_history':[step.to_dict() for step in structure.get_operation_history()],
-            'front_index': getattr(structure, 'get_front_index', lambda: None)(),
-            'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
-        })
+            return jsonify({
+                'success': deleted_value is not None,
+                'deleted_value': deleted_value,
+                'data': structure.to_list(),
+                'size': structure.size(),
+                'operation_history':_serialize_history(structure),
+                'front_index': getattr(structure, 'get_front_index', lambda: None)(),
+                'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
+            })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -352,18 +563,20 @@ def search_element(structure_id):
         data = request.json
         value = data.get('value')
 
-        #调用search方法
-        result_index = structure.search(value)
+        with _structure_lock(structure):
+            #调用search方法
+            with _trace_scope(structure, data):
+                result_index = structure.search(value)
 
-        return jsonify({
-            'found':result_index != -1,
-            'index':result_index,
-            'data': structure.to_list(),
-            'size': structure.size(),
-            'operation_history':[step.to_dict() for step in structure.get_operation_history()],
-            'front_index': getattr(structure, 'get_front_index', lambda: None)(),
-            'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
-        })
+            return jsonify({
+                'found':result_index != -1,
+                'index':result_index,
+                'data': structure.to_list(),
+                'size': structure.size(),
+                'operation_history':_serialize_history(structure),
+                'front_index': getattr(structure, 'get_front_index', lambda: None)(),
+                'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
+            })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -378,18 +591,20 @@ def get_front(structure_id):
         if not hasattr(structure, 'front'):
             return jsonify({'error':'该结构不支持 front 操作'}),400
 
-        structure.clear_operation_history()
-        value = structure.front()
+        with _structure_lock(structure):
+            structure.clear_operation_history()
+            with _trace_scope(structure):
+                value = structure.front()
 
-        return jsonify({
-            'success': value is not None,
-            'value': value,
-            'data': structure.to_list(),
-            'size': structure.size(),
-            'operation_history':[step.to_dict() for step in structure.get_operation_history()],
-            'front_index': getattr(structure, 'get_front_index', lambda: None)(),
-            'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
-        })
+            return jsonify({
+                'success': value is not None,
+                'value': value,
+                'data': structure.to_list(),
+                'size': structure.size(),
+                'operation_history':_serialize_history(structure),
+                'front_index': getattr(structure, 'get_front_index', lambda: None)(),
+                'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
+            })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -404,18 +619,20 @@ def get_rear(structure_id):
         if not hasattr(structure, 'rear'):
             return jsonify({'error':'该结构不支持 rear 操作'}),400
 
-        structure.clear_operation_history()
-        value = structure.rear()
+        with _structure_lock(structure):
+            structure.clear_operation_history()
+            with _trace_scope(structure):
+                value = structure.rear()
 
-        return jsonify({
-            'success': value is not None,
-            'value': value,
-            'data': structure.to_list(),
-            'size': structure.size(),
-            'operation_history':[step.to_dict() for step in structure.get_operation_history()],
-            'front_index': getattr(structure, 'get_front_index', lambda: None)(),
-            'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
-        })
+            return jsonify({
+                'success': value is not None,
+                'value': value,
+                'data': structure.to_list(),
+                'size': structure.size(),
+                'operation_history':_serialize_history(structure),
+                'front_index': getattr(structure, 'get_front_index', lambda: None)(),
+                'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
+            })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -427,33 +644,33 @@ def clear_structure(structure_id):
         if not structure:
             return jsonify({'error':'结构不存在，请先创建'}),404
 
-        #清空数据和历史
-        structure.clear_operation_history()
-
-        #重新初始化
-        if isinstance(structure,SequentialList):
-            structure._data = [None]*structure._capacity
-            structure._size = 0
-        elif isinstance(structure,LinearLinkedList):
-            structure._head = None
-            structure._size = 0
-        elif isinstance(structure, SequentialQueue):
-            # 复位队列
-            if structure._capacity is not None:
-                structure._data = [None] * structure._capacity
-            else:
-                structure._data = []
-            structure._size = 0
-            structure._front = 0
-            structure._rear = -1
-        return jsonify({
-            'success': True,
-            'data': structure.to_list(),
-            'size': structure.size(),
-            'operation_history':[],
-            'front_index': getattr(structure, 'get_front_index', lambda: None)(),
-            'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
-        })
+        with _structure_lock(structure):
+            #清空数据和历史
+            structure.clear_operation_history()
+
+            #重新初始化
+            if isinstance(structure,SequentialList):
+                structure._data = [None]*structure._capacity
+                structure._size = 0
+            elif isinstance(structure,LinearLinkedList):
+                structure.clear()
+            elif isinstance(structure, SequentialQueue):
+                # 复位队列
+                if structure._capacity is not None:
+                    structure._data = [None] * structure._capacity
+                else:
+                    structure._data = []
+                structure._size = 0
+                structure._front = 0
+                structure._rear = -1
+            return jsonify({
+                'success': True,
+                'data': structure.to_list(),
+                'size': structure.size(),
+                'operation_history':[],
+                'front_index': getattr(structure, 'get_front_index', lambda: None)(),
+                'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
+            })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -478,7 +695,7 @@ def delete_structure(structure_id):
 # ==================== 树结构路由 ====================
 @app.route('/tree/create', methods=['POST', 'OPTIONS'])
 def tree_create():
-    """创建树结构"""
+    """创建树结构；BST/AVL 可传 "storage": "arena" 使用紧凑存储"""
     try:
         data = request.json
         structure_type = data.get('type')
@@ -487,14 +704,18 @@ def tree_create():
         if structure_type == 'binary':
             structures[structure_id] = BinaryTree()
         elif structure_type == 'bst':
-            structures[structure_id] = BinarySearchTree()
+            structures[structure_id] = BinarySearchTree(storage=data.get('storage') or 'object')
         elif structure_type == 'avl':  # 添加AVL树支持
-            structures[structure_id] = AVLTree()
+            structures[structure_id] = AVLTree(storage=data.get('storage') or 'object')
+        elif structure_type == 'rbt':
+            structures[structure_id] = RedBlackTree()
         elif structure_type == 'huffman':
             structures[structure_id] = HuffmanTree()
         else:
             return jsonify({'error': f'未知的树类型: {structure_type}'}), 400
 
+        _apply_snapshot_mode(structures[structure_id], data)
+
         structure_names[structure_id] = f"{structure_type}_{structure_id[:4]}"
 
         return jsonify({
@@ -510,19 +731,29 @@ def tree_create():
 
 @app.route('/tree/<structure_id>/state', methods=['GET'])
 def get_tree_state(structure_id):
-    """获取树状态"""
+    """获取树状态；?fields=root,height 只返回 tree_data 中的指定字段"""
     try:
         structure = structures.get(structure_id)
         if not structure:
             return jsonify({'error': '结构不存在'}), 404
 
-        return jsonify({
-            'tree_data': structure.get_tree_data(),
-            'size': structure.size(),
-            'is_empty': structure.is_empty(),
-            'operation_history': [step.to_dict() for step in structure.get_operation_history()],
-            'name': structure_names.get(structure_id)
-        })
+        with _structure_lock(structure):
+            fields = request.args.get('fields')
+            try:
+                tree_data = structure.get_tree_data(
+                    [f.strip() for f in fields.split(',') if f.strip()] if fields else None
+                )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+
+            return jsonify({
+                'tree_data': tree_data,
+                'size': structure.size(),
+                'is_empty': structure.is_empty(),
+                'operation_history': _serialize_history(structure),
+                'storage': structure.get_storage(),
+                'name': structure_names.get(structure_id)
+            })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -540,85 +771,74 @@ def insert_tree_node(structure_id):
         parent_id = data.get('parent_id')
         direction = data.get('direction')  # left / right
 
-        # 🔥 关键: 清空历史记录
-        structure.clear_operation_history()
+        with _structure_lock(structure):
+            # 🔥 关键: 清空历史记录
+            structure.clear_operation_history()
 
-        value = _convert_tree_value(value)
+            value = _convert_tree_value(value)
 
-        # 仅普通二叉树支持定向插入
-        if isinstance(structure, BinaryTree) and parent_id and direction in ['left', 'right']:
-            try:
-                parent_id = int(parent_id)
-            except (TypeError, ValueError):
-                parent_id = None
+            # 仅普通二叉树支持定向插入
+            if isinstance(structure, BinaryTree) and parent_id and direction in ['left', 'right']:
+                try:
+                    parent_id = int(parent_id)
+                except (TypeError, ValueError):
+                    parent_id = None
 
-        if isinstance(structure, BinaryTree) and parent_id and direction in ['left', 'right']:
-            success = structure.insert(value, parent_id=parent_id, direction=direction)
-        else:
-            success = structure.insert(value)
-
-        # 🔥 打印调试信息
-        tree_data = structure.get_tree_data()
-        operation_history = structure.get_operation_history()
-        print(f"插入节点 {value}, 成功: {success}")
-        print(f"树大小: {tree_data.get('size', 0)}")
-        print(f"操作步骤数: {len(operation_history)}")
-
-        # 🔥 打印每个操作步骤的描述,确保虚线节点步骤被包含
-        print("📋 操作步骤详情:")
-        for i, step in enumerate(operation_history, 1):
-            desc = step.description
-            duration = getattr(step, 'duration', None)
-            print(f"  步骤{i}: {desc} (duration={duration})")
-            if '✏️' in desc:
-                print(f"    ✓✓✓ 虚线节点步骤! ✓✓✓")
-                # 打印虚线节点步骤的tree_snapshot
-                if hasattr(step, 'tree_snapshot') and step.tree_snapshot:
-                    print(f"    虚线节点步骤的tree_snapshot:")
-                    print(f"      root value: {step.tree_snapshot.get('value')}")
-                    print(f"      root node_id: {step.tree_snapshot.get('node_id')}")
-                    print(f"      highlight_indices: {step.highlight_indices}")
-                    # 递归打印所有节点的node_id
-                    def print_all_node_ids(node, level=0):
-                        if node:
-                            indent = "        " + "  " * level
-                            print(f"{indent}节点{node.get('value')}: node_id={node.get('node_id')}")
-                            if node.get('left'):
-                                print_all_node_ids(node['left'], level+1)
-                            if node.get('right'):
-                                print_all_node_ids(node['right'], level+1)
-                    print("    树中所有节点ID:")
-                    print_all_node_ids(step.tree_snapshot)
+            def run_insert():
+                if isinstance(structure, BinaryTree) and parent_id and direction in ['left', 'right']:
+                    return structure.insert(value, parent_id=parent_id, direction=direction)
+                return structure.insert(value)
 
-        return jsonify({
-            'success': success,
-            'tree_data': structure.get_tree_data(),
-            'operation_history': [step.to_dict() for step in structure.get_operation_history()]
-        })
+            if _stream_format():
+                return _stream_operation(structure, data, run_insert,
+                                         lambda success: {'success': success, 'tree_data': structure.get_tree_data()})
+
+            with _trace_scope(structure, data):
+                success = run_insert()
+
+            # 🔥 调试信息：列出每个操作步骤，确认虚线节点步骤被包含
+            if logger.isEnabledFor(logging.DEBUG):
+                operation_history = structure.get_operation_history()
+                logger.debug("插入节点 %s, 成功: %s, 树大小: %s, 操作步骤数: %s",
+                             value, success, structure.size(), len(operation_history))
+                for i, step in enumerate(operation_history, 1):
+                    logger.debug("  步骤%d: %s (duration=%s)%s", i, step.description, step.duration,
+                                 "  ← 虚线节点步骤" if '✏️' in step.description else "")
+
+            return jsonify({
+                'success': success,
+                'tree_data': structure.get_tree_data(),
+                'operation_history': _serialize_history(structure)
+            })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/tree/<structure_id>/delete', methods=['POST'])
 def delete_tree_node(structure_id):
-    """删除树节点"""
+    """删除树节点；普通二叉树可传 node_id 按节点删除（值可能重复）"""
     try:
         structure = structures.get(structure_id)
         if not structure:
             return jsonify({'error': '结构不存在'}), 404
 
         data = request.json
-        value = data.get('value')
+        node_id = data.get('node_id')
 
-        value = _convert_tree_value(value)
-
-        success = structure.delete(value)
+        with _structure_lock(structure):
+            if node_id is not None and isinstance(structure, BinaryTree):
+                with _trace_scope(structure, data):
+                    success = structure.delete_by_id(int(node_id))
+            else:
+                value = _convert_tree_value(data.get('value'))
+                with _trace_scope(structure, data):
+                    success = structure.delete(value)
 
-        return jsonify({
-            'success': success,
-            'tree_data': structure.get_tree_data(),
-            'operation_history': [step.to_dict() for step in structure.get_operation_history()]
-        })
+            return jsonify({
+                'success': success,
+                'tree_data': structure.get_tree_data(),
+                'operation_history': _serialize_history(structure)
+            })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -636,13 +856,94 @@ def search_tree_node(structure_id):
 
         value = _convert_tree_value(value)
 
-        node = structure.search(value)
+        with _structure_lock(structure):
+            with _trace_scope(structure, data):
+                node = structure.search(value)
 
-        return jsonify({
-            'found': node is not None,
-            'tree_data': structure.get_tree_data(),
-            'operation_history': [step.to_dict() for step in structure.get_operation_history()]
-        })
+            return jsonify({
+                'found': node is not None,
+                'tree_data': structure.get_tree_data(),
+                'operation_history': _serialize_history(structure)
+            })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# 顺序统计路由（BST / AVL / 红黑树）
+@app.route('/tree/<structure_id>/select', methods=['POST'])
+def select_tree_value(structure_id):
+    """第 k 小的值，请求体: {"k": 0}（k 从 0 开始）；越界时 result 为 null"""
+    try:
+        structure = structures.get(structure_id)
+        if not structure or not isinstance(structure, BinarySearchTree):
+            return jsonify({'error': '不是二叉搜索树结构'}), 404
+
+        data = request.json
+        try:
+            k = int(data.get('k'))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'k 必须是整数'}), 400
+
+        with _structure_lock(structure):
+            with _trace_scope(structure, data):
+                result = structure.select(k)
+
+            return jsonify({
+                'result': result,
+                'tree_data': structure.get_tree_data(),
+                'operation_history': _serialize_history(structure)
+            })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/tree/<structure_id>/rank', methods=['POST'])
+def rank_tree_value(structure_id):
+    """树中小于 value 的值的个数，请求体: {"value": 40}"""
+    try:
+        structure = structures.get(structure_id)
+        if not structure or not isinstance(structure, BinarySearchTree):
+            return jsonify({'error': '不是二叉搜索树结构'}), 404
+
+        data = request.json
+        value = _convert_tree_value(data.get('value'))
+
+        with _structure_lock(structure):
+            with _trace_scope(structure, data):
+                result = structure.rank(value)
+
+            return jsonify({
+                'result': result,
+                'tree_data': structure.get_tree_data(),
+                'operation_history': _serialize_history(structure)
+            })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/tree/<structure_id>/count_range', methods=['POST'])
+def count_tree_range(structure_id):
+    """闭区间 [lo, hi] 内的值的个数，请求体: {"lo": 10, "hi": 50}"""
+    try:
+        structure = structures.get(structure_id)
+        if not structure or not isinstance(structure, BinarySearchTree):
+            return jsonify({'error': '不是二叉搜索树结构'}), 404
+
+        data = request.json
+        lo = _convert_tree_value(data.get('lo'))
+        hi = _convert_tree_value(data.get('hi'))
+        if lo is None or hi is None:
+            return jsonify({'error': '必须提供lo和hi参数'}), 400
+
+        with _structure_lock(structure):
+            with _trace_scope(structure, data):
+                result = structure.count_range(lo, hi)
+
+            return jsonify({
+                'result': result,
+                'tree_data': structure.get_tree_data(),
+                'operation_history': _serialize_history(structure)
+            })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -655,13 +956,13 @@ def clear_tree(structure_id):
         if not structure:
             return jsonify({'error': '结构不存在'}), 404
 
-        structure.clear()
-
-        return jsonify({
-            'success': True,
-            'tree_data': structure.get_tree_data(),
-            'operation_history': []
-        })
+        with _structure_lock(structure):
+            structure.clear()
+            return jsonify({
+                'success': True,
+                'tree_data': structure.get_tree_data(),
+                'operation_history': []
+            })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -691,6 +992,7 @@ def traverse_tree(structure_id):
         "traversal_type": "preorder" | "inorder" | "postorder" | "levelorder",
         "use_recursion": true | false  (可选，默认 true)
     }
+    带 limit / range 时改为分页返回遍历结果，不生成动画步骤（见 _paginated_traverse）
     """
     try:
         structure = structures.get(structure_id)
@@ -706,29 +1008,102 @@ def traverse_tree(structure_id):
         if traversal_type not in valid_types:
             return jsonify({'error': f'无效的遍历类型: {traversal_type}，可选值: {valid_types}'}), 400
 
-        # 执行遍历（会自动记录OperationStep）
-        result = structure.traverse_with_animation(traversal_type, use_recursion)
+        with _structure_lock(structure):
+            if data.get('limit') is not None or data.get('range') is not None:
+                return _paginated_traverse(structure, structure_id, traversal_type, data)
+
+            if _stream_format():
+                return _stream_operation(
+                    structure, data,
+                    lambda: structure.traverse_with_animation(traversal_type, use_recursion),
+                    lambda result: {
+                        'success': True,
+                        'traversal_result': result,
+                        'traversal_method': 'recursive' if use_recursion else 'iterative',
+                        'tree_data': structure.get_tree_data(),
+                        'name': structure_names.get(structure_id)
+                    })
+
+            # 执行遍历（会自动记录OperationStep）
+            with _trace_scope(structure, data):
+                result = structure.traverse_with_animation(traversal_type, use_recursion)
 
-        return jsonify({
-            'success': True,
-            'traversal_result': result,
-            'traversal_method': 'recursive' if use_recursion else 'iterative',
-            'tree_data': structure.get_tree_data(),
-            'operation_history': [step.to_dict() for step in structure.get_operation_history()],
-            'name': structure_names.get(structure_id)
-        })
+            return jsonify({
+                'success': True,
+                'traversal_result': result,
+                'traversal_method': 'recursive' if use_recursion else 'iterative',
+                'tree_data': structure.get_tree_data(),
+                'operation_history': _serialize_history(structure),
+                'storage': structure.get_storage(),
+                'name': structure_names.get(structure_id)
+            })
 
     except Exception as e:
-        print(f"遍历错误: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"遍历错误: {e}")
         return jsonify({'error': str(e)}), 500
 
 
+def _paginated_traverse(structure, structure_id, traversal_type, data):
+    """
+    分页遍历：从惰性生成器中只取一页，大树上取前几个值不会走遍整棵树
+    请求体参数:
+        limit: 每页个数（不传时返回剩余全部）
+        range: [lo, hi]，只返回闭区间内的值（仅 BST / AVL / 红黑树的中序遍历）
+        after: 上一页返回的 next_after，取之后的一页（仅 BST / AVL / 红黑树的中序遍历，访问 O(log n + limit) 个节点）
+        offset: 跳过前 offset 个值；其他遍历按它翻页（返回 next_offset）
+    """
+    try:
+        limit = int(data['limit']) if data.get('limit') is not None else None
+        offset = int(data.get('offset') or 0)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'limit / offset 必须是整数'}), 400
+    if (limit is not None and limit <= 0) or offset < 0:
+        return jsonify({'error': 'limit 必须大于 0，offset 不能为负数'}), 400
+
+    value_range = data.get('range')
+    after = data.get('after')
+    ordered = isinstance(structure, BinarySearchTree) and traversal_type == 'inorder'
+    if ordered:
+        lo = hi = None
+        if value_range is not None:
+            if not isinstance(value_range, (list, tuple)) or len(value_range) != 2:
+                return jsonify({'error': 'range 必须是 [lo, hi]'}), 400
+            lo, hi = (_convert_tree_value(v) for v in value_range)
+        values = structure.range(lo, hi, after=_convert_tree_value(after))
+    elif value_range is not None or after is not None:
+        return jsonify({'error': 'range / after 只支持二叉搜索树的中序遍历'}), 400
+    else:
+        values = structure.iter_values(traversal_type)
+
+    # 多取一个值判断是否还有下一页
+    stop = None if limit is None else offset + limit + 1
+    page = list(islice(values, offset, stop))
+    has_more = limit is not None and len(page) > limit
+    page = page[:limit]
+
+    result = {
+        'success': True,
+        'traversal_result': page,
+        'traversal_type': traversal_type,
+        'has_more': has_more,
+        'size': structure.size(),
+        'name': structure_names.get(structure_id)
+    }
+    if has_more:
+        if ordered:
+            result['next_after'] = page[-1]
+        else:
+            result['next_offset'] = offset + len(page)
+    return jsonify(result)
+
+
 # Huffman树专用路由
 @app.route('/tree/<structure_id>/huffman/build', methods=['POST'])
 def build_huffman_tree(structure_id):
-    """从文本或数字列表构建Huffman树"""
+    """
+    从文本或数字列表构建Huffman树
+    可选 "method": "auto"（默认，权重已升序时用双队列 O(n) 构建）| "heap" | "two_queue"
+    """
     try:
         structure = structures.get(structure_id)
         if not structure or not isinstance(structure, HuffmanTree):
@@ -738,35 +1113,232 @@ def build_huffman_tree(structure_id):
         text = data.get('text')
         numbers = data.get('numbers')
 
+        if numbers is None and text is None:
+            return jsonify({'error': '必须提供text或numbers参数'}), 400
+        method = data.get('method') or 'auto'
+        if method not in HUFFMAN_BUILD_METHODS:
+            return jsonify({'error': f'未知的构建方式: {method}'}), 400
+
         # 🔥 支持两种模式: 数字模式和文本模式
-        if numbers is not None:
-            # 数字模式: 直接用数字列表构建
-            print(f"收到构建请求 (数字模式), 数字列表: {numbers}")
-            success = structure.build_from_numbers(numbers)
-        elif text is not None:
+        def run_build():
+            if numbers is not None:
+                # 数字模式: 直接用数字列表构建
+                logger.debug(f"收到构建请求 (数字模式), 数字列表: {numbers}")
+                return structure.build_from_numbers(numbers, method=method)
             # 文本模式: 从文本构建
-            print(f"收到构建请求 (文本模式), 文本: {text}")
-            success = structure.build_from_string(text)
-        else:
-            return jsonify({'error': '必须提供text或numbers参数'}), 400
+            logger.debug(f"收到构建请求 (文本模式), 文本: {text}")
+            return structure.build_from_string(text, method=method)
+
+        with _structure_lock(structure):
+            if _stream_format():
+                return _stream_operation(structure, data, run_build,
+                                         lambda success: {'success': success, 'tree_data': structure.get_tree_data()})
+
+            with _trace_scope(structure, data):
+                success = run_build()
+
+            tree_data = structure.get_tree_data()
+            logger.debug("树数据: %s", tree_data)
+
+            return jsonify({
+                'success': success,
+                'tree_data': tree_data,
+                'operation_history': _serialize_history(structure)
+            })
+    except Exception as e:
+        logger.exception(f"错误: {e}")
+        return jsonify({'error': str(e)}), 500
 
-        tree_data = structure.get_tree_data()
-        print(f"树数据: {tree_data}")  # 调试日志
-        print(f"root: {tree_data.get('root')}")  # 调试日志
+
+# 添加导出功能
+# ==================== 堆路由 ====================
+def _heap_response(structure, **extra):
+    """堆操作的返回：数组视图 + 树视图 + 本次操作步骤"""
+    return jsonify({
+        **extra,
+        'data': structure.to_list(),
+        'tree_data': structure.get_tree_data(),
+        'size': structure.size(),
+        'kind': structure.get_kind(),
+        'operation_history': _serialize_history(structure)
+    })
+
+
+@app.route('/heap/create', methods=['POST', 'OPTIONS'])
+def heap_create():
+    """创建二叉堆，请求体: {"kind": "min" | "max"}（默认最小堆），可带 snapshot_mode / trace_level"""
+    if request.method == 'OPTIONS':
+        return '', 204
+    try:
+        data = request.json or {}
+        kind = data.get('kind') or 'min'
+        if kind not in HEAP_KINDS:
+            return jsonify({'error': f'未知的堆类型: {kind}'}), 400
+
+        structure_id = str(uuid.uuid4())
+        structures[structure_id] = BinaryHeap(kind)
+        _apply_snapshot_mode(structures[structure_id], data)
+        structure_names[structure_id] = f"heap_{structure_id[:4]}"
 
         return jsonify({
-            'success': success,
-            'tree_data': tree_data,
-            'operation_history': [step.to_dict() for step in structure.get_operation_history()]
+            'success': True,
+            'structure_id': structure_id,
+            'type': 'maxheap' if kind == 'max' else 'heap',
+            'kind': kind,
+            'name': structure_names.get(structure_id),
+            'message': f"成功创建{'最大' if kind == 'max' else '最小'}堆"
         })
     except Exception as e:
-        print(f"错误: {e}")  # 调试日志
-        import traceback
-        traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
 
-# 添加导出功能
+@app.route('/heap/<structure_id>/state', methods=['GET'])
+def get_heap_state(structure_id):
+    """获取堆状态"""
+    try:
+        structure = structures.get(structure_id)
+        if not structure or not isinstance(structure, BinaryHeap):
+            return jsonify({'error': '不是堆结构'}), 404
+        with _structure_lock(structure):
+            return _heap_response(structure, name=structure_names.get(structure_id))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/heap/<structure_id>/push', methods=['POST'])
+def heap_push(structure_id):
+    """入堆，请求体: {"value": 5}"""
+    try:
+        structure = structures.get(structure_id)
+        if not structure or not isinstance(structure, BinaryHeap):
+            return jsonify({'error': '不是堆结构'}), 404
+
+        data = request.json
+        value = _convert_tree_value(data.get('value'))
+        if value is None:
+            return jsonify({'error': '必须提供value参数'}), 400
+
+        with _structure_lock(structure):
+            if _stream_format():
+                return _stream_operation(structure, data, lambda: structure.push(value),
+                                         lambda success: {'success': success, 'data': structure.to_list()})
+
+            with _trace_scope(structure, data):
+                success = structure.push(value)
+            return _heap_response(structure, success=success)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/heap/<structure_id>/pop', methods=['POST'])
+def heap_pop(structure_id):
+    """出堆，返回堆顶；堆为空时 value 为 null"""
+    try:
+        structure = structures.get(structure_id)
+        if not structure or not isinstance(structure, BinaryHeap):
+            return jsonify({'error': '不是堆结构'}), 404
+
+        with _structure_lock(structure):
+            with _trace_scope(structure, request.get_json(silent=True)):
+                value = structure.pop()
+            return _heap_response(structure, success=value is not None, value=value)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/heap/<structure_id>/peek', methods=['GET'])
+def heap_peek(structure_id):
+    """查看堆顶"""
+    try:
+        structure = structures.get(structure_id)
+        if not structure or not isinstance(structure, BinaryHeap):
+            return jsonify({'error': '不是堆结构'}), 404
+
+        with _structure_lock(structure):
+            with _trace_scope(structure):
+                value = structure.peek()
+            return _heap_response(structure, success=value is not None, value=value)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/heap/<structure_id>/heapify', methods=['POST'])
+def heap_heapify(structure_id):
+    """
+    自底向上建堆（O(n)），请求体: {"values": [5, 3, 8, 1]}
+    "append": true 时与原有元素一起重新建堆
+    """
+    try:
+        structure = structures.get(structure_id)
+        if not structure or not isinstance(structure, BinaryHeap):
+            return jsonify({'error': '不是堆结构'}), 404
+
+        data = request.json
+        values = data.get('values')
+        if not isinstance(values, list):
+            return jsonify({'error': 'values 必须是列表'}), 400
+        values = [_convert_tree_value(v) for v in values if v is not None]
+        run = (lambda: structure.extend(values)) if data.get('append') else (lambda: structure.heapify(values))
+
+        with _structure_lock(structure):
+            if _stream_format():
+                return _stream_operation(structure, data, run,
+                                         lambda success: {'success': success, 'data': structure.to_list()})
+
+            with _trace_scope(structure, data):
+                success = run()
+            return _heap_response(structure, success=success)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/heap/<structure_id>/decrease_key', methods=['POST'])
+def heap_decrease_key(structure_id):
+    """按下标提升优先级，请求体: {"index": 3, "value": 1}；下标越界或新值优先级更低时 success 为 false"""
+    try:
+        structure = structures.get(structure_id)
+        if not structure or not isinstance(structure, BinaryHeap):
+            return jsonify({'error': '不是堆结构'}), 404
+
+        data = request.json
+        try:
+            index = int(data.get('index'))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'index 必须是整数'}), 400
+        value = _convert_tree_value(data.get('value'))
+        if value is None:
+            return jsonify({'error': '必须提供value参数'}), 400
+
+        with _structure_lock(structure):
+            with _trace_scope(structure, data):
+                success = structure.decrease_key(index, value)
+            return _heap_response(structure, success=success)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/heap/<structure_id>/delete', methods=['POST'])
+def heap_delete(structure_id):
+    """删除下标 index 的元素，请求体: {"index": 2}"""
+    try:
+        structure = structures.get(structure_id)
+        if not structure or not isinstance(structure, BinaryHeap):
+            return jsonify({'error': '不是堆结构'}), 404
+
+        data = request.json
+        try:
+            index = int(data.get('index'))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'index 必须是整数'}), 400
+
+        with _structure_lock(structure):
+            with _trace_scope(structure, data):
+                value = structure.delete(index)
+            return _heap_response(structure, success=value is not None, deleted_value=value)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/structure/<structure_id>/export', methods=['GET'])
 def export_structure(structure_id):
     """导出数据结构到JSON"""
@@ -786,8 +1358,13 @@ def export_structure(structure_id):
                 'data': structure.to_list(),
                 'size': structure.size(),
                 'capacity': getattr(structure, '_capacity', None),
+                'circular': getattr(structure, 'is_circular', lambda: False)(),
+                'capacity_policy': structure.get_capacity_stats()['policy'] if hasattr(structure, 'get_capacity_stats') else None,
                 'front_index': getattr(structure, 'get_front_index', lambda: None)(),
-                'rear_index': getattr(structure, 'get_rear_index', lambda: None)()
+                'rear_index': getattr(structure, 'get_rear_index', lambda: None)(),
+                'kind': getattr(structure, 'get_kind', lambda: None)(),  # 堆：min / max
+                'node_ids': getattr(structure, 'get_node_ids', lambda: None)(),
+                'next_node_id': getattr(structure, 'get_next_node_id', lambda: None)()
             }
         else:
             #树结构
@@ -798,6 +1375,7 @@ def export_structure(structure_id):
                 'structure_type': type(structure).__name__,
                 'category': 'tree',
                 'tree_data': tree_data,
+                'storage': structure.get_storage(),
                 'huffman_codes': tree_data.get('huffman_codes') if hasattr(structure, '_huffman_codes') else None,
             }
 
@@ -830,13 +1408,11 @@ def export_structure(structure_id):
                 export_data['huffman_source'] = huffman_source
                 export_data['huffman_mode'] = huffman_mode
 
-        print(f"导出数据结构: {export_data['structure_type']}, size={export_data.get('size', 'N/A')}")
+        logger.debug(f"导出数据结构: {export_data['structure_type']}, size={export_data.get('size', 'N/A')}")
         return jsonify(export_data)
 
     except Exception as e:
-        print(f"导出失败: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"导出失败: {e}")
         return jsonify({'error': str(e)}), 500
 
 
@@ -858,12 +1434,16 @@ def import_structure():
         type_mapping = {
             'SequentialList': ('sequential', SequentialList),
             'LinearLinkedList': ('linked', LinearLinkedList),
+            'DoublyLinkedList': ('doubly', DoublyLinkedList),
+            'CircularLinkedList': ('circular', CircularLinkedList),
             'SequentialStack': ('stack', SequentialStack),
             'SequentialQueue': ('queue', SequentialQueue),
             'BinaryTree': ('binary', BinaryTree),
             'BinarySearchTree': ('bst', BinarySearchTree),
             'AVLTree': ('avl', AVLTree),
-            'HuffmanTree': ('huffman', HuffmanTree)
+            'RedBlackTree': ('rbt', RedBlackTree),
+            'HuffmanTree': ('huffman', HuffmanTree),
+            'BinaryHeap': ('heap', BinaryHeap)
         }
 
         if structure_type_name not in type_mapping:
@@ -872,12 +1452,27 @@ def import_structure():
         structure_type, structure_class = type_mapping[structure_type_name]
 
         # 创建结构实例
-        if structure_type in ['sequential', 'stack', 'queue']:
+        policy = CapacityPolicy.from_options(data.get('capacity_policy') or {})
+        if structure_type == 'queue':
+            structure = structure_class(capacity=data.get('capacity', 100), circular=bool(data.get('circular')), policy=policy)
+        elif structure_type in ['sequential', 'stack']:
             capacity = data.get('capacity', 100)
-            structure = structure_class(capacity=capacity)
+            structure = structure_class(capacity=capacity, policy=policy)
+        elif structure_type in ['bst', 'avl']:
+            structure = structure_class(storage=data.get('storage') or 'object')
+        elif structure_type == 'heap':
+            kind = data.get('kind') or 'min'
+            if kind not in HEAP_KINDS:
+                return jsonify({'error': f'未知的堆类型: {kind}'}), 400
+            structure = structure_class(kind)
+            if kind == 'max':
+                structure_type = 'maxheap'
         else:
             structure = structure_class()
 
+        # 导入只需要恢复结果状态，不记录重建过程的步骤
+        structure.set_trace_level('off')
+
         # 恢复数据
         if category == 'linear':
             # 线性结构：批量插入数据
@@ -886,23 +1481,30 @@ def import_structure():
                 # 栈：依次 push
                 for value in linear_data:
                     structure.push(value)
-                    print(f"  ✓ Push: {value}")
+                    logger.debug(f"  ✓ Push: {value}")
             elif structure_type == 'queue':
                 for value in linear_data:
                     structure.enqueue(value)
-                    print(f"  ✓ Enqueue: {value}")
+                    logger.debug(f"  ✓ Enqueue: {value}")
+            elif structure_type in ('heap', 'maxheap'):
+                # 堆：导出的数组本身满足堆序，自底向上建堆不会移动元素
+                structure.heapify(linear_data)
+                logger.debug(f"  ✓ 建堆: {linear_data}")
             else:
                 # 顺序表/链表：使用 initlist 批量初始化
                 if hasattr(structure, 'initlist') and linear_data:
                     structure.clear_operation_history()  # 清空初始化时的历史
                     structure.initlist(linear_data)
-                    print(f"  ✓ 批量初始化: {linear_data}")
+                    logger.debug(f"  ✓ 批量初始化: {linear_data}")
                 else:
                     # 如果没有 initlist，逐个插入
                     for i, value in enumerate(linear_data):
                         structure.insert(i, value)
-                        print(f"  ✓ Insert[{i}]: {value}")
-            print(f"线性结构恢复完成，当前大小: {structure.size()}")
+                        logger.debug(f"  ✓ Insert[{i}]: {value}")
+            # 🔥 链表节点恢复导出时的 node_id，导入前后的步骤快照可以直接对比
+            if data.get('node_ids') is not None and hasattr(structure, 'restore_node_ids'):
+                structure.restore_node_ids(data['node_ids'], data.get('next_node_id'))
+            logger.debug(f"线性结构恢复完成，当前大小: {structure.size()}")
 
         else:
             tree_data = data.get('tree_data', {})
@@ -915,24 +1517,24 @@ def import_structure():
                 if huffman_source and huffman_mode == 'text':
                     # 文本模式
                     structure.build_from_string(huffman_source)
-                    print(f"  ✓ 从文本重建: {huffman_source}")
+                    logger.debug(f"  ✓ 从文本重建: {huffman_source}")
                 elif huffman_source and huffman_mode == 'numbers':
                     # 数字模式
                     structure.build_from_numbers(huffman_source)
-                    print(f"  ✓ 从数字列表重建: {huffman_source}")
+                    logger.debug(f"  ✓ 从数字列表重建: {huffman_source}")
                 elif 'huffman_text' in data:
                     # 向后兼容：旧数据可能使用这个字段
                     text = data['huffman_text']
                     structure.build_from_string(text)
-                    print(f"  ✓ 从文本重建（兼容模式）: {text}")
+                    logger.debug(f"  ✓ 从文本重建（兼容模式）: {text}")
                 else:
                     # 无法重建Huffman树
-                    print("⚠️  Huffman树缺少原始数据，无法完全重建")
-                    print("   但树结构已加载到内存，可能缺少编码表")
+                    logger.warning("⚠️  Huffman树缺少原始数据，无法完全重建")
+                    logger.debug("   但树结构已加载到内存，可能缺少编码表")
             else:
                 # 普通树：从层序遍历重建
                 levelorder = tree_data.get('traversals', {}).get('levelorder', [])
-                print(f"📊 恢复树数据 (层序): {levelorder}")
+                logger.debug(f"📊 恢复树数据 (层序): {levelorder}")
 
                 # 清空初始化历史
                 structure.clear_operation_history()
@@ -942,9 +1544,15 @@ def import_structure():
                     # 转换类型（重要！）
                     converted_value = _convert_tree_value(value)
                     structure.insert(converted_value)
-                    print(f"  ✓ Insert: {converted_value}")
+                    logger.debug(f"  ✓ Insert: {converted_value}")
+
+                logger.debug(f"树结构恢复完成，节点数: {structure.size()}")
+
+            # 🔥 恢复导出时的 node_id（旧版本导出的数据没有 next_node_id，按节点 id 接着编号）
+            if tree_data.get('root') is not None:
+                structure.restore_node_ids(tree_data['root'], tree_data.get('next_node_id'))
 
-                print(f"树结构恢复完成，节点数: {structure.size()}")
+        structure.set_trace_level(data.get('trace_level', 'full'))
 
         #保存到全局字典
         structures[structure_id] = structure
@@ -952,10 +1560,10 @@ def import_structure():
         # 验证恢复结果
         if category == 'linear':
             restored_data = structure.to_list()
-            print(f"🔍 验证恢复数据: {restored_data}")
+            logger.debug(f"🔍 验证恢复数据: {restored_data}")
         else:
             restored_tree = structure.get_tree_data()
-            print(f"🔍 验证恢复树: size={restored_tree.get('size')}")
+            logger.debug(f"🔍 验证恢复树: size={restored_tree.get('size')}")
 
 
         return jsonify({
@@ -968,8 +1576,7 @@ def import_structure():
         })
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"导入失败: {e}")
         return jsonify({'error': str(e)}), 500
 
 from dsvision.extend1_dsl.lexer import Lexer
@@ -995,20 +1602,18 @@ def execute_dsl():
         if not dsl_code.strip():
             return jsonify({'error': 'DSL 代码不能为空'}), 400
 
-        print(f"\n{'=' * 60}")
-        print(f"收到 DSL 执行请求 (Session: {session_id})")
-        print(f"代码:\n{dsl_code}")
-        print(f"{'=' * 60}\n")
+        logger.debug(f"收到 DSL 执行请求 (Session: {session_id})")
+        logger.debug(f"代码:\n{dsl_code}")
 
         #词法分析
         lexer = Lexer(dsl_code)
         tokens = lexer.tokenize()
-        print(f"✓ 词法分析完成, Token 数: {len(tokens)}")
+        logger.info(f"✓ 词法分析完成, Token 数: {len(tokens)}")
 
         #语法分析
         parser = Parser(tokens)
         ast = parser.parse()
-        print(f"✓ 语法分析完成, 结构数: {len(ast.structures)}")
+        logger.info(f"✓ 语法分析完成, 结构数: {len(ast.structures)}")
 
         #创建或获取解释器
         if session_id not in interpreters:
@@ -1020,7 +1625,7 @@ def execute_dsl():
 
         # 执行dsl
         result = interpreter.execute(ast)  # 修复: 使用正确的方法名
-        print(f"✓ DSL 执行完成")
+        logger.info(f"✓ DSL 执行完成")
 
         #提取结构信息
         response_data = {
@@ -1042,14 +1647,14 @@ def execute_dsl():
                 # 🔥 检查是否已有ID（复用场景）
                 if 'structure_id' in struct_info and struct_info['structure_id'] in structures:
                     structure_id = struct_info['structure_id']
-                    print(f"✓ 复用现有结构ID: {struct_name} -> {structure_id[:8]}...")
+                    logger.info(f"✓ 复用现有结构ID: {struct_name} -> {structure_id[:8]}...")
                 else:
                     # 注册到全局 structures 字典,生成新 ID
                     structure_id = str(uuid.uuid4())
                     structures[structure_id] = structure
                     # 🔥 保存名称到ID的映射
                     interpreter.register_structure_mapping(struct_name, structure_id)
-                    print(f"✓ 新建结构并注册: {struct_name} -> {structure_id[:8]}...")
+                    logger.info(f"✓ 新建结构并注册: {struct_name} -> {structure_id[:8]}...")
 
                 # 准备返回数据
                 struct_data = {
@@ -1060,7 +1665,7 @@ def execute_dsl():
                 }
 
                 # 根据结构类型返回数据
-                if struct_type in ['sequential', 'linked', 'stack', 'queue']:
+                if struct_type in ['sequential', 'linked', 'doubly', 'circular', 'stack', 'queue']:
                     # 线性结构
                     struct_data['data'] = structure.to_list()
                     struct_data['size'] = structure.size()
@@ -1068,7 +1673,7 @@ def execute_dsl():
                     if struct_type == 'queue':
                         struct_data['front_index'] = getattr(structure, 'get_front_index', lambda: None)()
                         struct_data['rear_index'] = getattr(structure, 'get_rear_index', lambda: None)()
-                elif struct_type in ['binary', 'bst', 'avl', 'huffman']:
+                elif struct_type in ['binary', 'bst', 'avl', 'rbt', 'huffman']:
                     # 树结构
                     struct_data['tree_data'] = structure.get_tree_data()
                     struct_data['size'] = structure.size()
@@ -1077,19 +1682,25 @@ def execute_dsl():
                     # Huffman 特殊处理
                     if struct_type == 'huffman' and hasattr(structure, 'get_huffman_codes'):
                         struct_data['huffman_codes'] = structure.get_huffman_codes()
+                elif struct_type in ['heap', 'maxheap']:
+                    # 堆：数组视图 + 树视图
+                    struct_data['data'] = structure.to_list()
+                    struct_data['tree_data'] = structure.get_tree_data()
+                    struct_data['size'] = structure.size()
+                    struct_data['category'] = 'heap'
 
                 # 🔥 添加操作历史，支持前端动画播放（只包含最后一个操作的步骤）
-                struct_data['operation_history'] = [step.to_dict() for step in structure.get_operation_history()]
+                struct_data['operation_history'] = _serialize_history(structure)
 
                 # 记录名称映射，便于后续状态查询展示
                 structure_names[structure_id] = struct_name
                 response_data['structures'].append(struct_data)
 
-        print(f"\n✓ 成功执行,返回 {len(response_data['structures'])} 个结构\n")
+        logger.info(f"✓ 成功执行,返回 {len(response_data['structures'])} 个结构")
         return jsonify(response_data)
 
     except SyntaxError as e:
-        print(f"✗ 语法错误: {e}")
+        logger.error(f"✗ 语法错误: {e}")
         return jsonify({
             'success': False,
             'error': f'语法错误: {str(e)}',
@@ -1097,9 +1708,7 @@ def execute_dsl():
         }), 400
 
     except Exception as e:
-        print(f"✗ 执行错误: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"✗ 执行错误: {e}")
         return jsonify({
             'success': False,
             'error': str(e),
@@ -1187,6 +1796,17 @@ def get_dsl_examples():
     insert_head 0
     insert_tail 4
     search 2
+}""",
+        'doubly': """Doubly myDoubly {
+    init [1, 2, 3]
+    insert_tail 4
+    delete_tail
+    delete_head
+}""",
+        'circular': """Circular myCircular {
+    init [1, 2, 3]
+    insert_head 0
+    delete_tail
 }""",
         'stack': """Stack myStack {
     push 1
@@ -1196,7 +1816,7 @@ def get_dsl_examples():
     pop
 }""",
         'queue': """Queue myQueue {
-    init [1, 2, 3] capacity 5
+    init [1, 2, 3] capacity 5 circular
     enqueue 4
     enqueue 5
     front
@@ -1220,6 +1840,21 @@ def get_dsl_examples():
     insert 40
     insert 50
     traverse levelorder
+}""",
+        'rbt': """RBTree myRBT {
+    insert 10
+    insert 20
+    insert 30
+    insert 15
+    delete 10
+    traverse levelorder
+}""",
+        'heap': """Heap myHeap {
+    build [9, 4, 7, 1, 8, 2]
+    push 3
+    decrease_key 5 0
+    pop
+    peek
 }""",
         'huffman': """Huffman myHuffman {
     build_text "ABRACADABRA"
@@ -1249,8 +1884,8 @@ Stack stack1 {
     return jsonify({
         'examples': examples,
         'categories': {
-            'linear': ['sequential', 'linked', 'stack'],
-            'tree': ['bst', 'avl', 'huffman'],
+            'linear': ['sequential', 'linked', 'doubly', 'circular', 'stack'],
+            'tree': ['bst', 'avl', 'rbt', 'heap', 'huffman'],
             'complex': ['complex']
         }
     })
@@ -1292,12 +1927,10 @@ def llm_chat():
         if not user_message:
             return jsonify({'error': '消息不能为空'}), 400
 
-        print(f"\n{'=' * 60}")
-        print(f"[LLM Chat] Session: {session_id}")
-        print(f"用户: {user_message}")
+        logger.debug(f"[LLM Chat] Session: {session_id}")
+        logger.debug(f"用户: {user_message}")
         if context:
-            print(f"上下文: {context}")
-        print(f"{'=' * 60}\n")
+            logger.debug(f"上下文: {context}")
 
         # 🔥 如果有上下文，构建增强的消息
         enhanced_message = user_message
@@ -1353,7 +1986,7 @@ def llm_chat():
                 context_prefix = f"[当前数据结构：{struct_type}{name_brief}{rebuild_brief}，数据：{','.join(map(str, struct_data))}]\n"
                 enhanced_message = context_prefix + user_message
 
-            print(f"🔥 增强后的消息（带上下文）:\n{enhanced_message}\n")
+            logger.debug(f"🔥 增强后的消息（带上下文）:\n{enhanced_message}")
 
         # 调用LLM生成DSL
         result = llm_service.natural_language_to_dsl(enhanced_message)
@@ -1371,7 +2004,7 @@ def llm_chat():
         # 如果生成了DSL代码,自动执行
         execution_result = None
         if dsl_code and dsl_code.strip():
-            print(f"✓ 自动执行生成的DSL代码\n")
+            logger.info(f"✓ 自动执行生成的DSL代码")
 
             try:
                 # 复用DSL执行逻辑
@@ -1408,7 +2041,7 @@ def llm_chat():
                     if current_sid in structures:
                         # 从DSL代码中提取结构名称（例如 "BST myBST { ... }" -> "myBST"）
                         import re
-                        match = re.search(r'\b(Sequential|Linked|Stack|Queue|BST|Binary|AVL|Huffman)\s+(\w+)\s*\{', dsl_code)
+                        match = re.search(r'\b(Sequential|Linked|Doubly|Circular|Stack|Queue|BST|Binary|AVL|Huffman)\s+(\w+)\s*\{', dsl_code)
                         if match:
                             struct_name = match.group(2)  # 例如 "myBST"
                             struct_type = current_struct_info.get('type', '')
@@ -1435,13 +2068,13 @@ def llm_chat():
                             try:
                                 if hasattr(real_structure, 'to_list'):
                                     actual_data = real_structure.to_list()
-                                    print(f"🔥 强制使用当前页面结构: {struct_name} -> {current_sid[:8]}... ({struct_type})")
-                                    print(f"   实际数据: {actual_data}")
+                                    logger.debug(f"🔥 强制使用当前页面结构: {struct_name} -> {current_sid[:8]}... ({struct_type})")
+                                    logger.debug(f"   实际数据: {actual_data}")
                                 else:
-                                    print(f"🔥 强制使用当前页面结构: {struct_name} -> {current_sid[:8]}... ({struct_type})")
+                                    logger.debug(f"🔥 强制使用当前页面结构: {struct_name} -> {current_sid[:8]}... ({struct_type})")
                             except Exception as e:
-                                print(f"🔥 强制使用当前页面结构: {struct_name} -> {current_sid[:8]}... ({struct_type})")
-                                print(f"   警告: 无法读取数据: {e}")
+                                logger.debug(f"🔥 强制使用当前页面结构: {struct_name} -> {current_sid[:8]}... ({struct_type})")
+                                logger.warning(f"   警告: 无法读取数据: {e}")
 
                 exec_result = interpreter.execute(ast)
 
@@ -1455,13 +2088,13 @@ def llm_chat():
                         # 🔥 检查是否已有ID（复用场景）
                         if 'structure_id' in struct_info and struct_info['structure_id'] in structures:
                             structure_id = struct_info['structure_id']
-                            print(f"✓ LLM复用现有结构: {struct_name} -> {structure_id[:8]}...")
+                            logger.info(f"✓ LLM复用现有结构: {struct_name} -> {structure_id[:8]}...")
                         else:
                             # 注册到全局字典
                             structure_id = str(uuid.uuid4())
                             structures[structure_id] = structure
                             interpreter.register_structure_mapping(struct_name, structure_id)
-                            print(f"✓ LLM新建结构: {struct_name} -> {structure_id[:8]}...")
+                            logger.info(f"✓ LLM新建结构: {struct_name} -> {structure_id[:8]}...")
 
                         struct_data = {
                             'name': struct_name,
@@ -1469,11 +2102,11 @@ def llm_chat():
                             'structure_id': structure_id,
                             'operations_count': struct_result['operations_count'],
                             # 🔥 添加操作历史以支持动画播放
-                            'operation_history': [step.to_dict() for step in structure.get_operation_history()]
+                            'operation_history': _serialize_history(structure)
                         }
 
                         # 根据类型添加数据
-                        if struct_result['type'] in ['sequential', 'linked', 'stack', 'queue']:
+                        if struct_result['type'] in ['sequential', 'linked', 'doubly', 'circular', 'stack', 'queue']:
                             struct_data['data'] = structure.to_list()
                             struct_data['size'] = structure.size()
                             struct_data['category'] = 'linear'
@@ -1490,10 +2123,10 @@ def llm_chat():
                     'execution_log': exec_result['execution_log']
                 }
 
-                print(f"✓ DSL执行成功,创建了 {len(structures_data)} 个结构\n")
+                logger.info(f"✓ DSL执行成功,创建了 {len(structures_data)} 个结构")
 
             except Exception as exec_error:
-                print(f"✗ DSL执行失败: {exec_error}\n")
+                logger.error(f"✗ DSL执行失败: {exec_error}")
                 execution_result = {
                     'success': False,
                     'error': str(exec_error)
@@ -1511,9 +2144,7 @@ def llm_chat():
         })
 
     except Exception as e:
-        print(f"✗ LLM Chat错误: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"✗ LLM Chat错误: {e}")
         return jsonify({
             'success': False,
             'error': str(e),
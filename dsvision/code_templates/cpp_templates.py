@@ -386,6 +386,41 @@ Node* deleteHelper(Node* node, int value) {
     return node;
 }"""
 
+BST_SELECT = """int select(int k) {  // 第 k 小，k 从 0 开始
+    Node* current = root;
+    while (current != nullptr) {
+        int leftSize = size(current->left);
+        if (k < leftSize) {
+            current = current->left;
+        } else if (k == leftSize) {
+            return current->value;
+        } else {
+            k -= leftSize + 1;
+            current = current->right;
+        }
+    }
+    return -1;  // k 越界
+}"""
+
+BST_RANK = """int rank(int value, bool inclusive = false) {  // 小于（inclusive 时小于等于）value 的个数
+    int count = 0;
+    Node* current = root;
+    while (current != nullptr) {
+        if (value < current->value || (value == current->value && !inclusive)) {
+            current = current->left;
+        } else {
+            count += size(current->left) + 1;
+            current = current->right;
+        }
+    }
+    return count;
+}
+
+int countRange(int lo, int hi) {  // lo <= value <= hi 的个数
+    if (hi < lo) return 0;
+    return rank(hi, true) - rank(lo);
+}"""
+
 # ==================== AVL 树代码模板 ====================
 AVL_INSERT = """void insert(int value) {
     root = insertHelper(root, value);
@@ -466,6 +501,118 @@ AVL_ROTATE_RIGHT = """Node* rotateRight(Node* x) {
     return y;  // 新根节点
 }"""
 
+# ==================== 红黑树代码模板 ====================
+RBT_INSERT = """void insert(int value) {
+    Node* node = new Node(value);  // 新节点为红色
+    bstInsert(node);               // 先按BST规则插入
+    while (node != root && node->parent->color == RED) {
+        Node* parent = node->parent;
+        Node* grand = parent->parent;
+        Node* uncle = (parent == grand->left) ? grand->right : grand->left;
+        if (uncle != nullptr && uncle->color == RED) {
+            // 情况1：叔节点为红 —— 变色，问题上移到祖父
+            parent->color = BLACK;
+            uncle->color = BLACK;
+            grand->color = RED;
+            node = grand;
+        } else {
+            if (parent == grand->left) {
+                if (node == parent->right) {  // 情况2：内侧 —— 先左旋父节点
+                    node = parent;
+                    rotateLeft(node);
+                    parent = node->parent;
+                }
+                parent->color = BLACK;        // 情况3：外侧 —— 变色后右旋祖父
+                grand->color = RED;
+                rotateRight(grand);
+            } else {
+                if (node == parent->left) {   // 镜像：先右旋父节点
+                    node = parent;
+                    rotateRight(node);
+                    parent = node->parent;
+                }
+                parent->color = BLACK;        // 镜像：变色后左旋祖父
+                grand->color = RED;
+                rotateLeft(grand);
+            }
+        }
+    }
+    root->color = BLACK;
+}"""
+
+RBT_DELETE = """void remove(int value) {
+    Node* z = find(root, value);
+    if (z == nullptr) return;
+    if (z->left != nullptr && z->right != nullptr) {
+        Node* s = minimum(z->right);  // 两个孩子：用后继的值替换
+        z->value = s->value;
+        z = s;
+    }
+    Node* x = (z->left != nullptr) ? z->left : z->right;
+    Node* parent = z->parent;
+    transplant(z, x);                 // 用唯一的孩子顶替 z
+    if (z->color == BLACK) removeFixup(x, parent);
+    delete z;
+}
+
+void removeFixup(Node* x, Node* parent) {
+    while (x != root && isBlack(x)) {
+        bool left = (x == parent->left);
+        Node* w = left ? parent->right : parent->left;  // 兄弟节点
+        if (w->color == RED) {        // 情况1：兄弟为红 —— 变色并旋转父节点
+            w->color = BLACK;
+            parent->color = RED;
+            left ? rotateLeft(parent) : rotateRight(parent);
+            w = left ? parent->right : parent->left;
+        }
+        Node* near = left ? w->left : w->right;
+        Node* far = left ? w->right : w->left;
+        if (isBlack(near) && isBlack(far)) {  // 情况2：兄弟的孩子都为黑 —— 兄弟变红，问题上移
+            w->color = RED;
+            x = parent;
+            parent = x->parent;
+        } else {
+            if (isBlack(far)) {       // 情况3：远侄子为黑 —— 旋转兄弟
+                near->color = BLACK;
+                w->color = RED;
+                left ? rotateRight(w) : rotateLeft(w);
+                w = left ? parent->right : parent->left;
+                far = left ? w->right : w->left;
+            }
+            w->color = parent->color; // 情况4：远侄子为红 —— 旋转父节点后结束
+            parent->color = BLACK;
+            far->color = BLACK;
+            left ? rotateLeft(parent) : rotateRight(parent);
+            x = root;
+        }
+    }
+    if (x != nullptr) x->color = BLACK;
+}"""
+
+RBT_ROTATE_LEFT = """void rotateLeft(Node* x) {
+    Node* y = x->right;
+    x->right = y->left;
+    if (y->left != nullptr) y->left->parent = x;
+    y->parent = x->parent;
+    if (x->parent == nullptr) root = y;
+    else if (x == x->parent->left) x->parent->left = y;
+    else x->parent->right = y;
+    y->left = x;
+    x->parent = y;
+}"""
+
+RBT_ROTATE_RIGHT = """void rotateRight(Node* x) {
+    Node* y = x->left;
+    x->left = y->right;
+    if (y->right != nullptr) y->right->parent = x;
+    y->parent = x->parent;
+    if (x->parent == nullptr) root = y;
+    else if (x == x->parent->right) x->parent->right = y;
+    else x->parent->left = y;
+    y->right = x;
+    x->parent = y;
+}"""
+
 # ==================== 树遍历代码模板 ====================
 TREE_TRAVERSAL_INORDER = """void inorder(Node* node) {
     if (node == nullptr) return;
@@ -574,6 +721,57 @@ TREE_TRAVERSAL_LEVELORDER = """void levelorder(Node* root) {
     }
 }"""
 
+# ==================== 二叉堆代码模板 ====================
+HEAP_PUSH = """void push(int value) {
+    data.push_back(value);
+    siftUp(data.size() - 1);
+}
+
+void siftUp(int i) {  // before(a, b): 最小堆为 a < b，最大堆为 a > b
+    while (i > 0) {
+        int parent = (i - 1) / 2;
+        if (!before(data[i], data[parent])) break;
+        swap(data[i], data[parent]);
+        i = parent;
+    }
+}"""
+
+HEAP_POP = """int pop() {
+    if (data.empty()) return -1;
+    int top = data[0];
+    data[0] = data.back();
+    data.pop_back();
+    if (!data.empty()) siftDown(0);
+    return top;
+}
+
+void siftDown(int i) {
+    int n = data.size();
+    while (true) {
+        int best = i, left = 2 * i + 1, right = 2 * i + 2;
+        if (left < n && before(data[left], data[best])) best = left;
+        if (right < n && before(data[right], data[best])) best = right;
+        if (best == i) break;
+        swap(data[i], data[best]);
+        i = best;
+    }
+}"""
+
+HEAP_HEAPIFY = """void heapify(const vector<int>& values) {  // 自底向上建堆，O(n)
+    data = values;
+    for (int i = data.size() / 2 - 1; i >= 0; i--) {
+        siftDown(i);
+    }
+    // 建堆完成，data[0] 为堆顶
+}"""
+
+HEAP_DECREASE_KEY = """bool decreaseKey(int i, int value) {  // 提升优先级
+    if (i < 0 || i >= data.size() || before(data[i], value)) return false;
+    data[i] = value;
+    siftUp(i);
+    return true;
+}"""
+
 # ==================== Huffman 树代码模板 ====================
 HUFFMAN_BUILD = """void buildHuffmanTree(map<char, int> frequencies) {
     // 创建最小堆
@@ -607,6 +805,29 @@ HUFFMAN_BUILD = """void buildHuffmanTree(map<char, int> frequencies) {
     root = minHeap.top();
 }"""
 
+HUFFMAN_BUILD_TWO_QUEUE = """void buildHuffmanTwoQueue(vector<pair<char, int>> sortedFrequencies) {
+    // 叶子队列：权重已按升序排好；合并队列：新节点依次追加，天然有序
+    queue<Node*> leaves, merged;
+    for (auto& pair : sortedFrequencies) leaves.push(new Node(pair.first, pair.second));
+
+    auto popMin = [&]() {
+        // 比较两个队首，取较小者（相等时优先取叶子）
+        bool fromLeaves = merged.empty() || (!leaves.empty() && leaves.front()->weight <= merged.front()->weight);
+        queue<Node*>& q = fromLeaves ? leaves : merged;
+        Node* node = q.front(); q.pop(); return node;
+    };
+    // 每轮取两个最小节点合并，O(1)
+    while (leaves.size() + merged.size() > 1) {
+        Node* left = popMin();
+        Node* right = popMin();
+        Node* node = new Node('\\0', left->weight + right->weight);
+        node->left = left; node->right = right;
+        // 新权重不小于之前所有合并结果，直接追加到队尾
+        merged.push(node);
+    }
+    root = leaves.empty() ? merged.front() : leaves.front();
+}"""
+
 HUFFMAN_ENCODE = """string encode(string text) {
     // 检查编码表是否已生成
     if (huffmanCodes.empty()) {
@@ -730,6 +951,8 @@ CODE_TEMPLATES = {
     # BST
     'bst_insert': BST_INSERT,
     'bst_search': BST_SEARCH,
+    'bst_select': BST_SELECT,
+    'bst_rank': BST_RANK,
     'bst_delete': BST_DELETE,
 
     # AVL
@@ -737,6 +960,12 @@ CODE_TEMPLATES = {
     'avl_rotate_left': AVL_ROTATE_LEFT,
     'avl_rotate_right': AVL_ROTATE_RIGHT,
 
+    # 红黑树
+    'rbt_insert': RBT_INSERT,
+    'rbt_delete': RBT_DELETE,
+    'rbt_rotate_left': RBT_ROTATE_LEFT,
+    'rbt_rotate_right': RBT_ROTATE_RIGHT,
+
     # 树遍历
     'tree_traversal_inorder': TREE_TRAVERSAL_INORDER,
     'tree_traversal_preorder': TREE_TRAVERSAL_PREORDER,
@@ -746,8 +975,15 @@ CODE_TEMPLATES = {
     'tree_traversal_inorder_iterative': TREE_TRAVERSAL_INORDER_ITERATIVE,
     'tree_traversal_postorder_iterative': TREE_TRAVERSAL_POSTORDER_ITERATIVE,
 
+    # 二叉堆
+    'heap_push': HEAP_PUSH,
+    'heap_pop': HEAP_POP,
+    'heap_heapify': HEAP_HEAPIFY,
+    'heap_decrease_key': HEAP_DECREASE_KEY,
+
     # Huffman树
     'huffman_build': HUFFMAN_BUILD,
+    'huffman_build_two_queue': HUFFMAN_BUILD_TWO_QUEUE,
     'huffman_encode': HUFFMAN_ENCODE,
     'huffman_decode': HUFFMAN_DECODE,
     'huffman_generate_codes': HUFFMAN_GENERATE_CODES,
@@ -341,6 +341,41 @@ private boolean searchNode(Node node, int value) {
     }
 }"""
 
+BST_SELECT = """public Integer select(int k) {  // 第 k 小，k 从 0 开始
+    Node current = root;
+    while (current != null) {
+        int leftSize = size(current.left);
+        if (k < leftSize) {
+            current = current.left;
+        } else if (k == leftSize) {
+            return current.value;
+        } else {
+            k -= leftSize + 1;
+            current = current.right;
+        }
+    }
+    return null;  // k 越界
+}"""
+
+BST_RANK = """public int rank(int value, boolean inclusive) {  // 小于（inclusive 时小于等于）value 的个数
+    int count = 0;
+    Node current = root;
+    while (current != null) {
+        if (value < current.value || (value == current.value && !inclusive)) {
+            current = current.left;
+        } else {
+            count += size(current.left) + 1;
+            current = current.right;
+        }
+    }
+    return count;
+}
+
+public int countRange(int lo, int hi) {  // lo <= value <= hi 的个数
+    if (hi < lo) return 0;
+    return rank(hi, true) - rank(lo, false);
+}"""
+
 # ==================== AVL树代码模板 ====================
 AVL_INSERT = """public void insert(int value) {
     root = insertNode(root, value);
@@ -430,6 +465,94 @@ private Node deleteNode(Node node, int value) {
     return node;
 }"""
 
+# ==================== 红黑树代码模板 ====================
+RBT_INSERT = """public void insert(int value) {
+    Node node = new Node(value);  // 新节点为红色
+    bstInsert(node);              // 先按BST规则插入
+    while (node != root && node.parent.color == RED) {
+        Node parent = node.parent;
+        Node grand = parent.parent;
+        Node uncle = (parent == grand.left) ? grand.right : grand.left;
+        if (uncle != null && uncle.color == RED) {
+            // 情况1：叔节点为红 —— 变色，问题上移到祖父
+            parent.color = BLACK;
+            uncle.color = BLACK;
+            grand.color = RED;
+            node = grand;
+        } else {
+            if (parent == grand.left) {
+                if (node == parent.right) {  // 情况2：内侧 —— 先左旋父节点
+                    node = parent;
+                    rotateLeft(node);
+                    parent = node.parent;
+                }
+                parent.color = BLACK;        // 情况3：外侧 —— 变色后右旋祖父
+                grand.color = RED;
+                rotateRight(grand);
+            } else {
+                if (node == parent.left) {   // 镜像：先右旋父节点
+                    node = parent;
+                    rotateRight(node);
+                    parent = node.parent;
+                }
+                parent.color = BLACK;        // 镜像：变色后左旋祖父
+                grand.color = RED;
+                rotateLeft(grand);
+            }
+        }
+    }
+    root.color = BLACK;
+}"""
+
+RBT_DELETE = """public void delete(int value) {
+    Node z = find(root, value);
+    if (z == null) return;
+    if (z.left != null && z.right != null) {
+        Node s = minimum(z.right);   // 两个孩子：用后继的值替换
+        z.value = s.value;
+        z = s;
+    }
+    Node x = (z.left != null) ? z.left : z.right;
+    Node parent = z.parent;
+    transplant(z, x);                // 用唯一的孩子顶替 z
+    if (z.color == BLACK) deleteFixup(x, parent);
+    size--;
+}
+
+private void deleteFixup(Node x, Node parent) {
+    while (x != root && isBlack(x)) {
+        boolean left = (x == parent.left);
+        Node w = left ? parent.right : parent.left;  // 兄弟节点
+        if (w.color == RED) {        // 情况1：兄弟为红 —— 变色并旋转父节点
+            w.color = BLACK;
+            parent.color = RED;
+            if (left) rotateLeft(parent); else rotateRight(parent);
+            w = left ? parent.right : parent.left;
+        }
+        Node near = left ? w.left : w.right;
+        Node far = left ? w.right : w.left;
+        if (isBlack(near) && isBlack(far)) {  // 情况2：兄弟的孩子都为黑 —— 兄弟变红，问题上移
+            w.color = RED;
+            x = parent;
+            parent = x.parent;
+        } else {
+            if (isBlack(far)) {      // 情况3：远侄子为黑 —— 旋转兄弟
+                near.color = BLACK;
+                w.color = RED;
+                if (left) rotateRight(w); else rotateLeft(w);
+                w = left ? parent.right : parent.left;
+                far = left ? w.right : w.left;
+            }
+            w.color = parent.color;  // 情况4：远侄子为红 —— 旋转父节点后结束
+            parent.color = BLACK;
+            far.color = BLACK;
+            if (left) rotateLeft(parent); else rotateRight(parent);
+            x = root;
+        }
+    }
+    if (x != null) x.color = BLACK;
+}"""
+
 # ==================== 树遍历代码模板 ====================
 TREE_TRAVERSAL_INORDER = """void inorder(Node node) {
     if (node == null) return;
@@ -536,6 +659,58 @@ TREE_TRAVERSAL_LEVELORDER = """void levelorder(Node root) {
     }
 }"""
 
+# ==================== 二叉堆代码模板 ====================
+HEAP_PUSH = """public void push(int value) {
+    data.add(value);
+    siftUp(data.size() - 1);
+}
+
+private void siftUp(int i) {  // before(a, b): 最小堆为 a < b，最大堆为 a > b
+    while (i > 0) {
+        int parent = (i - 1) / 2;
+        if (!before(data.get(i), data.get(parent))) break;
+        Collections.swap(data, i, parent);
+        i = parent;
+    }
+}"""
+
+HEAP_POP = """public Integer pop() {
+    if (data.isEmpty()) return null;
+    int top = data.get(0);
+    int last = data.remove(data.size() - 1);
+    if (!data.isEmpty()) {
+        data.set(0, last);
+        siftDown(0);
+    }
+    return top;
+}
+
+private void siftDown(int i) {
+    int n = data.size();
+    while (true) {
+        int best = i, left = 2 * i + 1, right = 2 * i + 2;
+        if (left < n && before(data.get(left), data.get(best))) best = left;
+        if (right < n && before(data.get(right), data.get(best))) best = right;
+        if (best == i) break;
+        Collections.swap(data, i, best);
+        i = best;
+    }
+}"""
+
+HEAP_HEAPIFY = """public void heapify(List<Integer> values) {  // 自底向上建堆，O(n)
+    data = new ArrayList<>(values);
+    for (int i = data.size() / 2 - 1; i >= 0; i--) {
+        siftDown(i);
+    }
+}"""
+
+HEAP_DECREASE_KEY = """public boolean decreaseKey(int i, int value) {  // 提升优先级
+    if (i < 0 || i >= data.size() || before(data.get(i), value)) return false;
+    data.set(i, value);
+    siftUp(i);
+    return true;
+}"""
+
 # ==================== Huffman 树代码模板 ====================
 HUFFMAN_BUILD = """void buildHuffmanTree(Map<Character, Integer> frequencies) {
     // 创建最小堆
@@ -569,6 +744,29 @@ HUFFMAN_BUILD = """void buildHuffmanTree(Map<Character, Integer> frequencies) {
     root = minHeap.poll();
 }"""
 
+HUFFMAN_BUILD_TWO_QUEUE = """void buildHuffmanTwoQueue(List<Map.Entry<Character, Integer>> sortedFrequencies) {
+    // 叶子队列：权重已按升序排好；合并队列：新节点依次追加，天然有序
+    Deque<Node> leaves = new ArrayDeque<>(), merged = new ArrayDeque<>();
+    for (Map.Entry<Character, Integer> entry : sortedFrequencies) leaves.add(new Node(entry.getKey(), entry.getValue()));
+
+    Supplier<Node> popMin = () -> {
+        // 比较两个队首，取较小者（相等时优先取叶子）
+        boolean fromLeaves = merged.isEmpty() || (!leaves.isEmpty() && leaves.peek().weight <= merged.peek().weight);
+        return fromLeaves ? leaves.poll() : merged.poll();
+    };
+
+    // 每轮取两个最小节点合并，O(1)
+    while (leaves.size() + merged.size() > 1) {
+        Node left = popMin.get();
+        Node right = popMin.get();
+        Node node = new Node('\\0', left.weight + right.weight);
+        node.left = left; node.right = right;
+        // 新权重不小于之前所有合并结果，直接追加到队尾
+        merged.add(node);
+    }
+    root = leaves.isEmpty() ? merged.peek() : leaves.peek();
+}"""
+
 HUFFMAN_ENCODE = """String encode(String text) {
     // 检查编码表是否已生成
     if (huffmanCodes.isEmpty()) {
@@ -687,8 +885,12 @@ JAVA_CODE_TEMPLATES = {
     'bst_insert': BST_INSERT,
     'bst_delete': BST_DELETE,
     'bst_search': BST_SEARCH,
+    'bst_select': BST_SELECT,
+    'bst_rank': BST_RANK,
     'avl_insert': AVL_INSERT,
     'avl_delete': AVL_DELETE,
+    'rbt_insert': RBT_INSERT,
+    'rbt_delete': RBT_DELETE,
 
     # 树遍历
     'tree_traversal_inorder': TREE_TRAVERSAL_INORDER,
@@ -699,8 +901,15 @@ JAVA_CODE_TEMPLATES = {
     'tree_traversal_inorder_iterative': TREE_TRAVERSAL_INORDER_ITERATIVE,
     'tree_traversal_postorder_iterative': TREE_TRAVERSAL_POSTORDER_ITERATIVE,
 
+    # 二叉堆
+    'heap_push': HEAP_PUSH,
+    'heap_pop': HEAP_POP,
+    'heap_heapify': HEAP_HEAPIFY,
+    'heap_decrease_key': HEAP_DECREASE_KEY,
+
     # Huffman树
     'huffman_build': HUFFMAN_BUILD,
+    'huffman_build_two_queue': HUFFMAN_BUILD_TWO_QUEUE,
     'huffman_encode': HUFFMAN_ENCODE,
     'huffman_decode': HUFFMAN_DECODE,
     'huffman_generate_codes': HUFFMAN_GENERATE_CODES,
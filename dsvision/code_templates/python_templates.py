@@ -300,6 +300,35 @@ BST_SEARCH = """def search(self, value):
 
     return False  # 未找到"""
 
+BST_SELECT = """def select(self, k):  # 第 k 小，k 从 0 开始
+    current = self.root
+    while current:
+        left_size = size(current.left)
+        if k < left_size:
+            current = current.left
+        elif k == left_size:
+            return current.value
+        else:
+            k -= left_size + 1
+            current = current.right
+    return None  # k 越界"""
+
+BST_RANK = """def rank(self, value, inclusive=False):  # 小于（inclusive 时小于等于）value 的个数
+    count = 0
+    current = self.root
+    while current:
+        if value < current.value or (value == current.value and not inclusive):
+            current = current.left
+        else:
+            count += size(current.left) + 1
+            current = current.right
+    return count
+
+def count_range(self, lo, hi):  # lo <= value <= hi 的个数
+    if hi < lo:
+        return 0
+    return self.rank(hi, True) - self.rank(lo)"""
+
 # ==================== AVL树代码模板 ====================
 AVL_INSERT = """def insert(self, value):
     self.root = self._insert_node(self.root, value)
@@ -372,6 +401,81 @@ def _delete_node(self, node, value):
 
     return node"""
 
+# ==================== 红黑树代码模板 ====================
+RBT_INSERT = """def insert(self, value):
+    node = Node(value)  # 新节点为红色
+    self._bst_insert(node)  # 先按BST规则插入
+    while node is not self.root and node.parent.color == RED:
+        parent = node.parent
+        grand = parent.parent
+        uncle = grand.right if parent is grand.left else grand.left
+        if uncle is not None and uncle.color == RED:
+            # 情况1：叔节点为红 —— 变色，问题上移到祖父
+            parent.color = BLACK
+            uncle.color = BLACK
+            grand.color = RED
+            node = grand
+        else:
+            if parent is grand.left:
+                if node is parent.right:  # 情况2：内侧 —— 先左旋父节点
+                    node = parent
+                    self._rotate_left(node)
+                    parent = node.parent
+                parent.color = BLACK  # 情况3：外侧 —— 变色后右旋祖父
+                grand.color = RED
+                self._rotate_right(grand)
+            else:
+                if node is parent.left:  # 镜像：先右旋父节点
+                    node = parent
+                    self._rotate_right(node)
+                    parent = node.parent
+                parent.color = BLACK  # 镜像：变色后左旋祖父
+                grand.color = RED
+                self._rotate_left(grand)
+    self.root.color = BLACK"""
+
+RBT_DELETE = """def delete(self, value):
+    z = self._find(self.root, value)
+    if z is None: return
+    if z.left is not None and z.right is not None:
+        s = self._minimum(z.right)  # 两个孩子：用后继的值替换
+        z.value = s.value
+        z = s
+    x = z.left if z.left is not None else z.right
+    parent = z.parent
+    self._transplant(z, x)  # 用唯一的孩子顶替 z
+    if z.color == BLACK: self._delete_fixup(x, parent)
+    self.size -= 1
+
+def _delete_fixup(self, x, parent):
+    while x is not self.root and is_black(x):
+        left = x is parent.left
+        w = parent.right if left else parent.left  # 兄弟节点
+        if w.color == RED:  # 情况1：兄弟为红 —— 变色并旋转父节点
+            w.color = BLACK
+            parent.color = RED
+            self._rotate_left(parent) if left else self._rotate_right(parent)
+            w = parent.right if left else parent.left
+        near = w.left if left else w.right
+        far = w.right if left else w.left
+        if is_black(near) and is_black(far):  # 情况2：兄弟的孩子都为黑 —— 兄弟变红，问题上移
+            w.color = RED
+            x = parent
+            parent = x.parent
+        else:
+            if is_black(far):  # 情况3：远侄子为黑 —— 旋转兄弟
+                near.color = BLACK
+                w.color = RED
+                self._rotate_right(w) if left else self._rotate_left(w)
+                w = parent.right if left else parent.left
+                far = w.right if left else w.left
+            w.color = parent.color  # 情况4：远侄子为红 —— 旋转父节点后结束
+            parent.color = BLACK
+            far.color = BLACK
+            self._rotate_left(parent) if left else self._rotate_right(parent)
+            x = self.root
+    if x is not None: x.color = BLACK"""
+
 # ==================== 树遍历代码模板 ====================
 TREE_TRAVERSAL_INORDER = """def inorder(self, node):
     if node is None:
@@ -470,6 +574,54 @@ TREE_TRAVERSAL_LEVELORDER = """def levelorder(self, root):
         if node.right:
             queue.append(node.right)"""
 
+# ==================== 二叉堆代码模板 ====================
+HEAP_PUSH = """def push(self, value):
+    self.data.append(value)
+    self._sift_up(len(self.data) - 1)
+
+def _sift_up(self, i):  # before(a, b): 最小堆为 a < b，最大堆为 a > b
+    while i > 0:
+        parent = (i - 1) // 2
+        if not self.before(self.data[i], self.data[parent]):
+            break
+        self.data[i], self.data[parent] = self.data[parent], self.data[i]
+        i = parent"""
+
+HEAP_POP = """def pop(self):
+    if not self.data:
+        return None
+    top = self.data[0]
+    last = self.data.pop()
+    if self.data:
+        self.data[0] = last
+        self._sift_down(0)
+    return top
+
+def _sift_down(self, i):
+    n = len(self.data)
+    while True:
+        best, left, right = i, 2 * i + 1, 2 * i + 2
+        if left < n and self.before(self.data[left], self.data[best]):
+            best = left
+        if right < n and self.before(self.data[right], self.data[best]):
+            best = right
+        if best == i:
+            break
+        self.data[i], self.data[best] = self.data[best], self.data[i]
+        i = best"""
+
+HEAP_HEAPIFY = """def heapify(self, values):  # 自底向上建堆，O(n)
+    self.data = list(values)
+    for i in range(len(self.data) // 2 - 1, -1, -1):
+        self._sift_down(i)"""
+
+HEAP_DECREASE_KEY = """def decrease_key(self, i, value):  # 提升优先级
+    if not 0 <= i < len(self.data) or self.before(self.data[i], value):
+        return False
+    self.data[i] = value
+    self._sift_up(i)
+    return True"""
+
 # ==================== Huffman 树代码模板 ====================
 HUFFMAN_BUILD = """def build_huffman_tree(self, frequencies):
     # 创建最小堆
@@ -499,6 +651,28 @@ HUFFMAN_BUILD = """def build_huffman_tree(self, frequencies):
     # 最后一个节点就是根节点
     self.root = heap[0][1] if heap else None"""
 
+HUFFMAN_BUILD_TWO_QUEUE = """def build_huffman_two_queue(self, sorted_frequencies):
+    # 叶子队列：权重已按升序排好；合并队列：新节点依次追加，天然有序
+    leaves = deque(HuffmanNode(char, freq) for char, freq in sorted_frequencies)
+    merged = deque()
+
+    def pop_min():
+        # 比较两个队首，取较小者（相等时优先取叶子）
+        if not merged or (leaves and leaves[0].weight <= merged[0].weight):
+            return leaves.popleft()
+        return merged.popleft()
+
+    # 每轮取两个最小节点合并，O(1)
+    while len(leaves) + len(merged) > 1:
+        left = pop_min()
+        right = pop_min()
+        node = HuffmanNode(None, left.weight + right.weight)
+        node.left, node.right = left, right
+        # 新权重不小于之前所有合并结果，直接追加到队尾
+        merged.append(node)
+
+    self.root = leaves[0] if leaves else merged[0]"""
+
 HUFFMAN_ENCODE = """def encode(self, text):
     # 检查编码表是否已生成
     if not self.huffman_codes:
@@ -606,8 +780,12 @@ PYTHON_CODE_TEMPLATES = {
     'bst_insert': BST_INSERT,
     'bst_delete': BST_DELETE,
     'bst_search': BST_SEARCH,
+    'bst_select': BST_SELECT,
+    'bst_rank': BST_RANK,
     'avl_insert': AVL_INSERT,
     'avl_delete': AVL_DELETE,
+    'rbt_insert': RBT_INSERT,
+    'rbt_delete': RBT_DELETE,
 
     # 树遍历
     'tree_traversal_inorder': TREE_TRAVERSAL_INORDER,
@@ -618,8 +796,15 @@ PYTHON_CODE_TEMPLATES = {
     'tree_traversal_inorder_iterative': TREE_TRAVERSAL_INORDER_ITERATIVE,
     'tree_traversal_postorder_iterative': TREE_TRAVERSAL_POSTORDER_ITERATIVE,
 
+    # 二叉堆
+    'heap_push': HEAP_PUSH,
+    'heap_pop': HEAP_POP,
+    'heap_heapify': HEAP_HEAPIFY,
+    'heap_decrease_key': HEAP_DECREASE_KEY,
+
     # Huffman树
     'huffman_build': HUFFMAN_BUILD,
+    'huffman_build_two_queue': HUFFMAN_BUILD_TWO_QUEUE,
     'huffman_encode': HUFFMAN_ENCODE,
     'huffman_decode': HUFFMAN_DECODE,
     'huffman_generate_codes': HUFFMAN_GENERATE_CODES,
@@ -30,9 +30,10 @@ class Operation(ASTNode):
 
 @dataclass
 class InitOperation(Operation):
-    """初始化操作 init [1, 2, 3] 或 init [1, 2, 3] capacity 10"""
+    """初始化操作 init [1, 2, 3] 或 init [1, 2, 3] capacity 10 [circular]"""
     values: List[Any]
     capacity: Optional[int] = None
+    circular: bool = False  # 仅队列：循环队列
 
 @dataclass
 class InsertOperation(Operation):
@@ -116,8 +117,9 @@ class RearOperation(Operation):
 
 @dataclass
 class BuildOperation(Operation):
-    """构建操作 build [1, 2, 3, null, 4]"""
+    """构建操作 build [1, 2, 3, null, 4] 或 build [1, 2, 3] balanced"""
     values: List[Any]
+    balanced: bool = False  # 仅 BST / AVL / RBTree：平衡构建
 
 
 @dataclass
@@ -144,6 +146,32 @@ class MaxOperation(Operation):
     pass
 
 
+@dataclass
+class SelectOperation(Operation):
+    """第 k 小（k 从 0 开始） select 2"""
+    k: Any
+
+
+@dataclass
+class RankOperation(Operation):
+    """小于 value 的值的个数 rank 40"""
+    value: Any
+
+
+@dataclass
+class CountRangeOperation(Operation):
+    """闭区间内的值的个数 count_range 10 50"""
+    lo: Any
+    hi: Any
+
+
+@dataclass
+class DecreaseKeyOperation(Operation):
+    """堆中按下标修改键值 decrease_key 3 1"""
+    index: Any
+    value: Any
+
+
 @dataclass
 class ReverseOperation(Operation):
     """反转操作 reverse"""
@@ -9,6 +9,9 @@ import re
 import string
 from typing import Dict, Any, List, Optional
 from .ast_nodes import *
+from ..logger import get_logger
+
+logger = get_logger(__name__)
 
 class ExecutionContext:
     """执行上下文"""
@@ -36,7 +39,7 @@ class Interpreter:
     def log(self, message: str):
         """记录日志"""
         self.execution_log.append(message)
-        print(f"[Interpreter] {message}")
+        logger.debug("[Interpreter] %s", message)
 
     def error(self, message: str):
         """报错"""
@@ -58,6 +61,8 @@ class Interpreter:
         type_map = {
             'SequentialList': 'sequential',
             'LinearLinkedList': 'linked',
+            'DoublyLinkedList': 'doubly',
+            'CircularLinkedList': 'circular',
             'SequentialStack': 'stack',
             'LinkedStack': 'stack',
             'SequentialQueue': 'queue',
@@ -65,8 +70,11 @@ class Interpreter:
             'BinaryTree': 'binary',
             'BinarySearchTree': 'bst',
             'AVLTree': 'avl',
+            'RedBlackTree': 'rbt',
             'HuffmanTree': 'huffman'
         }
+        if class_name == 'BinaryHeap':
+            return 'maxheap' if structure.get_kind() == 'max' else 'heap'
         return type_map.get(class_name, 'unknown')
 
     def register_structure_mapping(self, name: str, structure_id: str):
@@ -121,12 +129,17 @@ class Interpreter:
         type_mapping = {
             'Sequential': 'sequential',
             'Linked': 'linked',
+            'Doubly': 'doubly',
+            'Circular': 'circular',
             'Stack': 'stack',
             'Queue': 'queue',
             'Binary': 'binary',
             'BST': 'bst',
             'AVL': 'avl',
-            'Huffman': 'huffman'
+            'RBTree': 'rbt',
+            'Huffman': 'huffman',
+            'Heap': 'heap',
+            'MaxHeap': 'maxheap'
         }
 
         backend_type = type_mapping.get(decl.structure_type)
@@ -208,6 +221,8 @@ class Interpreter:
             # 评估随机数
             values = self.evaluate_value(operation.values)
             capacity_info = f" capacity {operation.capacity}" if operation.capacity else ""
+            if operation.circular:
+                capacity_info += " circular"
             self.log(f"  init {values}{capacity_info}")
 
             # 如果指定了 capacity 且结构支持设置容量，先更新容量
@@ -218,16 +233,16 @@ class Interpreter:
                 structure._size = 0
                 self.log(f"    设置容量: {old_capacity} -> {operation.capacity}")
 
+            if operation.circular and hasattr(structure, '_circular'):
+                # 循环队列需要固定容量
+                structure._circular = structure._capacity is not None
+
             if hasattr(structure, 'initlist'):
                 structure.initlist(values)
-            else:
-                for value in values:
-                    # 线性结构按索引插入，树形结构直接按值插入
-                    if struct_type in ['bst', 'binary', 'avl', 'huffman']:
-                        structure.insert(value)
-                    else:
-                        structure.insert(structure.size(), value)
-            op_record['details'] = {'values': values, 'capacity': operation.capacity}
+            elif hasattr(structure, 'bulk_insert'):
+                # 树形结构整批插入，只记录一个汇总步骤
+                structure.bulk_insert(values)
+            op_record['details'] = {'values': values, 'capacity': operation.capacity, 'circular': operation.circular}
 
         elif isinstance(operation, InsertOperation):
             # 评估随机数
@@ -239,12 +254,12 @@ class Interpreter:
             self.log(f"  insert {value}" + (f" at {index}" if index is not None else "") + (f" {direction}" if direction else ""))
 
             # 针对不同结构类型区分处理
-            if struct_type in ['stack']:
+            if struct_type in ['stack', 'heap', 'maxheap']:
                 structure.push(value)
             elif struct_type in ['binary']:
                 # 支持按父节点左/右插入
                 structure.insert(value, parent_id=parent_id, direction=direction)
-            elif struct_type in ['bst', 'avl', 'huffman']:
+            elif struct_type in ['bst', 'avl', 'rbt', 'huffman']:
                 # 这些树形结构的 insert 不需要 index
                 structure.insert(value)
             else:
@@ -255,7 +270,7 @@ class Interpreter:
             op_record['details'] = {'value': value, 'index': index, 'direction': direction}
 
         elif isinstance(operation, DeleteOperation):
-            tree_types = {'bst', 'binary', 'avl', 'huffman'}
+            tree_types = {'bst', 'binary', 'avl', 'rbt', 'huffman'}
 
             # 树结构：只按值删除，直接调用 delete(value)
             if struct_type in tree_types:
@@ -376,10 +391,15 @@ class Interpreter:
 
         elif isinstance(operation, BuildOperation):
             values = self.evaluate_value(operation.values)
-            self.log(f"  build {values}")
-            if hasattr(structure, 'build_from_list'):
+            self.log(f"  build {values}" + (" balanced" if operation.balanced else ""))
+            if operation.balanced and hasattr(structure, 'build_balanced'):
+                structure.build_balanced(values)
+            elif hasattr(structure, 'heapify'):
+                # 堆：自底向上一次建堆
+                structure.heapify(values)
+            elif hasattr(structure, 'build_from_list'):
                 structure.build_from_list(values)
-            op_record['details'] = {'values': values}
+            op_record['details'] = {'values': values, 'balanced': operation.balanced}
 
         elif isinstance(operation, TraverseOperation):
             self.log(f"  traverse {operation.method}")
@@ -420,6 +440,44 @@ class Interpreter:
             self.log(f"    结果: {result}")
             op_record['details'] = {'result': result}
 
+        elif isinstance(operation, SelectOperation):
+            k = self.evaluate_value(operation.k)
+            self.log(f"  select {k}")
+            if not hasattr(structure, 'select'):
+                self.error(f"Structure does not support select")
+            result = structure.select(int(k))
+            self.log(f"    结果: {result}")
+            op_record['details'] = {'k': k, 'result': result}
+
+        elif isinstance(operation, RankOperation):
+            value = self.evaluate_value(operation.value)
+            self.log(f"  rank {value}")
+            if not hasattr(structure, 'rank'):
+                self.error(f"Structure does not support rank")
+            result = structure.rank(value)
+            self.log(f"    结果: {result}")
+            op_record['details'] = {'value': value, 'result': result}
+
+        elif isinstance(operation, CountRangeOperation):
+            lo = self.evaluate_value(operation.lo)
+            hi = self.evaluate_value(operation.hi)
+            self.log(f"  count_range {lo} {hi}")
+            if not hasattr(structure, 'count_range'):
+                self.error(f"Structure does not support count_range")
+            result = structure.count_range(lo, hi)
+            self.log(f"    结果: {result}")
+            op_record['details'] = {'lo': lo, 'hi': hi, 'result': result}
+
+        elif isinstance(operation, DecreaseKeyOperation):
+            index = self.evaluate_value(operation.index)
+            value = self.evaluate_value(operation.value)
+            self.log(f"  decrease_key {index} {value}")
+            if not hasattr(structure, 'decrease_key'):
+                self.error(f"Structure does not support decrease_key")
+            result = structure.decrease_key(int(index), value)
+            self.log(f"    结果: {result}")
+            op_record['details'] = {'index': index, 'value': value, 'result': result}
+
         elif isinstance(operation, ReverseOperation):
             self.log(f"  reverse")
             if hasattr(structure, 'reverse'):
@@ -532,11 +590,15 @@ class Interpreter:
         struct_type = struct_info['type']
 
         # 线性结构
-        if struct_type in ['sequential', 'linked', 'stack', 'queue']:
+        if struct_type in ['sequential', 'linked', 'doubly', 'circular', 'stack', 'queue']:
             return structure.to_list()
 
         # 树结构
-        elif struct_type in ['binary', 'bst', 'avl', 'huffman']:
+        elif struct_type in ['binary', 'bst', 'avl', 'rbt', 'huffman']:
+            return structure.get_tree_data()
+
+        # 堆：数组 + 树两种视图
+        elif struct_type in ['heap', 'maxheap']:
             return structure.get_tree_data()
 
         return None
@@ -595,22 +657,31 @@ class SimpleStructureManager:
         # 实际使用时应该返回 dsvision.linear 或 dsvision.tree 中的实例
         from dsvision.linear.sequential_list import SequentialList
         from dsvision.linear.linked_list import LinearLinkedList
+        from dsvision.linear.doubly_linked_list import DoublyLinkedList
+        from dsvision.linear.circular_linked_list import CircularLinkedList
         from dsvision.linear.stack import SequentialStack
         from dsvision.linear.queue import SequentialQueue
         from dsvision.tree.binary_tree import BinaryTree
         from dsvision.tree.binary_search_tree import BinarySearchTree
         from dsvision.tree.avl_tree import AVLTree
+        from dsvision.tree.red_black_tree import RedBlackTree
         from dsvision.tree.huffman import HuffmanTree
+        from dsvision.tree.heap import BinaryHeap
 
         type_map = {
             'sequential': SequentialList,
             'linked': LinearLinkedList,
+            'doubly': DoublyLinkedList,
+            'circular': CircularLinkedList,
             'stack': SequentialStack,
             'queue': SequentialQueue,
             'binary': BinaryTree,
             'bst': BinarySearchTree,
             'avl': AVLTree,
-            'huffman': HuffmanTree
+            'rbt': RedBlackTree,
+            'huffman': HuffmanTree,
+            'heap': BinaryHeap,
+            'maxheap': lambda: BinaryHeap('max')
         }
 
         cls = type_map.get(struct_type)
@@ -7,12 +7,17 @@ class TokenType(Enum):
     #关键字
     SEQUENTIAL = "SEQUENTIAL"
     LINKED = "LINKED"
+    DOUBLY = "DOUBLY"
+    CIRCULAR = "CIRCULAR"
     STACK = "STACK"
     QUEUE = "QUEUE"
     BINARY = "BINARY"
     BST = "BST"
     AVL = "AVL"
+    RBTREE = "RBTREE"
     HUFFMAN = "HUFFMAN"
+    HEAP = "HEAP"
+    MAXHEAP = "MAXHEAP"
 
     #操作关键字
     INIT = "INIT"
@@ -36,11 +41,18 @@ class TokenType(Enum):
 
     #树操作
     BUILD = "BUILD"
+    BALANCED = "BALANCED"
     TRAVERSE = "TRAVERSE"
     HEIGHT = "HEIGHT"
     MIN = "MIN"
     MAX = "MAX"
     REVERSE = "REVERSE"
+    SELECT = "SELECT"
+    RANK = "RANK"
+    COUNT_RANGE = "COUNT_RANGE"
+
+    #堆操作
+    DECREASE_KEY = "DECREASE_KEY"
 
     #HUFFMAN
     BUILD_TEXT = "BUILD_TEXT"
@@ -118,12 +130,17 @@ class Lexer:
     KEYWORDS = {
         'sequential': TokenType.SEQUENTIAL,
         'linked': TokenType.LINKED,
+        'doubly': TokenType.DOUBLY,
+        'circular': TokenType.CIRCULAR,
         'stack': TokenType.STACK,
         'queue': TokenType.QUEUE,
         'binary': TokenType.BINARY,
         'bst': TokenType.BST,
         'avl': TokenType.AVL,
+        'rbtree': TokenType.RBTREE,
         'huffman': TokenType.HUFFMAN,
+        'heap': TokenType.HEAP,
+        'maxheap': TokenType.MAXHEAP,
 
         'init': TokenType.INIT,
         'insert': TokenType.INSERT,
@@ -144,11 +161,16 @@ class Lexer:
         'rear': TokenType.REAR,
 
         'build': TokenType.BUILD,
+        'balanced': TokenType.BALANCED,
         'traverse': TokenType.TRAVERSE,
         'height': TokenType.HEIGHT,
         'min': TokenType.MIN,
         'max': TokenType.MAX,
         'reverse': TokenType.REVERSE,
+        'select': TokenType.SELECT,
+        'rank': TokenType.RANK,
+        'count_range': TokenType.COUNT_RANGE,
+        'decrease_key': TokenType.DECREASE_KEY,
 
         'build_text': TokenType.BUILD_TEXT,
         'build_freq': TokenType.BUILD_FREQ,
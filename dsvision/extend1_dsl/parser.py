@@ -72,8 +72,10 @@ class Parser:
 
         # 获取结构类型
         structure_types = [
-            TokenType.SEQUENTIAL, TokenType.LINKED, TokenType.STACK, TokenType.QUEUE,
-            TokenType.BINARY, TokenType.BST, TokenType.AVL, TokenType.HUFFMAN
+            TokenType.SEQUENTIAL, TokenType.LINKED, TokenType.DOUBLY, TokenType.CIRCULAR,
+            TokenType.STACK, TokenType.QUEUE,
+            TokenType.BINARY, TokenType.BST, TokenType.AVL, TokenType.RBTREE, TokenType.HUFFMAN,
+            TokenType.HEAP, TokenType.MAXHEAP
         ]
 
         if self.current_token.type not in structure_types:
@@ -121,16 +123,21 @@ class Parser:
         line = token.line
         column = token.column
 
-        # init [1, 2, 3] 或 init [1, 2, 3] capacity 10
+        # init [1, 2, 3] 或 init [1, 2, 3] capacity 10 [circular]
         if token.type == TokenType.INIT:
             self.advance()
             values = self.parse_array()
             capacity = None
+            circular = False
             # 检查是否有 capacity 关键字
             if self.current_token and self.current_token.type == TokenType.CAPACITY:
                 self.advance()  # 跳过 capacity
                 capacity = self.expect(TokenType.NUMBER).value
-            return InitOperation(values=values, capacity=capacity, line=line, column=column)
+            # 队列可追加 circular 使用循环队列
+            if self.current_token and self.current_token.type == TokenType.CIRCULAR:
+                self.advance()
+                circular = True
+            return InitOperation(values=values, capacity=capacity, circular=circular, line=line, column=column)
 
         # insert 10 at 2
         elif token.type == TokenType.INSERT:
@@ -239,11 +246,16 @@ class Parser:
             self.advance()
             return RearOperation(line=line, column=column)
 
-        # build [1, 2, 3, null, 4]
+        # build [1, 2, 3, null, 4] 或 build [1, 2, 3] balanced
         elif token.type == TokenType.BUILD:
             self.advance()
             values = self.parse_array()
-            return BuildOperation(values=values, line=line, column=column)
+            balanced = False
+            # BST / AVL / RBTree 可追加 balanced：排序去重后直接建成平衡树
+            if self.current_token and self.current_token.type == TokenType.BALANCED:
+                self.advance()
+                balanced = True
+            return BuildOperation(values=values, balanced=balanced, line=line, column=column)
 
         # traverse inorder
         elif token.type == TokenType.TRAVERSE:
@@ -270,6 +282,32 @@ class Parser:
             self.advance()
             return MaxOperation(line=line, column=column)
 
+        # select 2（第 k 小，k 从 0 开始）
+        elif token.type == TokenType.SELECT:
+            self.advance()
+            k = self.parse_value()
+            return SelectOperation(k=k, line=line, column=column)
+
+        # rank 40
+        elif token.type == TokenType.RANK:
+            self.advance()
+            value = self.parse_value()
+            return RankOperation(value=value, line=line, column=column)
+
+        # count_range 10 50
+        elif token.type == TokenType.COUNT_RANGE:
+            self.advance()
+            lo = self.parse_value()
+            hi = self.parse_value()
+            return CountRangeOperation(lo=lo, hi=hi, line=line, column=column)
+
+        # decrease_key 3 1（把下标 3 的键值改为 1）
+        elif token.type == TokenType.DECREASE_KEY:
+            self.advance()
+            index = self.parse_value()
+            value = self.parse_value()
+            return DecreaseKeyOperation(index=index, value=value, line=line, column=column)
+
         # reverse
         elif token.type == TokenType.REVERSE:
             self.advance()
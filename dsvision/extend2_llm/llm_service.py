@@ -9,16 +9,23 @@ import json
 from dotenv import load_dotenv
 load_dotenv()
 
+try:
+    from ..logger import get_logger
+except ImportError:  # 在本目录下作为独立脚本导入（test_llm.py）
+    from logging import getLogger as get_logger
+
+logger = get_logger(__name__)
+
 # ==================== 配置部分 ====================
 LLM_PROVIDER = os.getenv('LLM_PROVIDER', 'openai')
 LLM_BASE_URL = os.getenv('LLM_BASE_URL', None)  # 可选,用于第三方API或代理
 API_KEY = os.getenv('LLM_API_KEY')
 if not API_KEY:
     raise ValueError("未设置 LLM_API_KEY,请在 .env 文件中配置")
-print(f"✓ LLM配置加载成功")
-print(f"  - 提供商: {LLM_PROVIDER}")
-print(f"  - Base URL: {LLM_BASE_URL or '默认'}")
-print(f"  - API Key: {API_KEY[:15]}..." if len(API_KEY) > 15 else f"  - API Key: {API_KEY}")
+logger.info(f"✓ LLM配置加载成功")
+logger.debug(f"  - 提供商: {LLM_PROVIDER}")
+logger.debug(f"  - Base URL: {LLM_BASE_URL or '默认'}")
+logger.debug(f"  - API Key: {API_KEY[:15]}..." if len(API_KEY) > 15 else f"  - API Key: {API_KEY}")
 
 # ==================== 系统提示词 ====================
 SYSTEM_PROMPT = """你是DSVison,你的数据结构可视化系统的DSL代码生成助手。
@@ -66,8 +73,14 @@ SYSTEM_PROMPT = """你是DSVison,你的数据结构可视化系统的DSL代码
     2. 生成 `delete at <索引>`
     3. 例如：data=[5,6]，删除6 → `delete at 1` （6在索引1）
 - **Linked（链表）**：支持按值删除 `delete value`，也支持 `delete_head`, `delete_tail`
+- **Doubly（双向链表）/ Circular（循环链表）**：操作与 Linked 相同，`delete_tail` 经 tail 指针 O(1) 完成
 - **Stack/Queue**：使用特定操作 `pop`, `dequeue`
-- **BST/AVL/Binary**：支持按值删除 `delete value`
+  - 队列可写 `init [1, 2] capacity 5 circular` 使用循环队列（出队腾出的槽位会被复用，不会无限扩容）
+- **BST/AVL/RBTree/Binary**：支持按值删除 `delete value`
+  - BST/AVL/RBTree 可写 `build [1, 2, 3, 4, 5] balanced` 一次建成平衡树（排序去重，不逐个插入、不旋转）
+  - BST/AVL/RBTree 顺序统计："第k小" → `select <k-1>`（k 从 0 开始，第1小写 `select 0`）；"比x小的有几个/x的排名" → `rank x`；"[a, b] 之间有几个" → `count_range a b`
+- **Heap（最小堆）/ MaxHeap（最大堆）**：`build [...]` 建堆，`push x` 入堆，`pop` 取出堆顶，`peek` 查看堆顶
+  - "把下标 i 的元素改为 x / 提升优先级" → `decrease_key i x`（最小堆新值必须更小，最大堆新值必须更大）
 
 ### 线性结构
 ```
@@ -94,6 +107,12 @@ Linked myLinkedList {
     delete_tail           # 删除尾节点
 }
 
+Doubly myDoubly {
+    init [1, 2, 3]
+    insert_tail 4
+    delete_tail           # 经 tail.prev 直接删除，无需遍历
+}
+
 Stack myStack {
     init [] capacity 5   # 🔥 指定槽位数，默认5；不写则无限
     push 1
@@ -106,7 +125,7 @@ Stack myStack {
 ## 容量/长度需求处理（顺序表/栈）
 - 用户若提到“长度/容量/最多/size/limit/空间 N”，为 Sequential/Stack 添加 `capacity N`
 - 若已有 `capacity`，不要重复添加
-- Huffman/BST/AVL 不需要容量
+- Huffman/BST/AVL/RBTree 不需要容量
 
 ### 树结构
 ```
@@ -122,11 +141,11 @@ BST myBST {
 Binary myTree {
     # 任意形状二叉树，支持按父节点ID定向插入
     insert 6                # 自动按层序填充空位
-    insert 8 at 4352 left   # 将 8 插为 node_id=4352 的左子节点（right 同理）
+    insert 8 at 3 left      # 将 8 插为 node_id=3 的左子节点（right 同理）
 }
 
 💡 当用户说“在值为5的节点右边插入8”，你必须：
-1) 使用上下文提供的节点列表（格式 value#id，例如 5#4352）找到 value=5 对应的 node_id
+1) 使用上下文提供的节点列表（格式 value#id，例如 5#3）找到 value=5 对应的 node_id
 2) 生成 Binary 的 DSL（不要写 BST/AVL）
 3) 使用 `insert 8 at <node_id> right`（left 同理）
 
@@ -136,6 +155,21 @@ AVL myAVL {
     insert 30
 }
 
+RBTree myRBT {
+    # 红黑树：插入/删除后变色、旋转保持平衡，旋转比 AVL 少
+    insert 10
+    insert 20
+    insert 30
+    delete 10
+}
+
+Heap myHeap {
+    build [9, 4, 7, 1]
+    push 3
+    decrease_key 3 0
+    pop
+}
+
 Huffman myHuffman {
     build_text "HELLO"
     show_codes
@@ -301,7 +335,7 @@ class GroqProvider:
         from groq import Groq
 
         self.client = Groq(api_key=api_key)
-        print("✓ Groq 客户端初始化成功")
+        logger.info("✓ Groq 客户端初始化成功")
 
     def generate(self, user_message: str) -> Dict:
         try:
@@ -338,8 +372,8 @@ class ClaudeProvider:
 
         # 增加超时时间到 120 秒
         self.client = Anthropic(api_key=api_key, timeout=120.0)
-        print("✓ Claude 客户端初始化成功")
-        print(f"✓ 超时设置: 120.0 秒")
+        logger.info("✓ Claude 客户端初始化成功")
+        logger.info(f"✓ 超时设置: 120.0 秒")
 
     def generate(self, user_message: str) -> Dict:
         try:
@@ -380,13 +414,13 @@ class OpenAIProvider:
             # OpenRouter 需要较长的超时时间
             timeout = 120.0  # 增加超时时间到 120 秒
             self.client = OpenAI(api_key=api_key, base_url=base_url, timeout=timeout)
-            print(f"✓ 使用自定义 Base URL: {base_url}")
-            print(f"✓ 超时设置: {timeout} 秒")
+            logger.info(f"✓ 使用自定义 Base URL: {base_url}")
+            logger.info(f"✓ 超时设置: {timeout} 秒")
         else:
             self.client = OpenAI(api_key=api_key)
-            print("✓ 使用默认 OpenAI API")
+            logger.info("✓ 使用默认 OpenAI API")
 
-        print("✓ OpenAI 客户端初始化成功")
+        logger.info("✓ OpenAI 客户端初始化成功")
 
     def generate(self, user_message: str) -> Dict:
         try:
@@ -399,7 +433,7 @@ class OpenAIProvider:
 
             # 如果使用OpenRouter，不使用response_format（某些模型不支持）
             # 改为在system prompt中要求JSON格式
-            print(f"🔄 正在调用 OpenAI API (模型: {model})...")
+            logger.debug(f"🔄 正在调用 OpenAI API (模型: {model})...")
             response = self.client.chat.completions.create(
                 model=model,
                 messages=[
@@ -415,22 +449,22 @@ class OpenAIProvider:
 
             # 获取响应内容
             content = response.choices[0].message.content
-            print(f"✓ API响应成功")
-            print(f"原始响应内容: {content}")
+            logger.info(f"✓ API响应成功")
+            logger.debug(f"原始响应内容: {content}")
 
             # 🔥 处理markdown代码块格式（```json ... ```）
             import re
             json_match = re.search(r'```json\s*\n(.*?)\n```', content, re.DOTALL)
             if json_match:
                 content = json_match.group(1).strip()
-                print(f"✓ 提取到JSON内容: {content}")
+                logger.info(f"✓ 提取到JSON内容: {content}")
 
             # 尝试解析JSON
             try:
                 result = json.loads(content)
             except json.JSONDecodeError as json_err:
-                print(f"❌ JSON解析失败: {json_err}")
-                print(f"原始内容: {repr(content)}")
+                logger.error(f"❌ JSON解析失败: {json_err}")
+                logger.debug(f"原始内容: {repr(content)}")
                 return {
                     'success': False,
                     'error': f'LLM返回的内容不是有效的JSON格式: {content[:200]}...',
@@ -445,7 +479,7 @@ class OpenAIProvider:
             }
 
         except Exception as e:
-            print(f"❌ API调用失败: {type(e).__name__}: {str(e)}")
+            logger.error(f"❌ API调用失败: {type(e).__name__}: {str(e)}")
             import traceback
             traceback.print_exc()
             return {
@@ -486,20 +520,18 @@ class LLMService:
                 'provider': str
             }
         """
-        print(f"\n{'=' * 60}")
-        print(f"[LLM服务] 处理用户输入")
-        print(f"提供商: {self.provider_name}")
-        print(f"用户: {user_input}")
-        print(f"{'=' * 60}\n")
+        logger.debug(f"[LLM服务] 处理用户输入")
+        logger.debug(f"提供商: {self.provider_name}")
+        logger.debug(f"用户: {user_input}")
 
         result = self.provider.generate(user_input)
 
         if result['success']:
-            print(f"✓ DSL生成成功")
-            print(f"代码:\n{result['dsl_code']}")
-            print(f"说明: {result['explanation']}\n")
+            logger.info(f"✓ DSL生成成功")
+            logger.debug(f"代码:\n{result['dsl_code']}")
+            logger.debug(f"说明: {result['explanation']}")
         else:
-            print(f"✗ 生成失败: {result['error']}\n")
+            logger.error(f"✗ 生成失败: {result['error']}")
 
         return result
 
@@ -1,7 +1,9 @@
 from .base import LinearStructureBase
 from .sequential_list import SequentialList
 from .linked_list import LinearNode,LinearLinkedList
+from .doubly_linked_list import DoublyLinkedList
+from .circular_linked_list import CircularLinkedList
 from .stack import SequentialStack
 from .queue import SequentialQueue
 
-__all__ = ['LinearStructureBase','SequentialList','LinearNode','LinearLinkedList','SequentialStack','SequentialQueue']
+__all__ = ['LinearStructureBase','SequentialList','LinearNode','LinearLinkedList','DoublyLinkedList','CircularLinkedList','SequentialStack','SequentialQueue']
@@ -1,11 +1,11 @@
 from abc import ABC,abstractmethod
 from typing import List, Optional, Any, Tuple
-from ..operation.operation import OperationStep
+from ..operation.operation import OperationStep, OperationType, TraceLevel
+from ..operation.recorder import OperationRecorder
 
-class LinearStructureBase(ABC):
+class LinearStructureBase(OperationRecorder, ABC):
     def __init__(self):
-        self._operation_history: List[OperationStep] = []
-        self._current_step = -1
+        super().__init__()
 
     @abstractmethod
     def initlist(self,values:List[Any]) -> bool:
@@ -32,28 +32,68 @@ class LinearStructureBase(ABC):
         pass
     ###后面还差 转列表、添加操作步骤、获取操作历史、清空操作历史、保存当前状态
 
-    def add_operation_step(self,step:OperationStep) -> None:
-        """添加操作步骤"""
-        self._operation_history.append(step)
-        self._current_step += 1
+    # ==================== 批量操作 ====================
+
+    def extend(self, values: List[Any]) -> bool:
+        """在末尾批量追加，只记录一个汇总步骤"""
+        return self.bulk_insert(self.size(), values)
+
+    def bulk_insert(self, index: int, values: List[Any]) -> bool:
+        """
+        从 index 起依次插入 values，只记录一个汇总步骤，返回是否全部插入
+        默认逐个调用 insert 并关闭其步骤记录；顺序表/栈/队列/链表用整段搬移或整段拼接覆盖
+        """
+        values = list(values)
+        inserted = 0
+        with self.trace_scope(TraceLevel.OFF):
+            for value in values:
+                if not self.insert(index + inserted, value):
+                    break
+                inserted += 1
+        self._bulk_step(OperationType.INSERT, index, values[:inserted], len(values))
+        return inserted == len(values)
+
+    def bulk_delete(self, index: int, count: int) -> List[Any]:
+        """从 index 起删除 count 个元素（超出末尾的部分忽略），只记录一个汇总步骤，返回被删除的元素"""
+        requested = count
+        count = max(0, min(count, self.size() - index))
+        with self.trace_scope(TraceLevel.OFF):
+            deleted = [self.delete(index) for _ in range(count)]
+        self._bulk_step(OperationType.DELETE, index, deleted, requested)
+        return deleted
+
+    def _bulk_step(self, operation: OperationType, index: int, values: List[Any], requested: int) -> None:
+        """批量操作的汇总步骤；未能全部完成时说明实际处理了多少个"""
+        if not self._tracing(TraceLevel.SUMMARY):
+            return
+        prefix = 'linear_bulk_insert' if operation == OperationType.INSERT else 'linear_bulk_delete'
+        step = OperationStep(
+            operation,
+            index=index,
+            message_id=prefix if len(values) == requested else prefix + '_partial',
+            message_args={'count': len(values), 'requested': requested, 'index': index, 'values': values},
+            highlight_indices=list(range(index, index + len(values))) if operation == OperationType.INSERT else None,
+            animation_type="highlight",
+            data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+        )
+        self.add_operation_step(step, TraceLevel.SUMMARY)
 
     def remove_operation_step(self,step:OperationStep) -> None:
         self._operation_history.remove(step)
         self._current_step -= 1
 
-    def get_operation_history(self) -> List[OperationStep]:
-        return self._operation_history.copy()
-
-    def clear_operation_history(self) -> None:
-        self._operation_history.clear()
-        self._current_step = -1
+    def _trace_snapshot(self, level: TraceLevel = TraceLevel.FULL) -> Optional[List[Any]]:
+        """步骤用的数据快照；当前记录级别不需要该级别步骤时返回 None，避免无用的 O(n) 复制"""
+        if not self._tracing(level):
+            return None
+        return self.to_list()
 
     def save_state(self)->dict:
         """保存当前状态"""
         return {
             'size': self.size(),
             'is_empty': self.is_empty(),
-            'operation_history': [step.to_dict() for step in self._operation_history]
+            'operation_history': self.history_to_dicts()
         }
 
     def to_list(self) -> List[Any]:
@@ -0,0 +1,213 @@
+"""
+数组型结构（顺序表 / 顺序栈 / 顺序队列）共用的容量策略
+
+CapacityPolicy 决定何时、扩缩到多大；ResizableArrayMixin 负责缩容过程与均摊代价统计：
+每次扩容/缩容都要把现有元素复制到新数组，累计复制次数 ÷ 插入次数 就是每次插入的均摊复制代价
+（按倍数扩容时它有常数上界，这正是动态数组插入均摊 O(1) 的原因）
+"""
+from typing import Any, Dict, List, Optional
+
+from ..operation.operation import OperationStep, OperationType, TraceLevel
+
+
+class CapacityPolicy:
+    """
+    扩容 / 缩容策略
+    growth_factor: 存满时容量乘以该倍数（至少 +1）
+    shrink_threshold: 删除后元素数低于 容量 × 该比例 时缩容到 容量 / growth_factor，0 表示不缩容
+    max_capacity: 容量上限，None 表示不限
+    为避免在临界点反复扩容、缩容，要求 shrink_threshold × growth_factor < 1
+    """
+
+    def __init__(self, growth_factor: float = 1.5, shrink_threshold: float = 0.0,
+                 max_capacity: Optional[int] = None, min_capacity: int = 1):
+        if growth_factor <= 1:
+            raise ValueError(f"扩容倍数必须大于 1: {growth_factor}")
+        if not 0 <= shrink_threshold < 1:
+            raise ValueError(f"缩容阈值必须在 [0, 1) 之间: {shrink_threshold}")
+        if shrink_threshold * growth_factor >= 1:
+            raise ValueError(f"缩容阈值 {shrink_threshold} 必须小于 1/扩容倍数（{1 / growth_factor:.3f}）")
+        if min_capacity < 1:
+            raise ValueError(f"最小容量必须至少为 1: {min_capacity}")
+        if max_capacity is not None and max_capacity < min_capacity:
+            raise ValueError(f"最大容量 {max_capacity} 小于最小容量 {min_capacity}")
+        self.growth_factor = growth_factor
+        self.shrink_threshold = shrink_threshold
+        self.max_capacity = max_capacity
+        self.min_capacity = min_capacity
+
+    @classmethod
+    def from_options(cls, options: Dict[str, Any]) -> Optional['CapacityPolicy']:
+        """从请求参数构造（growth_factor / shrink_threshold / max_capacity），都没提供时返回 None"""
+        keys = ('growth_factor', 'shrink_threshold', 'max_capacity')
+        if not any(options.get(key) not in (None, '') for key in keys):
+            return None
+        max_capacity = options.get('max_capacity')
+        return cls(
+            growth_factor=float(options.get('growth_factor') or 1.5),
+            shrink_threshold=float(options.get('shrink_threshold') or 0.0),
+            max_capacity=int(max_capacity) if max_capacity not in (None, '') else None
+        )
+
+    def grow(self, capacity: int) -> Optional[int]:
+        """扩容后的容量；已达上限时返回 None"""
+        if self.max_capacity is not None and capacity >= self.max_capacity:
+            return None
+        new_capacity = max(int(capacity * self.growth_factor), capacity + 1)
+        if self.max_capacity is not None:
+            new_capacity = min(new_capacity, self.max_capacity)
+        return new_capacity
+
+    def shrink(self, size: int, capacity: int) -> Optional[int]:
+        """缩容后的容量；不需要缩容时返回 None"""
+        if not self.shrink_threshold or size >= capacity * self.shrink_threshold:
+            return None
+        new_capacity = max(int(capacity / self.growth_factor), self.min_capacity, size)
+        return new_capacity if new_capacity < capacity else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'growth_factor': self.growth_factor,
+            'shrink_threshold': self.shrink_threshold,
+            'max_capacity': self.max_capacity,
+        }
+
+
+# 默认策略：1.5 倍扩容、不缩容、不设上限
+DEFAULT_POLICY = CapacityPolicy()
+
+
+class ResizableArrayMixin:
+    """
+    顺序表 / 栈 / 队列共用：容量策略、缩容步骤和均摊代价统计
+    使用方需要有 _capacity、_data、size()，并实现 _items()（按逻辑顺序的元素）
+    """
+
+    def _init_capacity_policy(self, policy: Optional[CapacityPolicy]) -> None:
+        self._policy = policy or DEFAULT_POLICY
+        self._total_inserts = 0
+        self._total_copies = 0
+        self._expansions = 0
+        self._shrinks = 0
+
+    def _items(self) -> List[Any]:
+        """按逻辑顺序排列的元素（缩容时依次复制到新数组）"""
+        raise NotImplementedError
+
+    def _after_resize(self) -> None:
+        """换成新数组之后调整指针（队列把 front 归零），默认无需处理"""
+
+    def _record_inserts(self, count: int = 1) -> None:
+        self._total_inserts += count
+
+    def _record_resize(self, copied: int, shrink: bool = False) -> None:
+        self._total_copies += copied
+        if shrink:
+            self._shrinks += 1
+        else:
+            self._expansions += 1
+
+    def get_capacity_stats(self) -> Dict[str, Any]:
+        """容量与均摊代价：累计复制次数、每次插入平均复制多少个元素"""
+        return {
+            'capacity': self._capacity,
+            'size': self.size(),
+            'total_inserts': self._total_inserts,
+            'total_copies': self._total_copies,
+            'amortized_copies': round(self._total_copies / self._total_inserts, 3) if self._total_inserts else 0.0,
+            'expansions': self._expansions,
+            'shrinks': self._shrinks,
+            'policy': self._policy.to_dict(),
+        }
+
+    def _resize_hints(self) -> Dict[str, Any]:
+        """扩容/缩容完成步骤附带的均摊代价提示"""
+        stats = self.get_capacity_stats()
+        return {key: stats[key] for key in ('capacity', 'total_copies', 'amortized_copies')}
+
+    def _max_capacity_step(self) -> None:
+        """已达最大容量，无法继续扩容"""
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'已达到最大容量 {self._policy.max_capacity}，无法扩容',
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+
+    def _reserve(self, needed: int) -> None:
+        """
+        批量插入前一次性扩容到至少 needed：按策略倍数连续放大后只复制一次
+        受 max_capacity 限制时扩到上限为止，调用方按剩余空间决定能插入多少
+        """
+        if self._capacity is None or needed <= self._capacity:
+            return
+        new_capacity = self._capacity
+        while new_capacity < needed:
+            grown = self._policy.grow(new_capacity)
+            if grown is None:
+                break
+            new_capacity = grown
+        if new_capacity == self._capacity:
+            self._max_capacity_step()
+            return
+
+        old_capacity = self._capacity
+        size = self.size()
+        new_data = [None] * new_capacity
+        new_data[:size] = self._items()
+        self._data = new_data
+        self._capacity = new_capacity
+        self._after_resize()
+        self._record_resize(size)
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'批量扩容: {old_capacity} -> {new_capacity}，复制 {size} 个元素',
+                animation_type="fade",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY),
+                visual_hints=self._resize_hints()
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+
+    def _maybe_shrink(self) -> bool:
+        """删除之后元素过少时缩容，返回是否缩容"""
+        if self._capacity is None:
+            return False
+        size = self.size()
+        new_capacity = self._policy.shrink(size, self._capacity)
+        if new_capacity is None:
+            return False
+
+        old_capacity = self._capacity
+        if self._tracing():
+            step = OperationStep(
+                OperationType.SHRINK,
+                description=f'元素数 {size} 低于容量 {old_capacity} 的 {self._policy.shrink_threshold:.0%}，'
+                            f'触发缩容: {old_capacity} -> {new_capacity}',
+                animation_type="highlight",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+        new_data = [None] * new_capacity
+        new_data[:size] = self._items()
+        self._data = new_data
+        self._capacity = new_capacity
+        self._after_resize()
+        self._record_resize(size, shrink=True)
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SHRINK,
+                description=f'✓ 缩容完成！复制 {size} 个元素，新容量: {new_capacity}',
+                animation_type="fade",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY),
+                visual_hints=self._resize_hints()
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return True
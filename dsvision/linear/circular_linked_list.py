@@ -0,0 +1,69 @@
+from ..operation.operation import OperationStep, OperationType
+from .doubly_linked_list import DoublyLinkedList
+from .linked_list import LinearNode
+from typing import List, Any, Optional
+
+
+class CircularLinkedList(DoublyLinkedList):
+    """
+    循环双向链表
+    tail.next 指向 head、head.prev 指向 tail，其余操作与双向链表相同；
+    遍历按节点个数结束，而不是等待遇到 NULL
+    """
+    KIND = "循环链表"
+    NEXT_END = "head"
+    PREV_END = "tail"
+
+    def _ring_step(self) -> None:
+        """头/尾节点变化后重新闭合环"""
+        if self._head is None:
+            return
+        last = self._size - 1
+        if self._tracing():
+            step = OperationStep(
+                OperationType.LINK_NODE,
+                description="闭合环：tail.next → head，head.prev → tail",
+                pointers=self._ends(),
+                highlight_indices=[last, 0] if last else [0],
+                animation_type="move",
+                duration=0.5,
+                visual_hints={"show_arrow": True, "from": last, "to": 0},
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+    def _link_after(self, prev: Optional[LinearNode], node: LinearNode) -> None:
+        """先断开环，按线性链表链接，再重新闭合"""
+        self._open_ring()
+        super()._link_after(prev, node)
+        self._close_ring()
+
+    def _unlink_after(self, prev: Optional[LinearNode]) -> LinearNode:
+        self._open_ring()
+        node = super()._unlink_after(prev)
+        self._close_ring()
+        node.next = node.prev = None
+        return node
+
+    def _open_ring(self) -> None:
+        if self._head is not None:
+            self._tail.next = None
+            self._head.prev = None
+
+    def _close_ring(self) -> None:
+        if self._head is not None:
+            self._tail.next = self._head
+            self._head.prev = self._tail
+
+    def _values(self) -> List[Any]:
+        """绕环一周收集值（回到 head 即停止）"""
+        if self._values_cache is None:
+            values = []
+            current = self._head
+            while current is not None:
+                values.append(current.value)
+                current = current.next
+                if current is self._head:
+                    break
+            self._values_cache = values
+        return self._values_cache
@@ -0,0 +1,407 @@
+from ..operation.operation import OperationStep, OperationType, TraceLevel
+from .linked_list import LinearLinkedList, LinearNode
+from typing import Any
+
+
+class DoublyLinkedList(LinearLinkedList):
+    """
+    双向链表
+    每个节点同时维护 prev / next，链表维护 head / tail 指针：
+    头尾插入、头尾删除都是 O(1)；按下标定位时 current 从离目标更近的一端出发
+    """
+    KIND = "双向链表"
+    NEXT_END = "NULL"  # 尾节点 next 的指向（循环链表为 head）
+    PREV_END = "NULL"  # 头节点 prev 的指向（循环链表为 tail）
+
+    def __init__(self):
+        super().__init__(doubly=True)
+
+    def _ends(self, **pointers) -> dict:
+        """步骤中的指针位置：总是带上 head / tail，再加上本步骤的其他指针"""
+        result = {"head": 0 if self._size else -1, "tail": self._size - 1}
+        result.update(pointers)
+        return result
+
+    def _ring_step(self) -> None:
+        """头/尾节点变化后的附加步骤（循环链表在此重新闭合），双向链表没有"""
+
+    def _locate(self, index: int) -> LinearNode:
+        """current 指针从 head 或 tail 中较近的一端移动到位置 index，返回该节点"""
+        from_tail = self._size - 1 - index < index
+        start = self._size - 1 if from_tail else 0
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.POINTER_MOVE,
+                description=f"定位位置 {index}：current 从 {'tail' if from_tail else 'head'} 出发"
+                            f"（距离 {abs(index - start)} 步）",
+                pointers=self._ends(current=start),
+                highlight_indices=[start],
+                animation_type="highlight",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+        if not self._tracing():
+            return self._node_at(index)
+
+        node = self._tail if from_tail else self._head
+        position = start
+        while position != index:
+            target = position - 1 if from_tail else position + 1
+            step = OperationStep(
+                OperationType.POINTER_MOVE,
+                message_id='linked_current_back' if from_tail else 'linked_current_move',
+                message_args={'index': target},
+                pointers=self._ends(current=target),
+                highlight_indices=[position, target],
+                animation_type="move",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+            node = node.prev if from_tail else node.next
+            position = target
+        return node
+
+    # ========== 插入 ==========
+
+    def _insert_at_head(self, value: Any) -> bool:
+        """头部插入：新节点.next → 原 head，原 head.prev → 新节点"""
+        if self._tracing():
+            step = OperationStep(
+                OperationType.CREATE_NODE,
+                value=value,
+                description=f"Step 1: 创建新节点，值为 {value}",
+                pointers=self._ends(),
+                animation_type="fade",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+        new_node = self._new_node(value)
+
+        if self._head is not None:
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.LINK_NODE,
+                    description=f"Step 2: 新节点.next → 原 head（值为 {self._head.value}），原 head.prev → 新节点",
+                    pointers=self._ends(new_node=-1),
+                    highlight_indices=[0],
+                    animation_type="move",
+                    duration=0.6,
+                    visual_hints={"show_arrow": True, "from": -1, "to": 0},
+                    data_snapshot=self._trace_snapshot()
+                )
+                self.add_operation_step(step)
+
+        self._link_after(None, new_node)
+        self._size += 1
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.POINTER_MOVE,
+                description="Step 3: head 指针更新，指向新节点"
+                            + ("（链表原为空，tail 也指向它）" if self._size == 1 else ""),
+                pointers=self._ends(),
+                highlight_indices=[0],
+                animation_type="move",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+        self._ring_step()
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INSERT,
+                index=0,
+                value=value,
+                description="头部插入完成！新节点成为第一个节点",
+                pointers=self._ends(),
+                highlight_indices=[0],
+                animation_type="highlight",
+                duration=1.0,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return True
+
+    def _insert_at_middle(self, index: int, value: Any) -> bool:
+        """中间插入：从较近的一端定位到位置 index，新节点接在它前面；尾部插入经 tail 指针 O(1)"""
+        if index == self._size:
+            return self._insert_at_tail(value)
+
+        current = self._locate(index)
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.CREATE_NODE,
+                value=value,
+                description=f"到达位置 {index}（值={current.value}），创建新节点，值为 {value}",
+                pointers=self._ends(current=index),
+                highlight_indices=[index],
+                animation_type="fade",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+        new_node = self._new_node(value)
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.LINK_NODE,
+                description=f"Step 1: 新节点.prev → 位置 {index - 1}（值={current.prev.value}），"
+                            f"新节点.next → current（值={current.value}）",
+                pointers=self._ends(current=index, new_node=index),
+                highlight_indices=[index - 1, index],
+                animation_type="move",
+                duration=0.6,
+                visual_hints={"show_arrow": True, "from": index, "to": index + 1},
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+            step = OperationStep(
+                OperationType.LINK_NODE,
+                description="Step 2: current.prev.next → 新节点，current.prev → 新节点",
+                pointers=self._ends(current=index, new_node=index),
+                highlight_indices=[index - 1, index],
+                animation_type="move",
+                duration=0.6,
+                visual_hints={"show_arrow": True, "from": index - 1, "to": index},
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+        self._link_after(current.prev, new_node)
+        self._size += 1
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INSERT,
+                index=index,
+                value=value,
+                description=f"插入完成！元素 {value} 已插入到位置 {index}",
+                pointers=self._ends(),
+                highlight_indices=[index],
+                animation_type="highlight",
+                duration=1.2,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return True
+
+    def _insert_at_tail(self, value: Any) -> bool:
+        """尾部插入：经 tail 指针直接定位，不遍历"""
+        index = self._size
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.CREATE_NODE,
+                value=value,
+                description=f"Step 1: 创建新节点，值为 {value}（经 tail 指针直接定位尾部，无需遍历）",
+                pointers=self._ends(),
+                highlight_indices=[index - 1],
+                animation_type="fade",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+        new_node = self._new_node(value)
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.LINK_NODE,
+                description=f"Step 2: 新节点.prev → 原 tail（值为 {self._tail.value}），原 tail.next → 新节点",
+                pointers=self._ends(new_node=index),
+                highlight_indices=[index - 1],
+                animation_type="move",
+                duration=0.6,
+                visual_hints={"show_arrow": True, "from": index - 1, "to": index},
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+        self._link_after(self._tail, new_node)
+        self._size += 1
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.POINTER_MOVE,
+                description="Step 3: tail 指针更新，指向新节点",
+                pointers=self._ends(),
+                highlight_indices=[index],
+                animation_type="move",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+        self._ring_step()
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INSERT,
+                index=index,
+                value=value,
+                description=f"尾部插入完成！元素 {value} 已插入到位置 {index}",
+                pointers=self._ends(),
+                highlight_indices=[index],
+                animation_type="highlight",
+                duration=1.0,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return True
+
+    # ========== 删除 ==========
+
+    def _delete_head(self) -> Any:
+        """删除头节点：head 后移，新 head.prev 断开"""
+        deleted_value = self._head.value
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.DELETE,
+                value=deleted_value,
+                description=f"定位到头节点（值={deleted_value}）",
+                pointers=self._ends(),
+                highlight_indices=[0],
+                animation_type="highlight",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+            if self._size > 1:
+                step = OperationStep(
+                    OperationType.POINTER_MOVE,
+                    description=f"Step 1: head → 下一个节点（值={self._head.next.value}），"
+                                f"新 head.prev → {self.PREV_END}",
+                    pointers={"head": 1, "tail": self._size - 1},
+                    highlight_indices=[0, 1],
+                    animation_type="move",
+                    duration=0.6,
+                    data_snapshot=self._trace_snapshot()
+                )
+            else:
+                step = OperationStep(
+                    OperationType.POINTER_MOVE,
+                    description="Step 1: head、tail → NULL（链表将变为空）",
+                    pointers={"head": -1, "tail": -1},
+                    animation_type="move",
+                    duration=0.6,
+                    data_snapshot=self._trace_snapshot()
+                )
+            self.add_operation_step(step)
+
+        self._unlink_after(None)
+        self._size -= 1
+        self._ring_step()
+
+        return self._finish_delete(deleted_value, "Step 2: 删除原头节点")
+
+    def _delete_middle(self, index: int) -> Any:
+        """删除中间节点：前驱.next、后继.prev 互相指向；删除尾节点经 tail 指针 O(1)"""
+        if index == self._size - 1:
+            return self._delete_tail()
+
+        current = self._locate(index)
+        deleted_value = current.value
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.UNLINK_NODE,
+                description=f"Step 1: current.prev.next → 位置 {index + 1}（值={current.next.value}）",
+                pointers=self._ends(current=index),
+                highlight_indices=[index - 1, index, index + 1],
+                animation_type="move",
+                duration=0.6,
+                visual_hints={"show_arrow": True, "from": index - 1, "to": index + 1},
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+            step = OperationStep(
+                OperationType.LINK_NODE,
+                description=f"Step 2: current.next.prev → 位置 {index - 1}（值={current.prev.value}）",
+                pointers=self._ends(current=index),
+                highlight_indices=[index - 1, index, index + 1],
+                animation_type="move",
+                duration=0.6,
+                visual_hints={"show_arrow": True, "from": index + 1, "to": index - 1},
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+        self._unlink_after(current.prev)
+        self._size -= 1
+
+        return self._finish_delete(deleted_value, "Step 3: 删除节点")
+
+    def _delete_tail(self) -> Any:
+        """删除尾节点：tail 前移到 tail.prev，不遍历"""
+        deleted_value = self._tail.value
+        index = self._size - 1
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.DELETE,
+                value=deleted_value,
+                description=f"经 tail 指针直接定位尾节点（值={deleted_value}），无需遍历",
+                pointers=self._ends(),
+                highlight_indices=[index],
+                animation_type="highlight",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+            step = OperationStep(
+                OperationType.POINTER_MOVE,
+                description=f"Step 1: tail → tail.prev（位置 {index - 1}，值={self._tail.prev.value}），"
+                            f"新 tail.next → {self.NEXT_END}",
+                pointers={"head": 0, "tail": index - 1},
+                highlight_indices=[index - 1, index],
+                animation_type="move",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+        self._unlink_after(self._tail.prev)
+        self._size -= 1
+        self._ring_step()
+
+        return self._finish_delete(deleted_value, "Step 2: 删除原尾节点")
+
+    def _finish_delete(self, deleted_value: Any, description: str) -> Any:
+        """删除的最后两步：移除节点、完成"""
+        if self._tracing():
+            step = OperationStep(
+                OperationType.DELETE,
+                value=deleted_value,
+                description=f"{description}（值={deleted_value}）",
+                pointers=self._ends(),
+                animation_type="fade",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.DELETE,
+                value=deleted_value,
+                description=f"删除完成！已移除元素 {deleted_value}",
+                pointers=self._ends(),
+                animation_type="highlight",
+                duration=1.0,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return deleted_value
@@ -1,135 +1,161 @@
-from ..operation.operation import OperationStep, OperationType
+from ..operation.operation import OperationStep, OperationType, TraceLevel
+from ..operation.node_ids import NodeIdAllocator
 from .base import LinearStructureBase
-from typing import List, Any, Optional
+from typing import List, Any, Optional, Tuple
 
 
 class LinearNode:
-    def __init__(self, value: Any):
+    def __init__(self, value: Any, node_id: int = -1):
         self.value = value
         self.next: Optional['LinearNode'] = None
-        self.node_id = id(self)
+        self.prev: Optional['LinearNode'] = None  # 仅双向模式维护
+        self.node_id = node_id  # 🔥 由所属链表按创建顺序分配（见 LinearLinkedList._new_node）
 
 
 class LinearLinkedList(LinearStructureBase):
-    def __init__(self):
+    """
+    单链表
+    除 head 外还维护 tail 指针和最近访问位置的游标，尾部追加、顺序按下标访问为 O(1)；
+    doubly=True 时额外维护 prev 指针，删除尾节点、向前定位也不必从头走（动画步骤不变）
+    """
+    KIND = "单链表"  # 步骤描述里的结构名称，子类覆盖
+
+    def __init__(self, doubly: bool = False):
         super().__init__()
+        self._doubly = doubly
         self._head: Optional[LinearNode] = None
+        self._tail: Optional[LinearNode] = None  # 🔥 尾指针
         self._size = 0
+        self._cursor: Optional[Tuple[int, LinearNode]] = None  # 🔥 最近访问的 (位置, 节点)
+        self._values_cache: Optional[List[Any]] = None  # 🔥 结构不变时复用的值列表
+        self._node_ids = NodeIdAllocator()  # 🔥 节点 id 分配器，清空后也不回退
 
-        step = OperationStep(
-            OperationType.INIT,
-            description="初始化单链表",
-            pointers={"head": -1},
-            code_template='linked_insert_head',
-            code_line=1,
-            code_highlight=[1]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INIT,
+                description=f"初始化{self.KIND}",
+                pointers={"head": -1},
+                code_template='linked_insert_head',
+                code_line=1,
+                code_highlight=[1]
+            )
+            self.add_operation_step(step)
 
     def initlist(self, values: List[Any]) -> bool:
         """批量初始化 - 详细展示每个节点创建和连接"""
-        self._head = None
-        self._size = 0
+        self.clear()
 
         if not values:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INIT,
+                    description="初始化完成：链表为空",
+                    pointers={"head": -1}
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return True
+
+        if self._tracing():
             step = OperationStep(
                 OperationType.INIT,
-                description="初始化完成：链表为空",
-                pointers={"head": -1}
+                message_id='linear_init_start',
+                message_args={'count': len(values), 'values': values},
+                animation_type="instant",
+                duration=0.5
             )
             self.add_operation_step(step)
-            return True
-
-        step = OperationStep(
-            OperationType.INIT,
-            description=f"开始批量初始化 {len(values)} 个元素: {values}",
-            animation_type="instant",
-            duration=0.5
-        )
-        self.add_operation_step(step)
 
         # === 创建头节点 ===
-        step = OperationStep(
-            OperationType.CREATE_NODE,
-            value=values[0],
-            description=f"Step 1: 创建头节点，值为 {values[0]}",
-            animation_type="fade",
-            duration=0.6,
-            data_snapshot=[]
-        )
-        self.add_operation_step(step)
-
-        self._head = LinearNode(values[0])
+        if self._tracing():
+            step = OperationStep(
+                OperationType.CREATE_NODE,
+                value=values[0],
+                description=f"Step 1: 创建头节点，值为 {values[0]}",
+                animation_type="fade",
+                duration=0.6,
+                data_snapshot=[]
+            )
+            self.add_operation_step(step)
+
+        self._link_after(None, self._new_node(values[0]))
         self._size = 1
 
-        step = OperationStep(
-            OperationType.POINTER_MOVE,
-            description="Step 2: head 指针指向新创建的节点",
-            pointers={"head": 0},
-            highlight_indices=[0],
-            animation_type="highlight",
-            duration=0.5,
-            data_snapshot=[values[0]]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.POINTER_MOVE,
+                description="Step 2: head 指针指向新创建的节点",
+                pointers={"head": 0},
+                highlight_indices=[0],
+                animation_type="highlight",
+                duration=0.5,
+                data_snapshot=[values[0]]
+            )
+            self.add_operation_step(step)
 
         # === 依次创建后续节点 ===
         current = self._head
 
         for i, value in enumerate(values[1:], 1):
             # 显示 current 指针位置
-            step = OperationStep(
-                OperationType.POINTER_MOVE,
-                description=f"Step {2 * i + 1}: current 指针指向位置 {i - 1}（值为 {current.value}）",
-                pointers={"head": 0, "current": i - 1},
-                highlight_indices=[i - 1],
-                animation_type="highlight",
-                duration=0.4,
-                data_snapshot=self.to_list()
-            )
-            self.add_operation_step(step)
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.POINTER_MOVE,
+                    message_id='linked_init_locate',
+                    message_args={'step_no': 2 * i + 1, 'index': i - 1, 'value': current.value},
+                    pointers={"head": 0, "current": i - 1},
+                    highlight_indices=[i - 1],
+                    animation_type="highlight",
+                    duration=0.4,
+                    data_snapshot=self._trace_snapshot()
+                )
+                self.add_operation_step(step)
 
             # 创建新节点
-            step = OperationStep(
-                OperationType.CREATE_NODE,
-                value=value,
-                description=f"Step {2 * i + 2}: 创建新节点，值为 {value}",
-                pointers={"head": 0, "current": i - 1},
-                animation_type="fade",
-                duration=0.5,
-                data_snapshot=self.to_list()
-            )
-            self.add_operation_step(step)
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.CREATE_NODE,
+                    value=value,
+                    message_id='linked_init_create',
+                    message_args={'step_no': 2 * i + 2, 'value': value},
+                    pointers={"head": 0, "current": i - 1},
+                    animation_type="fade",
+                    duration=0.5,
+                    data_snapshot=self._trace_snapshot()
+                )
+                self.add_operation_step(step)
 
-            new_node = LinearNode(value)
+            new_node = self._new_node(value)
 
             # 连接节点
-            step = OperationStep(
-                OperationType.LINK_NODE,
-                description=f"Step {2 * i + 3}: 将 current.next 指向新节点",
-                pointers={"head": 0, "current": i - 1},
-                highlight_indices=[i - 1, i],
-                animation_type="move",
-                duration=0.5,
-                visual_hints={"show_arrow": True, "from": i - 1, "to": i},
-                data_snapshot=self.to_list()
-            )
-            self.add_operation_step(step)
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.LINK_NODE,
+                    message_id='linked_init_link',
+                    message_args={'step_no': 2 * i + 3},
+                    pointers={"head": 0, "current": i - 1},
+                    highlight_indices=[i - 1, i],
+                    animation_type="move",
+                    duration=0.5,
+                    visual_hints={"show_arrow": True, "from": i - 1, "to": i},
+                    data_snapshot=self._trace_snapshot()
+                )
+                self.add_operation_step(step)
 
-            current.next = new_node
+            self._link_after(current, new_node)
             current = new_node
             self._size += 1
 
-        step = OperationStep(
-            OperationType.INIT,
-            description=f"✓ 批量初始化完成，共创建 {self._size} 个节点",
-            pointers={"head": 0},
-            highlight_indices=list(range(self._size)),
-            animation_type="highlight",
-            duration=1.0,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INIT,
+                description=f"✓ 批量初始化完成，共创建 {self._size} 个节点",
+                pointers={"head": 0},
+                highlight_indices=list(range(self._size)),
+                animation_type="highlight",
+                duration=1.0,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
 
     def insert(self, index: int, value: Any) -> bool:
@@ -138,25 +164,27 @@ class LinearLinkedList(LinearStructureBase):
         self._operation_history = []
 
         if index < 0 or index > self._size:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INSERT,
+                    description=f"插入失败：索引越界 (index: {index}, 有效范围: 0-{self._size})",
+                    data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return False
+
+        if self._tracing():
             step = OperationStep(
                 OperationType.INSERT,
-                description=f"插入失败：索引越界 (index: {index}, 有效范围: 0-{self._size})",
-                data_snapshot=self.to_list()
+                description=f"准备在位置 {index} 插入元素 {value}",
+                value=value,
+                index=index,
+                highlight_indices=[index] if index < self._size else [],
+                animation_type="highlight",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot()
             )
             self.add_operation_step(step)
-            return False
-
-        step = OperationStep(
-            OperationType.INSERT,
-            description=f"准备在位置 {index} 插入元素 {value}",
-            value=value,
-            index=index,
-            highlight_indices=[index] if index < self._size else [],
-            animation_type="highlight",
-            duration=0.5,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
 
         # 头部插入
         if index == 0:
@@ -167,212 +195,226 @@ class LinearLinkedList(LinearStructureBase):
 
     def _insert_at_head(self, value: Any) -> bool:
         """头部插入 - 详细展示"""
-        step = OperationStep(
-            OperationType.CREATE_NODE,
-            value=value,
-            description=f"Step 1/3: 创建新节点，值为 {value}",
-            animation_type="fade",
-            duration=0.6,
-            data_snapshot=self.to_list(),
-            code_template='linked_insert_head',
-            code_line=2,
-            code_highlight=[2, 3]
-        )
-        self.add_operation_step(step)
-
-        new_node = LinearNode(value)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.CREATE_NODE,
+                value=value,
+                description=f"Step 1/3: 创建新节点，值为 {value}",
+                animation_type="fade",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot(),
+                code_template='linked_insert_head',
+                code_line=2,
+                code_highlight=[2, 3]
+            )
+            self.add_operation_step(step)
+
+        new_node = self._new_node(value)
 
         if self._head is not None:
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.LINK_NODE,
+                    description=f"Step 2/3: 新节点.next → 原 head（值为 {self._head.value}）",
+                    pointers={"head": 0, "new_node": -1},
+                    highlight_indices=[0],
+                    animation_type="move",
+                    duration=0.6,
+                    visual_hints={"show_arrow": True, "from": -1, "to": 0},
+                    data_snapshot=self._trace_snapshot(),
+                    code_template='linked_insert_head',
+                    code_line=6,
+                    code_highlight=[6]
+                )
+                self.add_operation_step(step)
+
+        if self._tracing():
             step = OperationStep(
-                OperationType.LINK_NODE,
-                description=f"Step 2/3: 新节点.next → 原 head（值为 {self._head.value}）",
-                pointers={"head": 0, "new_node": -1},
+                OperationType.POINTER_MOVE,
+                description=f"Step 3/3: head 指针更新，指向新节点",
+                pointers={"head": 0},
                 highlight_indices=[0],
                 animation_type="move",
                 duration=0.6,
-                visual_hints={"show_arrow": True, "from": -1, "to": 0},
-                data_snapshot=self.to_list(),
+                data_snapshot=self._trace_snapshot(),
                 code_template='linked_insert_head',
-                code_line=6,
-                code_highlight=[6]
+                code_line=9,
+                code_highlight=[9, 10]
             )
             self.add_operation_step(step)
 
-        new_node.next = self._head
-
-        step = OperationStep(
-            OperationType.POINTER_MOVE,
-            description=f"Step 3/3: head 指针更新，指向新节点",
-            pointers={"head": 0},
-            highlight_indices=[0],
-            animation_type="move",
-            duration=0.6,
-            data_snapshot=self.to_list(),
-            code_template='linked_insert_head',
-            code_line=9,
-            code_highlight=[9, 10]
-        )
-        self.add_operation_step(step)
-
-        self._head = new_node
+        self._link_after(None, new_node)
         self._size += 1
 
-        step = OperationStep(
-            OperationType.INSERT,
-            index=0,
-            value=value,
-            description=f"头部插入完成！新节点成为第一个节点",
-            pointers={"head": 0},
-            highlight_indices=[0],
-            animation_type="highlight",
-            duration=1.0,
-            data_snapshot=self.to_list(),
-            code_template='linked_insert_head',
-            code_line=10,
-            code_highlight=[10]
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INSERT,
+                index=0,
+                value=value,
+                description=f"头部插入完成！新节点成为第一个节点",
+                pointers={"head": 0},
+                highlight_indices=[0],
+                animation_type="highlight",
+                duration=1.0,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY),
+                code_template='linked_insert_head',
+                code_line=10,
+                code_highlight=[10]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
 
     def _insert_at_middle(self, index: int, value: Any) -> bool:
         """中间/尾部插入 - 完整指针移动过程"""
 
         # === 阶段1：定位到插入位置 ===
-        step = OperationStep(
-            OperationType.POINTER_MOVE,
-            description=f"阶段 1/3：开始定位到位置 {index - 1}",
-            pointers={"head": 0, "prev": 0},
-            highlight_indices=[0],
-            animation_type="highlight",
-            duration=0.5,
-            data_snapshot=self.to_list(),
-            code_template='linked_insert_tail',
-            code_line=12,
-            code_highlight=[12, 13, 14, 15]
-        )
-        self.add_operation_step(step)
-
-        prev = self._head
-        for i in range(index - 1):
+        if self._tracing():
             step = OperationStep(
-                OperationType.COMPARE,
-                description=f"当前 prev 在位置 {i}（值={prev.value}），目标位置 {index - 1}",
-                pointers={"head": 0, "prev": i},
-                highlight_indices=[i],
+                OperationType.POINTER_MOVE,
+                description=f"阶段 1/3：开始定位到位置 {index - 1}",
+                pointers={"head": 0, "prev": 0},
+                highlight_indices=[0],
                 animation_type="highlight",
-                duration=0.4,
-                data_snapshot=self.to_list(),
+                duration=0.5,
+                data_snapshot=self._trace_snapshot(),
                 code_template='linked_insert_tail',
-                code_line=13,
+                code_line=12,
                 code_highlight=[12, 13, 14, 15]
             )
             self.add_operation_step(step)
 
+        if not self._tracing():
+            # 不展示逐个移动时直接定位（尾部追加经 tail 指针 O(1)）
+            prev = self._node_at(index - 1)
+        else:
+            prev = self._head
+            for i in range(index - 1):
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.COMPARE,
+                        message_id='linked_prev_at',
+                        message_args={'index': i, 'value': prev.value, 'target': index - 1},
+                        pointers={"head": 0, "prev": i},
+                        highlight_indices=[i],
+                        animation_type="highlight",
+                        duration=0.4,
+                        data_snapshot=self._trace_snapshot(),
+                        code_template='linked_insert_tail',
+                        code_line=13,
+                        code_highlight=[12, 13, 14, 15]
+                    )
+                    self.add_operation_step(step)
+
+                    step = OperationStep(
+                        OperationType.POINTER_MOVE,
+                        message_id='linked_prev_move',
+                        message_args={'index': i + 1},
+                        pointers={"head": 0, "prev": i + 1},
+                        highlight_indices=[i, i + 1],
+                        animation_type="move",
+                        duration=0.5,
+                        data_snapshot=self._trace_snapshot(),
+                        code_template='linked_insert_tail',
+                        code_line=14,
+                        code_highlight=[12, 13, 14, 15]
+                    )
+                    self.add_operation_step(step)
+
+                prev = prev.next
+
+        if self._tracing():
             step = OperationStep(
-                OperationType.POINTER_MOVE,
-                description=f"prev = prev.next，移动到位置 {i + 1}",
-                pointers={"head": 0, "prev": i + 1},
-                highlight_indices=[i, i + 1],
-                animation_type="move",
-                duration=0.5,
-                data_snapshot=self.to_list(),
-                code_template='linked_insert_tail',
-                code_line=14,
-                code_highlight=[12, 13, 14, 15]
+                OperationType.COMPARE,
+                description=f"到达目标：prev 在位置 {index - 1}（值={prev.value}）",
+                pointers={"head": 0, "prev": index - 1},
+                highlight_indices=[index - 1],
+                animation_type="highlight",
+                duration=0.7,
+                data_snapshot=self._trace_snapshot()
             )
             self.add_operation_step(step)
 
-            prev = prev.next
-
-        step = OperationStep(
-            OperationType.COMPARE,
-            description=f"到达目标：prev 在位置 {index - 1}（值={prev.value}）",
-            pointers={"head": 0, "prev": index - 1},
-            highlight_indices=[index - 1],
-            animation_type="highlight",
-            duration=0.7,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
-
         # === 阶段2：创建新节点 ===
-        step = OperationStep(
-            OperationType.CREATE_NODE,
-            value=value,
-            description=f"阶段 2/3：创建新节点，值为 {value}",
-            pointers={"head": 0, "prev": index - 1},
-            animation_type="fade",
-            duration=0.6,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
-
-        new_node = LinearNode(value)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.CREATE_NODE,
+                value=value,
+                description=f"阶段 2/3：创建新节点，值为 {value}",
+                pointers={"head": 0, "prev": index - 1},
+                animation_type="fade",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
+
+        new_node = self._new_node(value)
 
         # === 阶段3：调整指针连接 ===
         if prev.next is not None:
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.LINK_NODE,
+                    description=f"阶段 3/3 - Step 1: 新节点.next → 位置 {index}（值={prev.next.value}）",
+                    pointers={"head": 0, "prev": index - 1, "new_node": index},
+                    highlight_indices=[index - 1, index],
+                    animation_type="move",
+                    duration=0.6,
+                    visual_hints={"show_arrow": True, "from": index, "to": index + 1},
+                    data_snapshot=self._trace_snapshot()
+                )
+                self.add_operation_step(step)
+        else:
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.LINK_NODE,
+                    description=f"阶段 3/3 - Step 1: 新节点.next → NULL（尾部插入）",
+                    pointers={"head": 0, "prev": index - 1, "new_node": index},
+                    animation_type="move",
+                    duration=0.6,
+                    data_snapshot=self._trace_snapshot()
+                )
+                self.add_operation_step(step)
+
+        if self._tracing():
             step = OperationStep(
-                OperationType.LINK_NODE,
-                description=f"阶段 3/3 - Step 1: 新节点.next → 位置 {index}（值={prev.next.value}）",
+                OperationType.UNLINK_NODE,
+                description=f"Step 2: 断开 prev.next 的原连接",
                 pointers={"head": 0, "prev": index - 1, "new_node": index},
-                highlight_indices=[index - 1, index],
-                animation_type="move",
-                duration=0.6,
-                visual_hints={"show_arrow": True, "from": index, "to": index + 1},
-                data_snapshot=self.to_list()
+                highlight_indices=[index - 1],
+                animation_type="highlight",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot()
             )
             self.add_operation_step(step)
-        else:
+
             step = OperationStep(
                 OperationType.LINK_NODE,
-                description=f"阶段 3/3 - Step 1: 新节点.next → NULL（尾部插入）",
+                description=f"Step 3: prev.next → 新节点",
                 pointers={"head": 0, "prev": index - 1, "new_node": index},
+                highlight_indices=[index - 1, index],
                 animation_type="move",
                 duration=0.6,
-                data_snapshot=self.to_list()
+                visual_hints={"show_arrow": True, "from": index - 1, "to": index},
+                data_snapshot=self._trace_snapshot()
             )
             self.add_operation_step(step)
 
-        new_node.next = prev.next
-
-        step = OperationStep(
-            OperationType.UNLINK_NODE,
-            description=f"Step 2: 断开 prev.next 的原连接",
-            pointers={"head": 0, "prev": index - 1, "new_node": index},
-            highlight_indices=[index - 1],
-            animation_type="highlight",
-            duration=0.5,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
-
-        step = OperationStep(
-            OperationType.LINK_NODE,
-            description=f"Step 3: prev.next → 新节点",
-            pointers={"head": 0, "prev": index - 1, "new_node": index},
-            highlight_indices=[index - 1, index],
-            animation_type="move",
-            duration=0.6,
-            visual_hints={"show_arrow": True, "from": index - 1, "to": index},
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
-
-        prev.next = new_node
+        self._link_after(prev, new_node)
         self._size += 1
 
-        step = OperationStep(
-            OperationType.INSERT,
-            index=index,
-            value=value,
-            description=f"插入完成！元素 {value} 已插入到位置 {index}",
-            pointers={"head": 0},
-            highlight_indices=[index],
-            animation_type="highlight",
-            duration=1.2,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INSERT,
+                index=index,
+                value=value,
+                description=f"插入完成！元素 {value} 已插入到位置 {index}",
+                pointers={"head": 0},
+                highlight_indices=[index],
+                animation_type="highlight",
+                duration=1.2,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
 
     def delete(self, index: int = None, value: Any = None) -> Any:
@@ -382,114 +424,125 @@ class LinearLinkedList(LinearStructureBase):
 
         # 优先按值删除：遍历查找第一个匹配的节点
         if value is not None and (index is None or index == ''):
-            step = OperationStep(
-                OperationType.SEARCH,
-                value=value,
-                description=f"开始搜索值为 {value} 的节点以删除",
-                data_snapshot=self.to_list()
-            )
-            self.add_operation_step(step)
-
-            if self._head is None:
+            if self._tracing():
                 step = OperationStep(
-                    OperationType.DELETE,
+                    OperationType.SEARCH,
                     value=value,
-                    description="链表为空，无法删除指定值",
-                    pointers={"head": -1},
-                    data_snapshot=self.to_list()
+                    description=f"开始搜索值为 {value} 的节点以删除",
+                    data_snapshot=self._trace_snapshot()
                 )
                 self.add_operation_step(step)
+
+            if self._head is None:
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.DELETE,
+                        value=value,
+                        description="链表为空，无法删除指定值",
+                        pointers={"head": -1},
+                        data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
                 return None
 
             current = self._head
             idx = 0
-            while current is not None:
-                step = OperationStep(
-                    OperationType.COMPARE,
-                    value=value,
-                    description=f"位置 {idx}: 比较 {current.value} == {value} ?",
-                    pointers={"head": 0, "current": idx},
-                    highlight_indices=[idx],
-                    compare_indices=[idx],
-                    animation_type="highlight",
-                    duration=0.6,
-                    data_snapshot=self.to_list()
-                )
-                self.add_operation_step(step)
-
-                if current.value == value or str(current.value) == str(value):
+            while idx < self._size:  # 按计数结束，循环链表同样适用
+                if self._tracing():
                     step = OperationStep(
-                        OperationType.SEARCH,
-                        index=idx,
+                        OperationType.COMPARE,
                         value=value,
-                        description=f"找到目标值 {value}，准备删除位置 {idx}",
+                        message_id='linked_compare',
+                        message_args={'index': idx, 'current': current.value, 'value': value},
                         pointers={"head": 0, "current": idx},
                         highlight_indices=[idx],
+                        compare_indices=[idx],
                         animation_type="highlight",
-                        duration=0.8,
-                        data_snapshot=self.to_list()
+                        duration=0.6,
+                        data_snapshot=self._trace_snapshot()
                     )
                     self.add_operation_step(step)
+
+                if current.value == value or str(current.value) == str(value):
+                    if self._tracing():
+                        step = OperationStep(
+                            OperationType.SEARCH,
+                            index=idx,
+                            value=value,
+                            description=f"找到目标值 {value}，准备删除位置 {idx}",
+                            pointers={"head": 0, "current": idx},
+                            highlight_indices=[idx],
+                            animation_type="highlight",
+                            duration=0.8,
+                            data_snapshot=self._trace_snapshot()
+                        )
+                        self.add_operation_step(step)
                     index = idx
                     break
 
                 # 移动指针到下一个节点
-                if current.next is not None:
-                    step = OperationStep(
-                        OperationType.POINTER_MOVE,
-                        description=f"current = current.next，移动到位置 {idx + 1}",
-                        pointers={"head": 0, "current": idx + 1},
-                        highlight_indices=[idx, idx + 1],
-                        animation_type="move",
-                        duration=0.5,
-                        data_snapshot=self.to_list()
-                    )
-                    self.add_operation_step(step)
+                if idx + 1 < self._size:
+                    if self._tracing():
+                        step = OperationStep(
+                            OperationType.POINTER_MOVE,
+                            message_id='linked_current_move',
+                            message_args={'index': idx + 1},
+                            pointers={"head": 0, "current": idx + 1},
+                            highlight_indices=[idx, idx + 1],
+                            animation_type="move",
+                            duration=0.5,
+                            data_snapshot=self._trace_snapshot()
+                        )
+                        self.add_operation_step(step)
 
                 current = current.next
                 idx += 1
 
             if index is None:
-                step = OperationStep(
-                    OperationType.DELETE,
-                    value=value,
-                    description=f"未找到值为 {value} 的节点，删除失败",
-                    data_snapshot=self.to_list()
-                )
-                self.add_operation_step(step)
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.DELETE,
+                        value=value,
+                        description=f"未找到值为 {value} 的节点，删除失败",
+                        data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
                 return None
 
         if index is None:
-            step = OperationStep(
-                OperationType.DELETE,
-                description="删除失败：未提供索引或值",
-                data_snapshot=self.to_list()
-            )
-            self.add_operation_step(step)
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.DELETE,
+                    description="删除失败：未提供索引或值",
+                    data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return None
 
         if index < 0 or index >= self._size:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.DELETE,
+                    index=index,
+                    description=f"删除失败：索引越界 (index: {index}, 有效范围: 0-{self._size - 1})",
+                    data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return None
+
+        deleted_value = self._node_at(index).value
+
+        if self._tracing():
             step = OperationStep(
                 OperationType.DELETE,
                 index=index,
-                description=f"删除失败：索引越界 (index: {index}, 有效范围: 0-{self._size - 1})",
-                data_snapshot=self.to_list()
+                description=f"准备删除位置 {index} 的节点（值={deleted_value}）",
+                highlight_indices=[index],
+                animation_type="highlight",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot()
             )
             self.add_operation_step(step)
-            return None
-
-        deleted_value = self.get(index)
-
-        step = OperationStep(
-            OperationType.DELETE,
-            index=index,
-            description=f"准备删除位置 {index} 的节点（值={deleted_value}）",
-            highlight_indices=[index],
-            animation_type="highlight",
-            duration=0.6,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
 
         if index == 0:
             return self._delete_head()
@@ -500,210 +553,226 @@ class LinearLinkedList(LinearStructureBase):
         """删除头节点 - 详细步骤"""
         deleted_value = self._head.value
 
-        step = OperationStep(
-            OperationType.DELETE,
-            value=deleted_value,
-            description=f"定位到头节点（值={deleted_value}）",
-            pointers={"head": 0},
-            highlight_indices=[0],
-            animation_type="highlight",
-            duration=0.6,
-            data_snapshot=self.to_list(),
-            code_template='linked_delete',
-            code_line=3,
-            code_highlight=[2, 3, 4, 5]
-        )
-        self.add_operation_step(step)
-
-        if self._head.next is not None:
+        if self._tracing():
             step = OperationStep(
-                OperationType.POINTER_MOVE,
-                description=f"Step 1/2: head → 下一个节点（值={self._head.next.value}）",
-                pointers={"head": 1},
-                highlight_indices=[0, 1],
-                animation_type="move",
+                OperationType.DELETE,
+                value=deleted_value,
+                description=f"定位到头节点（值={deleted_value}）",
+                pointers={"head": 0},
+                highlight_indices=[0],
+                animation_type="highlight",
                 duration=0.6,
-                data_snapshot=self.to_list(),
+                data_snapshot=self._trace_snapshot(),
                 code_template='linked_delete',
-                code_line=4,
-                code_highlight=[4]
+                code_line=3,
+                code_highlight=[2, 3, 4, 5]
             )
             self.add_operation_step(step)
+
+        if self._head.next is not None:
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.POINTER_MOVE,
+                    description=f"Step 1/2: head → 下一个节点（值={self._head.next.value}）",
+                    pointers={"head": 1},
+                    highlight_indices=[0, 1],
+                    animation_type="move",
+                    duration=0.6,
+                    data_snapshot=self._trace_snapshot(),
+                    code_template='linked_delete',
+                    code_line=4,
+                    code_highlight=[4]
+                )
+                self.add_operation_step(step)
         else:
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.POINTER_MOVE,
+                    description="Step 1/2: head → NULL（链表将变为空）",
+                    pointers={"head": -1},
+                    animation_type="move",
+                    duration=0.6,
+                    data_snapshot=self._trace_snapshot()
+                )
+                self.add_operation_step(step)
+
+        self._unlink_after(None)
+
+        if self._tracing():
             step = OperationStep(
-                OperationType.POINTER_MOVE,
-                description="Step 1/2: head → NULL（链表将变为空）",
-                pointers={"head": -1},
-                animation_type="move",
+                OperationType.DELETE,
+                value=deleted_value,
+                description=f"Step 2/2: 删除原头节点（值={deleted_value}）",
+                animation_type="fade",
                 duration=0.6,
-                data_snapshot=self.to_list()
+                data_snapshot=self._trace_snapshot()
             )
             self.add_operation_step(step)
 
-        self._head = self._head.next
-
-        step = OperationStep(
-            OperationType.DELETE,
-            value=deleted_value,
-            description=f"Step 2/2: 删除原头节点（值={deleted_value}）",
-            animation_type="fade",
-            duration=0.6,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
-
         self._size -= 1
 
-        step = OperationStep(
-            OperationType.DELETE,
-            value=deleted_value,
-            description=f"删除完成！已移除元素 {deleted_value}",
-            pointers={"head": 0} if self._head else {"head": -1},
-            animation_type="highlight",
-            duration=1.0,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.DELETE,
+                value=deleted_value,
+                description=f"删除完成！已移除元素 {deleted_value}",
+                pointers={"head": 0} if self._head else {"head": -1},
+                animation_type="highlight",
+                duration=1.0,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return deleted_value
 
     def _delete_middle(self, index: int) -> Any:
         """删除中间/尾部节点 - 完整指针调整"""
 
         # === 阶段1：定位到目标节点的前驱 ===
-        step = OperationStep(
-            OperationType.POINTER_MOVE,
-            description=f"阶段 1/2：定位到位置 {index - 1}",
-            pointers={"head": 0, "prev": 0},
-            highlight_indices=[0],
-            animation_type="highlight",
-            duration=0.5,
-            data_snapshot=self.to_list(),
-            code_template='linked_delete',
-            code_line=11,
-            code_highlight=[10, 11, 12]
-        )
-        self.add_operation_step(step)
-
-        prev = self._head
-        for i in range(index - 1):
-            step = OperationStep(
-                OperationType.COMPARE,
-                description=f"当前 prev 在位置 {i}，目标位置 {index - 1}",
-                pointers={"head": 0, "prev": i},
-                highlight_indices=[i],
-                animation_type="highlight",
-                duration=0.4,
-                data_snapshot=self.to_list(),
-                code_template='linked_delete',
-                code_line=12,
-                code_highlight=[12, 13]
-            )
-            self.add_operation_step(step)
-
+        if self._tracing():
             step = OperationStep(
                 OperationType.POINTER_MOVE,
-                description=f"prev = prev.next，移动到位置 {i + 1}",
-                pointers={"head": 0, "prev": i + 1},
-                highlight_indices=[i, i + 1],
-                animation_type="move",
+                description=f"阶段 1/2：定位到位置 {index - 1}",
+                pointers={"head": 0, "prev": 0},
+                highlight_indices=[0],
+                animation_type="highlight",
                 duration=0.5,
-                data_snapshot=self.to_list(),
+                data_snapshot=self._trace_snapshot(),
                 code_template='linked_delete',
-                code_line=13,
-                code_highlight=[12, 13]
+                code_line=11,
+                code_highlight=[10, 11, 12]
             )
             self.add_operation_step(step)
 
-            prev = prev.next
+        if not self._tracing():
+            prev = self._node_at(index - 1)
+        else:
+            prev = self._head
+            for i in range(index - 1):
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.COMPARE,
+                        description=f"当前 prev 在位置 {i}，目标位置 {index - 1}",
+                        pointers={"head": 0, "prev": i},
+                        highlight_indices=[i],
+                        animation_type="highlight",
+                        duration=0.4,
+                        data_snapshot=self._trace_snapshot(),
+                        code_template='linked_delete',
+                        code_line=12,
+                        code_highlight=[12, 13]
+                    )
+                    self.add_operation_step(step)
 
-        deleted_value = prev.next.value
+                    step = OperationStep(
+                        OperationType.POINTER_MOVE,
+                        message_id='linked_prev_move',
+                        message_args={'index': i + 1},
+                        pointers={"head": 0, "prev": i + 1},
+                        highlight_indices=[i, i + 1],
+                        animation_type="move",
+                        duration=0.5,
+                        data_snapshot=self._trace_snapshot(),
+                        code_template='linked_delete',
+                        code_line=13,
+                        code_highlight=[12, 13]
+                    )
+                    self.add_operation_step(step)
 
-        step = OperationStep(
-            OperationType.COMPARE,
-            description=f"到达：prev 在位置 {index - 1}，要删除的节点值={deleted_value}",
-            pointers={"head": 0, "prev": index - 1},
-            highlight_indices=[index - 1, index],
-            animation_type="highlight",
-            duration=0.7,
-            data_snapshot=self.to_list(),
-            code_template='linked_delete',
-            code_line=12,
-            code_highlight=[12, 13]
-        )
-        self.add_operation_step(step)
+                prev = prev.next
 
-        # === 阶段2：调整指针，跳过目标节点 ===
-        if prev.next.next is not None:
+        deleted_value = prev.next.value
+
+        if self._tracing():
             step = OperationStep(
-                OperationType.UNLINK_NODE,
-                description=f"阶段 2/2 - Step 1: 准备断开与节点 {deleted_value} 的连接",
+                OperationType.COMPARE,
+                description=f"到达：prev 在位置 {index - 1}，要删除的节点值={deleted_value}",
                 pointers={"head": 0, "prev": index - 1},
                 highlight_indices=[index - 1, index],
                 animation_type="highlight",
-                duration=0.5,
-                data_snapshot=self.to_list(),
+                duration=0.7,
+                data_snapshot=self._trace_snapshot(),
                 code_template='linked_delete',
-                code_line=16,
-                code_highlight=[15, 16, 17]
+                code_line=12,
+                code_highlight=[12, 13]
             )
             self.add_operation_step(step)
 
-            step = OperationStep(
-                OperationType.LINK_NODE,
-                description=f"Step 2: prev.next → 位置 {index + 1}（值={prev.next.next.value}）",
-                pointers={"head": 0, "prev": index - 1},
-                highlight_indices=[index - 1, index, index + 1],
-                animation_type="move",
-                duration=0.6,
-                visual_hints={"show_arrow": True, "from": index - 1, "to": index + 1},
-                data_snapshot=self.to_list(),
-                code_template='linked_delete',
-                code_line=17,
-                code_highlight=[16, 17]
-            )
-            self.add_operation_step(step)
+        # === 阶段2：调整指针，跳过目标节点 ===
+        if prev.next.next is not None:
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.UNLINK_NODE,
+                    description=f"阶段 2/2 - Step 1: 准备断开与节点 {deleted_value} 的连接",
+                    pointers={"head": 0, "prev": index - 1},
+                    highlight_indices=[index - 1, index],
+                    animation_type="highlight",
+                    duration=0.5,
+                    data_snapshot=self._trace_snapshot(),
+                    code_template='linked_delete',
+                    code_line=16,
+                    code_highlight=[15, 16, 17]
+                )
+                self.add_operation_step(step)
+
+                step = OperationStep(
+                    OperationType.LINK_NODE,
+                    description=f"Step 2: prev.next → 位置 {index + 1}（值={prev.next.next.value}）",
+                    pointers={"head": 0, "prev": index - 1},
+                    highlight_indices=[index - 1, index, index + 1],
+                    animation_type="move",
+                    duration=0.6,
+                    visual_hints={"show_arrow": True, "from": index - 1, "to": index + 1},
+                    data_snapshot=self._trace_snapshot(),
+                    code_template='linked_delete',
+                    code_line=17,
+                    code_highlight=[16, 17]
+                )
+                self.add_operation_step(step)
         else:
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.LINK_NODE,
+                    description=f"Step 2: prev.next → NULL（删除尾节点）",
+                    pointers={"head": 0, "prev": index - 1},
+                    highlight_indices=[index - 1, index],
+                    animation_type="move",
+                    duration=0.6,
+                    data_snapshot=self._trace_snapshot(),
+                    code_template='linked_delete',
+                    code_line=17,
+                    code_highlight=[16, 17]
+                )
+                self.add_operation_step(step)
+
+        self._unlink_after(prev)
+
+        if self._tracing():
             step = OperationStep(
-                OperationType.LINK_NODE,
-                description=f"Step 2: prev.next → NULL（删除尾节点）",
-                pointers={"head": 0, "prev": index - 1},
-                highlight_indices=[index - 1, index],
-                animation_type="move",
+                OperationType.DELETE,
+                value=deleted_value,
+                description=f"Step 3: 删除节点（值={deleted_value}）",
+                animation_type="fade",
                 duration=0.6,
-                data_snapshot=self.to_list(),
+                data_snapshot=self._trace_snapshot(),
                 code_template='linked_delete',
-                code_line=17,
-                code_highlight=[16, 17]
+                code_line=18,
+                code_highlight=[18, 19]
             )
             self.add_operation_step(step)
 
-        prev.next = prev.next.next
-
-        step = OperationStep(
-            OperationType.DELETE,
-            value=deleted_value,
-            description=f"Step 3: 删除节点（值={deleted_value}）",
-            animation_type="fade",
-            duration=0.6,
-            data_snapshot=self.to_list(),
-            code_template='linked_delete',
-            code_line=18,
-            code_highlight=[18, 19]
-        )
-        self.add_operation_step(step)
-
         self._size -= 1
 
-        step = OperationStep(
-            OperationType.DELETE,
-            value=deleted_value,
-            description=f"删除完成！已移除元素 {deleted_value}",
-            pointers={"head": 0},
-            animation_type="highlight",
-            duration=1.2,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.DELETE,
+                value=deleted_value,
+                description=f"删除完成！已移除元素 {deleted_value}",
+                pointers={"head": 0},
+                animation_type="highlight",
+                duration=1.2,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return deleted_value
 
     def search(self, value: Any) -> int:
@@ -711,119 +780,126 @@ class LinearLinkedList(LinearStructureBase):
         # 🔥 清空操作历史，避免累积之前的操作
         self._operation_history = []
 
-        step = OperationStep(
-            OperationType.SEARCH,
-            value=value,
-            description=f"开始搜索元素 {value}",
-            duration=0.5,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
-
-        if self._head is None:
+        if self._tracing():
             step = OperationStep(
                 OperationType.SEARCH,
                 value=value,
-                description="链表为空，搜索失败",
-                pointers={"head": -1}
+                description=f"开始搜索元素 {value}",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot()
             )
             self.add_operation_step(step)
-            return -1
 
-        step = OperationStep(
-            OperationType.POINTER_MOVE,
-            description="初始化：current 指针从 head 开始",
-            pointers={"head": 0, "current": 0},
-            highlight_indices=[0],
-            animation_type="move",
-            duration=0.5,
-            data_snapshot=self.to_list(),
-            code_template='linked_search',
-            code_line=2,
-            code_highlight=[2, 3]
-        )
-        self.add_operation_step(step)
-
-        current = self._head
-        index = 0
+        if self._head is None:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    value=value,
+                    description="链表为空，搜索失败",
+                    pointers={"head": -1}
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return -1
 
-        while current is not None:
+        if self._tracing():
             step = OperationStep(
-                OperationType.COMPARE,
-                value=value,
+                OperationType.POINTER_MOVE,
+                description="初始化：current 指针从 head 开始",
+                pointers={"head": 0, "current": 0},
+                highlight_indices=[0],
+                animation_type="move",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot(),
                 code_template='linked_search',
-                code_line=7,
-                code_highlight=[6, 7, 8],
-                description=f"位置 {index}: 比较 {current.value} == {value} ?",
-                pointers={"head": 0, "current": index},
-                highlight_indices=[index],
-                compare_indices=[index],
-                animation_type="highlight",
-                duration=0.6,
-                data_snapshot=self.to_list()
+                code_line=2,
+                code_highlight=[2, 3]
             )
             self.add_operation_step(step)
 
-            if current.value == value or str(current.value) == str(value):
+        current = self._head
+        index = 0
+
+        while index < self._size:
+            if self._tracing():
                 step = OperationStep(
-                    OperationType.SEARCH,
-                    index=index,
+                    OperationType.COMPARE,
                     value=value,
-                    description=f"找到了！元素 {value} 在位置 {index}",
+                    code_template='linked_search',
+                    code_line=7,
+                    code_highlight=[6, 7, 8],
+                    message_id='linked_compare',
+                    message_args={'index': index, 'current': current.value, 'value': value},
                     pointers={"head": 0, "current": index},
                     highlight_indices=[index],
+                    compare_indices=[index],
                     animation_type="highlight",
-                    duration=1.5,
-                    data_snapshot=self.to_list()
+                    duration=0.6,
+                    data_snapshot=self._trace_snapshot()
                 )
                 self.add_operation_step(step)
-                return index
 
-            step = OperationStep(
-                OperationType.COMPARE,
-                description=f"{current.value} ≠ {value}，继续向后查找",
-                pointers={"head": 0, "current": index},
-                animation_type="instant",
-                duration=0.3,
-                data_snapshot=self.to_list()
-            )
-            self.add_operation_step(step)
+            if current.value == value or str(current.value) == str(value):
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        index=index,
+                        value=value,
+                        description=f"找到了！元素 {value} 在位置 {index}",
+                        pointers={"head": 0, "current": index},
+                        highlight_indices=[index],
+                        animation_type="highlight",
+                        duration=1.5,
+                        data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
+                return index
 
-            if current.next is not None:
+            if self._tracing():
                 step = OperationStep(
-                    OperationType.POINTER_MOVE,
-                    description=f"current = current.next，移动到位置 {index + 1}",
-                    pointers={"head": 0, "current": index + 1},
-                    highlight_indices=[index, index + 1],
-                    animation_type="move",
-                    duration=0.5,
-                    data_snapshot=self.to_list()
+                    OperationType.COMPARE,
+                    description=f"{current.value} ≠ {value}，继续向后查找",
+                    pointers={"head": 0, "current": index},
+                    animation_type="instant",
+                    duration=0.3,
+                    data_snapshot=self._trace_snapshot()
                 )
                 self.add_operation_step(step)
 
+            if index + 1 < self._size:
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.POINTER_MOVE,
+                        message_id='linked_current_move',
+                        message_args={'index': index + 1},
+                        pointers={"head": 0, "current": index + 1},
+                        highlight_indices=[index, index + 1],
+                        animation_type="move",
+                        duration=0.5,
+                        data_snapshot=self._trace_snapshot()
+                    )
+                    self.add_operation_step(step)
+
             current = current.next
             index += 1
 
-        step = OperationStep(
-            OperationType.SEARCH,
-            value=value,
-            description=f"遍历结束，未找到元素 {value}",
-            pointers={"head": 0},
-            animation_type="instant",
-            duration=0.8,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                value=value,
+                description=f"遍历结束，未找到元素 {value}",
+                pointers={"head": 0},
+                animation_type="instant",
+                duration=0.8,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return -1
 
     def get(self, index: int) -> Any:
         """获取指定位置元素"""
         if index < 0 or index >= self._size:
             return None
-        current = self._head
-        for i in range(index):
-            current = current.next
-        return current.value
+        return self._node_at(index).value
 
     def size(self) -> int:
         return self._size
@@ -831,11 +907,161 @@ class LinearLinkedList(LinearStructureBase):
     def is_empty(self) -> bool:
         return self._size == 0
 
+    def clear(self) -> None:
+        """清空链表（不记录步骤）"""
+        self._head = None
+        self._tail = None
+        self._size = 0
+        self._changed()
+
+    def bulk_insert(self, index: int, values: List[Any]) -> bool:
+        """把 values 依次接在第 index-1 个节点之后：只定位一次前驱，O(index + k)"""
+        values = list(values)
+        if index < 0 or index > self._size:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INSERT,
+                    index=index,
+                    description=f"批量插入失败：索引 {index} 超出范围 [0, {self._size}]"
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return False
+
+        prev = None if index == 0 else self._node_at(index - 1)
+        for value in values:
+            node = self._new_node(value)
+            self._link_after(prev, node)
+            prev = node
+        self._size += len(values)
+        self._bulk_step(OperationType.INSERT, index, values, len(values))
+        return True
+
+    def bulk_delete(self, index: int, count: int) -> List[Any]:
+        """摘下第 index 个节点起的 count 个节点：只定位一次前驱，O(index + k)"""
+        if index < 0 or index >= self._size:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.DELETE,
+                    index=index,
+                    description=f"批量删除失败：索引 {index} 超出范围 [0, {self._size - 1}]"
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return []
+
+        requested = count
+        count = max(0, min(count, self._size - index))
+        prev = None if index == 0 else self._node_at(index - 1)
+        deleted = [self._unlink_after(prev).value for _ in range(count)]
+        self._size -= count
+        self._bulk_step(OperationType.DELETE, index, deleted, requested)
+        return deleted
+
     def to_list(self) -> List[Any]:
         """转换为列表"""
-        result = []
+        return list(self._values())
+
+    def _trace_snapshot(self, level: TraceLevel = TraceLevel.FULL) -> Optional[List[Any]]:
+        """两次修改之间的步骤共享同一个值列表，不再每步遍历整个链表"""
+        if not self._tracing(level):
+            return None
+        return self._values()
+
+    def _values(self) -> List[Any]:
+        """当前的值列表；结构不变时返回同一个列表对象，调用方不能原地修改"""
+        if self._values_cache is None:
+            values = []
+            current = self._head
+            while current:
+                values.append(current.value)
+                current = current.next
+            self._values_cache = values
+        return self._values_cache
+
+    def _changed(self) -> None:
+        """链接或节点值发生变化：位置游标和值列表缓存失效"""
+        self._cursor = None
+        self._values_cache = None
+
+    def _new_node(self, value: Any) -> LinearNode:
+        return LinearNode(value, self._node_ids.allocate())
+
+    def get_node_ids(self) -> List[int]:
+        """从头到尾各节点的 node_id，与 to_list() 一一对应，前端按 id 对比前后两次状态"""
+        ids = []
         current = self._head
-        while current:
-            result.append(current.value)
+        for _ in range(self._size):
+            ids.append(current.node_id)
             current = current.next
-        return result
+        return ids
+
+    def restore_node_ids(self, node_ids: List[int], next_id: Optional[int] = None) -> None:
+        """
+        导入时恢复导出数据中的 node_id（按位置对应）；个数对不上时多出的节点在导出 id 之后重新编号
+        next_id: 导出时的 next_node_id，之后新建的节点接着它编号
+        """
+        for node_id in node_ids:
+            self._node_ids.reserve(node_id)
+        if next_id is not None:
+            self._node_ids.reserve(next_id - 1)
+        current = self._head
+        for i in range(self._size):
+            current.node_id = node_ids[i] if i < len(node_ids) else self._node_ids.allocate()
+            current = current.next
+
+    def get_next_node_id(self) -> int:
+        return self._node_ids.next_id
+
+    def _link_after(self, prev: Optional[LinearNode], node: LinearNode) -> None:
+        """把 node 接到 prev 之后（prev 为 None 时作为新的头节点），维护 tail/prev 指针"""
+        node.next = self._head if prev is None else prev.next
+        if prev is None:
+            self._head = node
+        else:
+            prev.next = node
+        if self._doubly:
+            node.prev = prev
+            if node.next is not None:
+                node.next.prev = node
+        if node.next is None:
+            self._tail = node
+        self._changed()
+
+    def _unlink_after(self, prev: Optional[LinearNode]) -> LinearNode:
+        """摘下 prev 之后的节点（prev 为 None 时摘头节点），返回被摘下的节点"""
+        node = self._head if prev is None else prev.next
+        if prev is None:
+            self._head = node.next
+        else:
+            prev.next = node.next
+        if self._doubly and node.next is not None:
+            node.next.prev = prev
+        if node is self._tail:
+            self._tail = prev
+        self._changed()
+        return node
+
+    def _node_at(self, index: int) -> LinearNode:
+        """
+        定位第 index 个节点（调用方保证下标有效）
+        尾节点 O(1)；否则从头、游标（双向模式下还有尾）中最近的一处出发，结果记为新的游标
+        """
+        if index == self._size - 1:
+            node = self._tail
+        else:
+            start, node = 0, self._head
+            if self._cursor is not None and self._cursor[0] <= index:
+                start, node = self._cursor
+            if self._doubly:
+                # 向前走可能更近：从游标或尾节点往回走
+                back_start, back_node = self._size - 1, self._tail
+                if self._cursor is not None and index <= self._cursor[0] < back_start:
+                    back_start, back_node = self._cursor
+                if back_start - index < index - start:
+                    for _ in range(back_start - index):
+                        back_node = back_node.prev
+                    self._cursor = (index, back_node)
+                    return back_node
+            for _ in range(index - start):
+                node = node.next
+        self._cursor = (index, node)
+        return node
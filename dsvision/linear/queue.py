@@ -1,40 +1,50 @@
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 from .base import LinearStructureBase
-from ..operation.operation import OperationStep, OperationType
+from .capacity import CapacityPolicy, ResizableArrayMixin
+from ..operation.operation import OperationStep, OperationType, TraceLevel
 
 
-class SequentialQueue(LinearStructureBase):
-    """顺序队列（基于数组，支持可选容量与扩容动画）"""
+class SequentialQueue(ResizableArrayMixin, LinearStructureBase):
+    """
+    顺序队列（基于数组，支持可选容量与扩容动画）
+    circular=True 时为循环队列：front / rear 按容量取模回绕，出队腾出的槽位可以再用，
+    只有真正存满 capacity 个元素才扩容，持续入队出队时占用的空间不变（需要固定容量）
+    扩容/缩容规则见 CapacityPolicy
+    """
 
-    def __init__(self, capacity: int = 100):
+    def __init__(self, capacity: int = 100, circular: bool = False, policy: Optional[CapacityPolicy] = None):
         super().__init__()
         self._capacity = capacity if capacity else None  # None 表示无限容量
+        self._circular = bool(circular) and self._capacity is not None
         self._data = [] if self._capacity is None else [None] * self._capacity
         self._size = 0
         self._front = 0
         self._rear = -1
+        self._init_capacity_policy(policy)
 
-        step = OperationStep(
-            OperationType.INIT,
-            description=f"初始化顺序队列，容量为{self._capacity if self._capacity is not None else '∞'}",
-            highlight_indices=[],
-            code_template='queue_enqueue',
-            code_line=1,
-            code_highlight=[1]
-        )
-        self.add_operation_step(step)
-
-    # 基础能力
-    def initlist(self, values: List[Any]) -> bool:
-        if self._capacity is not None and len(values) > self._capacity:
+        if self._tracing():
             step = OperationStep(
                 OperationType.INIT,
-                description=f'初始化失败：元素数量({len(values)})超过容量({self._capacity})',
+                description=f"初始化{'循环' if self._circular else '顺序'}队列，容量为{self._capacity if self._capacity is not None else '∞'}",
+                highlight_indices=[],
                 code_template='queue_enqueue',
-                code_line=3,
-                code_highlight=[2, 3, 4]
+                code_line=1,
+                code_highlight=[1]
             )
             self.add_operation_step(step)
+
+    # 基础能力
+    def initlist(self, values: List[Any]) -> bool:
+        if self._capacity is not None and len(values) > self._capacity:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INIT,
+                    description=f'初始化失败：元素数量({len(values)})超过容量({self._capacity})',
+                    code_template='queue_enqueue',
+                    code_line=3,
+                    code_highlight=[2, 3, 4]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return False
 
         self._data = [] if self._capacity is None else [None] * self._capacity
@@ -49,60 +59,68 @@ class SequentialQueue(LinearStructureBase):
                 self._data[i] = value
             self._size += 1
             self._rear = i
+        self._record_inserts(len(values))
 
-        step = OperationStep(
-            OperationType.INIT,
-            description=f'批量初始化队列，{len(values)}个元素: {values}',
-            highlight_indices=list(range(len(values))),
-            code_template='queue_enqueue',
-            code_line=10,
-            code_highlight=[7, 8, 9, 10]
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INIT,
+                message_id='queue_init_batch',
+                message_args={'count': len(values), 'values': values},
+                highlight_indices=list(range(len(values))),
+                code_template='queue_enqueue',
+                code_line=10,
+                code_highlight=[7, 8, 9, 10]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
 
     # 队列操作
     def enqueue(self, value: Any) -> bool:
         if self.is_full():
             if not self._expand():
-                step = OperationStep(
-                    OperationType.INSERT,
-                    index=self._size,
-                    value=value,
-                    description=f'入队失败：队列已满 (容量: {self._capacity})',
-                    code_template='queue_enqueue',
-                    code_line=3,
-                    code_highlight=[2, 3, 4]
-                )
-                self.add_operation_step(step)
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.INSERT,
+                        index=self._size,
+                        value=value,
+                        description=f'入队失败：队列已满 (容量: {self._capacity})',
+                        code_template='queue_enqueue',
+                        code_line=3,
+                        code_highlight=[2, 3, 4]
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
                 return False
 
-        target_index = self._rear + 1
-        step = OperationStep(
-            OperationType.INSERT,
-            index=target_index,
-            value=value,
-            description=f'准备将元素 {value} 入队到位置 {target_index}',
-            highlight_indices=[target_index],
-            code_template='queue_enqueue',
-            code_line=7,
-            code_highlight=[7, 8],
-            visual_hints={'front': self._front, 'rear': self._rear}
-        )
-        self.add_operation_step(step)
-
-        move_step = OperationStep(
-            OperationType.POINTER_MOVE,
-            index=target_index,
-            description=f'REAR 移动到位置 {target_index}',
-            highlight_indices=[target_index],
-            pointer_position=target_index,
-            animation_type="move",
-            duration=0.35,
-            data_snapshot=self.to_list(),
-            visual_hints={'front': self._front, 'rear': target_index}
-        )
-        self.add_operation_step(move_step)
+        target_index = self._next_slot(self._rear)
+        wrapped = target_index <= self._rear  # 循环队列：rear 从数组末尾回绕到开头
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INSERT,
+                index=target_index,
+                value=value,
+                description=f'准备将元素 {value} 入队到位置 {target_index}'
+                            + (f'（rear 已在末尾，回绕到位置 {target_index}）' if wrapped else ''),
+                highlight_indices=[target_index],
+                code_template='queue_enqueue',
+                code_line=7,
+                code_highlight=[7, 8],
+                visual_hints=self._pointer_hints(self._front, self._rear)
+            )
+            self.add_operation_step(step)
+
+            move_step = OperationStep(
+                OperationType.POINTER_MOVE,
+                index=target_index,
+                description=f'REAR 移动到位置 {target_index}'
+                            + (f'（(rear + 1) % {self._capacity} 回绕）' if wrapped else ''),
+                highlight_indices=[target_index],
+                pointer_position=target_index,
+                animation_type="move",
+                duration=0.35,
+                data_snapshot=self._trace_snapshot(),
+                visual_hints=self._pointer_hints(self._front, target_index, wrap=wrapped)
+            )
+            self.add_operation_step(move_step)
 
         # 写入数据
         if self._capacity is None:
@@ -114,146 +132,161 @@ class SequentialQueue(LinearStructureBase):
             self._data[target_index] = value
         self._rear = target_index
         self._size += 1
+        self._record_inserts()
         if self._size == 1:
             self._front = 0
 
-        step = OperationStep(
-            OperationType.INSERT,
-            index=target_index,
-            value=value,
-            description=f'成功入队元素 {value} 到位置 {target_index}，当前大小: {self._size}',
-            highlight_indices=[0, self._size - 1] if self._size > 1 else [0],
-            code_template='queue_enqueue',
-            code_line=10,
-            code_highlight=[10],
-            visual_hints={'front': self._front, 'rear': self._rear}
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INSERT,
+                index=target_index,
+                value=value,
+                description=f'成功入队元素 {value} 到位置 {target_index}，当前大小: {self._size}',
+                highlight_indices=[0, self._size - 1] if self._size > 1 else [0],
+                code_template='queue_enqueue',
+                code_line=10,
+                code_highlight=[10],
+                visual_hints=self._pointer_hints(self._front, self._rear)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
 
     def dequeue(self) -> Any:
         if self.is_empty():
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.DELETE,
+                    index=0,
+                    description='出队失败：队列为空',
+                    code_template='queue_dequeue',
+                    code_line=3,
+                    code_highlight=[2, 3, 4]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return None
+
+        old_front = self._front
+        front_value = self._data[old_front] if old_front < len(self._data) else None
+
+        if self._tracing():
             step = OperationStep(
                 OperationType.DELETE,
-                index=0,
-                description='出队失败：队列为空',
+                index=old_front,
+                value=front_value,
+                description=f'准备出队队首元素 {front_value}',
+                highlight_indices=[old_front],
                 code_template='queue_dequeue',
-                code_line=3,
-                code_highlight=[2, 3, 4]
+                code_line=7,
+                code_highlight=[7],
+                visual_hints=self._pointer_hints(old_front, self._rear)
             )
             self.add_operation_step(step)
-            return None
-
-        old_front = self._front
-        front_value = self._data[old_front] if old_front < len(self._data) else None
 
-        step = OperationStep(
-            OperationType.DELETE,
-            index=old_front,
-            value=front_value,
-            description=f'准备出队队首元素 {front_value}',
-            highlight_indices=[old_front],
-            code_template='queue_dequeue',
-            code_line=7,
-            code_highlight=[7],
-            visual_hints={'front': old_front, 'rear': self._rear}
-        )
-        self.add_operation_step(step)
-
-        # 清空当前队首并仅移动指针（非循环队列）
+        # 清空当前队首并仅移动指针（循环队列按容量取模）
         if self._capacity is None and old_front < len(self._data):
             self._data[old_front] = None
         elif self._capacity is not None and old_front < len(self._data):
             self._data[old_front] = None
 
-        move_step = OperationStep(
-            OperationType.POINTER_MOVE,
-            index=old_front,
-            description=f'FRONT 从 {old_front} 移动到 {old_front + 1 if self._size > 0 else 0}',
-            highlight_indices=[old_front],
-            pointer_position=old_front,
-            animation_type="move",
-            duration=0.35,
-            data_snapshot=self.to_list(),
-            visual_hints={'front': old_front + 1 if self._size > 0 else 0, 'rear': self._rear}
-        )
-        self.add_operation_step(move_step)
-
-        self._front += 1
+        new_front = self._next_slot(old_front)
+        wrapped = new_front < old_front
+        if self._tracing():
+            move_step = OperationStep(
+                OperationType.POINTER_MOVE,
+                index=old_front,
+                description=f'FRONT 从 {old_front} 移动到 {new_front if self._size > 0 else 0}'
+                            + (f'（(front + 1) % {self._capacity} 回绕）' if wrapped else ''),
+                highlight_indices=[old_front],
+                pointer_position=old_front,
+                animation_type="move",
+                duration=0.35,
+                data_snapshot=self._trace_snapshot(),
+                visual_hints=self._pointer_hints(new_front if self._size > 0 else 0, self._rear, wrap=wrapped)
+            )
+            self.add_operation_step(move_step)
+
+        self._front = new_front
         self._size -= 1
         if self._size == 0:
             # 重置指针
             self._front = 0
             self._rear = -1
 
-        step = OperationStep(
-            OperationType.DELETE,
-            index=old_front,
-            value=front_value,
-            description=f'成功出队 {front_value}，当前大小: {self._size}',
-            highlight_indices=[self._front] if self._size > 0 else [],
-            code_template='queue_dequeue',
-            code_line=10,
-            code_highlight=[10],
-            visual_hints={'front': self._front, 'rear': self._rear}
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.DELETE,
+                index=old_front,
+                value=front_value,
+                description=f'成功出队 {front_value}，当前大小: {self._size}',
+                highlight_indices=[self._front] if self._size > 0 else [],
+                code_template='queue_dequeue',
+                code_line=10,
+                code_highlight=[10],
+                visual_hints=self._pointer_hints(self._front, self._rear)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+
+        self._maybe_shrink()
         return front_value
 
     def front(self) -> Any:
         if self.is_empty():
-            step = OperationStep(
-                OperationType.SEARCH,
-                description='查看失败：队列为空',
-                code_template='queue_front',
-                code_line=3,
-                code_highlight=[2, 3, 4]
-            )
-            self.add_operation_step(step)
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    description='查看失败：队列为空',
+                    code_template='queue_front',
+                    code_line=3,
+                    code_highlight=[2, 3, 4]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return None
 
         idx = self._front
         value = self._data[idx]
-        step = OperationStep(
-            OperationType.SEARCH,
-            index=idx,
-            value=value,
-            description=f'队首元素: {value}',
-            highlight_indices=[idx],
-            code_template='queue_front',
-            code_line=7,
-            code_highlight=[7],
-            visual_hints={'front': self._front, 'rear': self._rear}
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                index=idx,
+                value=value,
+                description=f'队首元素: {value}',
+                highlight_indices=[idx],
+                code_template='queue_front',
+                code_line=7,
+                code_highlight=[7],
+                visual_hints=self._pointer_hints(self._front, self._rear)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return value
 
     def rear(self) -> Any:
         if self.is_empty():
-            step = OperationStep(
-                OperationType.SEARCH,
-                description='查看失败：队列为空',
-                code_template='queue_rear',
-                code_line=3,
-                code_highlight=[2, 3, 4]
-            )
-            self.add_operation_step(step)
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    description='查看失败：队列为空',
+                    code_template='queue_rear',
+                    code_line=3,
+                    code_highlight=[2, 3, 4]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return None
 
         idx = self._rear
         value = self._data[idx] if idx >= 0 else None
-        step = OperationStep(
-            OperationType.SEARCH,
-            index=idx,
-            value=value,
-            description=f'队尾元素: {value}',
-            highlight_indices=[idx],
-            code_template='queue_rear',
-            code_line=7,
-            code_highlight=[7],
-            visual_hints={'front': self._front, 'rear': self._rear}
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                index=idx,
+                value=value,
+                description=f'队尾元素: {value}',
+                highlight_indices=[idx],
+                code_template='queue_rear',
+                code_line=7,
+                code_highlight=[7],
+                visual_hints=self._pointer_hints(self._front, self._rear)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return value
 
     # 兼容基类接口
@@ -265,31 +298,34 @@ class SequentialQueue(LinearStructureBase):
 
     def search(self, value: Any) -> int:
         for i in range(self._size):
-            idx = self._front + i
+            idx = self._slot(i)
             if idx < len(self._data) and self._data[idx] == value:
-                step = OperationStep(
-                    OperationType.SEARCH,
-                    index=idx,
-                    value=value,
-                    description=f'找到元素 {value} 于位置 {idx}',
-                    highlight_indices=[idx],
-                    visual_hints={'front': self._front, 'rear': self._rear}
-                )
-                self.add_operation_step(step)
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        index=idx,
+                        value=value,
+                        description=f'找到元素 {value} 于位置 {idx}',
+                        highlight_indices=[idx],
+                        visual_hints=self._pointer_hints(self._front, self._rear)
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
                 return idx
 
-        step = OperationStep(
-            OperationType.SEARCH,
-            value=value,
-            description=f'未找到元素 {value}',
-            visual_hints={'front': self._front, 'rear': self._rear}
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                value=value,
+                description=f'未找到元素 {value}',
+                visual_hints=self._pointer_hints(self._front, self._rear)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return -1
 
     def get(self, index: int, value: Any = None) -> Any:
         if 0 <= index < self._size:
-            return self._data[index]
+            # 循环队列按从队首数起的逻辑位置取值
+            return self._data[self._slot(index) if self._circular else index]
         return None
 
     def size(self) -> int:
@@ -301,8 +337,13 @@ class SequentialQueue(LinearStructureBase):
     def is_full(self) -> bool:
         if self._capacity is None:
             return False
+        if self._circular:
+            return self._size >= self._capacity
         return (self._rear + 1) >= self._capacity
 
+    def is_circular(self) -> bool:
+        return self._circular
+
     def to_list(self) -> List[Any]:
         return list(self._data)
 
@@ -316,22 +357,106 @@ class SequentialQueue(LinearStructureBase):
         return self._rear
 
     def clear(self) -> None:
-        step = OperationStep(
-            OperationType.CLEAR,
-            description='清空队列'
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.CLEAR,
+                description='清空队列'
+            )
+            self.add_operation_step(step)
 
         self._data = [] if self._capacity is None else [None] * self._capacity
         self._size = 0
         self._front = 0
         self._rear = -1
 
-        step = OperationStep(
-            OperationType.CLEAR,
-            description='队列已清空'
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.CLEAR,
+                description='队列已清空'
+            )
+            self.add_operation_step(step)
+
+    def bulk_insert(self, index: int, values: List[Any]) -> bool:
+        """批量入队（与 insert 一样忽略 index），容量不足时一次扩到位"""
+        values = list(values)
+        requested = len(values)
+        if self._capacity is not None:
+            # 普通队列按 rear 之后的空位计算，循环队列按元素数计算
+            self._reserve(self._used_slots() + requested)
+            values = values[:self._capacity - self._used_slots()]
+        start = self._next_slot(self._rear)
+        for value in values:
+            target_index = self._next_slot(self._rear)
+            if target_index < len(self._data):
+                self._data[target_index] = value
+            else:
+                self._data.append(value)
+            self._rear = target_index
+        if values and self._size == 0:
+            self._front = start
+        self._size += len(values)
+        self._record_inserts(len(values))
+        self._bulk_step(OperationType.INSERT, start, values, requested)
+        return len(values) == requested
+
+    def bulk_delete(self, index: int, count: int) -> List[Any]:
+        """批量出队（忽略 index），返回按出队顺序排列的元素"""
+        requested = count
+        count = max(0, min(count, self._size))
+        start = self._front
+        deleted = []
+        for _ in range(count):
+            deleted.append(self._data[self._front])
+            self._data[self._front] = None
+            self._front = self._next_slot(self._front)
+        self._size -= count
+        if self._size == 0:
+            self._front = 0
+            self._rear = -1
+        self._bulk_step(OperationType.DELETE, start, deleted, requested)
+
+        while self._maybe_shrink():
+            pass
+        return deleted
+
+    def _used_slots(self) -> int:
+        """已占用的槽位数：循环队列是元素数，普通队列出队腾出的槽位不再使用，按 rear + 1 计"""
+        return self._size if self._circular else self._rear + 1
+
+    def _slot(self, offset: int) -> int:
+        """从队首数起第 offset 个元素所在的数组下标"""
+        if self._circular:
+            return (self._front + offset) % self._capacity
+        return self._front + offset
+
+    def _next_slot(self, index: int) -> int:
+        """下标 index 的下一个槽位；循环队列在数组末尾回绕到 0"""
+        if self._circular:
+            return (index + 1) % self._capacity
+        return index + 1
+
+    def _items(self) -> List[Any]:
+        return [self._data[self._slot(i)] for i in range(self._size)]
+
+    def _after_resize(self) -> None:
+        # 新数组从下标 0 开始紧凑存放
+        self._front = 0
+        self._rear = self._size - 1
+
+    def _resize_hints(self) -> Dict[str, Any]:
+        hints = self._pointer_hints(self._front, self._rear)
+        hints.update(super()._resize_hints())
+        return hints
+
+    def _pointer_hints(self, front: int, rear: int, wrap: bool = False) -> dict:
+        """front / rear 指针的可视化提示；循环队列额外标记 circular，指针回绕时标记 wrap"""
+        hints = {'front': front, 'rear': rear}
+        if self._circular:
+            hints['circular'] = True
+            hints['capacity'] = self._capacity
+            if wrap:
+                hints['wrap'] = True
+        return hints
 
     # 扩容
     def _expand(self) -> bool:
@@ -339,57 +464,63 @@ class SequentialQueue(LinearStructureBase):
             return False
 
         old_capacity = self._capacity
-        new_capacity = max(int(old_capacity * 1.5), old_capacity + 1)
+        new_capacity = self._policy.grow(old_capacity)
+        if new_capacity is None:
+            self._max_capacity_step()
+            return False
 
         # 1) 提示扩容
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'容量已满 (当前: {self._size}/{old_capacity})，触发扩容',
-            animation_type="highlight",
-            duration=0.5,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'容量已满 (当前: {self._size}/{old_capacity})，触发扩容',
+                animation_type="highlight",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
 
         # 2) 创建新槽位
         new_data = [None] * new_capacity
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'准备扩容: {old_capacity} -> {new_capacity}',
-            animation_type="fade",
-            duration=0.8,
-            data_snapshot=self.to_list(),
-            visual_hints={'new_array': new_data[:], 'new_capacity': new_capacity}
-        )
-        self.add_operation_step(step)
-
-        # 3) 复制元素（保持逻辑顺序，从 front 开始紧凑拷贝）
-        for i in range(self._size):
-            new_data[i] = self._data[self._front + i]
-
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'完成复制 {self._size} 个元素',
-            animation_type="highlight",
-            duration=0.4,
-            data_snapshot=self.to_list(),
-            visual_hints={'new_array': new_data[:], 'new_capacity': new_capacity}
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'准备扩容: {old_capacity} -> {new_capacity}',
+                animation_type="fade",
+                duration=0.8,
+                data_snapshot=self._trace_snapshot(),
+                visual_hints={'new_array': new_data[:], 'new_capacity': new_capacity}
+            )
+            self.add_operation_step(step)
+
+        # 3) 复制元素（保持逻辑顺序，从 front 开始紧凑拷贝；循环队列在此展开回绕的部分）
+        new_data[:self._size] = self._items()
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'完成复制 {self._size} 个元素',
+                animation_type="highlight",
+                duration=0.4,
+                data_snapshot=self._trace_snapshot(),
+                visual_hints={'new_array': new_data[:], 'new_capacity': new_capacity}
+            )
+            self.add_operation_step(step)
 
         # 4) 切换新数组
         self._data = new_data
         self._capacity = new_capacity
-        self._front = 0
-        self._rear = self._size - 1
+        self._after_resize()
+        self._record_resize(self._size)
 
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'✓ 扩容完成！新容量: {new_capacity}',
-            animation_type="fade",
-            duration=0.6,
-            data_snapshot=self.to_list(),
-            visual_hints={'front': self._front, 'rear': self._rear}
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'✓ 扩容完成！新容量: {new_capacity}',
+                animation_type="fade",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY),
+                visual_hints=self._resize_hints()
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
@@ -1,34 +1,52 @@
 from dsvision.linear.base import LinearStructureBase
-from ..operation.operation import OperationStep, OperationType
-from typing import List,Any
+from .capacity import CapacityPolicy, ResizableArrayMixin
+from ..operation.operation import OperationStep, OperationType, TraceLevel
+from typing import List,Any,Optional
 
-class SequentialList(LinearStructureBase):
-    """顺序表实现"""
-    def __init__(self,capacity:int = 100):
+class SequentialList(ResizableArrayMixin, LinearStructureBase):
+    """顺序表实现（扩容/缩容规则见 CapacityPolicy）"""
+    def __init__(self,capacity:int = 100, policy: Optional[CapacityPolicy] = None):
         super().__init__()
         self._capacity = capacity
         self._data = [None] * capacity #创建一个长度为 capacity 的列表，每个位置先用 None 占位
         self._size = 0
+        self._init_capacity_policy(policy)
 
         #记录初始化步骤
-        step = OperationStep(
-            OperationType.INIT,
-            description = f"初始化顺序表，容量为{capacity}"
-        )
-        self.add_operation_step(step)
-
-    def initlist(self,values:List[Any]) -> bool:
-        """从列表批量初始化顺序表"""
-        if len(values) > self._capacity:
+        if self._tracing():
             step = OperationStep(
                 OperationType.INIT,
-                description = f'初始化失败：元素数量({len(values)})超过容量({self._capacity})'
+                description = f"初始化顺序表，容量为{capacity}"
             )
             self.add_operation_step(step)
+
+    def initlist(self,values:List[Any]) -> bool:
+        """从列表批量初始化顺序表"""
+        if len(values) > self._capacity:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INIT,
+                    description = f'初始化失败：元素数量({len(values)})超过容量({self._capacity})'
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return False
         #清空现有数据
         self._data = [None] * self._capacity
         self._size = 0
+        if not self._tracing():
+            # 不展示逐个插入时整段写入
+            self._data[:len(values)] = values
+            self._size = len(values)
+            self._record_inserts(len(values))
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INIT,
+                    description=f'批量初始化完成，共 {self._size} 个元素',
+                    data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return True
+
         step = OperationStep(
             OperationType.INIT,
             description=f'开始批量初始化 {len(values)} 个元素',
@@ -44,46 +62,51 @@ class SequentialList(LinearStructureBase):
                 step = OperationStep(
                     OperationType.INSERT,
                     description=f'容量已满，停止插入',
-                    data_snapshot=self.to_list()
+                    data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
                 )
-                self.add_operation_step(step)
+                self.add_operation_step(step, TraceLevel.SUMMARY)
                 return False
 
             # 显示当前正在插入的元素
-            step = OperationStep(
-                OperationType.INSERT,
-                index=i,
-                value=value,
-                description=f'正在插入第 {i + 1} 个元素: {value}',
-                highlight_indices=[i],
-                animation_type="fade",
-                duration=0.3,
-                data_snapshot=self.to_list()
-            )
-            self.add_operation_step(step)
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.INSERT,
+                    index=i,
+                    value=value,
+                    message_id='seq_init_inserting',
+                    message_args={'ordinal': i + 1, 'value': value},
+                    highlight_indices=[i],
+                    animation_type="fade",
+                    duration=0.3,
+                    data_snapshot=self._trace_snapshot()
+                )
+                self.add_operation_step(step)
 
             self._data[i] = value
             self._size += 1
+            self._record_inserts()
 
             # 显示插入后的状态
-            step = OperationStep(
-                OperationType.INSERT,
-                index=i,
-                value=value,
-                description=f'成功插入元素 {value} 到位置 {i}',
-                highlight_indices=[i],
-                animation_type="highlight",
-                duration=0.2,
-                data_snapshot=self.to_list()
-            )
-            self.add_operation_step(step)
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.INSERT,
+                    index=i,
+                    value=value,
+                    message_id='seq_init_inserted',
+                    message_args={'value': value, 'index': i},
+                    highlight_indices=[i],
+                    animation_type="highlight",
+                    duration=0.2,
+                    data_snapshot=self._trace_snapshot()
+                )
+                self.add_operation_step(step)
 
         step = OperationStep(
             OperationType.INIT,
             description=f'批量初始化完成，共 {self._size} 个元素',
-            data_snapshot=self.to_list()
+            data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
         )
-        self.add_operation_step(step)
+        self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
 
     def insert(self,index:int,value:Any) -> bool:
@@ -93,152 +116,164 @@ class SequentialList(LinearStructureBase):
 
         # === 步骤1: 检查容量，如果满了就扩容 ===
         # 🔥 对应C++代码第2-4行
-        step = OperationStep(
-            OperationType.INSERT,
-            description=f'检查容量 (当前: {self._size}/{self._capacity})',
-            data_snapshot=self.to_list(),
-            code_template='sequential_insert',
-            code_line=2,
-            code_highlight=[2, 3, 4]
-        )
-        self.add_operation_step(step)
-
-        if self._size >= self._capacity:
-            # 触发扩容
+        if self._tracing():
             step = OperationStep(
                 OperationType.INSERT,
-                description=f'容量已满，触发扩容 (line 3)',
-                data_snapshot=self.to_list(),
+                description=f'检查容量 (当前: {self._size}/{self._capacity})',
+                data_snapshot=self._trace_snapshot(),
                 code_template='sequential_insert',
-                code_line=3,
-                code_highlight=[3]
+                code_line=2,
+                code_highlight=[2, 3, 4]
             )
             self.add_operation_step(step)
 
-            if not self._expand():
+        if self._size >= self._capacity:
+            # 触发扩容
+            if self._tracing():
                 step = OperationStep(
                     OperationType.INSERT,
-                    index=index,
-                    value=value,
-                    description=f'扩容失败，无法插入',
-                    data_snapshot=self.to_list()
+                    description=f'容量已满，触发扩容 (line 3)',
+                    data_snapshot=self._trace_snapshot(),
+                    code_template='sequential_insert',
+                    code_line=3,
+                    code_highlight=[3]
                 )
                 self.add_operation_step(step)
+
+            if not self._expand():
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.INSERT,
+                        index=index,
+                        value=value,
+                        description=f'扩容失败，无法插入',
+                        data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
                 return False
 
         # === 步骤2: 检查索引 ===
         # 🔥 对应C++代码第7-9行
-        step = OperationStep(
-            OperationType.INSERT,
-            index=index,
-            description=f'检查索引有效性 (索引: {index}, 范围: 0-{self._size})',
-            data_snapshot=self.to_list(),
-            code_template='sequential_insert',
-            code_line=7,
-            code_highlight=[7, 8, 9]
-        )
-        self.add_operation_step(step)
-
-        if index < 0 or index > self._size:
+        if self._tracing():
             step = OperationStep(
                 OperationType.INSERT,
                 index=index,
-                value=value,
-                description=f'插入失败：索引越界 (line 8)',
-                data_snapshot=self.to_list(),
+                description=f'检查索引有效性 (索引: {index}, 范围: 0-{self._size})',
+                data_snapshot=self._trace_snapshot(),
                 code_template='sequential_insert',
-                code_line=8,
-                code_highlight=[8]
+                code_line=7,
+                code_highlight=[7, 8, 9]
             )
             self.add_operation_step(step)
+
+        if index < 0 or index > self._size:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INSERT,
+                    index=index,
+                    value=value,
+                    description=f'插入失败：索引越界 (line 8)',
+                    data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY),
+                    code_template='sequential_insert',
+                    code_line=8,
+                    code_highlight=[8]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return False
 
         # === 步骤3: 显示插入目标 ===
-        step = OperationStep(
-            OperationType.INSERT,
-            index=index,
-            value=value,
-            description=f'准备在位置 {index} 插入元素 {value}',
-            highlight_indices=[index],
-            animation_type="highlight",
-            duration=0.5,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
-
-        # === 步骤4: 如果不是末尾插入，需要移动元素 ===
-        # 🔥 对应C++代码第12-14行
-        if index < self._size:
+        if self._tracing():
             step = OperationStep(
                 OperationType.INSERT,
                 index=index,
                 value=value,
-                description=f'需要将位置 {index} 到 {self._size - 1} 的元素向后移动 (line 12)',
-                highlight_indices=list(range(index, self._size)),
+                description=f'准备在位置 {index} 插入元素 {value}',
+                highlight_indices=[index],
                 animation_type="highlight",
                 duration=0.5,
-                data_snapshot=self.to_list(),
-                code_template='sequential_insert',
-                code_line=12,
-                code_highlight=[12, 13, 14]
+                data_snapshot=self._trace_snapshot()
             )
             self.add_operation_step(step)
 
-            # 从后往前逐个移动
-            for i in range(self._size, index, -1):
+        # === 步骤4: 如果不是末尾插入，需要移动元素 ===
+        # 🔥 对应C++代码第12-14行
+        if index < self._size:
+            if self._tracing():
                 step = OperationStep(
-                    OperationType.POINTER_MOVE,
-                    index=i - 1,
-                    description=f'将位置 {i - 1} 的元素移动到位置 {i} (line 13)',
-                    pointer_position=i - 1,
-                    highlight_indices=[i - 1, i],
-                    animation_type="move",
-                    duration=0.4,
-                    data_snapshot=self.to_list(),
+                    OperationType.INSERT,
+                    index=index,
+                    value=value,
+                    description=f'需要将位置 {index} 到 {self._size - 1} 的元素向后移动 (line 12)',
+                    highlight_indices=list(range(index, self._size)),
+                    animation_type="highlight",
+                    duration=0.5,
+                    data_snapshot=self._trace_snapshot(),
                     code_template='sequential_insert',
-                    code_line=13,
-                    code_highlight=[13]
+                    code_line=12,
+                    code_highlight=[12, 13, 14]
                 )
                 self.add_operation_step(step)
 
+            # 从后往前逐个移动
+            for i in range(self._size, index, -1):
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.POINTER_MOVE,
+                        index=i - 1,
+                        message_id='seq_shift_right',
+                        message_args={'src': i - 1, 'dst': i},
+                        pointer_position=i - 1,
+                        highlight_indices=[i - 1, i],
+                        animation_type="move",
+                        duration=0.4,
+                        data_snapshot=self._trace_snapshot(),
+                        code_template='sequential_insert',
+                        code_line=13,
+                        code_highlight=[13]
+                    )
+                    self.add_operation_step(step)
+
                 self._data[i] = self._data[i - 1]
 
         # === 步骤5: 插入新元素 ===
         # 🔥 对应C++代码第17行
-        step = OperationStep(
-            OperationType.CREATE_NODE,
-            index=index,
-            value=value,
-            description=f'在位置 {index} 插入新元素 {value} (line 17)',
-            highlight_indices=[index],
-            animation_type="fade",
-            duration=0.5,
-            data_snapshot=self.to_list(),
-            code_template='sequential_insert',
-            code_line=17,
-            code_highlight=[17]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.CREATE_NODE,
+                index=index,
+                value=value,
+                description=f'在位置 {index} 插入新元素 {value} (line 17)',
+                highlight_indices=[index],
+                animation_type="fade",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot(),
+                code_template='sequential_insert',
+                code_line=17,
+                code_highlight=[17]
+            )
+            self.add_operation_step(step)
 
         self._data[index] = value
         self._size += 1
+        self._record_inserts()
 
         # === 步骤6: 更新大小 ===
         # 🔥 对应C++代码第18行
-        step = OperationStep(
-            OperationType.INSERT,
-            index=index,
-            value=value,
-            description=f'✓ 插入完成！size++ (当前大小: {self._size}) (line 18)',
-            highlight_indices=[index],
-            animation_type="highlight",
-            duration=0.8,
-            data_snapshot=self.to_list(),
-            code_template='sequential_insert',
-            code_line=18,
-            code_highlight=[18]
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INSERT,
+                index=index,
+                value=value,
+                description=f'✓ 插入完成！size++ (当前大小: {self._size}) (line 18)',
+                highlight_indices=[index],
+                animation_type="highlight",
+                duration=0.8,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY),
+                code_template='sequential_insert',
+                code_line=18,
+                code_highlight=[18]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
 
     def delete(self, index: int = None, value: Any = None) -> Any:
@@ -248,130 +283,141 @@ class SequentialList(LinearStructureBase):
 
         # 如果传入值，则先查找对应索引并展示遍历动画
         if value is not None and (index is None or index == ''):
-            step = OperationStep(
-                OperationType.SEARCH,
-                value=value,
-                description=f'按值删除：开始查找第一个值为 {value} 的元素',
-                data_snapshot=self.to_list(),
-                code_template='sequential_delete',
-                code_line=1,
-                code_highlight=[1]
-            )
-            self.add_operation_step(step)
-
-            found_idx = -1
-            for i in range(self._size):
+            if self._tracing():
                 step = OperationStep(
-                    OperationType.COMPARE,
-                    index=i,
+                    OperationType.SEARCH,
                     value=value,
-                    description=f'比较位置 {i}: {self._data[i]} == {value} ?',
-                    pointer_position=i,
-                    highlight_indices=[i],
-                    compare_indices=[i],
-                    animation_type="highlight",
-                    duration=0.4,
-                    data_snapshot=self.to_list(),
+                    description=f'按值删除：开始查找第一个值为 {value} 的元素',
+                    data_snapshot=self._trace_snapshot(),
                     code_template='sequential_delete',
-                    code_line=2,
-                    code_highlight=[2, 3, 4]
+                    code_line=1,
+                    code_highlight=[1]
                 )
                 self.add_operation_step(step)
 
-                if self._data[i] == value or str(self._data[i]) == str(value):
-                    found_idx = i
+            found_idx = -1
+            for i in range(self._size):
+                if self._tracing():
                     step = OperationStep(
-                        OperationType.SEARCH,
+                        OperationType.COMPARE,
                         index=i,
                         value=value,
-                        description=f'✓ 找到第一个匹配值 {value}，索引 {i}',
+                        message_id='seq_delete_compare',
+                        message_args={'index': i, 'current': self._data[i], 'value': value},
+                        pointer_position=i,
                         highlight_indices=[i],
+                        compare_indices=[i],
                         animation_type="highlight",
-                        duration=0.7,
-                        data_snapshot=self.to_list()
+                        duration=0.4,
+                        data_snapshot=self._trace_snapshot(),
+                        code_template='sequential_delete',
+                        code_line=2,
+                        code_highlight=[2, 3, 4]
                     )
                     self.add_operation_step(step)
+
+                if self._data[i] == value or str(self._data[i]) == str(value):
+                    found_idx = i
+                    if self._tracing():
+                        step = OperationStep(
+                            OperationType.SEARCH,
+                            index=i,
+                            value=value,
+                            description=f'✓ 找到第一个匹配值 {value}，索引 {i}',
+                            highlight_indices=[i],
+                            animation_type="highlight",
+                            duration=0.7,
+                            data_snapshot=self._trace_snapshot()
+                        )
+                        self.add_operation_step(step)
                     break
 
             if found_idx == -1:
-                step = OperationStep(
-                    OperationType.DELETE,
-                    description=f'删除失败：未找到值 {value}',
-                    data_snapshot=self.to_list()
-                )
-                self.add_operation_step(step)
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.DELETE,
+                        description=f'删除失败：未找到值 {value}',
+                        data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
                 return None
             index = found_idx
 
         if index is None:
-            step = OperationStep(
-                OperationType.DELETE,
-                description='删除失败：未提供索引或值',
-                data_snapshot=self.to_list()
-            )
-            self.add_operation_step(step)
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.DELETE,
+                    description='删除失败：未提供索引或值',
+                    data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return None
 
         # === 步骤1: 检查索引 ===
         if index < 0 or index >= self._size:
-            step = OperationStep(
-                OperationType.DELETE,
-                index=index,
-                description=f'删除失败：索引越界 (索引: {index}, 有效范围: 0-{self._size - 1})',
-                data_snapshot=self.to_list()
-            )
-            self.add_operation_step(step)
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.DELETE,
+                    index=index,
+                    description=f'删除失败：索引越界 (索引: {index}, 有效范围: 0-{self._size - 1})',
+                    data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return None
 
         deleted_value = self._data[index]
 
         # === 步骤2: 标记要删除的元素 ===
-        step = OperationStep(
-            OperationType.DELETE,
-            index=index,
-            value=deleted_value,
-            description=f'准备删除位置 {index} 的元素 {deleted_value}',
-            highlight_indices=[index],
-            animation_type="highlight",
-            duration=0.5,
-            data_snapshot=self.to_list(),
-            code_template='sequential_delete',
-            code_line=2,
-            code_highlight=[2, 3, 4]
-        )
-        self.add_operation_step(step)
-
-        # === 步骤3: 如果不是最后一个元素，需要前移 ===
-        if index < self._size - 1:
+        if self._tracing():
             step = OperationStep(
                 OperationType.DELETE,
                 index=index,
                 value=deleted_value,
-                description=f'需要将位置 {index + 1} 到 {self._size - 1} 的元素向前移动',
-                highlight_indices=list(range(index + 1, self._size)),
+                description=f'准备删除位置 {index} 的元素 {deleted_value}',
+                highlight_indices=[index],
                 animation_type="highlight",
                 duration=0.5,
-                data_snapshot=self.to_list()
+                data_snapshot=self._trace_snapshot(),
+                code_template='sequential_delete',
+                code_line=2,
+                code_highlight=[2, 3, 4]
             )
             self.add_operation_step(step)
 
-            # 从前往后逐个移动
-            for i in range(index, self._size - 1):
+        # === 步骤3: 如果不是最后一个元素，需要前移 ===
+        if index < self._size - 1:
+            if self._tracing():
                 step = OperationStep(
-                    OperationType.POINTER_MOVE,
-                    index=i,
-                    description=f'将位置 {i + 1} 的元素 {self._data[i + 1]} 移动到位置 {i}',
-                    pointer_position=i + 1,
-                    highlight_indices=[i, i + 1],
-                    animation_type="move",
-                    duration=0.4,
-                    data_snapshot=self.to_list(),
-                    code_template='sequential_delete',
-                    code_line=7,
-                    code_highlight=[7]
+                    OperationType.DELETE,
+                    index=index,
+                    value=deleted_value,
+                    description=f'需要将位置 {index + 1} 到 {self._size - 1} 的元素向前移动',
+                    highlight_indices=list(range(index + 1, self._size)),
+                    animation_type="highlight",
+                    duration=0.5,
+                    data_snapshot=self._trace_snapshot()
                 )
                 self.add_operation_step(step)
 
+            # 从前往后逐个移动
+            for i in range(index, self._size - 1):
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.POINTER_MOVE,
+                        index=i,
+                        message_id='seq_shift_left',
+                        message_args={'src': i + 1, 'value': self._data[i + 1], 'dst': i},
+                        pointer_position=i + 1,
+                        highlight_indices=[i, i + 1],
+                        animation_type="move",
+                        duration=0.4,
+                        data_snapshot=self._trace_snapshot(),
+                        code_template='sequential_delete',
+                        code_line=7,
+                        code_highlight=[7]
+                    )
+                    self.add_operation_step(step)
+
                 self._data[i] = self._data[i + 1]
 
         # === 步骤4: 清空最后一个位置 ===
@@ -379,19 +425,22 @@ class SequentialList(LinearStructureBase):
         self._data[self._size] = None
 
         # === 步骤5: 删除完成 ===
-        step = OperationStep(
-            OperationType.DELETE,
-            index=index,
-            value=deleted_value,
-            description=f'✓ 成功删除元素 {deleted_value}，当前大小: {self._size}',
-            animation_type="fade",
-            duration=0.8,
-            data_snapshot=self.to_list(),
-            code_template='sequential_delete',
-            code_line=11,
-            code_highlight=[11]
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.DELETE,
+                index=index,
+                value=deleted_value,
+                description=f'✓ 成功删除元素 {deleted_value}，当前大小: {self._size}',
+                animation_type="fade",
+                duration=0.8,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY),
+                code_template='sequential_delete',
+                code_line=11,
+                code_highlight=[11]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+
+        self._maybe_shrink()
         return deleted_value
 
     def search(self, value: Any) -> int:
@@ -400,78 +449,85 @@ class SequentialList(LinearStructureBase):
         self._operation_history = []
 
         # === 步骤1: 开始搜索 ===
-        step = OperationStep(
-            OperationType.SEARCH,
-            value=value,
-            description=f'开始在顺序表中搜索元素 {value}',
-            animation_type="instant",
-            duration=0.3,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
-
-        # === 步骤2: 逐个比较 ===
-        for i in range(self._size):
-            # 显示当前检查的位置
+        if self._tracing():
             step = OperationStep(
-                OperationType.COMPARE,
-                index=i,
+                OperationType.SEARCH,
                 value=value,
-                description=f'检查位置 {i}: {self._data[i]} == {value} ?',
-                pointer_position=i,
-                highlight_indices=[i],
-                compare_indices=[i],
-                animation_type="highlight",
-                duration=0.4,
-                data_snapshot=self.to_list(),
-                code_template='sequential_search',
-                code_line=4,
-                code_highlight=[4, 5, 6, 7]
+                description=f'开始在顺序表中搜索元素 {value}',
+                animation_type="instant",
+                duration=0.3,
+                data_snapshot=self._trace_snapshot()
             )
             self.add_operation_step(step)
 
-            # 比较结果（支持类型容错：字符串 vs 数字）
-            if self._data[i] == value or str(self._data[i]) == str(value):
-                # 找到了
+        # === 步骤2: 逐个比较 ===
+        for i in range(self._size):
+            # 显示当前检查的位置
+            if self._tracing():
                 step = OperationStep(
-                    OperationType.SEARCH,
+                    OperationType.COMPARE,
                     index=i,
                     value=value,
-                    description=f'✓ 找到目标元素 {value}，位置为 {i}',
+                    message_id='seq_search_check',
+                    message_args={'index': i, 'current': self._data[i], 'value': value},
+                    pointer_position=i,
                     highlight_indices=[i],
+                    compare_indices=[i],
                     animation_type="highlight",
-                    duration=1.0,
-                    data_snapshot=self.to_list(),
+                    duration=0.4,
+                    data_snapshot=self._trace_snapshot(),
                     code_template='sequential_search',
-                    code_line=6,
-                    code_highlight=[6]
+                    code_line=4,
+                    code_highlight=[4, 5, 6, 7]
                 )
                 self.add_operation_step(step)
+
+            # 比较结果（支持类型容错：字符串 vs 数字）
+            if self._data[i] == value or str(self._data[i]) == str(value):
+                # 找到了
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        index=i,
+                        value=value,
+                        description=f'✓ 找到目标元素 {value}，位置为 {i}',
+                        highlight_indices=[i],
+                        animation_type="highlight",
+                        duration=1.0,
+                        data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY),
+                        code_template='sequential_search',
+                        code_line=6,
+                        code_highlight=[6]
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
                 return i
             else:
                 # 不匹配，继续
-                step = OperationStep(
-                    OperationType.COMPARE,
-                    index=i,
-                    value=value,
-                    description=f'✗ {self._data[i]} ≠ {value}，继续搜索',
-                    pointer_position=i,
-                    animation_type="instant",
-                    duration=0.2,
-                    data_snapshot=self.to_list()
-                )
-                self.add_operation_step(step)
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.COMPARE,
+                        index=i,
+                        value=value,
+                        message_id='seq_search_miss',
+                        message_args={'current': self._data[i], 'value': value},
+                        pointer_position=i,
+                        animation_type="instant",
+                        duration=0.2,
+                        data_snapshot=self._trace_snapshot()
+                    )
+                    self.add_operation_step(step)
 
         # === 步骤3: 未找到 ===
-        step = OperationStep(
-            OperationType.SEARCH,
-            value=value,
-            description=f'✗ 未找到元素 {value}',
-            animation_type="instant",
-            duration=0.5,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                value=value,
+                description=f'✗ 未找到元素 {value}',
+                animation_type="instant",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return -1
 
     def get(self, index: int) -> Any:
@@ -498,124 +554,192 @@ class SequentialList(LinearStructureBase):
         """获取已使用的大小"""
         return self._size
 
+    def bulk_insert(self, index: int, values: List[Any]) -> bool:
+        """从 index 起整段插入：后面的元素整体后移一次，容量不足时一次扩到位，O(n + k)"""
+        values = list(values)
+        if index < 0 or index > self._size:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INSERT,
+                    index=index,
+                    description=f'批量插入失败：索引 {index} 超出范围 [0, {self._size}]'
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return False
+
+        self._reserve(self._size + len(values))
+        count = min(len(values), self._capacity - self._size)
+        self._data[index + count:self._size + count] = self._data[index:self._size]
+        self._data[index:index + count] = values[:count]
+        self._size += count
+        self._record_inserts(count)
+        self._bulk_step(OperationType.INSERT, index, values[:count], len(values))
+        return count == len(values)
+
+    def bulk_delete(self, index: int, count: int) -> List[Any]:
+        """删除 index 起的 count 个元素：后面的元素整体前移一次，O(n)"""
+        if index < 0 or index >= self._size:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.DELETE,
+                    index=index,
+                    description=f'批量删除失败：索引 {index} 超出范围 [0, {self._size - 1}]'
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return []
+
+        requested = count
+        count = max(0, min(count, self._size - index))
+        deleted = self._data[index:index + count]
+        self._data[index:self._size - count] = self._data[index + count:self._size]
+        self._data[self._size - count:self._size] = [None] * count
+        self._size -= count
+        self._bulk_step(OperationType.DELETE, index, deleted, requested)
+
+        while self._maybe_shrink():
+            pass
+        return deleted
+
+    def _items(self) -> List[Any]:
+        return self._data[:self._size]
+
     def _expand(self) -> bool:
-        """扩容操作 - 1.5倍扩容，带完整动画步骤"""
+        """扩容操作 - 按容量策略扩容（默认1.5倍），带完整动画步骤"""
         old_capacity = self._capacity
-        new_capacity = int(old_capacity * 1.5)
+        new_capacity = self._policy.grow(old_capacity)
+        if new_capacity is None:
+            self._max_capacity_step()
+            return False
 
         # === 步骤1: 开始扩容提示 ===
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'容量已满 (当前: {self._size}/{old_capacity})，触发扩容',
-            animation_type="highlight",
-            duration=0.5,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'容量已满 (当前: {self._size}/{old_capacity})，触发扩容',
+                animation_type="highlight",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
 
         # === 步骤2: 显示扩容计划 ===
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'准备扩容: {old_capacity} -> {new_capacity} (1.5倍)',
-            animation_type="instant",
-            duration=0.5,
-            data_snapshot=self.to_list(),
-            code_template='sequential_expand',
-            code_line=2,
-            code_highlight=[2, 3]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'准备扩容: {old_capacity} -> {new_capacity} ({self._policy.growth_factor:g}倍)',
+                animation_type="instant",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot(),
+                code_template='sequential_expand',
+                code_line=2,
+                code_highlight=[2, 3]
+            )
+            self.add_operation_step(step)
 
         # === 步骤3: 创建新数组（在下方显示） ===
         new_data = [None] * new_capacity
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'创建新数组，容量: {new_capacity}',
-            animation_type="fade",
-            duration=0.8,
-            data_snapshot=self.to_list(),
-            visual_hints={'new_array': new_data, 'new_capacity': new_capacity},
-            code_template='sequential_expand',
-            code_line=6,
-            code_highlight=[6]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'创建新数组，容量: {new_capacity}',
+                animation_type="fade",
+                duration=0.8,
+                data_snapshot=self._trace_snapshot(),
+                visual_hints={'new_array': new_data, 'new_capacity': new_capacity},
+                code_template='sequential_expand',
+                code_line=6,
+                code_highlight=[6]
+            )
+            self.add_operation_step(step)
 
         # === 步骤4: 逐个复制元素到新数组 ===
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'开始复制 {self._size} 个元素到新数组',
-            animation_type="instant",
-            duration=0.3,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
-
-        for i in range(self._size):
-            # 显示复制过程
+        if self._tracing():
             step = OperationStep(
                 OperationType.EXPAND,
-                index=i,
-                value=self._data[i],
-                description=f'复制元素 [{i}]: {self._data[i]} 到新数组',
-                highlight_indices=[i],
-                code_template='sequential_expand',
-                code_line=10,
-                code_highlight=[9, 10],
-                animation_type="move",
+                description=f'开始复制 {self._size} 个元素到新数组',
+                animation_type="instant",
                 duration=0.3,
-                data_snapshot=self.to_list(),
-                visual_hints={'copy_index': i, 'new_array': new_data[:]}
+                data_snapshot=self._trace_snapshot()
             )
             self.add_operation_step(step)
 
-            # 执行复制
-            new_data[i] = self._data[i]
+        if not self._tracing():
+            # 不展示逐个复制时整段拷贝
+            new_data[:self._size] = self._data[:self._size]
+        else:
+            for i in range(self._size):
+                # 显示复制过程
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.EXPAND,
+                        index=i,
+                        value=self._data[i],
+                        message_id='seq_copy_element',
+                        message_args={'index': i, 'value': self._data[i]},
+                        highlight_indices=[i],
+                        code_template='sequential_expand',
+                        code_line=10,
+                        code_highlight=[9, 10],
+                        animation_type="move",
+                        duration=0.3,
+                        data_snapshot=self._trace_snapshot(),
+                        visual_hints={'copy_index': i, 'new_array': new_data[:]}
+                    )
+                    self.add_operation_step(step)
+
+                # 执行复制
+                new_data[i] = self._data[i]
+
+                # 显示复制后状态
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.EXPAND,
+                        index=i,
+                        value=self._data[i],
+                        message_id='seq_copied_element',
+                        message_args={'index': i},
+                        highlight_indices=[i],
+                        animation_type="highlight",
+                        duration=0.2,
+                        data_snapshot=self._trace_snapshot(),
+                        visual_hints={'copy_index': i, 'new_array': new_data[:]}
+                    )
+                    self.add_operation_step(step)
 
-            # 显示复制后状态
+        # === 步骤5: 标记旧数组（全红强调） ===
+        if self._tracing():
             step = OperationStep(
                 OperationType.EXPAND,
-                index=i,
-                value=self._data[i],
-                description=f'✓ 已复制元素 [{i}]',
-                highlight_indices=[i],
+                description=f'标记旧数组准备删除',
+                highlight_indices=list(range(self._size)),
                 animation_type="highlight",
-                duration=0.2,
-                data_snapshot=self.to_list(),
-                visual_hints={'copy_index': i, 'new_array': new_data[:]}
+                duration=1.0,
+                data_snapshot=self._trace_snapshot(),
+                visual_hints={'old_array_delete': True, 'new_array': new_data[:]},
+                code_template='sequential_expand',
+                code_line=14,
+                code_highlight=[14]
             )
             self.add_operation_step(step)
 
-        # === 步骤5: 标记旧数组（全红强调） ===
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'标记旧数组准备删除',
-            highlight_indices=list(range(self._size)),
-            animation_type="highlight",
-            duration=1.0,
-            data_snapshot=self.to_list(),
-            visual_hints={'old_array_delete': True, 'new_array': new_data[:]},
-            code_template='sequential_expand',
-            code_line=14,
-            code_highlight=[14]
-        )
-        self.add_operation_step(step)
-
         # === 步骤6: 删除旧数组，切换到新数组 ===
         self._data = new_data
         self._capacity = new_capacity
+        self._record_resize(self._size)
 
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'✓ 扩容完成！新容量: {new_capacity}',
-            animation_type="fade",
-            duration=0.8,
-            data_snapshot=self.to_list(),
-            code_template='sequential_expand',
-            code_line=17,
-            code_highlight=[17, 18]
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'✓ 扩容完成！新容量: {new_capacity}',
+                animation_type="fade",
+                duration=0.8,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY),
+                visual_hints=self._resize_hints(),
+                code_template='sequential_expand',
+                code_line=17,
+                code_highlight=[17, 18]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
 
         return True
 
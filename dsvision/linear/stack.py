@@ -1,38 +1,42 @@
 from .base import LinearStructureBase
-from ..operation.operation import OperationStep, OperationType
+from .capacity import CapacityPolicy, ResizableArrayMixin
+from ..operation.operation import OperationStep, OperationType, TraceLevel
 from typing import List, Any, Optional
 
 
-class SequentialStack(LinearStructureBase):
-    """顺序栈实现 (LIFO - Last In First Out)"""
+class SequentialStack(ResizableArrayMixin, LinearStructureBase):
+    """顺序栈实现 (LIFO - Last In First Out)，有限容量时按 CapacityPolicy 扩容/缩容"""
 
-    def __init__(self, capacity: int = 100):
+    def __init__(self, capacity: int = 100, policy: Optional[CapacityPolicy] = None):
         super().__init__()
         self._capacity = capacity if capacity else None  # None 表示无限容量
         self._data = [] if self._capacity is None else [None] * self._capacity
         self._top = -1  # 栈顶指针，-1表示空栈
+        self._init_capacity_policy(policy)
 
         # 记录初始化步骤
-        step = OperationStep(
-            OperationType.INIT,
-            description=f"初始化顺序栈，容量为{self._capacity if self._capacity is not None else '∞'}",
-            code_template='stack_push',
-            code_line=1,
-            code_highlight=[1]
-        )
-        self.add_operation_step(step)
-
-    def initlist(self, values: List[Any]) -> bool:
-        """从列表批量初始化栈（列表首元素为栈底）"""
-        if self._capacity is not None and len(values) > self._capacity:
+        if self._tracing():
             step = OperationStep(
                 OperationType.INIT,
-                description=f'初始化失败：元素数量({len(values)})超过容量({self._capacity})',
+                description=f"初始化顺序栈，容量为{self._capacity if self._capacity is not None else '∞'}",
                 code_template='stack_push',
-                code_line=3,
-                code_highlight=[2, 3, 4]
+                code_line=1,
+                code_highlight=[1]
             )
             self.add_operation_step(step)
+
+    def initlist(self, values: List[Any]) -> bool:
+        """从列表批量初始化栈（列表首元素为栈底）"""
+        if self._capacity is not None and len(values) > self._capacity:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INIT,
+                    description=f'初始化失败：元素数量({len(values)})超过容量({self._capacity})',
+                    code_template='stack_push',
+                    code_line=3,
+                    code_highlight=[2, 3, 4]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return False
 
         #清空现有数据
@@ -46,16 +50,19 @@ class SequentialStack(LinearStructureBase):
                 self._data.append(value)
             else:
                 self._data[self._top] = value
+        self._record_inserts(len(values))
 
-        step = OperationStep(
-            OperationType.INIT,
-            description=f'批量初始化栈，{len(values)}个元素: {values}',
-            highlight_indices=list(range(len(values))),
-            code_template='stack_push',
-            code_line=11,
-            code_highlight=[7, 8, 9, 10, 11]
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INIT,
+                message_id='stack_init_batch',
+                message_args={'count': len(values), 'values': values},
+                highlight_indices=list(range(len(values))),
+                code_template='stack_push',
+                code_line=11,
+                code_highlight=[7, 8, 9, 10, 11]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
 
     def push(self, value: Any) -> bool:
@@ -66,30 +73,32 @@ class SequentialStack(LinearStructureBase):
                 # 扩容后继续 push
                 pass
             else:
-                step = OperationStep(
-                    OperationType.INSERT,
-                    self._top,
-                    value,
-                    f'入栈失败：栈已满 (容量: {self._capacity})',
-                    code_template='stack_push',
-                    code_line=3,
-                    code_highlight=[2, 3, 4]
-                )
-                self.add_operation_step(step)
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.INSERT,
+                        self._top,
+                        value,
+                        f'入栈失败：栈已满 (容量: {self._capacity})',
+                        code_template='stack_push',
+                        code_line=3,
+                        code_highlight=[2, 3, 4]
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
                 return False
 
         # 记录入栈操作
-        step = OperationStep(
-            OperationType.INSERT,
-            self._top + 1,
-            value,
-            f'准备将元素 {value} 入栈，栈顶指针从 {self._top} 移动到 {self._top + 1}',
-            highlight_indices=[self._top + 1] if self._top >= 0 else [0],
-            code_template='stack_push',
-            code_line=7,
-            code_highlight=[7, 8]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INSERT,
+                self._top + 1,
+                value,
+                f'准备将元素 {value} 入栈，栈顶指针从 {self._top} 移动到 {self._top + 1}',
+                highlight_indices=[self._top + 1] if self._top >= 0 else [0],
+                code_template='stack_push',
+                code_line=7,
+                code_highlight=[7, 8]
+            )
+            self.add_operation_step(step)
 
         # 栈顶指针上移，插入新元素
         self._top += 1
@@ -100,51 +109,55 @@ class SequentialStack(LinearStructureBase):
                 self._data.append(value)
         else:
             self._data[self._top] = value
+        self._record_inserts()
 
         # 记录入栈成功
-        step = OperationStep(
-            OperationType.INSERT,
-            self._top,
-            value,
-            f'成功将元素 {value} 入栈到位置 {self._top}，当前栈大小: {self._top + 1}',
-            highlight_indices=[self._top],
-            code_template='stack_push',
-            code_line=11,
-            code_highlight=[11]
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INSERT,
+                self._top,
+                value,
+                f'成功将元素 {value} 入栈到位置 {self._top}，当前栈大小: {self._top + 1}',
+                highlight_indices=[self._top],
+                code_template='stack_push',
+                code_line=11,
+                code_highlight=[11]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
 
     def pop(self) -> Any:
         """出栈操作"""
         # 检查栈是否为空
         if self.is_empty():
-            step = OperationStep(
-                OperationType.DELETE,
-                self._top,
-                description='出栈失败：栈为空',
-                code_template='stack_pop',
-                code_line=3,
-                code_highlight=[2, 3, 4]
-            )
-            self.add_operation_step(step)
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.DELETE,
+                    self._top,
+                    description='出栈失败：栈为空',
+                    code_template='stack_pop',
+                    code_line=3,
+                    code_highlight=[2, 3, 4]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return None
 
         # 获取栈顶元素
         popped_value = self._data[self._top]
 
         # 记录出栈操作
-        step = OperationStep(
-            OperationType.DELETE,
-            self._top,
-            popped_value,
-            f'准备将栈顶元素 {popped_value} (位置 {self._top}) 出栈',
-            highlight_indices=[self._top],
-            code_template='stack_pop',
-            code_line=7,
-            code_highlight=[7]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.DELETE,
+                self._top,
+                popped_value,
+                f'准备将栈顶元素 {popped_value} (位置 {self._top}) 出栈',
+                highlight_indices=[self._top],
+                code_template='stack_pop',
+                code_line=7,
+                code_highlight=[7]
+            )
+            self.add_operation_step(step)
 
         # 删除栈顶元素，栈顶指针下移
         if self._capacity is None:
@@ -154,104 +167,154 @@ class SequentialStack(LinearStructureBase):
         self._top -= 1
 
         # 记录出栈成功
-        step = OperationStep(
-            OperationType.DELETE,
-            self._top + 1,
-            popped_value,
-            f'成功将元素 {popped_value} 出栈，栈顶指针移动到 {self._top}，当前栈大小: {self._top + 1}',
-            highlight_indices=[self._top] if self._top >= 0 else [],
-            code_template='stack_pop',
-            code_line=10,
-            code_highlight=[10, 12]
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.DELETE,
+                self._top + 1,
+                popped_value,
+                f'成功将元素 {popped_value} 出栈，栈顶指针移动到 {self._top}，当前栈大小: {self._top + 1}',
+                highlight_indices=[self._top] if self._top >= 0 else [],
+                code_template='stack_pop',
+                code_line=10,
+                code_highlight=[10, 12]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+
+        self._maybe_shrink()
         return popped_value
 
+    def bulk_insert(self, index: int, values: List[Any]) -> bool:
+        """批量入栈（与 insert 一样忽略 index，依次压到栈顶），容量不足时一次扩到位"""
+        values = list(values)
+        start = self._top + 1
+        if self._capacity is None:
+            del self._data[start:]
+            self._data.extend(values)
+            count = len(values)
+        else:
+            self._reserve(start + len(values))
+            count = min(len(values), self._capacity - start)
+            self._data[start:start + count] = values[:count]
+        self._top += count
+        self._record_inserts(count)
+        self._bulk_step(OperationType.INSERT, start, values[:count], len(values))
+        return count == len(values)
+
+    def bulk_delete(self, index: int, count: int) -> List[Any]:
+        """批量出栈（忽略 index），返回按出栈顺序排列的元素"""
+        requested = count
+        count = max(0, min(count, self._top + 1))
+        start = self._top + 1 - count
+        deleted = self._data[start:self._top + 1][::-1]
+        if self._capacity is None:
+            del self._data[start:]
+        else:
+            self._data[start:self._top + 1] = [None] * count
+        self._top -= count
+        self._bulk_step(OperationType.DELETE, start, deleted, requested)
+
+        while self._maybe_shrink():
+            pass
+        return deleted
+
+    def _items(self) -> List[Any]:
+        return self._data[:self._top + 1]
+
     def _expand(self) -> bool:
-        """栈扩容：仅在有限容量时触发，容量*1.5"""
+        """栈扩容：仅在有限容量时触发，倍数见容量策略（默认1.5）"""
         if self._capacity is None:
             return False  # 无限容量不需要扩容
 
         old_capacity = self._capacity
-        new_capacity = max(int(old_capacity * 1.5), old_capacity + 1)
+        new_capacity = self._policy.grow(old_capacity)
+        if new_capacity is None:
+            self._max_capacity_step()
+            return False
 
         # 1) 提示扩容
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'容量已满 (当前: {self._top + 1}/{old_capacity})，触发扩容',
-            animation_type="highlight",
-            duration=0.5,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'容量已满 (当前: {self._top + 1}/{old_capacity})，触发扩容',
+                animation_type="highlight",
+                duration=0.5,
+                data_snapshot=self._trace_snapshot()
+            )
+            self.add_operation_step(step)
 
         # 2) 创建新槽位（用于前端动画）
         new_data = [None] * new_capacity
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'准备扩容: {old_capacity} -> {new_capacity}',
-            animation_type="fade",
-            duration=0.8,
-            data_snapshot=self.to_list(),
-            # copy to freeze the empty slots snapshot for the animation
-            visual_hints={'new_array': new_data[:], 'new_capacity': new_capacity}
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'准备扩容: {old_capacity} -> {new_capacity}',
+                animation_type="fade",
+                duration=0.8,
+                data_snapshot=self._trace_snapshot(),
+                # copy to freeze the empty slots snapshot for the animation
+                visual_hints={'new_array': new_data[:], 'new_capacity': new_capacity}
+            )
+            self.add_operation_step(step)
 
         # 3) 复制元素
-        for i in range(self._top + 1):
-            new_data[i] = self._data[i]
-
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'完成复制 {self._top + 1} 个元素',
-            animation_type="highlight",
-            duration=0.4,
-            data_snapshot=self.to_list(),
-            visual_hints={'new_array': new_data[:], 'new_capacity': new_capacity}
-        )
-        self.add_operation_step(step)
+        new_data[:self._top + 1] = self._data[:self._top + 1]
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'完成复制 {self._top + 1} 个元素',
+                animation_type="highlight",
+                duration=0.4,
+                data_snapshot=self._trace_snapshot(),
+                visual_hints={'new_array': new_data[:], 'new_capacity': new_capacity}
+            )
+            self.add_operation_step(step)
 
         # 4) 切换新数组
         self._data = new_data
         self._capacity = new_capacity
+        self._record_resize(self._top + 1)
 
-        step = OperationStep(
-            OperationType.EXPAND,
-            description=f'✓ 扩容完成！新容量: {new_capacity}',
-            animation_type="fade",
-            duration=0.6,
-            data_snapshot=self.to_list()
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.EXPAND,
+                description=f'✓ 扩容完成！新容量: {new_capacity}',
+                animation_type="fade",
+                duration=0.6,
+                data_snapshot=self._trace_snapshot(TraceLevel.SUMMARY),
+                visual_hints=self._resize_hints()
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
 
     def peek(self) -> Any:
         """查看栈顶元素（不出栈）"""
         if self.is_empty():
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    self._top,
+                    description='查看失败：栈为空',
+                    code_template='stack_peek',
+                    code_line=3,
+                    code_highlight=[2, 3, 4]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return None
+
+        top_value = self._data[self._top]
+        if self._tracing(TraceLevel.SUMMARY):
             step = OperationStep(
                 OperationType.SEARCH,
                 self._top,
-                description='查看失败：栈为空',
+                top_value,
+                f'查看栈顶元素: {top_value} (位置 {self._top})',
+                highlight_indices=[self._top],
                 code_template='stack_peek',
-                code_line=3,
-                code_highlight=[2, 3, 4]
+                code_line=8,
+                code_highlight=[8]
             )
-            self.add_operation_step(step)
-            return None
-
-        top_value = self._data[self._top]
-        step = OperationStep(
-            OperationType.SEARCH,
-            self._top,
-            top_value,
-            f'查看栈顶元素: {top_value} (位置 {self._top})',
-            highlight_indices=[self._top],
-            code_template='stack_peek',
-            code_line=8,
-            code_highlight=[8]
-        )
-        self.add_operation_step(step)
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return top_value
 
     def insert(self, index: int, value: Any) -> bool:
@@ -264,40 +327,44 @@ class SequentialStack(LinearStructureBase):
 
     def search(self, value: Any) -> int:
         """搜索元素在栈中的位置（从栈底开始计数）"""
-        step = OperationStep(
-            OperationType.SEARCH,
-            value=value,
-            description=f'开始搜索元素 {value}',
-        )
-        self.add_operation_step(step)
-
-        for i in range(self._top + 1):
+        if self._tracing():
             step = OperationStep(
                 OperationType.SEARCH,
-                i,
-                value,
-                f'比较位置 {i} 的元素 {self._data[i]} 与目标元素 {value}',
-                highlight_indices=[i]
+                value=value,
+                description=f'开始搜索元素 {value}',
             )
             self.add_operation_step(step)
 
-            if self._data[i] == value:
+        for i in range(self._top + 1):
+            if self._tracing():
                 step = OperationStep(
                     OperationType.SEARCH,
                     i,
                     value,
-                    f'找到目标元素 {value}，位置为 {i}',
+                    f'比较位置 {i} 的元素 {self._data[i]} 与目标元素 {value}',
                     highlight_indices=[i]
                 )
                 self.add_operation_step(step)
+
+            if self._data[i] == value:
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        i,
+                        value,
+                        f'找到目标元素 {value}，位置为 {i}',
+                        highlight_indices=[i]
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
                 return i
 
-        step = OperationStep(
-            OperationType.SEARCH,
-            value=value,
-            description=f'未找到目标元素 {value}',
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                value=value,
+                description=f'未找到目标元素 {value}',
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return -1
 
     def get(self, index: int) -> Any:
@@ -334,17 +401,19 @@ class SequentialStack(LinearStructureBase):
 
     def clear(self) -> None:
         """清空栈"""
-        step = OperationStep(
-            OperationType.CLEAR,
-            description='清空栈',
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.CLEAR,
+                description='清空栈',
+            )
+            self.add_operation_step(step)
 
         self._data = [] if self._capacity is None else [None] * self._capacity
         self._top = -1
 
-        step = OperationStep(
-            OperationType.CLEAR,
-            description='栈已清空',
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.CLEAR,
+                description='栈已清空',
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
@@ -0,0 +1,78 @@
+"""
+日志配置
+
+dsvision 各模块和 controller 统一通过 get_logger(__name__) 获取 logger，替代散落的 print 调试输出。
+默认关闭（生产环境不产生任何输出，也不做字符串格式化），通过环境变量打开:
+
+    DSVISION_LOG_LEVEL=DEBUG                                  全部模块
+    DSVISION_LOG_MODULES="dsvision.tree=DEBUG,controller=INFO" 按模块前缀单独设置
+
+级别取值: DEBUG / INFO / WARNING / ERROR / CRITICAL / OFF
+"""
+import logging
+import os
+import sys
+from typing import Dict, Optional
+
+# 高于 CRITICAL，表示完全关闭
+OFF = logging.CRITICAL + 10
+
+ROOT_LOGGERS = ('dsvision', 'controller')
+
+LOG_FORMAT = '%(asctime)s %(levelname)-5s [%(name)s] %(message)s'
+
+_configured = False
+
+
+def parse_level(text: Optional[str], default: int = OFF) -> int:
+    """'debug' / 'INFO' / 'off' / '10' -> logging 级别"""
+    if not text:
+        return default
+    text = text.strip().upper()
+    if text == 'OFF':
+        return OFF
+    if text.isdigit():
+        return int(text)
+    level = logging.getLevelName(text)
+    if not isinstance(level, int):
+        raise ValueError(f"未知的日志级别: {text}")
+    return level
+
+
+def parse_modules(text: Optional[str]) -> Dict[str, int]:
+    """'dsvision.tree=DEBUG,controller=INFO' -> {'dsvision.tree': 10, 'controller': 20}"""
+    levels = {}
+    for item in (text or '').split(','):
+        if '=' not in item:
+            continue
+        name, level = item.split('=', 1)
+        levels[name.strip()] = parse_level(level)
+    return levels
+
+
+def configure(level: Optional[str] = None, modules: Optional[str] = None) -> None:
+    """
+    配置 dsvision / controller 两棵 logger 树
+    参数为空时读取环境变量 DSVISION_LOG_LEVEL / DSVISION_LOG_MODULES；可重复调用以修改级别
+    """
+    global _configured
+    root_level = parse_level(level if level is not None else os.getenv('DSVISION_LOG_LEVEL'))
+    module_levels = parse_modules(modules if modules is not None else os.getenv('DSVISION_LOG_MODULES'))
+
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    for name in ROOT_LOGGERS:
+        logger = logging.getLogger(name)
+        logger.handlers[:] = [handler]
+        logger.propagate = False
+        logger.setLevel(root_level)
+    for name, module_level in module_levels.items():
+        logging.getLogger(name).setLevel(module_level)
+    _configured = True
+
+
+def get_logger(name: str) -> logging.Logger:
+    """获取模块 logger；首次调用时按环境变量完成配置"""
+    if not _configured:
+        configure()
+    return logging.getLogger(name)
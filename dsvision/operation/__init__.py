@@ -1,3 +1,7 @@
-from .operation import OperationStep,OperationType
+from .operation import OperationStep,OperationType,TraceLevel
+from .snapshot import SnapshotEncoder, materialize_history, SNAPSHOT_MODE_FULL, SNAPSHOT_MODE_DELTA
+from .recorder import OperationRecorder
+from .node_ids import NodeIdAllocator
 
-__all__ = ['OperationStep','OperationType']
\ No newline at end of file
+__all__ = ['OperationStep','OperationType','TraceLevel','SnapshotEncoder','materialize_history',
+           'SNAPSHOT_MODE_FULL','SNAPSHOT_MODE_DELTA','OperationRecorder','NodeIdAllocator']
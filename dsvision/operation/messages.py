@@ -0,0 +1,130 @@
+"""
+操作步骤描述模板
+
+步骤可以只保存 message_id + message_args，description 在真正被读取（to_dict / 前端展示）时才格式化。
+无头/批量执行时不会读取描述，也就完全跳过了字符串格式化（尤其是把整张编码表、整个列表转成字符串的开销）。
+
+注意：message_args 按引用保存，记录步骤之后不应再原地修改其中的列表/字典。
+"""
+import string
+from typing import Any, Dict
+
+
+MESSAGES: Dict[str, str] = {
+    # ===== 通用 / 树遍历 =====
+    'traversal_done': "{type_name}（{method_name}）完成，访问顺序: {result}",
+
+    # ===== 线性结构 =====
+    'linear_init_start': "开始批量初始化 {count} 个元素: {values}",
+    'linear_bulk_insert': "批量插入 {count} 个元素到位置 {index}: {values}",
+    'linear_bulk_insert_partial': "批量插入中止：只插入了 {count}/{requested} 个元素（位置 {index}）: {values}",
+    'linear_bulk_delete': "批量删除位置 {index} 起的 {count} 个元素: {values}",
+    'linear_bulk_delete_partial': "批量删除：只删除了 {count}/{requested} 个元素（位置 {index}）: {values}",
+    'stack_init_batch': "批量初始化栈，{count}个元素: {values}",
+    'queue_init_batch': "批量初始化队列，{count}个元素: {values}",
+    'seq_init_inserting': "正在插入第 {ordinal} 个元素: {value}",
+    'seq_init_inserted': "成功插入元素 {value} 到位置 {index}",
+    'seq_shift_right': "将位置 {src} 的元素移动到位置 {dst} (line 13)",
+    'seq_shift_left': "将位置 {src} 的元素 {value} 移动到位置 {dst}",
+    'seq_delete_compare': "比较位置 {index}: {current} == {value} ?",
+    'seq_search_check': "检查位置 {index}: {current} == {value} ?",
+    'seq_search_miss': "✗ {current} ≠ {value}，继续搜索",
+    'seq_copy_element': "复制元素 [{index}]: {value} 到新数组",
+    'seq_copied_element': "✓ 已复制元素 [{index}]",
+    'linked_init_locate': "Step {step_no}: current 指针指向位置 {index}（值为 {value}）",
+    'linked_init_create': "Step {step_no}: 创建新节点，值为 {value}",
+    'linked_init_link': "Step {step_no}: 将 current.next 指向新节点",
+    'linked_prev_at': "当前 prev 在位置 {index}（值={value}），目标位置 {target}",
+    'linked_prev_move': "prev = prev.next，移动到位置 {index}",
+    'linked_compare': "位置 {index}: 比较 {current} == {value} ?",
+    'linked_current_move': "current = current.next，移动到位置 {index}",
+    'linked_current_back': "current = current.prev，移动到位置 {index}",
+
+    # ===== 二叉树 / BST =====
+    'binary_build_start': "从列表构建二叉树: {values}",
+    'tree_bulk_insert': "批量插入 {requested} 个值，新增 {count} 个节点，当前共 {size} 个节点: {values}",
+    'tree_bulk_delete': "批量删除 {requested} 个值，删除了 {count} 个节点，当前共 {size} 个节点: {values}",
+    'bst_build_start': "从列表构建二叉搜索树: {values}",
+    'bst_balanced_start': "从有序序列构建平衡二叉搜索树（{count} 个不同的值）: {values}",
+    'bst_balanced_pick': "区间 [{lo}, {hi}] 取中点 {value} 作为子树根",
+    'bst_compare': "📍 当前在节点 {current}, 比较 {value} vs {current}",
+    'bst_go_left': "↙️ {value} < {current}, 向左子树移动",
+    'bst_go_right': "↘️ {value} > {current}, 向右子树移动",
+    'bst_search_left': "{value} < {current}，向左子树搜索",
+    'bst_search_right': "{value} > {current}，向右子树搜索",
+    'bst_select_left': "📍 节点 {current} 的左子树有 {left_size} 个节点，k = {k} < {left_size}，向左子树查找",
+    'bst_select_right': "📍 节点 {current} 的左子树有 {left_size} 个节点，k = {k} > {left_size}，"
+                        "跳过左子树和 {current}，在右子树中找第 {k} - {left_size} - 1 小",
+    'bst_select_found': "✓ 第 {k} 小（从 0 开始）的值为 {value}",
+    'bst_select_out_of_range': "k = {k} 超出范围，树中共 {size} 个节点",
+    'bst_rank_left': "{value} {cmp} {current}，向左子树移动，计数仍为 {count}",
+    'bst_rank_right': "{value} {cmp} {current}，计入左子树和 {current}，计数为 {count}，向右子树移动",
+    'bst_rank_done': "✓ 树中小于 {value} 的值共 {count} 个",
+    'bst_count_range_done': "✓ 区间 [{lo}, {hi}] 内的值共 {count} 个",
+
+    # ===== 二叉堆 =====
+    'heap_push_append': "将 {value} 放到数组末尾（下标 {index}），即完全二叉树的最后一个位置",
+    'heap_push_done': "✓ {value} 入堆完成，堆顶为 {top}，共 {size} 个元素",
+    'heap_pop_start': "取出堆顶 {value}，把末尾元素 {last} 移到堆顶",
+    'heap_pop_done': "✓ 出堆 {value}，当前堆顶为 {top}，剩余 {size} 个元素",
+    'heap_pop_empty': "出堆失败：堆为空",
+    'heap_replace_done': "✓ 取出堆顶 {old} 并放入 {value}，当前堆顶为 {top}",
+    'heap_peek': "堆顶元素为 {value}",
+    'heap_peek_empty': "堆为空，没有堆顶元素",
+    'heap_sift_up': "{value} 比父节点 {other} 更{better}，交换下标 {other_index} 与 {index}",
+    'heap_sift_up_stop': "{value} 不比父节点 {other} 更{better}，上浮结束",
+    'heap_sift_down': "孩子 {other} 比 {value} 更{better}，交换下标 {other_index} 与 {index}",
+    'heap_sift_down_stop': "{value} 的孩子都不比它更{better}，下沉结束",
+    'heap_heapify_start': "自底向上建堆：{count} 个元素，从最后一个非叶子节点（下标 {start}）开始依次下沉",
+    'heap_heapify_node': "下沉下标 {index} 的元素 {value}",
+    'heap_heapify_done': "✓ 建堆完成：{count} 个元素，共交换 {swaps} 次，堆顶为 {top}",
+    'heap_decrease_key': "下标 {index} 的键值 {old} 改为 {value}，向上调整",
+    'heap_decrease_key_done': "✓ 键值修改完成，{value} 现位于下标 {index}",
+    'heap_decrease_key_out_of_range': "修改失败：下标 {index} 超出范围，堆中共 {size} 个元素",
+    'heap_decrease_key_wrong_direction': "修改失败：{value} 比原键值 {old} 更远离堆顶，decrease-key 只能提升优先级",
+    'heap_delete': "删除下标 {index} 的元素 {value}，用末尾元素 {last} 填补",
+    'heap_delete_done': "✓ 删除 {value} 完成，剩余 {size} 个元素",
+    'heap_delete_out_of_range': "删除失败：下标 {index} 超出范围，堆中共 {size} 个元素",
+    'heap_search_found': "✓ 在下标 {index} 处找到 {value}",
+    'heap_search_miss': "堆中没有 {value}",
+
+    # ===== 哈夫曼树 =====
+    'huffman_numbers_start': "开始构建哈夫曼树（数字模式），输入权重列表: {numbers}",
+    'huffman_initial_freq': "📊 初始频率列表: {freq_list}",
+    'huffman_weights_start': "开始构建哈夫曼树,输入权重: {weights}",
+    'huffman_create_leaf': "创建叶子节点: 字符='{value}', 权重={weight}",
+    'huffman_initial_queue': "初始节点队列(按权重排序): {nodes!w}",
+    'huffman_current_freq': "📊 当前频率列表: {freq_list}",
+    'huffman_heap_nodes': "当前堆中节点(按权重排序): {nodes!w}",
+    'huffman_two_queue_start': "权重已按升序排列，改用双队列构建（O(n)）：叶子队列 {leaves!w}，合并队列为空",
+    'huffman_two_queue_sorted': "先按权重排序叶子节点，再用双队列构建：叶子队列 {leaves!w}，合并队列为空",
+    'huffman_two_queue_pick': "【第{merge_count}次合并】比较两个队首，取出左节点='{left}'(频率{left_weight}，来自{left_queue})、"
+                              "右节点='{right}'(频率{right_weight}，来自{right_queue})",
+    'huffman_two_queue_append': "新节点 '{value}'(频率{weight}) 追加到合并队列队尾，合并队列仍然有序。"
+                                "叶子队列: {leaves!w}，合并队列: {merged!w}",
+    'huffman_text_analyze': "分析输入文本: '{text}' (长度={length})",
+    'huffman_text_freq': "字符频率统计完成: {frequencies}",
+    'huffman_codes_done': "哈夫曼编码生成完成,编码表: {codes}, 平均编码长度: {avg_length:.2f}位",
+    'huffman_leaf_code': "字符 '{value}' (频率={weight}) 的编码为: {code}",
+    'huffman_decode_done': "✓ 解码完成,结果: '{decoded}'",
+}
+
+
+class _MessageFormatter(string.Formatter):
+    """支持额外转换符 !w：把哈夫曼节点列表渲染为 ['A(5)', 'B(9)', ...]"""
+
+    def convert_field(self, value: Any, conversion: str) -> Any:
+        if conversion == 'w':
+            return [f'{n.value}({n.weight})' for n in value]
+        return super().convert_field(value, conversion)
+
+
+_formatter = _MessageFormatter()
+
+
+def render_message(message_id: str, message_args: Dict[str, Any] = None) -> str:
+    """按模板 id 渲染描述文本"""
+    template = MESSAGES.get(message_id)
+    if template is None:
+        return message_id
+    return _formatter.format(template, **(message_args or {}))
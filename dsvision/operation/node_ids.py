@@ -0,0 +1,27 @@
+"""
+节点 id 分配器
+
+树节点和链表节点的 node_id 由所属结构按创建顺序分配：从 1 开始单调递增，同一结构内不复用。
+- 同样的操作序列总是得到同样的 id，导出的步骤/快照可以缓存、对比
+- 节点删除后 id 不会分给新节点，前端按 id 做动画差分时不会把新节点当成旧节点
+- id 是小整数，快照 JSON 比 id(obj) 的内存地址短得多
+导入时用 reserve 把导出数据里的 id 接上，之后新建的节点继续按原来的顺序编号
+"""
+
+
+class NodeIdAllocator:
+    """单个结构的节点 id 分配器"""
+    __slots__ = ('next_id',)
+
+    def __init__(self, start: int = 1):
+        self.next_id = start  # 下一个要分配的 id
+
+    def allocate(self) -> int:
+        node_id = self.next_id
+        self.next_id += 1
+        return node_id
+
+    def reserve(self, node_id: int) -> None:
+        """保证之后分配的 id 都大于 node_id（导入已有 id 时调用）"""
+        if node_id >= self.next_id:
+            self.next_id = node_id + 1
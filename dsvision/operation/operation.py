@@ -1,5 +1,7 @@
-from enum import Enum
+from enum import Enum, IntEnum
+from types import MappingProxyType
 from typing import Any,List,Optional,Tuple,Dict
+from .messages import render_message
 
 
 class OperationType(Enum):
@@ -11,6 +13,7 @@ class OperationType(Enum):
     CLEAR = "clear"
     INIT = "init"
     EXPAND = "expand"  # 扩容操作
+    SHRINK = "shrink"  # 缩容操作
 
     #后面再加
     POINTER_MOVE = "pointer_move"  # 指针移动
@@ -23,10 +26,41 @@ class OperationType(Enum):
     TRAVERSE_RIGHT = "traverse_right"  # 向右遍历
     ROTATE_LEFT = "rotate_left"  # 左旋
     ROTATE_RIGHT = "rotate_right"  # 右旋
+    RECOLOR = "recolor"  # 变色（红黑树）
+
+
+class TraceLevel(IntEnum):
+    """操作步骤记录级别"""
+    OFF = 0  # 不记录任何步骤，只关心结果状态
+    SUMMARY = 1  # 只记录每个操作的关键结果步骤（完成/失败/找到）
+    FULL = 2  # 记录全部微步骤（默认，用于逐步动画）
+
+    @classmethod
+    def parse(cls, level) -> 'TraceLevel':
+        """接受 TraceLevel 或 'off' / 'summary' / 'full'"""
+        if isinstance(level, cls):
+            return level
+        try:
+            return cls[str(level).strip().upper()]
+        except KeyError:
+            raise ValueError(f"未知的记录级别: {level}")
+
+
+# 🔥 共享的不可变空默认值：没有高亮/指针/快照的步骤不再各自分配空列表和空字典
+_EMPTY_LIST: tuple = ()
+_EMPTY_DICT = MappingProxyType({})
 
 
 class OperationStep:
-    """记录操作步骤 - 增强版"""
+    """记录操作步骤 - 增强版（__slots__ 紧凑存储，长轨迹下每步内存更小）"""
+
+    __slots__ = (
+        'operation', '_description', 'message_id', 'message_args', 'index', 'value', 'highlight_indices',
+        'pointers', 'pointer_position', 'compare_indices', 'node_id',
+        'animation_type', 'duration', 'data_snapshot', 'tree_snapshot',
+        'visual_hints', 'timestamp', 'path', 'comparison_result',
+        'code_template', 'code_line', 'code_highlight', 'snapshot_delta',
+    )
 
     def __init__(
             self,
@@ -56,7 +90,6 @@ class OperationStep:
             visual_hints: Dict[str, Any] = None, # {"show_arrow": True, "from": 1, "to": 2}
 
             # 树结构专用
-            #node_id: int = -1,  # 当前操作的节点ID
             path: str = "",  # 遍历路径
             comparison_result: str = "",  # 比较结果: "equal", "less", "greater"
             tree_snapshot: dict = None,  # 完整树快照
@@ -65,28 +98,32 @@ class OperationStep:
             code_template: str = None,  # 对应的代码模板key (如 'sequential_insert')
             code_line: int = None,  # 当前执行的代码行号（从1开始）
             code_highlight: List[int] = None,  # 需要高亮的代码行列表
+
+            # 🔥 延迟渲染的描述：模板id + 参数（见 messages.py），读取 description 时才格式化
+            message_id: str = None,
+            message_args: Dict[str, Any] = None,
     ):
         self.operation = operation
-        self.description = description
+        self._description = None if message_id else description
+        self.message_id = message_id
+        self.message_args = message_args
         self.index = index
         self.value = value
-        self.highlight_indices = highlight_indices or []
+        self.highlight_indices = highlight_indices or _EMPTY_LIST
 
         # 多指针系统
-        self.pointers = pointers or {}
+        self.pointers = pointers or _EMPTY_DICT
         self.pointer_position = pointer_position
 
-
         # 动画字段
-        self.compare_indices = compare_indices or []
+        self.compare_indices = compare_indices or _EMPTY_LIST
         self.node_id = node_id
         self.animation_type = animation_type
         self.duration = duration
 
         # 状态数据
-        self.data_snapshot = data_snapshot or []
-        self.tree_snapshot = tree_snapshot  # 🔥 新增
-        self.visual_hints = visual_hints or {}
+        self.data_snapshot = data_snapshot or _EMPTY_LIST
+        self.visual_hints = visual_hints or _EMPTY_DICT
         self.timestamp = None
 
         # 树结构专用
@@ -97,11 +134,25 @@ class OperationStep:
         # 🔥 代码面板相关
         self.code_template = code_template
         self.code_line = code_line
-        self.code_highlight = code_highlight or []
+        self.code_highlight = code_highlight or _EMPTY_LIST
+
+        # 🔥 delta 模式下的快照增量（由 SnapshotEncoder 填充，完整模式下为 None）
+        self.snapshot_delta = None
+
+    @property
+    def description(self) -> str:
+        """步骤描述；使用模板时首次读取才渲染"""
+        if self._description is None:
+            self._description = render_message(self.message_id, self.message_args)
+        return self._description
+
+    @description.setter
+    def description(self, text: str) -> None:
+        self._description = text
 
     def to_dict(self) -> dict:
         """转字典"""
-        return {
+        result = {
             'operation': self.operation.value,
             'description': self.description,
             'index': self.index,
@@ -109,7 +160,7 @@ class OperationStep:
             'highlight_indices': self.highlight_indices,
 
             # 多指针数据
-            'pointers': self.pointers,
+            'pointers': self.pointers if self.pointers is not _EMPTY_DICT else {},
             'pointer_position': self.pointer_position,
 
             # 动画字段
@@ -120,7 +171,7 @@ class OperationStep:
 
             # 状态快照
             'data_snapshot': self.data_snapshot,
-            'visual_hints': self.visual_hints,
+            'visual_hints': self.visual_hints if self.visual_hints is not _EMPTY_DICT else {},
 
             # 树结构专用字段
             'tree_snapshot': self.tree_snapshot,
@@ -132,3 +183,8 @@ class OperationStep:
             'code_line': self.code_line,
             'code_highlight': self.code_highlight
         }
+        if self.message_id is not None:
+            result['message_id'] = self.message_id
+        if self.snapshot_delta is not None:
+            result['snapshot_delta'] = self.snapshot_delta
+        return result
@@ -0,0 +1,115 @@
+"""
+操作步骤记录器
+
+线性结构基类和树结构基类共用的步骤记录逻辑：
+- 操作历史的追加/获取/清空
+- 快照模式（full / delta，见 snapshot.py）
+- 记录级别（off / summary / full）：调用方只需要结果状态时可以关闭或精简步骤记录
+- 流式输出：步骤产生时直接交给 sink，不保存在操作历史中
+"""
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+from .operation import OperationStep, TraceLevel
+from .snapshot import SnapshotEncoder, materialize_history, SNAPSHOT_MODES, SNAPSHOT_MODE_DELTA
+
+
+class OperationRecorder:
+    """操作步骤记录混入类"""
+
+    def __init__(self):
+        self._operation_history: List[OperationStep] = []
+        self._current_step = -1
+        self._snapshot_encoder: Optional[SnapshotEncoder] = None  # 🔥 delta 快照模式
+        self._trace_level = TraceLevel.FULL  # 🔥 步骤记录级别
+        self._step_sink: Optional[Callable[[OperationStep], None]] = None  # 🔥 流式输出目标
+
+    # ==================== 步骤记录 ====================
+
+    def add_operation_step(self, step: OperationStep, level: TraceLevel = TraceLevel.FULL) -> None:
+        """
+        添加操作步骤
+        level: 该步骤所属级别，SUMMARY 表示操作的关键结果步骤；低于结构当前记录级别的步骤直接丢弃
+        """
+        if self._trace_level < level:
+            return
+        if self._step_sink is not None:
+            if self._snapshot_encoder is not None:
+                self._snapshot_encoder.encode(step, None)
+            self._step_sink(step)
+            return
+        if self._snapshot_encoder is not None:
+            self._snapshot_encoder.encode(step, self._operation_history)
+        self._operation_history.append(step)
+        self._current_step += 1
+
+    def get_operation_history(self) -> List[OperationStep]:
+        """获取操作历史"""
+        return self._operation_history.copy()
+
+    def clear_operation_history(self) -> None:
+        """清空操作历史"""
+        self._operation_history.clear()
+        self._current_step = -1
+
+    @contextmanager
+    def stream_steps(self, sink: Callable[[OperationStep], None]):
+        """
+        在 with 块内把新步骤逐个交给 sink（例如推送到 SSE 响应），不追加到操作历史
+        大批量操作时服务端不需要持有整段步骤列表
+        """
+        previous = self._step_sink
+        self._step_sink = sink
+        if self._snapshot_encoder is not None:
+            self._snapshot_encoder.reset()  # 流的第一步作为基准快照
+        try:
+            yield self
+        finally:
+            self._step_sink = previous
+            if self._snapshot_encoder is not None:
+                self._snapshot_encoder.reset()
+
+    # ==================== 记录级别 ====================
+
+    def set_trace_level(self, level) -> None:
+        """设置记录级别: 'off' | 'summary' | 'full'"""
+        self._trace_level = TraceLevel.parse(level)
+
+    def get_trace_level(self) -> TraceLevel:
+        return self._trace_level
+
+    @contextmanager
+    def trace_scope(self, level):
+        """临时切换记录级别（单次请求/批量加载用），退出时恢复"""
+        previous = self._trace_level
+        self._trace_level = TraceLevel.parse(level)
+        try:
+            yield self
+        finally:
+            self._trace_level = previous
+
+    def _tracing(self, level: TraceLevel = TraceLevel.FULL) -> bool:
+        """当前级别下是否需要构造该级别的步骤（热路径上用它跳过步骤和快照的分配）"""
+        return self._trace_level >= level
+
+    # ==================== 快照模式 ====================
+
+    def set_snapshot_mode(self, mode: str) -> None:
+        """设置快照模式: 'full' 每步完整快照 / 'delta' 基准快照 + 增量"""
+        if mode not in SNAPSHOT_MODES:
+            raise ValueError(f"未知的快照模式: {mode}")
+        self._snapshot_encoder = SnapshotEncoder() if mode == SNAPSHOT_MODE_DELTA else None
+
+    def get_snapshot_mode(self) -> str:
+        return 'delta' if self._snapshot_encoder is not None else 'full'
+
+    def history_to_dicts(self, materialize: bool = False) -> List[dict]:
+        """
+        序列化操作历史
+        full 模式下每步的树快照都是完整的嵌套树，体积随树的大小线性增长；
+        需要只输出变化节点、未变子树按 node_id 引用的轨迹时使用 delta 模式
+        materialize=True 时把 delta 模式的增量还原为完整快照（兼容旧版前端）
+        """
+        if materialize and self._snapshot_encoder is not None:
+            return materialize_history(self._operation_history)
+        return [step.to_dict() for step in self._operation_history]
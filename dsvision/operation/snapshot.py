@@ -0,0 +1,292 @@
+"""
+操作步骤快照的增量编码（delta 模式）
+
+完整快照模式下，每个 OperationStep 都携带一份完整的 data_snapshot / tree_snapshot，
+一次 N 元素的 initlist 会产生 O(N²) 的快照数据。delta 模式下：
+- 一段操作历史中第一个带快照的步骤记录基准快照（base）
+- 之后的步骤只记录相对上一个快照的变化（线性结构：下标->值；树结构：节点链接变化）
+- 前端或 materialize_history() 按顺序回放即可还原每一步的完整快照
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from .operation import OperationStep
+
+
+SNAPSHOT_MODE_FULL = 'full'
+SNAPSHOT_MODE_DELTA = 'delta'
+SNAPSHOT_MODES = (SNAPSHOT_MODE_FULL, SNAPSHOT_MODE_DELTA)
+
+# 节点字典中表示子节点的键，扁平化时替换为子节点的 node_id
+_CHILD_KEYS = ('left', 'right')
+
+
+# ==================== 线性结构 ====================
+
+def list_delta(prev: List[Any], cur: List[Any]) -> dict:
+    """计算两个线性快照之间的变化: {'length': n, 'changes': [[index, value], ...]}"""
+    changes = []
+    common = min(len(prev), len(cur))
+    for i in range(common):
+        if prev[i] != cur[i]:
+            changes.append([i, cur[i]])
+    for i in range(common, len(cur)):
+        changes.append([i, cur[i]])
+    return {'length': len(cur), 'changes': changes}
+
+
+def apply_list_delta(prev: List[Any], delta: dict) -> List[Any]:
+    """在上一个线性快照上应用变化，返回新列表（不修改 prev）"""
+    length = delta['length']
+    result = list(prev[:length])
+    if len(result) < length:
+        result.extend([None] * (length - len(result)))
+    for index, value in delta['changes']:
+        result[index] = value
+    return result
+
+
+# ==================== 树结构 ====================
+
+def flatten_tree(snapshot: Optional[dict]) -> Tuple[Any, Dict[Any, dict], dict]:
+    """
+    把嵌套的树快照 {'root': {...}, 'size': .., 'height': ..} 扁平化
+    返回 (根节点id, {node_id: 节点条目}, 其余元数据)
+    节点条目中的 left/right 替换为子节点 node_id
+    """
+    if snapshot is None:
+        return None, {}, {}
+    meta = {k: v for k, v in snapshot.items() if k != 'root'}
+    root = snapshot.get('root')
+    nodes = {}
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        entry = _flat_entry(node)
+        nodes[entry['node_id']] = entry
+        stack.extend(node[key] for key in _CHILD_KEYS if node.get(key) is not None)
+    return (root['node_id'] if root is not None else None), nodes, meta
+
+
+def _flat_entry(node: dict) -> dict:
+    """节点字典 -> 扁平条目（left/right 替换为子节点 node_id）"""
+    entry = {}
+    for key, val in node.items():
+        if key in _CHILD_KEYS:
+            entry[key] = val['node_id'] if val is not None else None
+        else:
+            entry[key] = val
+    return entry
+
+
+def tree_delta(prev_nodes: Dict[Any, dict], cur_root: Any,
+               cur_nodes: Dict[Any, dict], meta: dict) -> dict:
+    """计算两个扁平化树快照之间的变化（新增/修改的节点条目 + 被移除的节点id）"""
+    changed = [entry for node_id, entry in cur_nodes.items()
+               if prev_nodes.get(node_id) != entry]
+    removed = [node_id for node_id in prev_nodes if node_id not in cur_nodes]
+    return {'root': cur_root, 'meta': meta, 'nodes': changed, 'removed': removed}
+
+
+def shared_tree_delta(prev_root: Optional[dict], prev_objs: Dict[Any, dict], prev_nodes: Dict[Any, dict],
+                      cur_root: Optional[dict], meta: dict) -> dict:
+    """
+    利用快照字典的结构共享计算树增量（结果格式同 tree_delta）
+    树结构只重建被修改路径上的节点字典，与上一快照是同一个字典对象的子树一定没有变化，整棵跳过，
+    因此每步只需访问变化的路径而不是整棵树。
+    prev_objs / prev_nodes（node_id -> 上一快照中的节点字典 / 扁平条目）会被原地更新为当前快照
+    """
+    shared = set()
+    visited = set()
+    changed = []
+    stack = [cur_root] if cur_root is not None else []
+    while stack:
+        node = stack.pop()
+        node_id = node['node_id']
+        if prev_objs.get(node_id) is node:
+            shared.add(node_id)
+            continue
+        visited.add(node_id)
+        prev_objs[node_id] = node
+        entry = _flat_entry(node)
+        if prev_nodes.get(node_id) != entry:
+            prev_nodes[node_id] = entry
+            changed.append(entry)
+        stack.extend(node[key] for key in _CHILD_KEYS if node.get(key) is not None)
+
+    # 上一快照中没有被共享、这次也没有出现的节点即被移除
+    removed = []
+    stack = [prev_root] if prev_root is not None else []
+    while stack:
+        node = stack.pop()
+        node_id = node['node_id']
+        if node_id in shared:
+            continue
+        if node_id not in visited:
+            removed.append(node_id)
+            prev_objs.pop(node_id, None)
+            prev_nodes.pop(node_id, None)
+        stack.extend(node[key] for key in _CHILD_KEYS if node.get(key) is not None)
+
+    return {'root': cur_root['node_id'] if cur_root is not None else None,
+            'meta': meta, 'nodes': changed, 'removed': removed}
+
+
+def apply_tree_delta(prev_nodes: Dict[Any, dict], delta: dict) -> Dict[Any, dict]:
+    """在上一个扁平化树快照上应用变化，返回新的节点表（不修改 prev_nodes）"""
+    nodes = dict(prev_nodes)
+    for node_id in delta['removed']:
+        nodes.pop(node_id, None)
+    for entry in delta['nodes']:
+        nodes[entry['node_id']] = entry
+    return nodes
+
+
+def build_tree(root_id: Any, nodes: Dict[Any, dict], meta: dict) -> dict:
+    """由扁平节点表重建嵌套的树快照（与 _get_tree_snapshot 的格式一致）"""
+    snapshot = dict(meta)
+    if root_id is None:
+        snapshot['root'] = None
+        return snapshot
+
+    def _copy(node_id):
+        entry = nodes[node_id]
+        return {key: (None if key in _CHILD_KEYS else val) for key, val in entry.items()}
+
+    root = _copy(root_id)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        entry = nodes[node['node_id']]
+        for key in _CHILD_KEYS:
+            if key in entry and entry[key] is not None:
+                child = _copy(entry[key])
+                node[key] = child
+                stack.append(child)
+    snapshot['root'] = root
+    return snapshot
+
+
+# ==================== 编码器 ====================
+
+class SnapshotEncoder:
+    """
+    把步骤中的完整快照替换为增量
+    每段操作历史（结构重置 _operation_history 时即开始新的一段）从基准快照开始编码
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._history = None
+        self._length = 0
+        self._prev_list: Optional[List[Any]] = None
+        self._prev_source: Optional[List[Any]] = None
+        self._prev_root: Optional[dict] = None
+        self._prev_objs: Optional[Dict[Any, dict]] = None
+        self._prev_nodes: Optional[Dict[Any, dict]] = None
+
+    def encode(self, step: OperationStep, history: Optional[List[OperationStep]]) -> None:
+        """
+        编码即将追加到 history 末尾的 step
+        history 为 None 表示步骤不落地（流式输出），直接接着上一步继续编码，链的起点由调用方 reset()
+        """
+        if history is not None:
+            if history is not self._history or len(history) != self._length:
+                # 历史被重置/截断，重新从基准快照开始
+                self.reset()
+                self._history = history
+            self._length = len(history) + 1
+
+        delta = {}
+        if step.data_snapshot and step.data_snapshot is self._prev_source:
+            # 结构没变的步骤共享同一个快照列表（见 LinearLinkedList._values），无需逐项比较
+            delta['data'] = {'length': len(self._prev_list), 'changes': []}
+            step.data_snapshot = ()
+        elif step.data_snapshot:
+            self._prev_source = step.data_snapshot
+            cur = list(step.data_snapshot)
+            if self._prev_list is None:
+                delta['data'] = list_delta([], cur)
+                delta['data']['base'] = True
+            else:
+                delta['data'] = list_delta(self._prev_list, cur)
+            self._prev_list = cur
+            step.data_snapshot = ()
+
+        if step.tree_snapshot is not None:
+            snapshot = step.tree_snapshot
+            meta = {k: v for k, v in snapshot.items() if k != 'root'}
+            base = self._prev_nodes is None
+            if base:
+                self._prev_objs, self._prev_nodes = {}, {}
+            delta['tree'] = shared_tree_delta(self._prev_root, self._prev_objs, self._prev_nodes,
+                                              snapshot.get('root'), meta)
+            if base:
+                delta['tree']['base'] = True
+            self._prev_root = snapshot.get('root')
+            step.tree_snapshot = None
+
+        if delta:
+            step.snapshot_delta = delta
+
+
+def iter_materialized(steps: List[OperationStep]):
+    """按顺序回放增量，逐步产出 (step, 完整线性快照或None, 完整树快照或None)"""
+    cur_list: List[Any] = []
+    cur_nodes: Dict[Any, dict] = {}
+    for step in steps:
+        delta = step.snapshot_delta
+        data = tree = None
+        if delta:
+            if 'data' in delta:
+                base = [] if delta['data'].get('base') else cur_list
+                cur_list = apply_list_delta(base, delta['data'])
+                data = cur_list
+            if 'tree' in delta:
+                tree_delta_ = delta['tree']
+                base_nodes = {} if tree_delta_.get('base') else cur_nodes
+                cur_nodes = apply_tree_delta(base_nodes, tree_delta_)
+                tree = build_tree(tree_delta_['root'], cur_nodes, tree_delta_['meta'])
+        yield step, data, tree
+
+
+def materialize_history(steps: List[OperationStep]) -> List[dict]:
+    """
+    把（可能为增量编码的）步骤序列转换为带完整快照的字典列表
+    供只认识完整快照的旧版前端使用
+    """
+    result = []
+    for step, data, tree in iter_materialized(steps):
+        step_dict = step.to_dict()
+        if step.snapshot_delta:
+            step_dict.pop('snapshot_delta', None)
+            if data is not None:
+                step_dict['data_snapshot'] = data
+            if tree is not None:
+                step_dict['tree_snapshot'] = tree
+        result.append(step_dict)
+    return result
+
+
+def rebase_history(steps: List[OperationStep], start: int) -> None:
+    """
+    历史被截断为 steps[start:] 之前调用：
+    把保留部分中第一个带增量的步骤改写为基准快照，保证截断后仍可独立回放
+    """
+    data_done = tree_done = False
+    for index, (step, data, tree) in enumerate(iter_materialized(steps)):
+        if index < start or not step.snapshot_delta:
+            continue
+        delta = step.snapshot_delta
+        if data is not None and not data_done:
+            delta['data'] = list_delta([], data)
+            delta['data']['base'] = True
+            data_done = True
+        if tree is not None and not tree_done:
+            root_id, nodes, meta = flatten_tree(tree)
+            delta['tree'] = tree_delta({}, root_id, nodes, meta)
+            delta['tree']['base'] = True
+            tree_done = True
+        if data_done and tree_done:
+            break
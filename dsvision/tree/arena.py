@@ -0,0 +1,221 @@
+"""
+紧凑的树节点存储（arena）
+
+大树（几十万、上百万节点）时每个 TreeNode 都是一个 Python 对象，再加上 node_id 索引字典，每个节点要占几百字节。
+arena 把所有节点的字段放进几组并行数组（值、左右孩子、父节点、高度、node_id 及缓存的子树高度/节点数），按槽位下标互相引用，
+每个节点只占几十字节；算法代码拿到的是 ArenaNode 句柄，读写都转到数组上，所以 BST / AVL 的代码不用改。
+
+- 句柄按槽位复用（弱引用表）：同一个节点在任何时候拿到的都是同一个句柄，`is` 比较照常成立；
+  没有被引用的句柄随时回收，树本身不持有任何节点对象
+- node_id 由所属结构的分配器（NodeIdAllocator）按创建顺序分配，不随垃圾回收、不随压缩变化，也不会被其他节点复用
+- 删除的槽位先标记为空闲，空闲过多时在下一次分配前整体压缩；压缩保持槽位顺序，
+  因此 ids 数组始终递增，按 node_id 查找用二分，不需要额外的索引字典（导入时改回的 id 不一定有序，改完按 id 重排一次）
+"""
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable, List, Optional, Tuple
+from weakref import WeakValueDictionary
+
+from ..operation.node_ids import NodeIdAllocator
+from .base import TreeNode
+
+NIL = -1  # 空孩子 / 空父节点
+COMPACT_MIN_FREE = 1024  # 空闲槽位至少这么多、且占到一半时才压缩
+
+
+class ArenaNode(TreeNode):
+    """arena 中一个节点的句柄：自身不保存字段，TreeNode 的私有字段都映射到 arena 的并行数组"""
+    __slots__ = ('_arena', '_slot', '__weakref__')
+
+    def __init__(self, arena: 'TreeArena', slot: int):
+        self._arena = arena
+        self._slot = slot
+
+    @property
+    def node_id(self) -> int:
+        return self._arena.ids[self._slot]
+
+    @property
+    def _value(self) -> Any:
+        return self._arena.values[self._slot]
+
+    @_value.setter
+    def _value(self, value: Any) -> None:
+        self._arena.values[self._slot] = value
+
+    @property
+    def _left(self) -> Optional['ArenaNode']:
+        return self._arena.node(self._arena.left[self._slot])
+
+    @_left.setter
+    def _left(self, child: Optional['ArenaNode']) -> None:
+        self._arena.left[self._slot] = NIL if child is None else child._slot
+
+    @property
+    def _right(self) -> Optional['ArenaNode']:
+        return self._arena.node(self._arena.right[self._slot])
+
+    @_right.setter
+    def _right(self, child: Optional['ArenaNode']) -> None:
+        self._arena.right[self._slot] = NIL if child is None else child._slot
+
+    @property
+    def _parent(self) -> Optional['ArenaNode']:
+        return self._arena.node(self._arena.parent[self._slot])
+
+    @_parent.setter
+    def _parent(self, parent: Optional['ArenaNode']) -> None:
+        self._arena.parent[self._slot] = NIL if parent is None else parent._slot
+
+    @property
+    def _height(self) -> int:
+        return self._arena.height[self._slot]
+
+    @_height.setter
+    def _height(self, height: int) -> None:
+        self._arena.height[self._slot] = height
+
+    @property
+    def _snapshot(self) -> Optional[dict]:
+        return self._arena.snapshots.get(self._slot)
+
+    @_snapshot.setter
+    def _snapshot(self, snapshot: Optional[dict]) -> None:
+        if snapshot is None:
+            self._arena.snapshots.pop(self._slot, None)
+        else:
+            self._arena.snapshots[self._slot] = snapshot
+
+    @property
+    def _subtree_height(self) -> Optional[int]:
+        return self._arena.subtree_height[self._slot] or None
+
+    @_subtree_height.setter
+    def _subtree_height(self, height: Optional[int]) -> None:
+        self._arena.subtree_height[self._slot] = height or 0
+
+    @property
+    def _subtree_size(self) -> Optional[int]:
+        return self._arena.subtree_size[self._slot] or None
+
+    @_subtree_size.setter
+    def _subtree_size(self, size: Optional[int]) -> None:
+        self._arena.subtree_size[self._slot] = size or 0
+
+
+class TreeArena:
+    """并行数组形式的节点存储，槽位下标即节点在数组中的位置"""
+
+    def __init__(self, node_ids: Optional[NodeIdAllocator] = None):
+        self._node_ids = node_ids or NodeIdAllocator()  # 与所属结构共用，reset 后也不回退
+        self.reset()
+
+    def reset(self) -> None:
+        """丢弃全部节点（清空树时调用）"""
+        self.values: List[Any] = []
+        self.left = array('i')
+        self.right = array('i')
+        self.parent = array('i')
+        self.height = array('i')
+        self.subtree_height = array('i')  # 0 表示未缓存
+        self.subtree_size = array('i')  # 0 表示未缓存
+        self.ids = array('q')
+        self.alive = bytearray()
+        self.snapshots = {}  # 槽位 -> 缓存的快照字典，只有生成过快照的节点才有
+        self._free = 0
+        self._handles: 'WeakValueDictionary[int, ArenaNode]' = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self.values) - self._free
+
+    def new_node(self, value: Any) -> ArenaNode:
+        if self._free >= COMPACT_MIN_FREE and self._free * 2 >= len(self.values):
+            self._compact()
+        slot = len(self.values)
+        self.values.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.parent.append(NIL)
+        self.height.append(1)
+        self.subtree_height.append(0)
+        self.subtree_size.append(0)
+        self.ids.append(self._node_ids.allocate())
+        self.alive.append(1)
+        return self.node(slot)
+
+    def node(self, slot: int) -> Optional[ArenaNode]:
+        """槽位对应的句柄（同一槽位总是返回同一个存活的句柄）"""
+        if slot == NIL:
+            return None
+        handle = self._handles.get(slot)
+        if handle is None:
+            handle = ArenaNode(self, slot)
+            self._handles[slot] = handle
+        return handle
+
+    def free(self, node: ArenaNode) -> None:
+        """
+        标记节点已删除；字段保留到下一次压缩，删除流程里摘下节点后仍可读取它的孩子
+        """
+        slot = node._slot
+        if self.alive[slot]:
+            self.alive[slot] = 0
+            self._free += 1
+
+    def find(self, node_id: Any) -> Optional[ArenaNode]:
+        """按 node_id 查找存活节点：ids 按槽位递增，二分即可"""
+        try:
+            node_id = int(node_id)
+        except (TypeError, ValueError):
+            return None
+        slot = bisect_left(self.ids, node_id)
+        if slot < len(self.ids) and self.ids[slot] == node_id and self.alive[slot]:
+            return self.node(slot)
+        return None
+
+    def renumber(self, pairs: Iterable[Tuple[ArenaNode, int]]) -> None:
+        """把节点的 node_id 改成指定值（导入时恢复导出的 id），之后按 id 重排槽位，二分查找照常可用"""
+        for node, node_id in pairs:
+            self.ids[node._slot] = node_id
+        self._compact(by_id=True)
+
+    def nbytes(self) -> int:
+        """并行数组与值列表本身占用的字节数（不含节点值对象）"""
+        arrays = (self.left, self.right, self.parent, self.height, self.subtree_height, self.subtree_size, self.ids)
+        return sum(a.itemsize * len(a) for a in arrays) + len(self.alive) + sys.getsizeof(self.values)
+
+    def _compact(self, by_id: bool = False) -> None:
+        """
+        去掉空闲槽位，保持存活节点的相对顺序（by_id=True 时按 node_id 排序）；存活句柄原地改成新槽位，缓存全部清空
+        """
+        keep = [slot for slot in range(len(self.values)) if self.alive[slot]]
+        if by_id:
+            keep.sort(key=self.ids.__getitem__)
+        remap = array('i', [NIL]) * len(self.values)
+        for new_slot, slot in enumerate(keep):
+            remap[slot] = new_slot
+
+        def relink(links: array) -> array:
+            return array('i', (NIL if links[slot] == NIL else remap[links[slot]] for slot in keep))
+
+        handles = list(self._handles.items())
+        self.values = [self.values[slot] for slot in keep]
+        self.left = relink(self.left)
+        self.right = relink(self.right)
+        self.parent = relink(self.parent)
+        self.height = array('i', (self.height[slot] for slot in keep))
+        self.subtree_height = array('i', [0]) * len(keep)
+        self.subtree_size = array('i', [0]) * len(keep)
+        self.ids = array('q', (self.ids[slot] for slot in keep))
+        self.alive = bytearray(b'\x01') * len(keep)
+        self.snapshots = {}
+        self._free = 0
+
+        self._handles = WeakValueDictionary()
+        for slot, handle in handles:
+            if remap[slot] == NIL:
+                handle._arena = None  # 已删除节点的句柄失效，继续使用会直接报错
+                continue
+            handle._slot = remap[slot]
+            self._handles[handle._slot] = handle
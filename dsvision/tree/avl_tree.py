@@ -1,22 +1,23 @@
 from .binary_search_tree import BinarySearchTree
 from .base import TreeNode
-from ..operation.operation import OperationStep, OperationType
-from typing import Optional, Any
+from ..operation.operation import OperationStep, OperationType, TraceLevel
+from typing import Optional, Any, List
 
 
 class AVLTree(BinarySearchTree):
     """AVL树实现（自平衡二叉搜索树）"""
 
-    def __init__(self):
-        super().__init__()
-        step = OperationStep(
-            OperationType.INIT,
-            description="初始化AVL树",
-            code_template='avl_insert',
-            code_line=1,
-            code_highlight=[1]
-        )
-        self.add_operation_step(step)
+    def __init__(self, storage: str = 'object'):
+        super().__init__(storage)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INIT,
+                description="初始化AVL树",
+                code_template='avl_insert',
+                code_line=1,
+                code_highlight=[1]
+            )
+            self.add_operation_step(step)
 
     def insert(self, value: Any) -> bool:
         """插入节点"""
@@ -27,45 +28,74 @@ class AVLTree(BinarySearchTree):
         try:
             value = int(value)
         except (ValueError, TypeError):
-            step = OperationStep(
-                OperationType.INSERT,
-                value=value,
-                description=f"插入失败：值'{value}'无法转换为数字"
-            )
-            self.add_operation_step(step)
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INSERT,
+                    value=value,
+                    description=f"插入失败：值'{value}'无法转换为数字"
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return False
 
-        step = OperationStep(
-            OperationType.INSERT,
-            value=value,
-            description=f"准备插入节点{value}到AVL树",
-            code_template='avl_insert',
-            code_line=1,
-            code_highlight=[1]
-        )
-        self.add_operation_step(step)
-
-        if self._root is None:
-            self._root = TreeNode(value)
-            self._size += 1
+        if self._tracing():
             step = OperationStep(
                 OperationType.INSERT,
                 value=value,
-                description=f"插入节点 {value} 作为AVL树根节点",
-                tree_snapshot=self._get_tree_snapshot(),
+                description=f"准备插入节点{value}到AVL树",
                 code_template='avl_insert',
-                code_line=3,
-                code_highlight=[2, 3, 4, 5]
+                code_line=1,
+                code_highlight=[1]
             )
             self.add_operation_step(step)
+
+        if self._root is None:
+            self._root = self._new_node(value)
+            self._size += 1
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INSERT,
+                    value=value,
+                    description=f"插入节点 {value} 作为AVL树根节点",
+                    tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                    code_template='avl_insert',
+                    code_line=3,
+                    code_highlight=[2, 3, 4, 5]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return True
 
-        # 标记开始插入,用于在递归中只显示一次虚线节点
-        self._just_inserted = False
-        # 调用AVL的递归插入，不是BST的
-        self._root = self._insert_recursive(self._root, value)
+        size_before = self._size
+        self._insert_path(value)
+
+        # 精简记录下没有逐层确认步骤，补一条插入结果
+        if not self._tracing():
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INSERT,
+                    value=value,
+                    description=f"节点{value}插入完成" if self._size > size_before else f"节点 {value} 已存在,不插入",
+                    tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                    code_template='avl_insert',
+                    code_line=41,
+                    code_highlight=[41]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
 
+    def build_balanced(self, values: List[Any]) -> bool:
+        """与 insert 一样把值转换为整数后平衡构建；建好的树每个节点平衡因子都在 [-1, 1] 内，无需旋转"""
+        try:
+            values = [int(value) for value in values]
+        except (ValueError, TypeError):
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INIT,
+                    description=f"构建失败：{values} 中有无法转换为数字的值"
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return False
+        return super().build_balanced(values)
+
     def _get_height(self, node: Optional[TreeNode]) -> int:
         """获取节点高度"""
         if node is None:
@@ -84,39 +114,35 @@ class AVLTree(BinarySearchTree):
             return 0
         return self._get_height(node.left) - self._get_height(node.right)
 
-    def _rotate_right(self, z: TreeNode) -> TreeNode:
-        """右旋转 - 带中间步骤的详细动画"""
+    def _rotate_right(self, z: TreeNode, parent: Optional[TreeNode]) -> TreeNode:
+        """
+        右旋转 - 带中间步骤的详细动画
+        parent 为 z 的父节点（z 为根时为 None）：旋转后先把新子树接回 parent，完成步骤的快照才是完整的树
+        """
         # 第1步：标记需要旋转的节点（红色高亮）
-        step = OperationStep(
-            OperationType.ROTATE_RIGHT,
-            description=f"🔄 开始右旋转：节点{z.value}向右旋转",
-            tree_snapshot={
-                'root': self._node_to_dict(self._root),
-                'size': self._size,
-                'height': self.get_height()
-            },
-            highlight_indices=[z.node_id, z.left.node_id],  # 高亮要旋转的两个节点
-            animation_type="rotate",
-            duration=1.0,
-            code_template='avl_rotate_right',
-            code_line=2,
-            code_highlight=[2, 3, 4]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.ROTATE_RIGHT,
+                description=f"🔄 开始右旋转：节点{z.value}向右旋转",
+                tree_snapshot=self._get_tree_snapshot(),
+                highlight_indices=[z.node_id, z.left.node_id],  # 高亮要旋转的两个节点
+                animation_type="rotate",
+                duration=1.0,
+                code_template='avl_rotate_right',
+                code_line=2,
+                code_highlight=[2, 3, 4]
+            )
+            self.add_operation_step(step)
 
         y = z.left
         T3 = y.right
 
         # 第2步：显示T3子树将被移动
-        if T3:
+        if T3 and self._tracing():
             step = OperationStep(
                 OperationType.UPDATE,
                 description=f"移动T3子树：从节点{y.value}右侧移到节点{z.value}左侧",
-                tree_snapshot={
-                    'root': self._node_to_dict(self._root),
-                    'size': self._size,
-                    'height': self.get_height()
-                },
+                tree_snapshot=self._get_tree_snapshot(),
                 highlight_indices=[T3.node_id],
                 animation_type="move",
                 duration=0.8
@@ -126,65 +152,59 @@ class AVLTree(BinarySearchTree):
         # 执行旋转
         y.right = z
         z.left = T3
+        self._replace_child(parent, z, y)
 
         # 更新高度
         self._update_height(z)
         self._update_height(y)
 
         # 第3步：显示旋转完成后的结果（带过渡动画）
-        step = OperationStep(
-            OperationType.UPDATE,
-            description=f"✅ 右旋转完成，{y.value}成为新的根节点",
-            tree_snapshot={
-                'root': self._node_to_dict(y),  # 🔥 使用新的根节点y
-                'size': self._size,
-                'height': self.get_height()
-            },
-            highlight_indices=[y.node_id],
-            animation_type="settle",
-            duration=0.6,
-            code_template='avl_rotate_right',
-            code_line=12,
-            code_highlight=[6, 7, 10, 11, 12]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.UPDATE,
+                description=f"✅ 右旋转完成，{y.value}成为新的根节点",
+                tree_snapshot=self._get_tree_snapshot(),  # 🔥 子树已接回父节点，显示整棵树
+                highlight_indices=[y.node_id],
+                animation_type="settle",
+                duration=0.6,
+                code_template='avl_rotate_right',
+                code_line=12,
+                code_highlight=[6, 7, 10, 11, 12]
+            )
+            self.add_operation_step(step)
 
 
         return y
 
-    def _rotate_left(self, z: TreeNode) -> TreeNode:
-        """左旋转 - 带中间步骤的详细动画"""
+    def _rotate_left(self, z: TreeNode, parent: Optional[TreeNode]) -> TreeNode:
+        """
+        左旋转 - 带中间步骤的详细动画
+        parent 为 z 的父节点（z 为根时为 None）：旋转后先把新子树接回 parent，完成步骤的快照才是完整的树
+        """
         # 第1步：标记需要旋转的节点（红色高亮）
-        step = OperationStep(
-            OperationType.ROTATE_LEFT,
-            description=f"🔄 开始左旋转：节点{z.value}向左旋转",
-            tree_snapshot={
-                'root': self._node_to_dict(self._root),
-                'size': self._size,
-                'height': self.get_height()
-            },
-            highlight_indices=[z.node_id, z.right.node_id],  # 高亮要旋转的两个节点
-            animation_type="rotate",
-            duration=1.0,
-            code_template='avl_rotate_left',
-            code_line=2,
-            code_highlight=[2, 3, 4]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.ROTATE_LEFT,
+                description=f"🔄 开始左旋转：节点{z.value}向左旋转",
+                tree_snapshot=self._get_tree_snapshot(),
+                highlight_indices=[z.node_id, z.right.node_id],  # 高亮要旋转的两个节点
+                animation_type="rotate",
+                duration=1.0,
+                code_template='avl_rotate_left',
+                code_line=2,
+                code_highlight=[2, 3, 4]
+            )
+            self.add_operation_step(step)
 
         y = z.right
         T2 = y.left
 
         # 第2步：显示T2子树将被移动
-        if T2:
+        if T2 and self._tracing():
             step = OperationStep(
                 OperationType.UPDATE,
                 description=f"移动T2子树：从节点{y.value}左侧移到节点{z.value}右侧",
-                tree_snapshot={
-                    'root': self._node_to_dict(self._root),
-                    'size': self._size,
-                    'height': self.get_height()
-                },
+                tree_snapshot=self._get_tree_snapshot(),
                 highlight_indices=[T2.node_id],
                 animation_type="move",
                 duration=0.8
@@ -194,351 +214,213 @@ class AVLTree(BinarySearchTree):
         # 执行旋转
         y.left = z
         z.right = T2
+        self._replace_child(parent, z, y)
 
         # 更新高度
         self._update_height(z)
         self._update_height(y)
 
         # 第3步：显示旋转完成后的结果（带过渡动画）
-        step = OperationStep(
-            OperationType.UPDATE,
-            description=f"✅ 左旋转完成，{y.value}成为新的根节点",
-            tree_snapshot={
-                'root': self._node_to_dict(y),  # 🔥 使用新的根节点y
-                'size': self._size,
-                'height': self.get_height()
-            },
-            highlight_indices=[y.node_id],
-            animation_type="settle",
-            duration=0.6,
-            code_template='avl_rotate_left',
-            code_line=12,
-            code_highlight=[6, 7, 10, 11, 12]
-        )
-        self.add_operation_step(step)
-
-        return y
-
-    def _insert_recursive(self, node: Optional[TreeNode], value: Any) -> TreeNode:
-        """递归插入并保持平衡"""
-        # 1. 执行标准BST插入
-        if node is None:
-            self._size += 1
-            new_node = TreeNode(value)
-            self._just_inserted = True  # 标记刚插入了新节点
-            return new_node
-
-        if value < node.value:
-            node.left = self._insert_recursive(node.left, value)
-        elif value > node.value:
-            node.right = self._insert_recursive(node.right, value)
-        else:
-            # 值已存在
-            return node
-
-        # 2. 更新当前节点高度
-        self._update_height(node)
-
-        # 🔥 只在刚插入新节点后的第一次回溯时显示虚线节点
-        if hasattr(self, '_just_inserted') and self._just_inserted:
-            self._just_inserted = False  # 只显示一次
-            inserted_node = self._find_node_by_value(self._root, value)
-            if inserted_node:
-                # 步骤1: 显示浅绿色脉冲（BST位置）
-                step = OperationStep(
-                    OperationType.UPDATE,
-                    description=f"✏️ 节点{value}已按BST规则插入",
-                    tree_snapshot={
-                        'root': self._node_to_dict(self._root),
-                        'size': self._size,
-                        'height': self.get_height()
-                    },
-                    highlight_indices=[inserted_node.node_id],
-                    animation_type="pulse",  # 明确表示脉冲动画
-                    duration=0.8,
-                    code_template='avl_insert',
-                    code_line=7,
-                    code_highlight=[7, 8, 9, 10, 11]
-                )
-                self.add_operation_step(step)
-
-        # 3. 获取平衡因子
-        balance = self._get_balance(node)
-
-        # 🔥 获取新插入的节点引用（用于后续确认步骤）
-        inserted_node = self._find_node_by_value(self._root, value) if hasattr(self, '_just_inserted') or True else None
-
-        # 4. 检查是否需要旋转
-        # Left Left Case
-        if balance > 1 and value < node.left.value:
-            # 步骤2: 检测不平衡并提示需要旋转
-            step = OperationStep(
-                OperationType.UPDATE,
-                description=f"⚠️ 检测到LL失衡：节点{node.value}平衡因子={balance}，左子树过高，需要右旋",
-                tree_snapshot={
-                    'root': self._node_to_dict(self._root),
-                    'size': self._size,
-                    'height': self.get_height()
-                },
-                highlight_indices=[node.node_id],  # 高亮失衡节点
-                animation_type="warning",
-                duration=0.8,
-                code_template='avl_insert',
-                code_line=20,
-                code_highlight=[19, 20, 21]
-            )
-            self.add_operation_step(step)
-
-            # 执行旋转
-            new_root = self._rotate_right(node)
-
-            # 步骤3: 旋转完成后，确认新插入的节点为深绿色
-            if inserted_node:
-                step = OperationStep(
-                    OperationType.UPDATE,
-                    description=f"✅ 旋转完成，节点{value}已确认插入",
-                    tree_snapshot={
-                        'root': self._node_to_dict(new_root),
-                        'size': self._size,
-                        'height': self.get_height()
-                    },
-                    highlight_indices=[inserted_node.node_id],
-                    animation_type="confirm",  # 停止脉冲，变深绿色
-                    duration=0.5,
-                    code_template='avl_insert',
-                    code_line=41,
-                    code_highlight=[41]
-                )
-                self.add_operation_step(step)
-
-            return new_root
-
-        # Right Right Case
-        elif balance < -1 and value > node.right.value:
-            # 步骤2: 检测不平衡并提示需要旋转
+        if self._tracing():
             step = OperationStep(
                 OperationType.UPDATE,
-                description=f"⚠️ 检测到RR失衡：节点{node.value}平衡因子={balance}，右子树过高，需要左旋",
-                tree_snapshot={
-                    'root': self._node_to_dict(self._root),
-                    'size': self._size,
-                    'height': self.get_height()
-                },
-                highlight_indices=[node.node_id],  # 高亮失衡节点
-                animation_type="warning",
-                duration=0.8,
-                code_template='avl_insert',
-                code_line=25,
-                code_highlight=[24, 25, 26]
+                description=f"✅ 左旋转完成，{y.value}成为新的根节点",
+                tree_snapshot=self._get_tree_snapshot(),  # 🔥 子树已接回父节点，显示整棵树
+                highlight_indices=[y.node_id],
+                animation_type="settle",
+                duration=0.6,
+                code_template='avl_rotate_left',
+                code_line=12,
+                code_highlight=[6, 7, 10, 11, 12]
             )
             self.add_operation_step(step)
 
-            # 执行旋转
-            new_root = self._rotate_left(node)
-
-            # 步骤3: 旋转完成后，确认新插入的节点为深绿色
-            if inserted_node:
-                step = OperationStep(
-                    OperationType.UPDATE,
-                    description=f"✅ 旋转完成，节点{value}已确认插入",
-                    tree_snapshot={
-                        'root': self._node_to_dict(new_root),
-                        'size': self._size,
-                        'height': self.get_height()
-                    },
-                    highlight_indices=[inserted_node.node_id],
-                    animation_type="confirm",  # 停止脉冲，变深绿色
-                    duration=0.5,
-                    code_template='avl_insert',
-                    code_line=41,
-                    code_highlight=[41]
-                )
-                self.add_operation_step(step)
+        return y
 
-            return new_root
+    # 插入失衡的四种情况：(提示, code_line, code_highlight)
+    _INSERT_CASES = {
+        'LL': ("左子树过高，需要右旋", 20, [19, 20, 21]),
+        'RR': ("右子树过高，需要左旋", 25, [24, 25, 26]),
+        'LR': ("需要先左旋后右旋", 30, [29, 30, 31, 32]),
+        'RL': ("需要先右旋后左旋", 36, [35, 36, 37, 38]),
+    }
+
+    def _insert_path(self, value: Any) -> None:
+        """
+        🔥 单趟插入：一次下降把经过的节点压入路径栈，挂上新节点后沿栈自下而上更新高度
+        某层高度不变时更上面的祖先都不受影响，立即停止；插入最多旋转一次，旋转后子树恢复原高度，同样停止
+        """
+        path = []
+        node = self._root
+        while node is not None:
+            if value == node.value:
+                return  # 值已存在
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        self._size += 1
+        inserted_node = self._new_node(value)
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = inserted_node
+        else:
+            parent.right = inserted_node
 
-        # Left Right Case
-        elif balance > 1 and value > node.left.value:
-            # 步骤2: 检测不平衡并提示需要旋转
+        # 步骤1: 显示浅绿色脉冲（BST位置）
+        if self._tracing():
             step = OperationStep(
                 OperationType.UPDATE,
-                description=f"⚠️ 检测到LR失衡：节点{node.value}平衡因子={balance}，需要先左旋后右旋",
-                tree_snapshot={
-                    'root': self._node_to_dict(self._root),
-                    'size': self._size,
-                    'height': self.get_height()
-                },
-                highlight_indices=[node.node_id],  # 高亮失衡节点
-                animation_type="warning",
+                description=f"✏️ 节点{value}已按BST规则插入",
+                tree_snapshot=self._get_tree_snapshot(),
+                highlight_indices=[inserted_node.node_id],
+                animation_type="pulse",  # 明确表示脉冲动画
                 duration=0.8,
                 code_template='avl_insert',
-                code_line=30,
-                code_highlight=[29, 30, 31, 32]
+                code_line=7,
+                code_highlight=[7, 8, 9, 10, 11]
             )
             self.add_operation_step(step)
 
-            # 执行双旋转
-            node.left = self._rotate_left(node.left)
-            new_root = self._rotate_right(node)
-
-            # 步骤3: 旋转完成后，确认新插入的节点为深绿色
-            if inserted_node:
-                step = OperationStep(
-                    OperationType.UPDATE,
-                    description=f"✅ 旋转完成，节点{value}已确认插入",
-                    tree_snapshot={
-                        'root': self._node_to_dict(new_root),
-                        'size': self._size,
-                        'height': self.get_height()
-                    },
-                    highlight_indices=[inserted_node.node_id],
-                    animation_type="confirm",  # 停止脉冲，变深绿色
-                    duration=0.5,
-                    code_template='avl_insert',
-                    code_line=41,
-                    code_highlight=[41]
-                )
-                self.add_operation_step(step)
-
-            return new_root
-
-        # Right Left Case
-        elif balance < -1 and value < node.right.value:
-            # 步骤2: 检测不平衡并提示需要旋转
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            left_height = node.left.height if node.left is not None else 0
+            right_height = node.right.height if node.right is not None else 0
+            balance = left_height - right_height
+
+            if balance > 1 or balance < -1:
+                if balance > 1:
+                    case = 'LL' if value < node.left.value else 'LR'
+                else:
+                    case = 'RR' if value > node.right.value else 'RL'
+
+                # 步骤2: 检测不平衡并提示需要旋转
+                if self._tracing():
+                    hint, code_line, code_highlight = self._INSERT_CASES[case]
+                    step = OperationStep(
+                        OperationType.UPDATE,
+                        description=f"⚠️ 检测到{case}失衡：节点{node.value}平衡因子={balance}，{hint}",
+                        tree_snapshot=self._get_tree_snapshot(),
+                        highlight_indices=[node.node_id],  # 高亮失衡节点
+                        animation_type="warning",
+                        duration=0.8,
+                        code_template='avl_insert',
+                        code_line=code_line,
+                        code_highlight=code_highlight
+                    )
+                    self.add_operation_step(step)
+
+                self._rebalance(node, case, path[i - 1] if i else None)
+
+                # 步骤3: 旋转完成后，确认新插入的节点为深绿色
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.UPDATE,
+                        description=f"✅ 旋转完成，节点{value}已确认插入",
+                        tree_snapshot=self._get_tree_snapshot(),
+                        highlight_indices=[inserted_node.node_id],
+                        animation_type="confirm",  # 停止脉冲，变深绿色
+                        duration=0.5,
+                        code_template='avl_insert',
+                        code_line=41,
+                        code_highlight=[41]
+                    )
+                    self.add_operation_step(step)
+                return
+
+            height = 1 + max(left_height, right_height)
+            if height == node.height:
+                break  # 高度稳定，祖先的高度和平衡因子都不变
+            node.height = height
+
+        # 步骤2: 停止脉冲，确认节点（深绿色） - 树已平衡
+        if self._tracing():
             step = OperationStep(
                 OperationType.UPDATE,
-                description=f"⚠️ 检测到RL失衡：节点{node.value}平衡因子={balance}，需要先右旋后左旋",
-                tree_snapshot={
-                    'root': self._node_to_dict(self._root),
-                    'size': self._size,
-                    'height': self.get_height()
-                },
-                highlight_indices=[node.node_id],  # 高亮失衡节点
-                animation_type="warning",
-                duration=0.8,
+                description=f"✅ 节点{value}已确认插入，节点{node.value}平衡因子为{balance}，树保持平衡",
+                tree_snapshot=self._get_tree_snapshot(),
+                highlight_indices=[inserted_node.node_id],
+                animation_type="confirm",  # 停止脉冲，变深绿色
+                duration=0.6,
                 code_template='avl_insert',
-                code_line=36,
-                code_highlight=[35, 36, 37, 38]
+                code_line=41,
+                code_highlight=[41]
             )
             self.add_operation_step(step)
 
-            # 执行双旋转
-            node.right = self._rotate_right(node.right)
-            new_root = self._rotate_left(node)
-
-            # 步骤3: 旋转完成后，确认新插入的节点为深绿色
-            if inserted_node:
-                step = OperationStep(
-                    OperationType.UPDATE,
-                    description=f"✅ 旋转完成，节点{value}已确认插入",
-                    tree_snapshot={
-                        'root': self._node_to_dict(new_root),
-                        'size': self._size,
-                        'height': self.get_height()
-                    },
-                    highlight_indices=[inserted_node.node_id],
-                    animation_type="confirm",  # 停止脉冲，变深绿色
-                    duration=0.5,
-                    code_template='avl_insert',
-                    code_line=41,
-                    code_highlight=[41]
-                )
-                self.add_operation_step(step)
-
-            return new_root
-
-        # 平衡的情况：直接确认节点为深绿色
+    def _rebalance(self, node: TreeNode, case: str, parent: Optional[TreeNode]) -> TreeNode:
+        """按失衡情况旋转（新子树已接回 parent），返回子树的新根"""
+        if case == 'LR':
+            self._rotate_left(node.left, node)
+        elif case == 'RL':
+            self._rotate_right(node.right, node)
+        if case in ('LL', 'LR'):
+            return self._rotate_right(node, parent)
+        return self._rotate_left(node, parent)
+
+    def _replace_child(self, parent: Optional[TreeNode], old: TreeNode, new: Optional[TreeNode]) -> None:
+        """把 parent 下的子树 old 换成 new；parent 为 None 时替换根"""
+        if parent is None:
+            self._root = new
+        elif parent.left is old:
+            parent.left = new
         else:
-            # 步骤2: 停止脉冲，确认节点（深绿色） - 树已平衡
-            if inserted_node:
-                step = OperationStep(
-                    OperationType.UPDATE,
-                    description=f"✅ 节点{value}已确认插入，节点{node.value}平衡因子为{balance}，树保持平衡",
-                    tree_snapshot={
-                        'root': self._node_to_dict(self._root),
-                        'size': self._size,
-                        'height': self.get_height()
-                    },
-                    highlight_indices=[inserted_node.node_id],
-                    animation_type="confirm",  # 停止脉冲，变深绿色
-                    duration=0.6,
-                    code_template='avl_insert',
-                    code_line=41,
-                    code_highlight=[41]
-                )
-                self.add_operation_step(step)
-
-        return node
-
-    def _find_node_by_value(self, node: Optional[TreeNode], value: Any) -> Optional[TreeNode]:
-        """根据值查找节点"""
+            parent.right = new
+
+    def _delete_node(self, root: Optional[TreeNode], value: Any) -> Optional[TreeNode]:
+        """
+        🔥 单趟删除：一次下降找到目标；有两个子节点时沿右子树继续下降到后继，同一条路径栈上换值后摘除后继，
+        不再按后继的值从目标处重新查找。摘除后沿栈自下而上调整，某层子树高度不变即停止
+        """
+        path = []
+        node = root
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
         if node is None:
-            return None
-        if node.value == value:
-            return node
-
-        left_result = self._find_node_by_value(node.left, value)
-        if left_result:
-            return left_result
-
-        return self._find_node_by_value(node.right, value)
-
-    def _delete_recursive(self, node: Optional[TreeNode], value: Any) -> Optional[TreeNode]:
-        """递归删除并保持平衡"""
-        # 1. 执行标准BST删除
-        if node is None:
-            return None
-
-        if value < node.value:
-            node.left = self._delete_recursive(node.left, value)
-        elif value > node.value:
-            node.right = self._delete_recursive(node.right, value)
-        else:
-            # 找到要删除的节点
-            if node.left is None:
-                self._size -= 1
-                return node.right
-            elif node.right is None:
-                self._size -= 1
-                return node.left
-
-            # 有两个子节点
-            min_node = self._find_min(node.right)
-            node.value = min_node.value
-            node.right = self._delete_recursive(node.right, min_node.value)
-
-        if node is None:
-            return node
-
-        # 2. 更新高度
-        self._update_height(node)
-
-        # 3. 获取平衡因子
-        balance = self._get_balance(node)
-
-        # 4. 如果不平衡，进行旋转
-        # Left Left Case
-        if balance > 1 and self._get_balance(node.left) >= 0:
-            return self._rotate_right(node)
-
-        # Left Right Case
-        if balance > 1 and self._get_balance(node.left) < 0:
-            node.left = self._rotate_left(node.left)
-            return self._rotate_right(node)
-
-        # Right Right Case
-        if balance < -1 and self._get_balance(node.right) <= 0:
-            return self._rotate_left(node)
-
-        # Right Left Case
-        if balance < -1 and self._get_balance(node.right) > 0:
-            node.right = self._rotate_right(node.right)
-            return self._rotate_left(node)
-
-        return node
-
-    def get_tree_data(self) -> dict:
-        """获取AVL树数据"""
-        data = super().get_tree_data()
-        data['is_avl'] = True
-        return data
\ No newline at end of file
+            return root
+
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+
+        # 先释放再替换：删掉最后一个节点时替换根会重置节点存储
+        child = node.left if node.left is not None else node.right
+        self._forget_node(node)
+        self._size -= 1
+        self._replace_child(path[-1] if path else None, node, child)
+
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            left_height = node.left.height if node.left is not None else 0
+            right_height = node.right.height if node.right is not None else 0
+            balance = left_height - right_height
+
+            if balance > 1:
+                case = 'LL' if self._get_balance(node.left) >= 0 else 'LR'
+            elif balance < -1:
+                case = 'RR' if self._get_balance(node.right) <= 0 else 'RL'
+            else:
+                height = 1 + max(left_height, right_height)
+                if height == node.height:
+                    break
+                node.height = height
+                continue
+
+            # 删除后的旋转可能让子树变矮，高度仍变化时继续向上
+            old_height = node.height
+            new_root = self._rebalance(node, case, path[i - 1] if i else None)
+            if new_root.height == old_height:
+                break
+
+        return self._root
+
+    def _tree_data_fields(self) -> dict:
+        """AVL树数据额外带 is_avl 标记"""
+        fields = super()._tree_data_fields()
+        fields['is_avl'] = lambda: True
+        return fields
\ No newline at end of file
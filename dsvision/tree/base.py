@@ -1,24 +1,224 @@
 from abc import ABC,abstractmethod
-from typing import List, Optional, Any
-from ..operation.operation import OperationStep, OperationType
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from ..operation.operation import OperationStep, OperationType, TraceLevel
+from ..operation.recorder import OperationRecorder
+from ..operation.node_ids import NodeIdAllocator
+from ..operation.snapshot import rebase_history
+from ..logger import get_logger
+
+logger = get_logger(__name__)
+
+# 递归版遍历动画每层占一个 Python 栈帧，树高超过该值时改用非递归版本
+MAX_RECURSIVE_TRAVERSE_HEIGHT = 500
 
 class TreeNode:
-    """树节点基类"""
-    def __init__(self,value:Any):
-        self.value = value
-        self.left:Optional['TreeNode'] = None
-        self.right:Optional['TreeNode'] = None
-        self.node_id = id(self)
-        self.height = 1 #用于AVL树
+    """
+    树节点基类
+    left/right/value/height 通过属性修改：修改时沿父指针清掉自身及祖先的缓存，
+    未修改的子树的快照字典在多个步骤的 tree_snapshot 之间共享（见 TreeStructureBase._node_to_dict）
+    用 __slots__ 存放字段，大树时每个节点不再各带一个 __dict__
+    """
+    __slots__ = ('_value', '_left', '_right', '_parent', '_height', '_snapshot', '_subtree_height', '_subtree_size',
+                 'node_id')
+
+    def __init__(self,value:Any, node_id: int = -1):
+        self._value = value
+        self._left:Optional['TreeNode'] = None
+        self._right:Optional['TreeNode'] = None
+        self._parent:Optional['TreeNode'] = None
+        self._height = 1 #用于AVL树
+        self._snapshot: Optional[dict] = None  # 🔥 缓存的快照字典
+        self._subtree_height: Optional[int] = None  # 🔥 缓存的子树高度
+        self._subtree_size: Optional[int] = None  # 🔥 缓存的子树节点数（顺序统计查询用）
+        self.node_id = node_id  # 🔥 由所属结构登记时分配（见 TreeStructureBase._register_node），-1 表示未登记
+
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._value = value
+        self._invalidate()
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @height.setter
+    def height(self, height: int) -> None:
+        if height != self._height:
+            self._height = height
+            self._invalidate()
+
+    @property
+    def left(self) -> Optional['TreeNode']:
+        return self._left
+
+    @left.setter
+    def left(self, child: Optional['TreeNode']) -> None:
+        if child is not self._left:
+            self._detach(self._left)
+            self._left = child
+            self._attach(child)
+
+    @property
+    def right(self) -> Optional['TreeNode']:
+        return self._right
+
+    @right.setter
+    def right(self, child: Optional['TreeNode']) -> None:
+        if child is not self._right:
+            self._detach(self._right)
+            self._right = child
+            self._attach(child)
+
+    @property
+    def parent(self) -> Optional['TreeNode']:
+        return self._parent
+
+    def _detach(self, child: Optional['TreeNode']) -> None:
+        if child is not None and child._parent is self:
+            child._parent = None
+
+    def _attach(self, child: Optional['TreeNode']) -> None:
+        if child is not None:
+            # 旋转时子节点先挂到新父节点上，旧父节点要等递归返回才改指针；
+            # 这期间旧父节点的快照也已经过期
+            if child._parent is not None and child._parent is not self:
+                child._parent._invalidate()
+            child._parent = self
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """
+        清掉自身和祖先的缓存
+        某个节点缓存已清空时它的祖先也一定已清空，遇到即可停止（旋转过程中父指针短暂成环也不会死循环）
+        """
+        node = self
+        while node is not None and (node._snapshot is not None or node._subtree_height is not None
+                                    or node._subtree_size is not None):
+            node._snapshot = None
+            node._subtree_height = None
+            node._subtree_size = None
+            node = node._parent
 
 
-class TreeStructureBase(ABC):
+class TreeStructureBase(OperationRecorder, ABC):
     """树结构抽象基类"""
     def __init__(self):
-        self._root: Optional[TreeNode] = None
-        self._operation_history: List[OperationStep] = []
-        self._current_step = -1
-        self._size = 0
+        super().__init__()
+        self._version = 0  # 🔥 结构版本号，每次修改递增
+        self._tree_data_cache: Dict[str, Any] = {}
+        self._tree_data_version = -1
+        self._root_node: Optional[TreeNode] = None
+        self._size_value = 0
+        self._nodes: Dict[int, TreeNode] = {}  # 🔥 node_id -> 节点索引，按 id 定位节点 O(1)
+        self._node_ids = NodeIdAllocator()  # 🔥 node_id 按创建顺序分配，清空树后也不回退
+        self._arena = None  # 🔥 紧凑存储（TreeArena）；为 None 时节点是普通 TreeNode 对象
+
+    @property
+    def _root(self) -> Optional[TreeNode]:
+        return self._root_node
+
+    @_root.setter
+    def _root(self, node: Optional[TreeNode]) -> None:
+        # 根节点没有父节点；旋转/删除后留下的旧父指针在这里断开
+        if node is not None:
+            node._parent = None
+        else:
+            self._nodes = {}
+            if self._arena is not None:
+                self._arena.reset()
+        self._root_node = node
+        self._touch()
+
+    @property
+    def _size(self) -> int:
+        return self._size_value
+
+    @_size.setter
+    def _size(self, size: int) -> None:
+        self._size_value = size
+        self._touch()
+
+    def _touch(self) -> None:
+        """
+        标记结构已修改，get_tree_data 的派生数据缓存随之失效
+        修改 _root / _size 时自动调用；只改节点值、不改变根和大小的操作需要自己调用
+        """
+        self._version += 1
+
+    # 🔍 node_id 索引：节点经 _new_node / _register_node 创建时登记，从树中摘除时 _forget_node
+    # 紧凑存储下节点由 arena 分配和索引（见 arena.py），不经过 _nodes 字典
+    def _new_node(self, value: Any) -> TreeNode:
+        """创建并登记一个普通树节点"""
+        if self._arena is not None:
+            return self._arena.new_node(value)
+        return self._register_node(TreeNode(value))
+
+    def _register_node(self, node: TreeNode) -> TreeNode:
+        node.node_id = self._node_ids.allocate()
+        self._nodes[node.node_id] = node
+        return node
+
+    def _forget_node(self, node: TreeNode) -> None:
+        if self._arena is not None:
+            self._arena.free(node)
+            return
+        self._nodes.pop(node.node_id, None)
+
+    def get_node_by_id(self, node_id: Any) -> Optional[TreeNode]:
+        """根据 node_id 查找节点"""
+        if self._arena is not None:
+            return self._arena.find(node_id)
+        return self._nodes.get(node_id)
+
+    def get_parent(self, node_id: Any) -> Optional[TreeNode]:
+        """根据 node_id 查找父节点；根节点或不存在时返回 None"""
+        node = self.get_node_by_id(node_id)
+        return node.parent if node is not None else None
+
+    def restore_node_ids(self, root: Optional[dict], next_id: Optional[int] = None) -> None:
+        """
+        导入时恢复导出数据中的 node_id
+        root: 导出的根节点字典（get_tree_data()['root']），与重建出的树按位置同步遍历，位置对应的节点改回原来的 id；
+        形状对不上的多余节点在所有导出 id 之后重新编号，不会与导出的 id 冲突
+        next_id: 导出时的 next_node_id，之后新建的节点接着它编号
+        """
+        restored, extra = [], []
+        pairs = [(root, self._root)]
+        while pairs:
+            data, node = pairs.pop()
+            if node is None:
+                continue
+            if data is None:
+                extra.append(node)
+                pairs.append((None, node.left))
+                pairs.append((None, node.right))
+                continue
+            restored.append((node, data['node_id']))
+            self._node_ids.reserve(data['node_id'])
+            pairs.append((data.get('left'), node.left))
+            pairs.append((data.get('right'), node.right))
+        if next_id is not None:
+            self._node_ids.reserve(next_id - 1)
+        restored.extend((node, self._node_ids.allocate()) for node in extra)
+
+        if self._arena is not None:
+            self._arena.renumber(restored)
+        else:
+            self._nodes = {}
+            for node, node_id in restored:
+                node.node_id = node_id
+                node._snapshot = None  # 缓存的快照字典里还是旧 id
+                self._nodes[node_id] = node
+        self._touch()
+
+    def get_storage(self) -> str:
+        """节点存储方式: 'object'（每个节点一个对象）| 'arena'（并行数组）"""
+        return 'arena' if self._arena is not None else 'object'
 
     @abstractmethod
     def insert(self,value:Any) -> bool:
@@ -35,10 +235,74 @@ class TreeStructureBase(ABC):
         """搜索节点"""
         pass
 
-    @abstractmethod
-    def get_tree_data(self) -> dict:
-        """获取树的结构数据，用于前端可视化"""
-        pass
+    # ==================== 批量操作 ====================
+
+    def bulk_insert(self, values: Iterable[Any]) -> bool:
+        """
+        依次插入 values，不记录逐个插入的比较/旋转步骤，只在最后记录一个汇总步骤
+        已存在的值按各自 insert 的规则跳过；返回是否每个值都插入了新节点
+        """
+        values = list(values)
+        size_before = self._size
+        with self.trace_scope(TraceLevel.OFF):
+            for value in values:
+                self.insert(value)
+        self._bulk_step(OperationType.INSERT, values, self._size - size_before)
+        return self._size - size_before == len(values)
+
+    def bulk_delete(self, values: Iterable[Any]) -> bool:
+        """依次删除 values，只记录一个汇总步骤；返回是否每个值都删除了节点"""
+        values = list(values)
+        size_before = self._size
+        with self.trace_scope(TraceLevel.OFF):
+            for value in values:
+                self.delete(value)
+        self._bulk_step(OperationType.DELETE, values, size_before - self._size)
+        return size_before - self._size == len(values)
+
+    def _bulk_step(self, operation: OperationType, values: List[Any], changed: int) -> None:
+        if not self._tracing(TraceLevel.SUMMARY):
+            return
+        step = OperationStep(
+            operation,
+            message_id='tree_bulk_insert' if operation == OperationType.INSERT else 'tree_bulk_delete',
+            message_args={'count': changed, 'requested': len(values), 'values': values, 'size': self._size},
+            animation_type="highlight",
+            tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY)
+        )
+        self.add_operation_step(step, TraceLevel.SUMMARY)
+
+    def _tree_data_fields(self) -> Dict[str, Callable[[], Any]]:
+        """get_tree_data 可返回的字段及计算方法，子类在此基础上扩展"""
+        return {
+            'root': lambda: self._node_to_dict(self._root),
+            'size': lambda: self._size,
+            'height': self.get_height,
+            'next_node_id': lambda: self._node_ids.next_id,
+        }
+
+    def get_tree_data(self, fields: Optional[Iterable[str]] = None) -> dict:
+        """
+        获取树的结构数据，用于前端可视化
+        fields: 只返回指定字段（如 ['root', 'height']），默认全部
+        每个字段按版本号缓存：树没有变化时重复请求不再遍历整棵树
+        """
+        if self._tree_data_version != self._version:
+            self._tree_data_cache = {}
+            self._tree_data_version = self._version
+
+        providers = self._tree_data_fields()
+        if fields is None:
+            fields = providers.keys()
+        data = {}
+        for name in fields:
+            if name not in providers:
+                raise ValueError(f"未知的字段: {name}")
+            if name not in self._tree_data_cache:
+                self._tree_data_cache[name] = providers[name]()
+            data[name] = self._tree_data_cache[name]
+        logger.debug("get_tree_data: version=%s, fields=%s", self._version, list(data))
+        return data
 
     def size(self)->int:
         """返回树的节点数"""
@@ -48,93 +312,135 @@ class TreeStructureBase(ABC):
         """判断树是否为空"""
         return self._root is None
 
-    def add_operation_step(self,step:OperationStep) -> None:
+    def add_operation_step(self, step: OperationStep, level: TraceLevel = TraceLevel.FULL) -> None:
         """添加操作步骤"""
+        if not self._tracing(level):
+            return
         #防止内存溢出
         if len(self._operation_history) > 100:
+            if self._snapshot_encoder is not None:
+                # 截断会丢掉基准快照，先把保留部分的第一步改写为基准
+                rebase_history(self._operation_history, len(self._operation_history) - 50)
             self._operation_history = self._operation_history[-50:]  # 只保留最近50条
-        self._operation_history.append(step)
-        self._current_step += 1
-
-    def get_operation_history(self)->List[OperationStep]:
-        """获取操作历史"""
-        return self._operation_history.copy()
+        super().add_operation_step(step, level)
 
-    def clear_operation_history(self) -> None:
-        """清空操作历史"""
-        self._operation_history.clear()
-        self._current_step = -1
+    def _get_tree_snapshot(self, level: TraceLevel = TraceLevel.FULL) -> Optional[dict]:
+        """获取当前树的完整快照,用于动画回放；当前记录级别不需要该级别步骤时返回 None"""
+        if not self._tracing(level):
+            return None
+        return {
+            'root': self._node_to_dict(self._root),
+            'size': self._size,
+            'height': self.get_height()
+        }
 
     def _node_to_dict(self, node: Optional[TreeNode])-> Optional[dict]:
-        """将节点转换为字典格式"""
+        """
+        将节点转换为字典格式
+        结果缓存在节点上：只有从被修改节点到根的路径会重新生成，其余子树直接复用上一次的字典。
+        返回的字典会被多个快照共享，调用方不能原地修改
+        共享只发生在内存中：full 快照模式序列化时每一步仍输出完整的嵌套树（前端按嵌套树读取），
+        只有 delta 模式的编码器会跳过共享子树、只输出变化的节点（见 snapshot.shared_tree_delta）
+        """
         if node is None:
             return None
-        result = {
-            'value': node.value,
-            'node_id': node.node_id,
-            'left': self._node_to_dict(node.left),
-            'right': self._node_to_dict(node.right),
-            'height': getattr(node, 'height', None)
-        }
-        print(f"调试: 节点 {node.value} 转换为字典: {result}")
-        return result
+        # 后序生成：子节点的字典先于父节点生成，已缓存的子树整棵跳过
+        for cur in self._iter_postorder(node, prune=lambda n: n._snapshot is not None):
+            cur._snapshot = {
+                'value': cur.value,
+                'node_id': cur.node_id,
+                'left': cur.left._snapshot if cur.left is not None else None,
+                'right': cur.right._snapshot if cur.right is not None else None,
+                'height': getattr(cur, 'height', None)
+            }
+        return node._snapshot
+
+    # 🔄 显式栈实现的节点生成器：树退化成链（如按顺序插入的BST）时也不会超出 Python 递归深度
+    @staticmethod
+    def _iter_preorder(node: Optional[TreeNode]) -> Iterator[TreeNode]:
+        """前序生成子树中的节点"""
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    @staticmethod
+    def _iter_inorder(node: Optional[TreeNode]) -> Iterator[TreeNode]:
+        """中序生成子树中的节点"""
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    @staticmethod
+    def _iter_postorder(node: Optional[TreeNode],
+                        prune: Optional[Callable[[TreeNode], bool]] = None) -> Iterator[TreeNode]:
+        """后序生成子树中的节点；prune(node) 为真的子树整棵跳过"""
+        if node is None or (prune and prune(node)):
+            return
+        stack = [(node, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                yield node
+                continue
+            stack.append((node, True))
+            for child in (node.right, node.left):
+                if child is not None and not (prune and prune(child)):
+                    stack.append((child, False))
+
+    @staticmethod
+    def _iter_level_order(node: Optional[TreeNode], with_depth: bool = False) -> Iterator[Any]:
+        """
+        宽度优先生成子树中的节点（deque 队列，出队 O(1)）
+        with_depth=True 时生成 (节点, 深度, 父节点)，根的深度为 0、父节点为 None
+        """
+        if node is None:
+            return
+        queue = deque([(node, 0, None)])
+        while queue:
+            node, depth, parent = queue.popleft()
+            if node.left is not None:
+                queue.append((node.left, depth + 1, node))
+            if node.right is not None:
+                queue.append((node.right, depth + 1, node))
+            yield (node, depth, parent) if with_depth else node
 
     def inorder_traversal(self) -> List[Any]:
         """中序周游"""
-        result = []
-        self._inorder_helper(self._root,result)
-        return result
-
-    def _inorder_helper(self,node:Optional[TreeNode], result:List[Any])-> None:
-        """中序周游辅助函数"""
-        if node:
-            self._inorder_helper(node.left, result)
-            result.append(node.value)
-            self._inorder_helper(node.right, result)
+        return [node.value for node in self._iter_inorder(self._root)]
 
     def preorder_traversal(self) -> List[Any]:
         """前序周游"""
-        result = []
-        self._preorder_helper(self._root,result)
-        return result
-
-    def _preorder_helper(self,node:Optional[TreeNode],result:List[Any])-> None:
-        """前序周游辅助函数"""
-        if node:
-            result.append(node.value)
-            self._preorder_helper(node.left, result)
-            self._preorder_helper(node.right, result)
+        return [node.value for node in self._iter_preorder(self._root)]
 
     def postorder_traversal(self) -> List[Any]:
         """后序周游"""
-        result = []
-        self._postorder_helper(self._root,result)
-        return result
-
-    def _postorder_helper(self,node:Optional[TreeNode],result:List[Any])-> None:
-        """后序周游辅助函数"""
-        if node:
-            self._postorder_helper(node.left, result)
-            self._postorder_helper(node.right, result)
-            result.append(node.value)
+        return [node.value for node in self._iter_postorder(self._root)]
 
     def level_order_traversal(self) -> List[Any]:
         """宽度优先周游"""
-        if not self._root:
-            return []
-        result = []
-        queue = [self._root]
-
-        while queue:
-            node = queue.pop(0)
-            result.append(node.value)
-
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
-
-        return result
+        return [node.value for node in self._iter_level_order(self._root)]
+
+    def iter_values(self, traversal_type: str = 'inorder') -> Iterator[Any]:
+        """按指定周游顺序惰性生成节点值（只取前几个时不会走遍整棵树）；迭代期间不要修改树"""
+        iterators = {
+            'preorder': self._iter_preorder,
+            'inorder': self._iter_inorder,
+            'postorder': self._iter_postorder,
+            'levelorder': self._iter_level_order,
+        }
+        if traversal_type not in iterators:
+            raise ValueError(f"未知的遍历类型: {traversal_type}")
+        return (node.value for node in iterators[traversal_type](self._root))
 
     # 🎬 可视化遍历方法（记录OperationStep）
     def traverse_with_animation(self, traversal_type: str, use_recursion: bool = True) -> List[Any]:
@@ -152,13 +458,26 @@ class TreeStructureBase(ABC):
             'levelorder': '层次遍历'
         }
 
+        height = self.get_height()
+        too_deep = use_recursion and height > MAX_RECURSIVE_TRAVERSE_HEIGHT
+        if too_deep:
+            use_recursion = False
         method_name = "递归" if use_recursion else "非递归"
 
-        step = OperationStep(
-            OperationType.SEARCH,
-            description=f"开始{type_names.get(traversal_type, '遍历')}（{method_name}）"
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.SEARCH,
+                description=f"开始{type_names.get(traversal_type, '遍历')}（{method_name}）"
+            )
+            self.add_operation_step(step)
+
+        if too_deep:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    description=f"树高 {height} 超过递归演示上限 {MAX_RECURSIVE_TRAVERSE_HEIGHT}，改用非递归遍历"
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
 
         result = []
 
@@ -183,11 +502,14 @@ class TreeStructureBase(ABC):
         else:
             raise ValueError(f"未知的遍历类型: {traversal_type}")
 
-        step = OperationStep(
-            OperationType.SEARCH,
-            description=f"{type_names.get(traversal_type)}（{method_name}）完成，访问顺序: {result}"
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                message_id='traversal_done',
+                message_args={'type_name': type_names.get(traversal_type), 'method_name': method_name,
+                              'result': result}
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
 
         return result
 
@@ -195,33 +517,35 @@ class TreeStructureBase(ABC):
         """前序遍历并记录步骤"""
         if node is None:
             # 基线条件
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    description="空节点，返回",
+                    highlight_indices=[],
+                    animation_type="highlight",
+                    duration=0.6,
+                    code_template='tree_traversal_preorder',
+                    code_line=2,
+                    code_highlight=[2]
+                )
+                self.add_operation_step(step)
+            return
+
+        # 访问当前节点
+        result.append(node.value)
+        if self._tracing():
             step = OperationStep(
                 OperationType.SEARCH,
-                description="空节点，返回",
-                highlight_indices=[],
+                value=node.value,
+                description=f"访问节点: {node.value}",
+                highlight_indices=[node.node_id],
                 animation_type="highlight",
-                duration=0.6,
+                duration=1.0,
                 code_template='tree_traversal_preorder',
-                code_line=2,
-                code_highlight=[2]
+                code_line=5,
+                code_highlight=[5]
             )
             self.add_operation_step(step)
-            return
-
-        # 访问当前节点
-        result.append(node.value)
-        step = OperationStep(
-            OperationType.SEARCH,
-            value=node.value,
-            description=f"访问节点: {node.value}",
-            highlight_indices=[node.node_id],
-            animation_type="highlight",
-            duration=1.0,
-            code_template='tree_traversal_preorder',
-            code_line=5,
-            code_highlight=[5]
-        )
-        self.add_operation_step(step)
 
         # 递归左子树（不再单独高亮，避免重复）
         self._preorder_with_steps(node.left, result)
@@ -233,17 +557,18 @@ class TreeStructureBase(ABC):
     def _inorder_with_steps(self, node: Optional[TreeNode], result: List[Any]) -> None:
         """中序遍历并记录步骤"""
         if node is None:
-            step = OperationStep(
-                OperationType.SEARCH,
-                description="空节点，返回",
-                highlight_indices=[],
-                animation_type="highlight",
-                duration=0.6,
-                code_template='tree_traversal_inorder',
-                code_line=2,
-                code_highlight=[2]
-            )
-            self.add_operation_step(step)
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    description="空节点，返回",
+                    highlight_indices=[],
+                    animation_type="highlight",
+                    duration=0.6,
+                    code_template='tree_traversal_inorder',
+                    code_line=2,
+                    code_highlight=[2]
+                )
+                self.add_operation_step(step)
             return
 
         # 递归左子树（不高亮递归提示）
@@ -251,18 +576,19 @@ class TreeStructureBase(ABC):
 
         # 访问当前节点
         result.append(node.value)
-        step = OperationStep(
-            OperationType.SEARCH,
-            value=node.value,
-            description=f"访问节点: {node.value}",
-            highlight_indices=[node.node_id],
-            animation_type="highlight",
-            duration=1.0,
-            code_template='tree_traversal_inorder',
-            code_line=8,
-            code_highlight=[8]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.SEARCH,
+                value=node.value,
+                description=f"访问节点: {node.value}",
+                highlight_indices=[node.node_id],
+                animation_type="highlight",
+                duration=1.0,
+                code_template='tree_traversal_inorder',
+                code_line=8,
+                code_highlight=[8]
+            )
+            self.add_operation_step(step)
 
         # 递归右子树（不高亮递归提示）
         self._inorder_with_steps(node.right, result)
@@ -270,17 +596,18 @@ class TreeStructureBase(ABC):
     def _postorder_with_steps(self, node: Optional[TreeNode], result: List[Any]) -> None:
         """后序遍历并记录步骤"""
         if node is None:
-            step = OperationStep(
-                OperationType.SEARCH,
-                description="空节点，返回",
-                highlight_indices=[],
-                animation_type="highlight",
-                duration=0.6,
-                code_template='tree_traversal_postorder',
-                code_line=2,
-                code_highlight=[2]
-            )
-            self.add_operation_step(step)
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    description="空节点，返回",
+                    highlight_indices=[],
+                    animation_type="highlight",
+                    duration=0.6,
+                    code_template='tree_traversal_postorder',
+                    code_line=2,
+                    code_highlight=[2]
+                )
+                self.add_operation_step(step)
             return
 
         # 递归左子树（不高亮递归提示）
@@ -290,31 +617,7 @@ class TreeStructureBase(ABC):
 
         # 访问当前节点
         result.append(node.value)
-        step = OperationStep(
-            OperationType.SEARCH,
-            value=node.value,
-            description=f"访问节点: {node.value}",
-            highlight_indices=[node.node_id],
-            animation_type="highlight",
-            duration=1.0,
-            code_template='tree_traversal_postorder',
-            code_line=11,
-            code_highlight=[11]
-        )
-        self.add_operation_step(step)
-
-    def _levelorder_with_steps(self, result: List[Any]) -> None:
-        """层次遍历并记录步骤"""
-        if not self._root:
-            return
-
-        queue = [self._root]
-
-        while queue:
-            node = queue.pop(0)
-            result.append(node.value)
-
-            # 访问当前节点
+        if self._tracing():
             step = OperationStep(
                 OperationType.SEARCH,
                 value=node.value,
@@ -322,25 +625,60 @@ class TreeStructureBase(ABC):
                 highlight_indices=[node.node_id],
                 animation_type="highlight",
                 duration=1.0,
-                code_template='tree_traversal_levelorder',
-                code_line=12,
-                code_highlight=[12]
+                code_template='tree_traversal_postorder',
+                code_line=11,
+                code_highlight=[11]
             )
             self.add_operation_step(step)
 
-            # 将子节点加入队列
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
+    def _levelorder_with_steps(self, result: List[Any]) -> None:
+        """层次遍历并记录步骤"""
+        for node in self._iter_level_order(self._root):
+            result.append(node.value)
+
+            # 访问当前节点
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    value=node.value,
+                    description=f"访问节点: {node.value}",
+                    highlight_indices=[node.node_id],
+                    animation_type="highlight",
+                    duration=1.0,
+                    code_template='tree_traversal_levelorder',
+                    code_line=12,
+                    code_highlight=[12]
+                )
+                self.add_operation_step(step)
 
     def get_height(self) -> int:
-        """获取树的高度，内部递归"""
-        def _height(node: Optional[TreeNode]) -> int:
-            if node is None:
-                return 0
-            return 1 + max(_height(node.left), _height(node.right))
-        return _height(self._root)
+        """获取树的高度"""
+        return self._height_of(self._root)
+
+    def _height_of(self, node: Optional[TreeNode]) -> int:
+        """子树高度；缓存在节点上，只重新计算被修改的路径"""
+        if node is None:
+            return 0
+        for cur in self._iter_postorder(node, prune=lambda n: n._subtree_height is not None):
+            cur._subtree_height = 1 + max(
+                cur.left._subtree_height if cur.left is not None else 0,
+                cur.right._subtree_height if cur.right is not None else 0
+            )
+        return node._subtree_height
+
+    def _size_of(self, node: Optional[TreeNode]) -> int:
+        """
+        子树节点数；和子树高度一样缓存在节点上
+        插入/删除/旋转经过 left/right 属性时会清掉沿途祖先的缓存，之后的查询只重新计算这条路径
+        """
+        if node is None:
+            return 0
+        for cur in self._iter_postorder(node, prune=lambda n: n._subtree_size is not None):
+            cur._subtree_size = 1 + (
+                (cur.left._subtree_size if cur.left is not None else 0)
+                + (cur.right._subtree_size if cur.right is not None else 0)
+            )
+        return node._subtree_size
 
     def clear(self)-> None:
         """清空树"""
@@ -357,94 +695,100 @@ class TreeStructureBase(ABC):
         stack = [self._root]
 
         # 初始化栈
-        step = OperationStep(
-            OperationType.SEARCH,
-            description=f"初始化栈，根节点入栈: {self._root.value}",
-            highlight_indices=[self._root.node_id],
-            animation_type="highlight",
-            duration=0.8,
-            code_template='tree_traversal_preorder_iterative',
-            code_line=3,
-            code_highlight=[3]
-        )
-        self.add_operation_step(step)
-
-        while stack:
-            # 栈非空检查
+        if self._tracing():
             step = OperationStep(
                 OperationType.SEARCH,
-                description=f"栈不为空，当前栈大小: {len(stack)}",
+                description=f"初始化栈，根节点入栈: {self._root.value}",
+                highlight_indices=[self._root.node_id],
                 animation_type="highlight",
-                duration=0.6,
+                duration=0.8,
                 code_template='tree_traversal_preorder_iterative',
-                code_line=5,
-                code_highlight=[5]
+                code_line=3,
+                code_highlight=[3]
             )
             self.add_operation_step(step)
 
+        while stack:
+            # 栈非空检查
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    description=f"栈不为空，当前栈大小: {len(stack)}",
+                    animation_type="highlight",
+                    duration=0.6,
+                    code_template='tree_traversal_preorder_iterative',
+                    code_line=5,
+                    code_highlight=[5]
+                )
+                self.add_operation_step(step)
+
             node = stack.pop()
 
             # 弹出节点
-            step = OperationStep(
-                OperationType.SEARCH,
-                value=node.value,
-                description=f"弹出栈顶节点: {node.value}",
-                highlight_indices=[node.node_id],
-                animation_type="highlight",
-                duration=0.8,
-                code_template='tree_traversal_preorder_iterative',
-                code_line=6,
-                code_highlight=[6]
-            )
-            self.add_operation_step(step)
-
-            # 访问节点
-            result.append(node.value)
-            step = OperationStep(
-                OperationType.SEARCH,
-                value=node.value,
-                description=f"访问节点: {node.value}",
-                highlight_indices=[node.node_id],
-                animation_type="highlight",
-                duration=1.0,
-                code_template='tree_traversal_preorder_iterative',
-                code_line=7,
-                code_highlight=[7]
-            )
-            self.add_operation_step(step)
-
-            # 右子节点先入栈
-            if node.right:
-                stack.append(node.right)
+            if self._tracing():
                 step = OperationStep(
                     OperationType.SEARCH,
-                    value=node.right.value,
-                    description=f"右子节点入栈: {node.right.value}",
-                    highlight_indices=[node.right.node_id],
+                    value=node.value,
+                    description=f"弹出栈顶节点: {node.value}",
+                    highlight_indices=[node.node_id],
                     animation_type="highlight",
                     duration=0.8,
                     code_template='tree_traversal_preorder_iterative',
-                    code_line=10,
-                    code_highlight=[10]
+                    code_line=6,
+                    code_highlight=[6]
                 )
                 self.add_operation_step(step)
 
-            # 左子节点后入栈
-            if node.left:
-                stack.append(node.left)
+            # 访问节点
+            result.append(node.value)
+            if self._tracing():
                 step = OperationStep(
                     OperationType.SEARCH,
-                    value=node.left.value,
-                    description=f"左子节点入栈: {node.left.value}",
-                    highlight_indices=[node.left.node_id],
+                    value=node.value,
+                    description=f"访问节点: {node.value}",
+                    highlight_indices=[node.node_id],
                     animation_type="highlight",
-                    duration=0.8,
+                    duration=1.0,
                     code_template='tree_traversal_preorder_iterative',
-                    code_line=13,
-                    code_highlight=[13]
+                    code_line=7,
+                    code_highlight=[7]
                 )
                 self.add_operation_step(step)
 
+            # 右子节点先入栈
+            if node.right:
+                stack.append(node.right)
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        value=node.right.value,
+                        description=f"右子节点入栈: {node.right.value}",
+                        highlight_indices=[node.right.node_id],
+                        animation_type="highlight",
+                        duration=0.8,
+                        code_template='tree_traversal_preorder_iterative',
+                        code_line=10,
+                        code_highlight=[10]
+                    )
+                    self.add_operation_step(step)
+
+            # 左子节点后入栈
+            if node.left:
+                stack.append(node.left)
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        value=node.left.value,
+                        description=f"左子节点入栈: {node.left.value}",
+                        highlight_indices=[node.left.node_id],
+                        animation_type="highlight",
+                        duration=0.8,
+                        code_template='tree_traversal_preorder_iterative',
+                        code_line=13,
+                        code_highlight=[13]
+                    )
+                    self.add_operation_step(step)
+
     def _inorder_iterative_with_steps(self, result: List[Any]) -> None:
         """非递归中序遍历并记录步骤"""
         if not self._root:
@@ -454,81 +798,86 @@ class TreeStructureBase(ABC):
         current = self._root
 
         # 初始化
-        step = OperationStep(
-            OperationType.SEARCH,
-            description=f"初始化，当前节点: {current.value}",
-            highlight_indices=[current.node_id],
-            animation_type="highlight",
-            duration=0.8,
-            code_template='tree_traversal_inorder_iterative',
-            code_line=3,
-            code_highlight=[3,4]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.SEARCH,
+                description=f"初始化，当前节点: {current.value}",
+                highlight_indices=[current.node_id],
+                animation_type="highlight",
+                duration=0.8,
+                code_template='tree_traversal_inorder_iterative',
+                code_line=3,
+                code_highlight=[3,4]
+            )
+            self.add_operation_step(step)
 
         while stack or current:
             # 一直往左走
             while current:
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        value=current.value,
+                        description=f"当前节点 {current.value} 入栈，继续往左",
+                        highlight_indices=[current.node_id],
+                        animation_type="highlight",
+                        duration=0.8,
+                        code_template='tree_traversal_inorder_iterative',
+                        code_line=7,
+                        code_highlight=[7,8]
+                    )
+                    self.add_operation_step(step)
+
+                stack.append(current)
+                current = current.left
+
+            # 弹出节点
+            current = stack.pop()
+            if self._tracing():
                 step = OperationStep(
                     OperationType.SEARCH,
                     value=current.value,
-                    description=f"当前节点 {current.value} 入栈，继续往左",
+                    description=f"弹出栈顶节点: {current.value}",
                     highlight_indices=[current.node_id],
                     animation_type="highlight",
                     duration=0.8,
                     code_template='tree_traversal_inorder_iterative',
-                    code_line=7,
-                    code_highlight=[7,8]
+                    code_line=11,
+                    code_highlight=[11]
                 )
                 self.add_operation_step(step)
 
-                stack.append(current)
-                current = current.left
-
-            # 弹出节点
-            current = stack.pop()
-            step = OperationStep(
-                OperationType.SEARCH,
-                value=current.value,
-                description=f"弹出栈顶节点: {current.value}",
-                highlight_indices=[current.node_id],
-                animation_type="highlight",
-                duration=0.8,
-                code_template='tree_traversal_inorder_iterative',
-                code_line=11,
-                code_highlight=[11]
-            )
-            self.add_operation_step(step)
-
             # 访问节点
             result.append(current.value)
-            step = OperationStep(
-                OperationType.SEARCH,
-                value=current.value,
-                description=f"访问节点: {current.value}",
-                highlight_indices=[current.node_id],
-                animation_type="highlight",
-                duration=1.0,
-                code_template='tree_traversal_inorder_iterative',
-                code_line=12,
-                code_highlight=[12]
-            )
-            self.add_operation_step(step)
-
-            # 转向右子树
-            if current.right:
+            if self._tracing():
                 step = OperationStep(
                     OperationType.SEARCH,
-                    value=current.right.value,
-                    description=f"转向右子树: {current.right.value}",
-                    highlight_indices=[current.right.node_id],
+                    value=current.value,
+                    description=f"访问节点: {current.value}",
+                    highlight_indices=[current.node_id],
                     animation_type="highlight",
-                    duration=0.8,
+                    duration=1.0,
                     code_template='tree_traversal_inorder_iterative',
-                    code_line=15,
-                    code_highlight=[15]
+                    code_line=12,
+                    code_highlight=[12]
                 )
                 self.add_operation_step(step)
+
+            # 转向右子树
+            if current.right:
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        value=current.right.value,
+                        description=f"转向右子树: {current.right.value}",
+                        highlight_indices=[current.right.node_id],
+                        animation_type="highlight",
+                        duration=0.8,
+                        code_template='tree_traversal_inorder_iterative',
+                        code_line=15,
+                        code_highlight=[15]
+                    )
+                    self.add_operation_step(step)
             current = current.right
 
     def _postorder_iterative_with_steps(self, result: List[Any]) -> None:
@@ -540,94 +889,100 @@ class TreeStructureBase(ABC):
         stack2 = []
 
         # 初始化
-        step = OperationStep(
-            OperationType.SEARCH,
-            description=f"初始化双栈，根节点入栈1: {self._root.value}",
-            highlight_indices=[self._root.node_id],
-            animation_type="highlight",
-            duration=0.8,
-            code_template='tree_traversal_postorder_iterative',
-            code_line=3,
-            code_highlight=[3,4]
-        )
-        self.add_operation_step(step)
-
-        # 第一阶段：用栈1按"根-右-左"顺序将节点压入栈2
-        while stack1:
-            node = stack1.pop()
-
+        if self._tracing():
             step = OperationStep(
                 OperationType.SEARCH,
-                value=node.value,
-                description=f"从栈1弹出节点 {node.value}，压入栈2",
-                highlight_indices=[node.node_id],
+                description=f"初始化双栈，根节点入栈1: {self._root.value}",
+                highlight_indices=[self._root.node_id],
                 animation_type="highlight",
                 duration=0.8,
                 code_template='tree_traversal_postorder_iterative',
-                code_line=8,
-                code_highlight=[8,9]
+                code_line=3,
+                code_highlight=[3,4]
             )
             self.add_operation_step(step)
 
-            stack2.append(node)
+        # 第一阶段：用栈1按"根-右-左"顺序将节点压入栈2
+        while stack1:
+            node = stack1.pop()
 
-            # 左子节点先入栈1
-            if node.left:
-                stack1.append(node.left)
+            if self._tracing():
                 step = OperationStep(
                     OperationType.SEARCH,
-                    value=node.left.value,
-                    description=f"左子节点入栈1: {node.left.value}",
-                    highlight_indices=[node.left.node_id],
+                    value=node.value,
+                    description=f"从栈1弹出节点 {node.value}，压入栈2",
+                    highlight_indices=[node.node_id],
                     animation_type="highlight",
                     duration=0.8,
                     code_template='tree_traversal_postorder_iterative',
-                    code_line=12,
-                    code_highlight=[12]
+                    code_line=8,
+                    code_highlight=[8,9]
                 )
                 self.add_operation_step(step)
 
+            stack2.append(node)
+
+            # 左子节点先入栈1
+            if node.left:
+                stack1.append(node.left)
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        value=node.left.value,
+                        description=f"左子节点入栈1: {node.left.value}",
+                        highlight_indices=[node.left.node_id],
+                        animation_type="highlight",
+                        duration=0.8,
+                        code_template='tree_traversal_postorder_iterative',
+                        code_line=12,
+                        code_highlight=[12]
+                    )
+                    self.add_operation_step(step)
+
             # 右子节点后入栈1
             if node.right:
                 stack1.append(node.right)
-                step = OperationStep(
-                    OperationType.SEARCH,
-                    value=node.right.value,
-                    description=f"右子节点入栈1: {node.right.value}",
-                    highlight_indices=[node.right.node_id],
-                    animation_type="highlight",
-                    duration=0.8,
-                    code_template='tree_traversal_postorder_iterative',
-                    code_line=15,
-                    code_highlight=[15]
-                )
-                self.add_operation_step(step)
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        value=node.right.value,
+                        description=f"右子节点入栈1: {node.right.value}",
+                        highlight_indices=[node.right.node_id],
+                        animation_type="highlight",
+                        duration=0.8,
+                        code_template='tree_traversal_postorder_iterative',
+                        code_line=15,
+                        code_highlight=[15]
+                    )
+                    self.add_operation_step(step)
 
         # 第二阶段：依次弹出栈2的节点并访问
-        step = OperationStep(
-            OperationType.SEARCH,
-            description=f"第一阶段完成，栈2大小: {len(stack2)}，开始访问",
-            animation_type="highlight",
-            duration=0.8,
-            code_template='tree_traversal_postorder_iterative',
-            code_line=18,
-            code_highlight=[18]
-        )
-        self.add_operation_step(step)
-
-        while stack2:
-            node = stack2.pop()
-            result.append(node.value)
-
+        if self._tracing():
             step = OperationStep(
                 OperationType.SEARCH,
-                value=node.value,
-                description=f"从栈2弹出并访问节点: {node.value}",
-                highlight_indices=[node.node_id],
+                description=f"第一阶段完成，栈2大小: {len(stack2)}，开始访问",
                 animation_type="highlight",
-                duration=1.0,
+                duration=0.8,
                 code_template='tree_traversal_postorder_iterative',
-                code_line=20,
-                code_highlight=[20]
+                code_line=18,
+                code_highlight=[18]
             )
             self.add_operation_step(step)
+
+        while stack2:
+            node = stack2.pop()
+            result.append(node.value)
+
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    value=node.value,
+                    description=f"从栈2弹出并访问节点: {node.value}",
+                    highlight_indices=[node.node_id],
+                    animation_type="highlight",
+                    duration=1.0,
+                    code_template='tree_traversal_postorder_iterative',
+                    code_line=20,
+                    code_highlight=[20]
+                )
+                self.add_operation_step(step)
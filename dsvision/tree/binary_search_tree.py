@@ -1,19 +1,34 @@
 from .base import TreeStructureBase,TreeNode
-from ..operation.operation import OperationStep, OperationType
-from typing import Optional,Any,List
+from .arena import TreeArena
+from ..operation.operation import OperationStep, OperationType, TraceLevel
+from ..logger import get_logger
+from typing import Iterator, Optional,Any,List
+
+logger = get_logger(__name__)
+
+STORAGE_MODES = ('object', 'arena')
+
 
 class BinarySearchTree(TreeStructureBase):
-    """二叉搜索树实现"""
-    def __init__(self):
+    """
+    二叉搜索树实现
+    storage='arena' 时节点字段存放在并行数组中（见 arena.py），百万节点的树内存占用小得多，node_id 也按创建顺序分配
+    """
+    def __init__(self, storage: str = 'object'):
         super().__init__()
-        step = OperationStep(
-            OperationType.INIT,
-            description = "初始化二叉搜索树",
-            code_template='bst_insert',
-            code_line=1,
-            code_highlight=[1, 2]
-        )
-        self.add_operation_step(step)
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"未知的存储方式: {storage}")
+        if storage == 'arena':
+            self._arena = TreeArena(self._node_ids)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INIT,
+                description = "初始化二叉搜索树",
+                code_template='bst_insert',
+                code_line=1,
+                code_highlight=[1, 2]
+            )
+            self.add_operation_step(step)
 
     def insert(self, value:Any) -> bool:
         """插入节点"""
@@ -29,364 +44,408 @@ class BinarySearchTree(TreeStructureBase):
         #     self.add_operation_step(step)
         #     return False  # 添加这个返回，拒绝非数字
 
-        step = OperationStep(
-            OperationType.INSERT,
-            value = value,
-            description = f"准备插入节点{value}",
-            code_template='bst_insert',
-            code_line=2,
-            code_highlight=[2, 3, 4, 5, 6, 7]
-        )
-        self.add_operation_step(step)
-
-        if self._root is None:
-            self._root = TreeNode(value)
-            self._size += 1
+        if self._tracing():
             step = OperationStep(
                 OperationType.INSERT,
-                value=value,
-                description=f"插入节点 {value} 作为根节点",
-                tree_snapshot=self._get_tree_snapshot(),
+                value = value,
+                description = f"准备插入节点{value}",
                 code_template='bst_insert',
-                code_line=3,
-                code_highlight=[2, 3, 4, 5]
+                code_line=2,
+                code_highlight=[2, 3, 4, 5, 6, 7]
             )
             self.add_operation_step(step)
+
+        if self._root is None:
+            self._root = self._new_node(value)
+            self._size += 1
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INSERT,
+                    value=value,
+                    description=f"插入节点 {value} 作为根节点",
+                    tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                    code_template='bst_insert',
+                    code_line=3,
+                    code_highlight=[2, 3, 4, 5]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return True
 
-        self._root = self._insert_recursive(self._root, value)
+        self._insert_from_root(value)
         return True
 
-    # binary_search_tree.py
-    def _insert_recursive(self, node: Optional[TreeNode], value: Any, path: str = "root") -> Optional[TreeNode]:
-        """递归插入 - 完整详细步骤版"""
+    def _insert_from_root(self, value: Any) -> None:
+        """自根向下迭代查找插入位置（不用递归：有序输入建成的链状树也不会超出递归深度）"""
+        node = self._root
+        path = ["root"]
+        while True:
+            # === 🔥 第1步: 高亮当前比较的节点 ===
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.COMPARE,
+                    message_id='bst_compare',
+                    message_args={'value': value, 'current': node.value},
+                    value=value,
+                    node_id=node.node_id,
+                    highlight_indices=[node.node_id],  # 高亮当前节点
+                    animation_type="highlight",
+                    duration=0.6,
+                    tree_snapshot=self._get_tree_snapshot(),
+                    code_template='bst_insert',
+                    code_line=9,
+                    code_highlight=[8, 9, 10, 11, 12, 13, 14, 15]
+                )
+                self.add_operation_step(step)
 
-        if node is None:
-            # 找到插入位置
-            self._size += 1
+            if value < node.value:
+                # === 🔥 第2步: 决策提示 ===
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.TRAVERSE_LEFT,
+                        message_id='bst_go_left',
+                        message_args={'value': value, 'current': node.value},
+                        value=value,
+                        node_id=node.node_id,
+                        highlight_indices=[node.node_id],
+                        animation_type="arrow_left",  # 新增动画类型
+                        duration=0.5,
+                        tree_snapshot=self._get_tree_snapshot(),
+                        code_template='bst_insert',
+                        code_line=11,
+                        code_highlight=[11, 12]
+                    )
+                    self.add_operation_step(step)
+                path.append("left")
+                if node.left is None:
+                    node.left = self._create_leaf(value, path)
+                    return
+                node = node.left
+
+            elif value > node.value:
+                # === 🔥 第3步: 向右移动 ===
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.TRAVERSE_RIGHT,
+                        message_id='bst_go_right',
+                        message_args={'value': value, 'current': node.value},
+                        value=value,
+                        node_id=node.node_id,
+                        highlight_indices=[node.node_id],
+                        animation_type="arrow_right",
+                        duration=0.5,
+                        tree_snapshot=self._get_tree_snapshot(),
+                        code_template='bst_insert',
+                        code_line=13,
+                        code_highlight=[13, 14]
+                    )
+                    self.add_operation_step(step)
+                path.append("right")
+                if node.right is None:
+                    node.right = self._create_leaf(value, path)
+                    return
+                node = node.right
+            else:
+                # 值已存在
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.COMPARE,
+                        description=f'⚠️ 节点 {value} 已存在,不插入',
+                        value=value,
+                        node_id=node.node_id,
+                        animation_type="shake",
+                        duration=0.5
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
+                return
+
+    def _create_leaf(self, value: Any, path: List[str]) -> TreeNode:
+        """找到插入位置：记录创建步骤并返回新节点，由调用方挂到父节点上"""
+        self._size += 1
+        if self._tracing(TraceLevel.SUMMARY):
             step = OperationStep(
                 OperationType.CREATE_NODE,
-                description=f'✓ 在 {path} 创建新节点 {value}',
+                description=f'✓ 在 {"→".join(path)} 创建新节点 {value}',
                 value=value,
                 node_id=-1,  # 新节点暂时用-1
                 animation_type="fade",
                 duration=0.8,
                 # 🔥 关键: 添加当前树的快照
-                tree_snapshot=self._get_tree_snapshot()
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY)
             )
-            self.add_operation_step(step)
-            return TreeNode(value)
-
-        # === 🔥 第1步: 高亮当前比较的节点 ===
-        step = OperationStep(
-            OperationType.COMPARE,
-            description=f'📍 当前在节点 {node.value}, 比较 {value} vs {node.value}',
-            value=value,
-            node_id=node.node_id,
-            highlight_indices=[node.node_id],  # 高亮当前节点
-            animation_type="highlight",
-            duration=0.6,
-            tree_snapshot=self._get_tree_snapshot(),
-            code_template='bst_insert',
-            code_line=9,
-            code_highlight=[8, 9, 10, 11, 12, 13, 14, 15]
-        )
-        self.add_operation_step(step)
-
-        if value < node.value:
-            # === 🔥 第2步: 决策提示 ===
-            step = OperationStep(
-                OperationType.TRAVERSE_LEFT,
-                description=f'↙️ {value} < {node.value}, 向左子树移动',
-                value=value,
-                node_id=node.node_id,
-                highlight_indices=[node.node_id],
-                animation_type="arrow_left",  # 新增动画类型
-                duration=0.5,
-                tree_snapshot=self._get_tree_snapshot(),
-                code_template='bst_insert',
-                code_line=11,
-                code_highlight=[11, 12]
-            )
-            self.add_operation_step(step)
-
-            node.left = self._insert_recursive(node.left, value, f"{path}→left")
-
-        elif value > node.value:
-            # === 🔥 第3步: 向右移动 ===
-            step = OperationStep(
-                OperationType.TRAVERSE_RIGHT,
-                description=f'↘️ {value} > {node.value}, 向右子树移动',
-                value=value,
-                node_id=node.node_id,
-                highlight_indices=[node.node_id],
-                animation_type="arrow_right",
-                duration=0.5,
-                tree_snapshot=self._get_tree_snapshot(),
-                code_template='bst_insert',
-                code_line=13,
-                code_highlight=[13, 14]
-            )
-            self.add_operation_step(step)
-
-            node.right = self._insert_recursive(node.right, value, f"{path}→right")
-        else:
-            # 值已存在
-            step = OperationStep(
-                OperationType.COMPARE,
-                description=f'⚠️ 节点 {value} 已存在,不插入',
-                value=value,
-                node_id=node.node_id,
-                animation_type="shake",
-                duration=0.5
-            )
-            self.add_operation_step(step)
-
-        return node
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return self._new_node(value)
 
     def search(self, value:Any) -> Optional[TreeNode]:
         """搜索节点"""
         # 🔥 清空操作历史，避免累积之前的操作
         self._operation_history = []
 
-        step = OperationStep(
-            OperationType.SEARCH,
-            value = value,
-            description=f"开始搜索节点{value}",
-            code_template='bst_search',
-            code_line=2,
-            code_highlight=[2]
-        )
-        self.add_operation_step(step)
-        return self._search_recursive(self._root, value)
-
-    def _search_recursive(self, node:Optional[TreeNode], value:Any) -> Optional[TreeNode]:
-        """递归搜索辅助函数"""
-        if node is None:
+        if self._tracing():
             step = OperationStep(
                 OperationType.SEARCH,
-                value=value,
-                description=f"未找到节点 {value}",
-                tree_snapshot=self._get_tree_snapshot(),
+                value = value,
+                description=f"开始搜索节点{value}",
                 code_template='bst_search',
-                code_line=10,
-                code_highlight=[10]
+                code_line=2,
+                code_highlight=[2]
             )
             self.add_operation_step(step)
-            return None
+        node = self._root
+        while node is not None:
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    value=value,
+                    description=f"检查节点 {node.value}",
+                    node_id=node.node_id,
+                    highlight_indices=[node.node_id],
+                    tree_snapshot=self._get_tree_snapshot(),
+                    code_template='bst_search',
+                    code_line=4,
+                    code_highlight=[3, 4, 5, 6, 7, 8]
+                )
+                self.add_operation_step(step)
 
-        step = OperationStep(
-            OperationType.SEARCH,
-            value=value,
-            description=f"检查节点 {node.value}",
-            node_id=node.node_id,
-            highlight_indices=[node.node_id],
-            tree_snapshot=self._get_tree_snapshot(),
-            code_template='bst_search',
-            code_line=4,
-            code_highlight=[3, 4, 5, 6, 7, 8]
-        )
-        self.add_operation_step(step)
-
-        if value == node.value:
-            step = OperationStep(
-                OperationType.SEARCH,
-                value=value,
-                description=f"找到目标节点{value}",
-                node_id=node.node_id,
-                highlight_indices=[node.node_id],
-                tree_snapshot=self._get_tree_snapshot(),
-                code_template='bst_search',
-                code_line=5,
-                code_highlight=[5]
-            )
-            self.add_operation_step(step)
-            return node
-        elif value < node.value:
-            step = OperationStep(
-                OperationType.SEARCH,
-                value=value,
-                description=f"{value} < {node.value}，向左子树搜索",
-                node_id=node.node_id,
-                highlight_indices=[node.node_id],
-                tree_snapshot=self._get_tree_snapshot(),
-                code_template='bst_search',
-                code_line=7,
-                code_highlight=[6, 7]
-            )
-            self.add_operation_step(step)
-            return self._search_recursive(node.left, value)
-        else:
+            if value == node.value:
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        value=value,
+                        description=f"找到目标节点{value}",
+                        node_id=node.node_id,
+                        highlight_indices=[node.node_id],
+                        tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                        code_template='bst_search',
+                        code_line=5,
+                        code_highlight=[5]
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
+                return node
+            elif value < node.value:
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        value=value,
+                        message_id='bst_search_left',
+                        message_args={'value': value, 'current': node.value},
+                        node_id=node.node_id,
+                        highlight_indices=[node.node_id],
+                        tree_snapshot=self._get_tree_snapshot(),
+                        code_template='bst_search',
+                        code_line=7,
+                        code_highlight=[6, 7]
+                    )
+                    self.add_operation_step(step)
+                node = node.left
+            else:
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        value=value,
+                        message_id='bst_search_right',
+                        message_args={'value': value, 'current': node.value},
+                        node_id=node.node_id,
+                        highlight_indices=[node.node_id],
+                        tree_snapshot=self._get_tree_snapshot(),
+                        code_template='bst_search',
+                        code_line=9,
+                        code_highlight=[8, 9]
+                    )
+                    self.add_operation_step(step)
+                node = node.right
+
+        if self._tracing(TraceLevel.SUMMARY):
             step = OperationStep(
                 OperationType.SEARCH,
                 value=value,
-                description=f"{value} > {node.value}，向右子树搜索",
-                node_id=node.node_id,
-                highlight_indices=[node.node_id],
-                tree_snapshot=self._get_tree_snapshot(),
+                description=f"未找到节点 {value}",
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
                 code_template='bst_search',
-                code_line=9,
-                code_highlight=[8, 9]
+                code_line=10,
+                code_highlight=[10]
             )
-            self.add_operation_step(step)
-            return self._search_recursive(node.right, value)
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return None
 
     def delete(self,value:Any) -> bool:
         """删除节点"""
         # 🔥 清空操作历史，避免累积之前的操作
         self._operation_history = []
 
-        step = OperationStep(
-            operation=OperationType.DELETE,
-            value=value,
-            description=f"开始删除节点{value}",
-            code_template='bst_delete',
-            code_line=1,
-            code_highlight=[1, 2]
-        )
-        self.add_operation_step(step)
-
-        if self._root is None:
+        if self._tracing():
             step = OperationStep(
                 operation=OperationType.DELETE,
                 value=value,
-                description="删除失败：树为空",
+                description=f"开始删除节点{value}",
                 code_template='bst_delete',
-                code_line=2,
+                code_line=1,
                 code_highlight=[1, 2]
             )
             self.add_operation_step(step)
+
+        if self._root is None:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    operation=OperationType.DELETE,
+                    value=value,
+                    description="删除失败：树为空",
+                    code_template='bst_delete',
+                    code_line=2,
+                    code_highlight=[1, 2]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return False
         original_size = self._size
-        self._root = self._delete_recursive(self._root, value)
+        self._root = self._delete_node(self._root, value)
 
         if self._size < original_size:
-            step = OperationStep(
-                operation=OperationType.DELETE,
-                value=value,
-                description=f"成功删除节点 {value}",
-                code_template='bst_delete',
-                code_line=24,
-                code_highlight=[24]
-            )
-            self.add_operation_step(step)
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    operation=OperationType.DELETE,
+                    value=value,
+                    description=f"成功删除节点 {value}",
+                    code_template='bst_delete',
+                    code_line=24,
+                    code_highlight=[24]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return True
         else:
-            step = OperationStep(
-                OperationType.DELETE,
-                value=value,
-                description=f"删除失败：未找到节点 {value}",
-                code_template='bst_delete',
-                code_line=24,
-                code_highlight=[24]
-            )
-            self.add_operation_step(step)
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.DELETE,
+                    value=value,
+                    description=f"删除失败：未找到节点 {value}",
+                    code_template='bst_delete',
+                    code_line=24,
+                    code_highlight=[24]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return False
 
-    def _delete_recursive(self, node: Optional[TreeNode], value: Any) -> Optional[TreeNode]:
-        """递归删除辅助函数"""
-        if node is None:
-            return None
-
-        if value < node.value:
-            step = OperationStep(
-                OperationType.DELETE,
-                value=value,
-                description=f"{value} < {node.value}，向左子树搜索",
-                node_id=node.node_id,
-                highlight_indices=[node.node_id],
-                tree_snapshot=self._get_tree_snapshot(),
-                code_template='bst_delete',
-                code_line=7,
-                code_highlight=[6, 7]
-            )
-            self.add_operation_step(step)
-            node.left = self._delete_recursive(node.left, value)
-        elif value > node.value:
-            step = OperationStep(
-                OperationType.DELETE,
-                value=value,
-                description=f"{value} > {node.value}，向右子树搜索",
-                node_id=node.node_id,
-                highlight_indices=[node.node_id],
-                tree_snapshot=self._get_tree_snapshot(),
-                code_template='bst_delete',
-                code_line=9,
-                code_highlight=[8, 9]
-            )
-            self.add_operation_step(step)
-            node.right = self._delete_recursive(node.right, value)
-        else:
-            step = OperationStep(
-                OperationType.DELETE,
-                value=value,
-                description=f"找到目标节点{value}",
-                node_id=node.node_id,
-                highlight_indices=[node.node_id],
-                tree_snapshot=self._get_tree_snapshot(),
-                code_template='bst_delete',
-                code_line=11,
-                code_highlight=[10, 11, 12]
-            )
-            self.add_operation_step(step)
-
-            #情况1 叶子节点只有一个子节点
-            if node.left is None:
+    def _delete_node(self, root: Optional[TreeNode], value: Any) -> Optional[TreeNode]:
+        """
+        迭代删除辅助函数：自根向下查找，返回删除后子树的新根
+        有两个子节点时用右子树最小值替换，再沿右子树继续删除该最小值
+        """
+        parent, side, node = None, None, root
+        while node is not None:
+            if value < node.value:
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.DELETE,
+                        value=value,
+                        message_id='bst_search_left',
+                        message_args={'value': value, 'current': node.value},
+                        node_id=node.node_id,
+                        highlight_indices=[node.node_id],
+                        tree_snapshot=self._get_tree_snapshot(),
+                        code_template='bst_delete',
+                        code_line=7,
+                        code_highlight=[6, 7]
+                    )
+                    self.add_operation_step(step)
+                parent, side, node = node, 'left', node.left
+                continue
+            if value > node.value:
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.DELETE,
+                        value=value,
+                        message_id='bst_search_right',
+                        message_args={'value': value, 'current': node.value},
+                        node_id=node.node_id,
+                        highlight_indices=[node.node_id],
+                        tree_snapshot=self._get_tree_snapshot(),
+                        code_template='bst_delete',
+                        code_line=9,
+                        code_highlight=[8, 9]
+                    )
+                    self.add_operation_step(step)
+                parent, side, node = node, 'right', node.right
+                continue
+
+            if self._tracing():
                 step = OperationStep(
                     OperationType.DELETE,
                     value=value,
-                    description=f"节点 {value} 没有左子树，用右子树替代",
+                    description=f"找到目标节点{value}",
+                    node_id=node.node_id,
+                    highlight_indices=[node.node_id],
                     tree_snapshot=self._get_tree_snapshot(),
                     code_template='bst_delete',
-                    code_line=15,
-                    code_highlight=[14, 15, 16, 17, 18, 19]
+                    code_line=11,
+                    code_highlight=[10, 11, 12]
                 )
                 self.add_operation_step(step)
+
+            #情况1 叶子节点只有一个子节点
+            if node.left is None or node.right is None:
+                replacement = node.right if node.left is None else node.left
+                if self._tracing():
+                    if node.left is None:
+                        step = OperationStep(
+                            OperationType.DELETE,
+                            value=value,
+                            description=f"节点 {value} 没有左子树，用右子树替代",
+                            tree_snapshot=self._get_tree_snapshot(),
+                            code_template='bst_delete',
+                            code_line=15,
+                            code_highlight=[14, 15, 16, 17, 18, 19]
+                        )
+                    else:
+                        step = OperationStep(
+                            OperationType.DELETE,
+                            value=value,
+                            description=f"节点 {value} 没有右子树，用左子树替代",
+                            tree_snapshot=self._get_tree_snapshot(),
+                            code_template='bst_delete',
+                            code_line=21,
+                            code_highlight=[20, 21, 22, 23, 24]
+                        )
+                    self.add_operation_step(step)
+                self._forget_node(node)
                 self._size -= 1
-                return node.right
-            elif node.right is None:
+                if parent is None:
+                    return replacement
+                setattr(parent, side, replacement)
+                return root
+
+            #情况2 有两个子节点
+            if self._tracing():
                 step = OperationStep(
                     OperationType.DELETE,
                     value=value,
-                    description=f"节点 {value} 没有右子树，用左子树替代",
-                    tree_snapshot=self._get_tree_snapshot(),
+                    description=f"节点 {value} 有两个子节点，查找右子树最小值",
                     code_template='bst_delete',
-                    code_line=21,
-                    code_highlight=[20, 21, 22, 23, 24]
+                    code_line=23,
+                    code_highlight=[23]
                 )
                 self.add_operation_step(step)
-                self._size -= 1
-                return node.left
-
-            #情况2 有两个子节点
-            step = OperationStep(
-                OperationType.DELETE,
-                value=value,
-                description=f"节点 {value} 有两个子节点，查找右子树最小值",
-                code_template='bst_delete',
-                code_line=23,
-                code_highlight=[23]
-            )
-            self.add_operation_step(step)
 
             #找到右子树的最小节点
             min_node = self._find_min(node.right)
-            step = OperationStep(
-                OperationType.DELETE,
-                value=value,
-                description=f"用右子树最小值 {min_node.value} 替换 {value}",
-                code_template='bst_delete',
-                code_line=23,
-                code_highlight=[23]
-            )
-            self.add_operation_step(step)
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.DELETE,
+                    value=value,
+                    description=f"用右子树最小值 {min_node.value} 替换 {value}",
+                    code_template='bst_delete',
+                    code_line=23,
+                    code_highlight=[23]
+                )
+                self.add_operation_step(step)
 
-            #用右子树最小值替换当前节点
+            #用右子树最小值替换当前节点，再到右子树中删除这个最小值
             node.value = min_node.value
-            #删除右子树的最小节点
-            node.right = self._delete_recursive(node.right, min_node.value)
+            value = min_node.value
+            parent, side, node = node, 'right', node.right
 
-        return node
+        return root
+
+    def _on_balanced_node(self, node: TreeNode, depth: int, levels: int) -> None:
+        """平衡构建时每建好一个节点调用（depth 从 0 开始，levels 为整棵树的层数），子类可在此补充节点字段"""
+        pass
 
     def _find_min(self, node:TreeNode) -> TreeNode:
         """找到子树中的最小节点"""
@@ -412,55 +471,308 @@ class BinarySearchTree(TreeStructureBase):
             return None
         return self._find_max(self._root).value
 
-    def get_tree_data(self) -> dict:
-        """获取树的结构数据，用于前端可视化"""
-        print(f"调试: get_tree_data 被调用")
-        print(f"调试: _root = {self._root}")
-        print(f"调试: _root.value = {self._root.value if self._root else None}")
-        print(f"调试: _size = {self._size}")
-        
-        tree_data = {
-            'root': self._node_to_dict(self._root),
-            'size': self._size,
-            'height': self.get_height(),
-            'min': self.get_min(),
-            'max': self.get_max(),
-            'traversals': {
+    # ==================== 惰性范围查询 ====================
+    # 只沿一条路径下降再按中序往后走，访问 O(h + k) 个节点；生成器迭代期间不要修改树
+
+    def range(self, lo: Any = None, hi: Any = None, after: Any = None) -> Iterator[Any]:
+        """
+        按从小到大的顺序惰性生成闭区间 [lo, hi] 内的值，lo / hi 为 None 表示该侧不限
+        after: 分页游标（上一页最后一个值），只生成大于 after 的值
+        """
+        def before_start(value: Any) -> bool:
+            return (lo is not None and value < lo) or (after is not None and not after < value)
+
+        # 自根向下：小于下界的节点连同左子树都跳过，栈中只留之后要生成的节点
+        stack, node = [], self._root
+        while node is not None:
+            if before_start(node.value):
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if hi is not None and hi < node.value:
+                return
+            yield node.value
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    def floor(self, value: Any) -> Optional[Any]:
+        """小于等于 value 的最大值；不存在时返回 None"""
+        return self._closest(value, below=True, strict=False)
+
+    def ceiling(self, value: Any) -> Optional[Any]:
+        """大于等于 value 的最小值；不存在时返回 None"""
+        return self._closest(value, below=False, strict=False)
+
+    def predecessor(self, value: Any) -> Optional[Any]:
+        """严格小于 value 的最大值（value 不必在树中）；不存在时返回 None"""
+        return self._closest(value, below=True, strict=True)
+
+    def successor(self, value: Any) -> Optional[Any]:
+        """严格大于 value 的最小值（value 不必在树中）；不存在时返回 None"""
+        return self._closest(value, below=False, strict=True)
+
+    def _closest(self, value: Any, below: bool, strict: bool) -> Optional[Any]:
+        """自根向下一次：below 时找 value 左侧最近的值，否则找右侧最近的值，strict 为假时命中 value 本身直接返回"""
+        best, node = None, self._root
+        while node is not None:
+            if node.value == value and not strict:
+                return node.value
+            if node.value != value and (node.value < value) == below:
+                # 在 value 的目标一侧：记为候选，再往 value 方向找更近的
+                best = node.value
+                node = node.right if below else node.left
+            else:
+                node = node.left if below else node.right
+        return best
+
+    # ==================== 顺序统计 ====================
+    # 子树节点数缓存在节点上（见 TreeStructureBase._size_of），下降时按左子树大小决定方向，O(h)
+
+    def select(self, k: int) -> Optional[Any]:
+        """第 k 小的值（k 从 0 开始，即中序序列中下标为 k 的值）；越界返回 None"""
+        self._operation_history = []
+        if not 0 <= k < self._size:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    message_id='bst_select_out_of_range',
+                    message_args={'k': k, 'size': self._size},
+                    code_template='bst_select',
+                    code_line=14,
+                    code_highlight=[14]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return None
+
+        node, rest = self._root, k
+        while True:
+            left_size = self._size_of(node.left)
+            if rest == left_size:
+                break
+            if self._tracing():
+                go_left = rest < left_size
+                step = OperationStep(
+                    OperationType.TRAVERSE_LEFT if go_left else OperationType.TRAVERSE_RIGHT,
+                    message_id='bst_select_left' if go_left else 'bst_select_right',
+                    message_args={'k': rest, 'current': node.value, 'left_size': left_size},
+                    node_id=node.node_id,
+                    highlight_indices=[node.node_id],
+                    animation_type="arrow_left" if go_left else "arrow_right",
+                    duration=0.5,
+                    tree_snapshot=self._get_tree_snapshot(),
+                    code_template='bst_select',
+                    code_line=6 if go_left else 11,
+                    code_highlight=[4, 5, 6] if go_left else [9, 10, 11]
+                )
+                self.add_operation_step(step)
+            if rest < left_size:
+                node = node.left
+            else:
+                rest -= left_size + 1
+                node = node.right
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                value=node.value,
+                message_id='bst_select_found',
+                message_args={'k': k, 'value': node.value},
+                node_id=node.node_id,
+                highlight_indices=[node.node_id],
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                code_template='bst_select',
+                code_line=8,
+                code_highlight=[7, 8]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return node.value
+
+    def median(self) -> Optional[Any]:
+        """中位数（节点数为偶数时取下中位数）；空树返回 None"""
+        return self.select((self._size - 1) // 2) if self._size else None
+
+    def rank(self, value: Any) -> int:
+        """树中小于 value 的值的个数；value 在树中时即它的中序下标，select(rank(v)) == v"""
+        self._operation_history = []
+        count = self._count_below(value)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                value=value,
+                message_id='bst_rank_done',
+                message_args={'value': value, 'count': count},
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                code_template='bst_rank',
+                code_line=12,
+                code_highlight=[12]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return count
+
+    def count_range(self, lo: Any, hi: Any) -> int:
+        """值在闭区间 [lo, hi] 内的节点数：两次下降相减，lo > hi 时为 0"""
+        self._operation_history = []
+        count = 0
+        if not hi < lo:
+            count = self._count_below(hi, inclusive=True) - self._count_below(lo)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                message_id='bst_count_range_done',
+                message_args={'lo': lo, 'hi': hi, 'count': count},
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                code_template='bst_rank',
+                code_line=17,
+                code_highlight=[15, 16, 17]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return count
+
+    def _count_below(self, value: Any, inclusive: bool = False) -> int:
+        """自根向下统计小于 value（inclusive=True 时小于等于）的值的个数：每向右走一步就加上左子树和当前节点"""
+        count, node = 0, self._root
+        while node is not None:
+            go_left = value < node.value or (value == node.value and not inclusive)
+            if not go_left:
+                count += self._size_of(node.left) + 1
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.TRAVERSE_LEFT if go_left else OperationType.TRAVERSE_RIGHT,
+                    value=value,
+                    message_id='bst_rank_left' if go_left else 'bst_rank_right',
+                    message_args={
+                        'value': value, 'current': node.value, 'count': count,
+                        'cmp': ('<' if inclusive else '≤') if go_left else ('≥' if inclusive else '>')
+                    },
+                    node_id=node.node_id,
+                    highlight_indices=[node.node_id],
+                    animation_type="arrow_left" if go_left else "arrow_right",
+                    duration=0.5,
+                    tree_snapshot=self._get_tree_snapshot(),
+                    code_template='bst_rank',
+                    code_line=6 if go_left else 8,
+                    code_highlight=[5, 6] if go_left else [7, 8, 9]
+                )
+                self.add_operation_step(step)
+            node = node.left if go_left else node.right
+        return count
+
+    def _tree_data_fields(self) -> dict:
+        """在基础字段上增加最小值/最大值和四种周游序列"""
+        fields = super()._tree_data_fields()
+        fields.update({
+            'min': self.get_min,
+            'max': self.get_max,
+            'traversals': lambda: {
                 'inorder': self.inorder_traversal(),
                 'preorder': self.preorder_traversal(),
                 'postorder': self.postorder_traversal(),
                 'levelorder': self.level_order_traversal()
             }
-        }
-        print(f"调试: 返回的树数据 = {tree_data}")
-        return tree_data
+        })
+        return fields
 
-    def build_from_list(self, values: List[Any]) -> bool:
-        """从列表构建BST"""
+    def build_from_list(self, values: List[Any], balanced: bool = False) -> bool:
+        """从列表构建BST；balanced=True 时排序去重后直接建成高度平衡的树（见 build_balanced）"""
         if not values:
             return False
+        if balanced:
+            return self.build_balanced(values)
 
-        step = OperationStep(
-            OperationType.INIT,
-            description=f"从列表构建二叉搜索树: {values}"
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INIT,
+                message_id='bst_build_start',
+                message_args={'values': values}
+            )
+            self.add_operation_step(step)
 
-        for value in values:
-            self.insert(value)
+        if self._tracing():
+            for value in values:
+                self.insert(value)
+        else:
+            # 不展示逐个插入时不再为每个值记录步骤和整树快照
+            with self.trace_scope(TraceLevel.OFF):
+                for value in values:
+                    self.insert(value)
 
-        step = OperationStep(
-            OperationType.INIT,
-            description=f"成功构建二叉搜索树，共 {self._size} 个节点"
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INIT,
+                description=f"成功构建二叉搜索树，共 {self._size} 个节点",
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
         return True
 
-    def _get_tree_snapshot(self) -> dict:
-        """获取当前树的完整快照,用于动画回放"""
-        return {
-            'root': self._node_to_dict(self._root),
-            'size': self._size,
-            'height': self.get_height()
-        }
+    def build_balanced(self, values: List[Any]) -> bool:
+        """
+        从有序序列构建高度平衡的树：每段取中点作子树根，O(n)；输入无序时先排序去重一次
+        树中已有的值与 values 合并后一起重建；中点划分下子树高度只取决于区间长度，height 直接算出
+        """
+        ordered = self.inorder_traversal() + list(values)
+        if not ordered:
+            return False
+        if any(ordered[i] >= ordered[i + 1] for i in range(len(ordered) - 1)):
+            ordered.sort()
+            ordered = [v for i, v in enumerate(ordered) if i == 0 or v != ordered[i - 1]]
 
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INIT,
+                message_id='bst_balanced_start',
+                message_args={'count': len(ordered), 'values': ordered}
+            )
+            self.add_operation_step(step)
+
+        self._root = None
+        self._size = 0
+        levels = len(ordered).bit_length()
+        # 自顶向下建树（每次弹出一个区间），完整记录时每一步都能看到已建好的上层
+        stack = [(0, len(ordered) - 1, None, False, 0)]
+        while stack:
+            lo, hi, parent, is_right, depth = stack.pop()
+            if lo > hi:
+                continue
+            mid = (lo + hi) // 2
+            node = self._new_node(ordered[mid])
+            node.height = (hi - lo + 1).bit_length()
+            self._on_balanced_node(node, depth, levels)
+            if parent is None:
+                self._root = node
+            elif is_right:
+                parent.right = node
+            else:
+                parent.left = node
+            self._size += 1
+
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.INSERT,
+                    value=ordered[mid],
+                    node_id=node.node_id,
+                    message_id='bst_balanced_pick',
+                    message_args={'lo': lo, 'hi': hi, 'value': ordered[mid]},
+                    highlight_indices=[node.node_id],
+                    animation_type="fade",
+                    duration=0.4,
+                    tree_snapshot=self._get_tree_snapshot()
+                )
+                self.add_operation_step(step)
+
+            stack.append((mid + 1, hi, node, True, depth + 1))
+            stack.append((lo, mid - 1, node, False, depth + 1))
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INIT,
+                description=f"平衡构建完成，共 {self._size} 个节点，高度 {self.get_height()}",
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return True
@@ -0,0 +1,535 @@
+"""
+二叉堆 / 优先队列
+
+完全二叉树按层序存放在数组中：下标 i 的孩子为 2i+1 / 2i+2，父节点为 (i-1)//2。
+每个步骤同时带数组快照 (data_snapshot) 和由数组生成的树快照 (tree_snapshot)；
+树节点的 node_id 就是数组下标，highlight_indices 在数组视图和树视图中指向同一个元素。
+
+哈夫曼树构建也使用这里的堆（关闭步骤记录），见 huffman.py
+"""
+import operator
+from typing import Any, Callable, List, Optional
+
+from ..operation.operation import OperationStep, OperationType, TraceLevel
+from ..operation.recorder import OperationRecorder
+
+HEAP_KINDS = ('min', 'max')
+
+
+class BinaryHeap(OperationRecorder):
+    """二叉堆（最小堆 / 最大堆），支持 O(n) 自底向上建堆和 decrease-key"""
+
+    def __init__(self, kind: str = 'min', key: Optional[Callable[[Any], Any]] = None):
+        """
+        kind: 'min' 堆顶为最小值 / 'max' 堆顶为最大值
+        key: 可选的比较键，例如 key=lambda node: node.weight；缺省时直接比较元素
+        """
+        super().__init__()
+        if kind not in HEAP_KINDS:
+            raise ValueError(f"未知的堆类型: {kind}")
+        self._kind = kind
+        self._key = key
+        self._data: List[Any] = []
+        # 🔥 比较函数在构造时选定：无 key 时直接用 operator.lt / gt，热路径上不再判断堆类型
+        if key is None:
+            self._before = operator.lt if kind == 'min' else operator.gt
+        elif kind == 'min':
+            self._before = lambda a, b: key(a) < key(b)
+        else:
+            self._before = lambda a, b: key(a) > key(b)
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INIT,
+                description=f"初始化{'最小' if kind == 'min' else '最大'}堆",
+                code_template='heap_push',
+                code_line=1,
+                code_highlight=[1]
+            )
+            self.add_operation_step(step)
+
+    # ==================== 基本信息 ====================
+
+    def size(self) -> int:
+        """返回堆中元素个数"""
+        return len(self._data)
+
+    def is_empty(self) -> bool:
+        return not self._data
+
+    def get_kind(self) -> str:
+        return self._kind
+
+    def to_list(self) -> List[Any]:
+        """按数组（层序）顺序返回元素"""
+        return list(self._data)
+
+    def clear(self) -> None:
+        self._data = []
+
+    # ==================== 入堆 / 出堆 ====================
+
+    def push(self, value: Any) -> bool:
+        """入堆：放到数组末尾后上浮"""
+        self._operation_history = []
+        self._data.append(value)
+        index = len(self._data) - 1
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INSERT,
+                index=index,
+                value=value,
+                message_id='heap_push_append',
+                message_args={'value': value, 'index': index},
+                highlight_indices=[index],
+                animation_type="pulse",
+                data_snapshot=self.to_list(),
+                tree_snapshot=self._get_tree_snapshot(),
+                code_template='heap_push',
+                code_line=2,
+                code_highlight=[2]
+            )
+            self.add_operation_step(step)
+
+        index = self._sift_up(index)
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INSERT,
+                index=index,
+                value=value,
+                message_id='heap_push_done',
+                message_args={'value': value, 'top': self._data[0], 'size': len(self._data)},
+                highlight_indices=[index],
+                data_snapshot=self.to_list(),
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                code_template='heap_push',
+                code_line=3,
+                code_highlight=[3]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return True
+
+    def pop(self) -> Any:
+        """出堆：取出堆顶，末尾元素移到堆顶后下沉；堆为空时返回 None"""
+        self._operation_history = []
+        if not self._data:
+            self._empty_step(OperationType.DELETE, 'heap_pop_empty', 'heap_pop')
+            return None
+
+        top = self._data[0]
+        last = self._data.pop()
+        if self._data:
+            self._data[0] = last
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.DELETE,
+                    index=0,
+                    value=top,
+                    message_id='heap_pop_start',
+                    message_args={'value': top, 'last': last},
+                    highlight_indices=[0],
+                    animation_type="move",
+                    data_snapshot=self.to_list(),
+                    tree_snapshot=self._get_tree_snapshot(),
+                    code_template='heap_pop',
+                    code_line=4,
+                    code_highlight=[3, 4, 5]
+                )
+                self.add_operation_step(step)
+            self._sift_down(0)
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.DELETE,
+                index=0,
+                value=top,
+                message_id='heap_pop_done',
+                message_args={'value': top, 'top': self._data[0] if self._data else None, 'size': len(self._data)},
+                data_snapshot=self.to_list(),
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                code_template='heap_pop',
+                code_line=7,
+                code_highlight=[7]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return top
+
+    def replace(self, value: Any) -> Any:
+        """
+        取出堆顶并放入 value（相当于 pop 之后 push，但只做一次下沉）；堆为空时直接入堆并返回 None
+        哈夫曼合并时用它把新节点放回堆：每次合并少一次上浮
+        """
+        if not self._data:
+            self.push(value)
+            return None
+        self._operation_history = []
+        top = self._data[0]
+        self._data[0] = value
+        self._sift_down(0)
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.UPDATE,
+                index=0,
+                value=value,
+                message_id='heap_replace_done',
+                message_args={'old': top, 'value': value, 'top': self._data[0]},
+                data_snapshot=self.to_list(),
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                code_template='heap_pop',
+                code_line=6,
+                code_highlight=[6]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return top
+
+    def peek(self) -> Any:
+        """查看堆顶；堆为空时返回 None"""
+        self._operation_history = []
+        if not self._data:
+            self._empty_step(OperationType.SEARCH, 'heap_peek_empty', 'heap_pop')
+            return None
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                index=0,
+                value=self._data[0],
+                message_id='heap_peek',
+                message_args={'value': self._data[0]},
+                highlight_indices=[0],
+                data_snapshot=self.to_list(),
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                code_template='heap_pop',
+                code_line=3,
+                code_highlight=[3]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return self._data[0]
+
+    # ==================== 建堆 ====================
+
+    def heapify(self, values: List[Any]) -> bool:
+        """
+        🔥 自底向上建堆：从最后一个非叶子节点开始依次下沉，O(n)
+        （逐个 push 为 O(n log n)）。替换堆中原有元素
+        """
+        self._operation_history = []
+        self._data = list(values)
+        count = len(self._data)
+        start = count // 2 - 1
+
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INIT,
+                message_id='heap_heapify_start',
+                message_args={'count': count, 'start': start},
+                highlight_indices=list(range(start + 1)),
+                data_snapshot=self.to_list(),
+                tree_snapshot=self._get_tree_snapshot(),
+                code_template='heap_heapify',
+                code_line=2,
+                code_highlight=[2, 3]
+            )
+            self.add_operation_step(step)
+
+        swaps = 0
+        for index in range(start, -1, -1):
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.COMPARE,
+                    index=index,
+                    value=self._data[index],
+                    message_id='heap_heapify_node',
+                    message_args={'index': index, 'value': self._data[index]},
+                    highlight_indices=[index],
+                    code_template='heap_heapify',
+                    code_line=4,
+                    code_highlight=[3, 4]
+                )
+                self.add_operation_step(step)
+            swaps += self._sift_down(index)
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INIT,
+                message_id='heap_heapify_done',
+                message_args={'count': count, 'swaps': swaps, 'top': self._data[0] if self._data else None},
+                data_snapshot=self.to_list(),
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                code_template='heap_heapify',
+                code_line=6,
+                code_highlight=[6]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return True
+
+    def initlist(self, values: List[Any]) -> bool:
+        """批量初始化（与线性结构同名，供 init_batch / DSL init 使用），即 heapify"""
+        return self.heapify(values)
+
+    def extend(self, values: List[Any]) -> bool:
+        """追加一批元素：与原有元素一起重新自底向上建堆，O(n + k)"""
+        return self.heapify(self._data + list(values))
+
+    # ==================== 按下标修改 / 删除 ====================
+
+    def decrease_key(self, index: int, value: Any) -> bool:
+        """
+        把下标 index 的元素改为 value 并上浮
+        只允许提升优先级：最小堆中新值不大于原值，最大堆中新值不小于原值
+        """
+        self._operation_history = []
+        if not 0 <= index < len(self._data):
+            self._index_error_step(OperationType.UPDATE, 'heap_decrease_key_out_of_range', index, 'heap_decrease_key')
+            return False
+        old = self._data[index]
+        if self._before(old, value):
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.UPDATE,
+                    index=index,
+                    value=value,
+                    message_id='heap_decrease_key_wrong_direction',
+                    message_args={'index': index, 'old': old, 'value': value},
+                    highlight_indices=[index],
+                    code_template='heap_decrease_key',
+                    code_line=2,
+                    code_highlight=[2]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return False
+
+        self._data[index] = value
+        if self._tracing():
+            step = OperationStep(
+                OperationType.UPDATE,
+                index=index,
+                value=value,
+                message_id='heap_decrease_key',
+                message_args={'index': index, 'old': old, 'value': value},
+                highlight_indices=[index],
+                animation_type="pulse",
+                data_snapshot=self.to_list(),
+                tree_snapshot=self._get_tree_snapshot(),
+                code_template='heap_decrease_key',
+                code_line=3,
+                code_highlight=[3]
+            )
+            self.add_operation_step(step)
+
+        index = self._sift_up(index)
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.UPDATE,
+                index=index,
+                value=value,
+                message_id='heap_decrease_key_done',
+                message_args={'value': value, 'index': index},
+                highlight_indices=[index],
+                data_snapshot=self.to_list(),
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                code_template='heap_decrease_key',
+                code_line=5,
+                code_highlight=[4, 5]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return True
+
+    def delete(self, index: int) -> Any:
+        """删除下标 index 的元素：末尾元素填补空位后视情况上浮或下沉；下标越界返回 None"""
+        self._operation_history = []
+        if not 0 <= index < len(self._data):
+            self._index_error_step(OperationType.DELETE, 'heap_delete_out_of_range', index, 'heap_pop')
+            return None
+
+        removed = self._data[index]
+        last = self._data.pop()
+        if index < len(self._data):
+            self._data[index] = last
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.DELETE,
+                    index=index,
+                    value=removed,
+                    message_id='heap_delete',
+                    message_args={'index': index, 'value': removed, 'last': last},
+                    highlight_indices=[index],
+                    animation_type="move",
+                    data_snapshot=self.to_list(),
+                    tree_snapshot=self._get_tree_snapshot(),
+                    code_template='heap_pop',
+                    code_line=4,
+                    code_highlight=[4, 5]
+                )
+                self.add_operation_step(step)
+            if index > 0 and self._before(last, self._data[(index - 1) // 2]):
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.DELETE,
+                index=index,
+                value=removed,
+                message_id='heap_delete_done',
+                message_args={'value': removed, 'size': len(self._data)},
+                data_snapshot=self.to_list(),
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                code_template='heap_pop',
+                code_line=7,
+                code_highlight=[7]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return removed
+
+    def search(self, value: Any) -> int:
+        """按数组顺序查找 value，返回第一个匹配的下标，找不到返回 -1（堆只对堆顶有序，查找为 O(n)）"""
+        self._operation_history = []
+        try:
+            index = self._data.index(value)
+        except ValueError:
+            index = -1
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                index=index,
+                value=value,
+                message_id='heap_search_found' if index >= 0 else 'heap_search_miss',
+                message_args={'value': value, 'index': index},
+                highlight_indices=[index] if index >= 0 else None,
+                data_snapshot=self.to_list(),
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY)
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return index
+
+    # ==================== 上浮 / 下沉 ====================
+
+    def _sift_up(self, index: int) -> int:
+        """从 index 上浮，返回元素最终所在的下标"""
+        data, before = self._data, self._before
+        tracing = self._tracing()
+        value = data[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if not before(value, data[parent]):
+                if tracing:
+                    self._sift_step('heap_sift_up_stop', index, parent, 'heap_push', 9)
+                break
+            data[index], data[parent] = data[parent], value
+            if tracing:
+                self._sift_step('heap_sift_up', parent, index, 'heap_push', 10)
+            index = parent
+        return index
+
+    def _sift_down(self, index: int) -> int:
+        """从 index 下沉，返回交换次数"""
+        data, before = self._data, self._before
+        tracing = self._tracing()
+        size = len(data)
+        value = data[index]
+        swaps = 0
+        while True:
+            best = index
+            left = 2 * index + 1
+            if left < size and before(data[left], value):
+                best = left
+            right = left + 1
+            if right < size and before(data[right], data[best]):
+                best = right
+            if best == index:
+                if tracing and left < size:
+                    self._sift_step('heap_sift_down_stop', index, left, 'heap_pop', 16)
+                return swaps
+            data[index], data[best] = data[best], value
+            swaps += 1
+            if tracing:
+                self._sift_step('heap_sift_down', best, index, 'heap_pop', 17)
+            index = best
+
+    def _sift_step(self, message_id: str, index: int, other: int, code_template: str, code_line: int) -> None:
+        """上浮/下沉中的一步：index 为当前元素所在下标，other 为与之比较（已交换时为交换前）的位置"""
+        step = OperationStep(
+            OperationType.COMPARE if message_id.endswith('_stop') else OperationType.UPDATE,
+            index=index,
+            value=self._data[index],
+            message_id=message_id,
+            message_args={'value': self._data[index], 'other': self._data[other], 'index': index,
+                          'other_index': other, 'better': '小' if self._kind == 'min' else '大'},
+            highlight_indices=[index],
+            compare_indices=[index, other],
+            animation_type="compare" if message_id.endswith('_stop') else "swap",
+            data_snapshot=self.to_list(),
+            tree_snapshot=self._get_tree_snapshot(),
+            code_template=code_template,
+            code_line=code_line,
+            code_highlight=[code_line]
+        )
+        self.add_operation_step(step)
+
+    # ==================== 失败步骤 ====================
+
+    def _empty_step(self, operation: OperationType, message_id: str, code_template: str) -> None:
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                operation,
+                message_id=message_id,
+                code_template=code_template,
+                code_line=2,
+                code_highlight=[2]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+
+    def _index_error_step(self, operation: OperationType, message_id: str, index: int, code_template: str) -> None:
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                operation,
+                index=index,
+                message_id=message_id,
+                message_args={'index': index, 'size': len(self._data)},
+                code_template=code_template,
+                code_line=2,
+                code_highlight=[2]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+
+    # ==================== 快照 ====================
+
+    def _get_tree_snapshot(self, level: TraceLevel = TraceLevel.FULL) -> Optional[dict]:
+        """数组对应的完全二叉树快照（格式同树结构的 _get_tree_snapshot，node_id 为数组下标）"""
+        if not self._tracing(level):
+            return None
+        return {
+            'root': self._array_to_tree(),
+            'size': len(self._data),
+            'height': len(self._data).bit_length()
+        }
+
+    def _array_to_tree(self) -> Optional[dict]:
+        """自底向上生成节点字典：孩子的下标总比父节点大，倒序遍历时孩子已经生成"""
+        data = self._data
+        size = len(data)
+        nodes: List[Optional[dict]] = [None] * size
+        for index in range(size - 1, -1, -1):
+            left = 2 * index + 1
+            nodes[index] = {
+                'value': data[index],
+                'node_id': index,
+                'left': nodes[left] if left < size else None,
+                'right': nodes[left + 1] if left + 1 < size else None
+            }
+        return nodes[0] if nodes else None
+
+    def get_tree_data(self) -> dict:
+        """当前状态：数组视图 + 树视图"""
+        return {
+            'array': self.to_list(),
+            'root': self._array_to_tree(),
+            'size': len(self._data),
+            'height': len(self._data).bit_length(),
+            'kind': self._kind
+        }
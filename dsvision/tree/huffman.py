@@ -1,8 +1,14 @@
+import heapq
+
 from .base import TreeStructureBase, TreeNode
-from ..operation import OperationType, OperationStep
+from .heap import BinaryHeap
+from ..operation import OperationType, OperationStep, TraceLevel
 from typing import Optional, Any, Dict, List, Tuple
 
 
+HUFFMAN_BUILD_METHODS = ('auto', 'heap', 'two_queue')
+
+
 class HuffmanNode(TreeNode):
     """哈夫曼树节点"""
 
@@ -12,104 +18,13 @@ class HuffmanNode(TreeNode):
         self.is_leaf = True  # 是否为叶子节点
 
     def __lt__(self, other):
-        """用于堆排序的比较方法"""
+        """按权重比较，BinaryHeap 据此直接比较节点"""
         return self.weight < other.weight
 
     def __repr__(self):
         return f"Huffman({self.value}, freq={self.weight})"
 
 
-class MinHeap:
-    """最小堆实现"""
-
-    def __init__(self):
-        self.heap: List[HuffmanNode] = []
-        self.size = 0
-
-    def parent(self, i: int) -> int:
-        """获取父节点索引"""
-        return (i - 1) // 2
-
-    def left_child(self, i: int) -> int:
-        """获取左子节点索引"""
-        return 2 * i + 1
-
-    def right_child(self, i: int) -> int:
-        """获取右子节点索引"""
-        return 2 * i + 2
-
-    def swap(self, i: int, j: int) -> None:
-        """交换两个节点"""
-        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
-
-    def insert(self, node: HuffmanNode) -> None:
-        """插入节点到堆中"""
-        self.heap.append(node)
-        self.size += 1
-        self._heapify_up(self.size - 1)
-
-    def _heapify_up(self, i: int) -> None:
-        """向上调整堆(上浮)"""
-        while i > 0:
-            parent_idx = self.parent(i)
-            if self.heap[i].weight < self.heap[parent_idx].weight:
-                self.swap(i, parent_idx)
-                i = parent_idx
-            else:
-                break
-
-    def extract_min(self) -> Optional[HuffmanNode]:
-        """取出并删除最小元素"""
-        if self.size == 0:
-            return None
-
-        if self.size == 1:
-            self.size -= 1
-            return self.heap.pop()
-
-        # 保存最小元素
-        min_node = self.heap[0]
-
-        # 用最后一个元素替换根节点
-        self.heap[0] = self.heap.pop()
-        self.size -= 1
-
-        # 向下调整堆
-        if self.size > 0:  # 🔥 关键修复: 只有堆非空时才调整
-            self._heapify_down(0)
-
-        return min_node
-
-    def _heapify_down(self, i: int) -> None:
-        """向下调整堆(下沉)"""
-        while True:
-            smallest = i
-            left = self.left_child(i)
-            right = self.right_child(i)
-
-            # 找到当前节点、左子节点、右子节点中最小的
-            if left < self.size and self.heap[left].weight < self.heap[smallest].weight:
-                smallest = left
-
-            if right < self.size and self.heap[right].weight < self.heap[smallest].weight:
-                smallest = right
-
-            # 如果当前节点不是最小的,交换并继续下沉
-            if smallest != i:
-                self.swap(i, smallest)
-                i = smallest
-            else:
-                break
-
-    def is_empty(self) -> bool:
-        """判断堆是否为空"""
-        return self.size == 0
-
-    def get_all_sorted(self) -> List[HuffmanNode]:
-        """获取堆中所有元素的排序列表(用于显示)"""
-        return sorted(self.heap, key=lambda x: x.weight)
-
-
 class HuffmanTree(TreeStructureBase):
     """哈夫曼树实现"""
 
@@ -117,244 +32,404 @@ class HuffmanTree(TreeStructureBase):
         super().__init__()
         self._huffman_codes: Dict[Any, str] = {}  # 存储哈夫曼编码
         self._root: Optional[HuffmanNode] = None
+        # 构建用的最小堆：HuffmanNode 按权重比较，直接放进堆；堆自身不记录步骤，每次构建复用
+        self._heap = BinaryHeap()
+        self._heap.set_trace_level(TraceLevel.OFF)
 
-        step = OperationStep(
-            OperationType.INIT,
-            description="初始化哈夫曼树",
-            code_template='huffman_build',
-            code_line=1,
-            code_highlight=[1, 2, 3]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INIT,
+                description="初始化哈夫曼树",
+                code_template='huffman_build',
+                code_line=1,
+                code_highlight=[1, 2, 3]
+            )
+            self.add_operation_step(step)
 
-    def build_from_numbers(self, numbers: List[int]) -> bool:
+    def build_from_numbers(self, numbers: List[int], method: str = 'auto') -> bool:
         """
         从数字列表构建哈夫曼树（纯数字模式）
-        numbers: 数字列表，例如 [2, 4, 6, 8]
+        numbers: 数字列表，例如 [2, 4, 6, 8]；已按升序给出时自动使用 O(n) 的双队列构建
+        method: 构建方式，见 build_from_weights
         """
         # 🔥 清空操作历史，避免累积之前的操作
         self._operation_history = []
 
         if not numbers:
-            step = OperationStep(
-                OperationType.INIT,
-                description="构建失败:数字列表为空",
-                code_template='huffman_build',
-                code_line=1,
-                code_highlight=[1]
-            )
-            self.add_operation_step(step)
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INIT,
+                    description="构建失败:数字列表为空",
+                    code_template='huffman_build',
+                    code_line=1,
+                    code_highlight=[1]
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return False
 
         # 💾 保存原始数据用于导出
         self._original_numbers = numbers
 
-        step = OperationStep(
-                OperationType.INIT,
-            description=f"开始构建哈夫曼树（数字模式），输入权重列表: {numbers}",
-            code_template='huffman_build',
-            code_line=2,
-            code_highlight=[1, 2, 3]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                    OperationType.INIT,
+                message_id='huffman_numbers_start',
+                message_args={'numbers': numbers},
+                code_template='huffman_build',
+                code_line=2,
+                code_highlight=[1, 2, 3]
+            )
+            self.add_operation_step(step)
 
         # 将数字列表转换为频率字典
         weights = {}
         for i, num in enumerate(numbers):
             weights[str(num)] = num  # 键和值都是数字，但键用字符串表示以保持唯一性
 
-        return self.build_from_weights(weights, mode='number')
+        return self.build_from_weights(weights, mode='number', method=method)
 
-    def build_from_weights(self, weights: Dict[Any, int], mode: str = 'text') -> bool:
+    def build_from_weights(self, weights: Dict[Any, int], mode: str = 'text', method: str = 'auto') -> bool:
         """
         从频率字典构建哈夫曼树
         frequencies: {字符: 频率} 例如 {'A': 5, 'B': 9, 'C': 12}
         mode: 'text' 文字模式 或 'number' 数字模式
+        method: 'heap' 最小堆，O(n log n)；'two_queue' 双队列，O(n)（权重无序时先排序）；
+                'auto'（默认）权重按给出顺序已非递减时用双队列，否则用最小堆
         """
+        if method not in HUFFMAN_BUILD_METHODS:
+            raise ValueError(f"未知的构建方式: {method}")
+
         if not weights:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INIT,
+                    description="构建失败:权重字典为空"
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+            return False
+
+        # 显示初始频率列表
+        freq_list = sorted(weights.values())
+        if self._tracing():
             step = OperationStep(
                 OperationType.INIT,
-                description="构建失败:权重字典为空"
+                message_id='huffman_initial_freq',
+                message_args={'freq_list': freq_list},
+                visual_hints={'frequency_list': freq_list, 'mode': mode}
             )
             self.add_operation_step(step)
-            return False
 
-        # 显示初始频率列表
-        freq_list = sorted(weights.values())
-        step = OperationStep(
-            OperationType.INIT,
-            description=f"📊 初始频率列表: {freq_list}",
-            visual_hints={'frequency_list': freq_list, 'mode': mode}
-        )
-        self.add_operation_step(step)
-
-        step = OperationStep(
-            OperationType.INIT,
-            description=f"开始构建哈夫曼树,输入权重: {weights}"
-        )
-        self.add_operation_step(step)
-
-        # 创建初始节点列表
-        heap = MinHeap()
-
-        # 给每个字符创建叶子节点并插入堆
+            step = OperationStep(
+                OperationType.INIT,
+                message_id='huffman_weights_start',
+                message_args={'weights': weights}
+            )
+            self.add_operation_step(step)
+
+        self._nodes = {}  # 重新构建，旧树的节点不再可查
+        self._root = None
+
+        # 给每个字符创建叶子节点
+        leaves = []
         for value, wei in weights.items():
-            node = HuffmanNode(value, wei)
-            heap.insert(node)
+            node = self._register_node(HuffmanNode(value, wei))
+            leaves.append(node)
             self._size += 1
 
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.INSERT,
+                    value=value,
+                    message_id='huffman_create_leaf',
+                    message_args={'value': value, 'weight': wei},
+                    code_template='huffman_build',
+                    code_line=6,
+                    code_highlight=[5, 6, 7]
+                )
+                self.add_operation_step(step)
+
+        # 🔥 权重已有序时不需要堆：双队列每轮 O(1) 取出最小的两个
+        is_sorted = all(a.weight <= b.weight for a, b in zip(leaves, leaves[1:]))
+        if method == 'two_queue' or (method == 'auto' and is_sorted):
+            merge_count = self._merge_with_two_queues(leaves, is_sorted, mode)
+        else:
+            merge_count = self._merge_with_heap(leaves, mode)
+
+        if self._root:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INIT,
+                    description=f"哈夫曼树构建完成!"
+                                f"根节点权重={self._root.weight}, "
+                                f"共{self._size}个节点,"
+                                f"进行了{merge_count}次合并操作"
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
+
+            # 生成哈夫曼编码
+            self._generate_codes()
+
+            return True
+
+        return False
+
+    def _merge_with_heap(self, leaves: List[HuffmanNode], mode: str) -> int:
+        """最小堆构建：每轮取出权重最小的两个节点合并后放回堆中，返回合并次数"""
+        heap = self._heap
+
+        # 🔥 自底向上一次建堆 O(n)，不再逐个插入（替换堆中原有内容）
+        heap.heapify(leaves)
+
+        if self._tracing():
+            sorted_nodes = sorted(heap.to_list())
             step = OperationStep(
-                OperationType.INSERT,
-                value=value,
-                description=f"创建叶子节点: 字符='{value}', 权重={wei}",
-                code_template='huffman_build',
-                code_line=6,
-                code_highlight=[5, 6, 7]
+                OperationType.INIT,
+                message_id='huffman_initial_queue',
+                message_args={'nodes': sorted_nodes}
             )
             self.add_operation_step(step)
 
-        sorted_nodes = heap.get_all_sorted()
-        step = OperationStep(
-            OperationType.INIT,
-            description=f"初始节点队列(按权重排序): {[f'{n.value}({n.weight})' for n in sorted_nodes]}"
-        )
-        self.add_operation_step(step)
-
         # 🔥 关键修复: 构建哈夫曼树的主循环
         merge_count = 0
-        while heap.size > 1:  # 🔥 修改条件: 当堆中还有多于1个节点时继续
+        while heap.size() > 1:  # 🔥 修改条件: 当堆中还有多于1个节点时继续
             merge_count += 1
 
-            # 📊 显示当前频率列表
-            current_freq_list = sorted([n.weight for n in heap.get_all_sorted()])
-            step = OperationStep(
-                OperationType.INSERT,
-                description=f"📊 当前频率列表: {current_freq_list}",
-                visual_hints={'frequency_list': current_freq_list, 'mode': mode}
-            )
-            self.add_operation_step(step)
+            # 每轮都要排序整个堆，只有记录详细步骤时才做
+            if self._tracing():
+                # 📊 显示当前频率列表
+                current_freq_list = sorted(n.weight for n in heap.to_list())
+                step = OperationStep(
+                    OperationType.INSERT,
+                    message_id='huffman_current_freq',
+                    message_args={'freq_list': current_freq_list},
+                    visual_hints={'frequency_list': current_freq_list, 'mode': mode}
+                )
+                self.add_operation_step(step)
 
-            # 🔴 选中最小的两个频率（红色高亮）
-            min1_weight = heap.heap[0].weight if heap.size > 0 else 0
-            min2_weight = sorted([n.weight for n in heap.heap])[1] if heap.size > 1 else 0
-            step = OperationStep(
-                OperationType.INSERT,
-                description=f"🔴 选中最小的两个频率: {min1_weight} 和 {min2_weight}",
-                visual_hints={'selected_weights': [min1_weight, min2_weight], 'frequency_list': current_freq_list, 'mode': mode}
-            )
-            self.add_operation_step(step)
+                # 🔴 选中最小的两个频率（红色高亮）
+                min1_weight, min2_weight = current_freq_list[0], current_freq_list[1]
+                step = OperationStep(
+                    OperationType.INSERT,
+                    description=f"🔴 选中最小的两个频率: {min1_weight} 和 {min2_weight}",
+                    visual_hints={'selected_weights': [min1_weight, min2_weight], 'frequency_list': current_freq_list, 'mode': mode}
+                )
+                self.add_operation_step(step)
 
-            # 取出频率最小的两个节点
-            left = heap.extract_min()
-            right = heap.extract_min()
+            # 取出频率最小的两个节点：第二个先留在堆顶，合并后直接被新节点替换
+            left = heap.pop()
+            right = heap.peek()
 
             if left is None or right is None:  # 🔥 安全检查
                 break
 
-            step = OperationStep(
-                OperationType.INSERT,
-                description=f"【第{merge_count}次合并】从堆中取出权重最小的两个节点: "
-                            f"左节点='{left.value}'(频率{left.weight}), "
-                            f"右节点='{right.value}'(频率{right.weight})",
-                code_template='huffman_build',
-                code_line=12,
-                code_highlight=[11, 12, 13, 14, 15]
-            )
-            self.add_operation_step(step)
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.INSERT,
+                    description=f"【第{merge_count}次合并】从堆中取出权重最小的两个节点: "
+                                f"左节点='{left.value}'(频率{left.weight}), "
+                                f"右节点='{right.value}'(频率{right.weight})",
+                    code_template='huffman_build',
+                    code_line=12,
+                    code_highlight=[11, 12, 13, 14, 15]
+                )
+                self.add_operation_step(step)
 
-            # 创建新的内部节点
-            merged_wei = left.weight + right.weight
-            merged_value = f"[{left.value}+{right.value}]"
-            merged_node = HuffmanNode(merged_value, merged_wei)
-            merged_node.is_leaf = False
-            merged_node.left = left
-            merged_node.right = right
+            merged_node = self._merge_nodes(left, right)
 
-            self._size += 1
+            # 🔥 关键: 新节点替换堆顶的 right 放回堆中，只需一次下沉
+            heap.replace(merged_node)
 
-            step = OperationStep(
-                OperationType.INSERT,
-                value=merged_value,
-                description=f"创建新的内部节点: "
-                            f"值='{merged_value}', "
-                            f"权重={left.weight}+{right.weight}={merged_wei}",
-                node_id = merged_node.node_id  # 高亮新创建的节点
-            )
-            self.add_operation_step(step)
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.INSERT,
+                    description=f"将新节点插入堆,重新调整堆结构"
+                )
+                self.add_operation_step(step)
 
-            # 🔥 关键: 将新节点插入回堆
-            heap.insert(merged_node)
+                # 🔥 关键: 生成合并后的子树快照
+                step = OperationStep(
+                    OperationType.INSERT,
+                    description=f"展示合并后的子树结构",
+                    tree_snapshot=self._get_partial_tree_data(merged_node)
+                )
+                self.add_operation_step(step)
 
-            step = OperationStep(
-                OperationType.INSERT,
-                description=f"将新节点插入堆,重新调整堆结构"
-            )
-            self.add_operation_step(step)
+                # 显示当前堆的状态
+                remaining = sorted(heap.to_list())
+                step = OperationStep(
+                    OperationType.INSERT,
+                    message_id='huffman_heap_nodes',
+                    message_args={'nodes': remaining}
+                )
+                self.add_operation_step(step)
 
-            # 🔥 关键: 生成当前树快照
-            # 临时设置根节点为新合并的节点来展示部分树
-            temp_root = merged_node
-            step = OperationStep(
-                OperationType.INSERT,
-                description=f"展示合并后的子树结构",
-                tree_snapshot=self._get_partial_tree_data(merged_node)
-            )
-            self.add_operation_step(step)
+        # 🔥 最后一个节点就是根节点
+        if heap.size() == 1:
+            self._root = heap.pop()
+        return merge_count
 
+    def _merge_with_two_queues(self, leaves: List[HuffmanNode], is_sorted: bool, mode: str) -> int:
+        """
+        🔥 双队列构建，O(n)：叶子按权重升序排成一个队列，合并出的节点依次追加到第二个队列。
+        每次合并的权重都不小于上一次，合并队列天然有序，因此两个队首中较小者就是全局最小，不需要堆。
+        两个队列都用列表 + 队首下标实现，出队不搬移元素。返回合并次数
+        """
+        if not is_sorted:
+            # 稳定排序：权重相同的叶子保持给出的顺序
+            leaves = sorted(leaves, key=lambda n: n.weight)
+        merged: List[HuffmanNode] = []
+        i = j = 0  # 两个队列的队首下标
 
-            # 显示当前堆的状态
-            remaining = heap.get_all_sorted()
+        if self._tracing():
             step = OperationStep(
-                OperationType.INSERT,
-                description=f"当前堆中节点(按权重排序): {[f'{n.value}({n.weight})' for n in remaining]}"
+                OperationType.INIT,
+                message_id='huffman_two_queue_start' if is_sorted else 'huffman_two_queue_sorted',
+                message_args={'leaves': leaves[:]},
+                visual_hints=self._two_queue_hints(leaves, 0, merged, 0, mode),
+                code_template='huffman_build_two_queue',
+                code_line=3,
+                code_highlight=[2, 3, 4]
             )
             self.add_operation_step(step)
 
-        # 🔥 最后一个节点就是根节点
-        if heap.size == 1:
-            self._root = heap.extract_min()
+        def pop_min() -> Tuple[HuffmanNode, str]:
+            """取两个队首中权重较小者；相等时先取叶子，使树高更小"""
+            nonlocal i, j
+            if j == len(merged) or (i < len(leaves) and leaves[i].weight <= merged[j].weight):
+                i += 1
+                return leaves[i - 1], '叶子队列'
+            j += 1
+            return merged[j - 1], '合并队列'
 
-        if self._root:
+        merge_count = 0
+        while (len(leaves) - i) + (len(merged) - j) > 1:
+            merge_count += 1
+            start_i, start_j = i, j
+            left, left_queue = pop_min()
+            right, right_queue = pop_min()
+
+            if self._tracing():
+                # 🔴 两个队列的当前内容，选中的两个权重红色高亮
+                step = OperationStep(
+                    OperationType.INSERT,
+                    message_id='huffman_two_queue_pick',
+                    message_args={
+                        'merge_count': merge_count,
+                        'left': left.value, 'left_weight': left.weight, 'left_queue': left_queue,
+                        'right': right.value, 'right_weight': right.weight, 'right_queue': right_queue
+                    },
+                    visual_hints=self._two_queue_hints(leaves, start_i, merged, start_j, mode,
+                                                       selected=(i - start_i, j - start_j)),
+                    code_template='huffman_build_two_queue',
+                    code_line=14,
+                    code_highlight=[6, 7, 8, 9, 10, 14, 15]
+                )
+                self.add_operation_step(step)
+
+            merged_node = self._merge_nodes(left, right, code_template='huffman_build_two_queue', code_line=16)
+
+            # 🔥 新权重不小于合并队列中已有的任何权重，直接追加到队尾
+            merged.append(merged_node)
+
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.INSERT,
+                    message_id='huffman_two_queue_append',
+                    message_args={'value': merged_node.value, 'weight': merged_node.weight,
+                                  'leaves': leaves[i:], 'merged': merged[j:]},
+                    visual_hints=self._two_queue_hints(leaves, i, merged, j, mode),
+                    code_template='huffman_build_two_queue',
+                    code_line=19,
+                    code_highlight=[18, 19]
+                )
+                self.add_operation_step(step)
+
+                step = OperationStep(
+                    OperationType.INSERT,
+                    description=f"展示合并后的子树结构",
+                    tree_snapshot=self._get_partial_tree_data(merged_node)
+                )
+                self.add_operation_step(step)
+
+        # 🔥 剩下的唯一节点就是根节点
+        self._root = leaves[i] if i < len(leaves) else merged[j]
+        return merge_count
+
+    def _merge_nodes(self, left: HuffmanNode, right: HuffmanNode,
+                     code_template: Optional[str] = None, code_line: Optional[int] = None) -> HuffmanNode:
+        """创建以 left、right 为孩子的内部节点，权重为两者之和"""
+        merged_wei = left.weight + right.weight
+        merged_value = f"[{left.value}+{right.value}]"
+        merged_node = self._register_node(HuffmanNode(merged_value, merged_wei))
+        merged_node.is_leaf = False
+        merged_node.left = left
+        merged_node.right = right
+
+        self._size += 1
+
+        if self._tracing():
             step = OperationStep(
-                OperationType.INIT,
-                description=f"哈夫曼树构建完成!"
-                            f"根节点权重={self._root.weight}, "
-                            f"共{self._size}个节点,"
-                            f"进行了{merge_count}次合并操作"
+                OperationType.INSERT,
+                value=merged_value,
+                description=f"创建新的内部节点: "
+                            f"值='{merged_value}', "
+                            f"权重={left.weight}+{right.weight}={merged_wei}",
+                node_id = merged_node.node_id,  # 高亮新创建的节点
+                code_template=code_template,
+                code_line=code_line,
+                code_highlight=[code_line, code_line + 1] if code_line else None
             )
             self.add_operation_step(step)
+        return merged_node
 
-            # 生成哈夫曼编码
-            self._generate_codes()
-
-            return True
-
-        return False
+    @staticmethod
+    def _two_queue_hints(leaves: List[HuffmanNode], i: int, merged: List[HuffmanNode], j: int,
+                         mode: str, selected: Tuple[int, int] = (0, 0)) -> dict:
+        """
+        双队列构建的 visual_hints：两个队列各自的权重，以及合并后的整体频率列表（兼容单列表展示）。
+        selected 为本轮分别从叶子队列、合并队列队首取出的个数
+        """
+        leaf_queue = [n.weight for n in leaves[i:]]
+        merged_queue = [n.weight for n in merged[j:]]
+        hints = {
+            'leaf_queue': leaf_queue,
+            'merged_queue': merged_queue,
+            'frequency_list': list(heapq.merge(leaf_queue, merged_queue)),
+            'mode': mode
+        }
+        if any(selected):
+            hints['selected_heads'] = {'leaf': selected[0], 'merged': selected[1]}
+            hints['selected_weights'] = leaf_queue[:selected[0]] + merged_queue[:selected[1]]
+        return hints
 
-    def build_from_string(self, text: str) -> bool:
+    def build_from_string(self, text: str, method: str = 'auto') -> bool:
         """
         从字符串构建哈夫曼树(自动统计频率)
         text: 输入字符串,例如 "ABRACADABRA"
+        method: 构建方式，见 build_from_weights
         """
         # 🔥 清空操作历史，避免累积之前的操作
         self._operation_history = []
 
         if not text:
-            step = OperationStep(
-                OperationType.INIT,
-                description="构建失败:输入文本为空"
-            )
-            self.add_operation_step(step)
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.INIT,
+                    description="构建失败:输入文本为空"
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
             return False
 
         # 💾 保存原始数据用于导出
         self._original_text = text
 
-        step = OperationStep(
-            OperationType.INIT,
-            description=f"分析输入文本: '{text}' (长度={len(text)})"
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INIT,
+                message_id='huffman_text_analyze',
+                message_args={'text': text, 'length': len(text)}
+            )
+            self.add_operation_step(step)
 
         # 统计字符频率
         frequencies = {}
@@ -363,72 +438,81 @@ class HuffmanTree(TreeStructureBase):
 
         # 按字符排序显示
         sorted_freq = sorted(frequencies.items(), key=lambda x: x[1], reverse=True)
-        step = OperationStep(
-            OperationType.INIT,
-            description=f"字符频率统计完成: {dict(sorted_freq)}"
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INIT,
+                message_id='huffman_text_freq',
+                message_args={'frequencies': dict(sorted_freq)}
+            )
+            self.add_operation_step(step)
 
         # 使用频率字典构建树
-        return self.build_from_weights(frequencies)
+        return self.build_from_weights(frequencies, method=method)
 
     def _generate_codes(self) -> None:
         """生成哈夫曼编码"""
         self._huffman_codes = {}
 
-        step = OperationStep(
-            OperationType.INIT,
-            description="开始生成哈夫曼编码(规则:左分支=0, 右分支=1)"
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INIT,
+                description="开始生成哈夫曼编码(规则:左分支=0, 右分支=1)"
+            )
+            self.add_operation_step(step)
 
         if self._root is None:
             return
 
-        self._generate_codes_helper(self._root, "")
+        weighted_length = self._generate_codes_helper(self._root, "")
+        self._touch()  # 编码表原地更新，让 get_tree_data 的缓存失效
 
         # 计算平均编码长度
-        if self._huffman_codes and self._root:
-            total_freq = self._root.weight
-            avg_length = sum(len(code) * self._get_node_weight(char)
-                             for char, code in self._huffman_codes.items()) / total_freq
+        if self._huffman_codes and self._root and self._tracing(TraceLevel.SUMMARY):
+            # 带权编码长度在遍历时顺带累加，不再逐个字符回树中查权重（那样是 O(n²)）
+            avg_length = weighted_length / self._root.weight
 
             step = OperationStep(
                 OperationType.INIT,
-                description=f"哈夫曼编码生成完成,编码表: {self._huffman_codes}, "
-                            f"平均编码长度: {avg_length:.2f}位"
+                message_id='huffman_codes_done',
+                message_args={'codes': self._huffman_codes, 'avg_length': avg_length}
             )
-            self.add_operation_step(step)
-
-    def _generate_codes_helper(self, node: Optional[HuffmanNode], code: str) -> None:
-        """递归辅助方法"""
-        if node is None:
-            return
-
-        # 如果是叶子节点,记录编码
-        if node.is_leaf:
-            final_code = code if code else "0"
-            self._huffman_codes[node.value] = final_code
-            step = OperationStep(
-                OperationType.SEARCH,
-                value=node.value,
-                description=f"字符 '{node.value}' (频率={node.weight}) 的编码为: {final_code}",
-                code_template='huffman_generate_codes',
-                code_line=5,
-                code_highlight=[4, 5, 6]
-            )
-            self.add_operation_step(step)
-            return
-
-        # 递归处理左右子树
-        if node.left:
-            self._generate_codes_helper(node.left, code + "0")
-        if node.right:
-            self._generate_codes_helper(node.right, code + "1")
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+
+    def _generate_codes_helper(self, node: Optional[HuffmanNode], code: str) -> int:
+        """前序遍历（显式栈）生成叶子编码，左分支先于右分支；返回带权编码长度之和"""
+        weighted_length = 0
+        stack = [(node, code)] if node is not None else []
+        while stack:
+            node, code = stack.pop()
+
+            # 如果是叶子节点,记录编码
+            if node.is_leaf:
+                final_code = code if code else "0"
+                self._huffman_codes[node.value] = final_code
+                weighted_length += len(final_code) * node.weight
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        value=node.value,
+                        message_id='huffman_leaf_code',
+                        message_args={'value': node.value, 'weight': node.weight, 'code': final_code},
+                        code_template='huffman_generate_codes',
+                        code_line=5,
+                        code_highlight=[4, 5, 6]
+                    )
+                    self.add_operation_step(step)
+                continue
+
+            # 右子树先入栈，保证先处理左子树
+            if node.right:
+                stack.append((node.right, code + "1"))
+            if node.left:
+                stack.append((node.left, code + "0"))
+        return weighted_length
 
     def _get_node_weight(self, value: Any) -> int:
         """获取指定值的节点权重"""
-        node = self._search_recursive(self._root, value)
+        node = self._search_preorder(value)
         return node.weight if node else 0
 
     def encode(self, text: str) -> Tuple[str, Dict[str, Any]]:
@@ -439,14 +523,15 @@ class HuffmanTree(TreeStructureBase):
         if not self._huffman_codes:
             raise ValueError("哈夫曼树未构建或编码未生成")
 
-        step = OperationStep(
-            OperationType.SEARCH,
-            description=f"开始编码文本: '{text}'",
-            code_template='huffman_encode',
-            code_line=2,
-            code_highlight=[1, 2, 3, 4]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.SEARCH,
+                description=f"开始编码文本: '{text}'",
+                code_template='huffman_encode',
+                code_line=2,
+                code_highlight=[1, 2, 3, 4]
+            )
+            self.add_operation_step(step)
 
         encoded = ""
         for char in text:
@@ -465,14 +550,15 @@ class HuffmanTree(TreeStructureBase):
             'savings_bits': original_bits - compressed_bits
         }
 
-        step = OperationStep(
-            OperationType.SEARCH,
-            description=f"编码完成,结果: {encoded[:50]}{'...' if len(encoded) > 50 else ''}\n"
-                        f"原始大小: {original_bits}位,经压缩后: {compressed_bits}位, "
-                        f"节省: {stats['savings_bits']}位, "
-                        f"压缩率: {compression_ratio:.2f}%"
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                description=f"编码完成,结果: {encoded[:50]}{'...' if len(encoded) > 50 else ''}\n"
+                            f"原始大小: {original_bits}位,经压缩后: {compressed_bits}位, "
+                            f"节省: {stats['savings_bits']}位, "
+                            f"压缩率: {compression_ratio:.2f}%"
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
 
         return encoded, stats
 
@@ -484,14 +570,15 @@ class HuffmanTree(TreeStructureBase):
         if not self._root:
             raise ValueError("哈夫曼树未构建")
 
-        step = OperationStep(
-            OperationType.SEARCH,
-            description=f"开始解码二进制串: {encoded[:50]}{'...' if len(encoded) > 50 else ''} (长度={len(encoded)}位)",
-            code_template='huffman_decode',
-            code_line=2,
-            code_highlight=[1, 2, 3, 4]
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.SEARCH,
+                description=f"开始解码二进制串: {encoded[:50]}{'...' if len(encoded) > 50 else ''} (长度={len(encoded)}位)",
+                code_template='huffman_decode',
+                code_line=2,
+                code_highlight=[1, 2, 3, 4]
+            )
+            self.add_operation_step(step)
 
         decoded = ""
         current = self._root
@@ -510,21 +597,24 @@ class HuffmanTree(TreeStructureBase):
             if current and current.is_leaf:
                 decoded += str(current.value)
 
-                step = OperationStep(
-                    OperationType.SEARCH,
-                    value=current.value,
-                    description=f"路径 '{path}' → 解码为字符 '{current.value}'"
-                )
-                self.add_operation_step(step)
+                if self._tracing():
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        value=current.value,
+                        description=f"路径 '{path}' → 解码为字符 '{current.value}'"
+                    )
+                    self.add_operation_step(step)
 
                 current = self._root
                 path = ""
 
-        step = OperationStep(
-            OperationType.SEARCH,
-            description=f"✓ 解码完成,结果: '{decoded}'"
-        )
-        self.add_operation_step(step)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.SEARCH,
+                message_id='huffman_decode_done',
+                message_args={'decoded': decoded}
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
 
         return decoded
 
@@ -532,95 +622,96 @@ class HuffmanTree(TreeStructureBase):
         """获取哈夫曼编码表"""
         return self._huffman_codes.copy()
 
-    def get_tree_data(self) -> dict:
-        """获取树的结构数据,用于前端可视化"""
-        return {
-            'root': self._node_to_dict_huffman(self._root),
-            'size': self._size,
-            'height': self.get_height(),
-            'huffman_codes': self._huffman_codes,
-            'traversals': {
+    def _tree_data_fields(self) -> dict:
+        """哈夫曼树节点带权重信息，另外返回编码表和周游序列"""
+        fields = super()._tree_data_fields()
+        fields.update({
+            'root': lambda: self._node_to_dict_huffman(self._root),
+            'huffman_codes': lambda: self._huffman_codes,
+            'traversals': lambda: {
                 'inorder': self.inorder_traversal(),
                 'preorder': self.preorder_traversal(),
                 'postorder': self.postorder_traversal(),
                 'levelorder': self.level_order_traversal()
             }
-        }
+        })
+        return fields
 
     def _node_to_dict_huffman(self, node: Optional[HuffmanNode]) -> Optional[dict]:
         """将哈夫曼节点转换为字典格式(包含权重信息)"""
         if node is None:
             return None
-        return {
-            'value': node.value,
-            'weight': node.weight,
-            'is_leaf': node.is_leaf,
-            'node_id': node.node_id,
-            'left': self._node_to_dict_huffman(node.left),
-            'right': self._node_to_dict_huffman(node.right)
-        }
+        # 后序生成，子节点的字典先于父节点完成
+        built = {}
+        for cur in self._iter_postorder(node):
+            built[cur.node_id] = {
+                'value': cur.value,
+                'weight': cur.weight,
+                'is_leaf': cur.is_leaf,
+                'node_id': cur.node_id,
+                'left': built.pop(cur.left.node_id) if cur.left is not None else None,
+                'right': built.pop(cur.right.node_id) if cur.right is not None else None
+            }
+        return built[node.node_id]
 
     # 实现抽象方法(不常用这些操作)
     def insert(self, value: Any) -> bool:
         """哈夫曼树不支持单个插入,使用build_from_weights"""
-        step = OperationStep(
-            OperationType.INSERT,
-            description="提示:哈夫曼树不支持单个节点插入"
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INSERT,
+                description="提示:哈夫曼树不支持单个节点插入"
+            )
+            self.add_operation_step(step)
         return False
 
     def delete(self, value: Any) -> bool:
         """哈夫曼树不支持删除操作"""
-        step = OperationStep(
-            OperationType.DELETE,
-            description="提示:哈夫曼树不支持删除操作"
-        )
-        self.add_operation_step(step)
+        if self._tracing():
+            step = OperationStep(
+                OperationType.DELETE,
+                description="提示:哈夫曼树不支持删除操作"
+            )
+            self.add_operation_step(step)
         return False
 
     def search(self, value: Any) -> Optional[TreeNode]:
         """搜索指定值的节点"""
-        step = OperationStep(
-            OperationType.SEARCH,
-            value=value,
-            description=f"开始在哈夫曼树中搜索节点 '{value}'"
-        )
-        self.add_operation_step(step)
-
-        result = self._search_recursive(self._root, value)
-
-        if result is None:
+        if self._tracing():
             step = OperationStep(
                 OperationType.SEARCH,
                 value=value,
-                description=f"未找到节点 '{value}'"
+                description=f"开始在哈夫曼树中搜索节点 '{value}'"
             )
             self.add_operation_step(step)
 
-        return result
-
-    def _search_recursive(self, node: Optional[HuffmanNode], value: Any) -> Optional[HuffmanNode]:
-        """递归搜索节点"""
-        if node is None:
-            return None
+        result = self._search_preorder(value)
 
-        if node.value == value:
-            step = OperationStep(
-                OperationType.SEARCH,
-                value=value,
-                description=f"找到节点 '{value}' (权重={node.weight}, "
-                            f"{'叶子节点' if node.is_leaf else '内部节点'})"
-            )
-            self.add_operation_step(step)
-            return node
+        if result is None:
+            if self._tracing(TraceLevel.SUMMARY):
+                step = OperationStep(
+                    OperationType.SEARCH,
+                    value=value,
+                    description=f"未找到节点 '{value}'"
+                )
+                self.add_operation_step(step, TraceLevel.SUMMARY)
 
-        # 搜索左右子树
-        left_result = self._search_recursive(node.left, value)
-        if left_result:
-            return left_result
+        return result
 
-        return self._search_recursive(node.right, value)
+    def _search_preorder(self, value: Any) -> Optional[HuffmanNode]:
+        """按前序搜索节点"""
+        for node in self._iter_preorder(self._root):
+            if node.value == value:
+                if self._tracing(TraceLevel.SUMMARY):
+                    step = OperationStep(
+                        OperationType.SEARCH,
+                        value=value,
+                        description=f"找到节点 '{value}' (权重={node.weight}, "
+                                    f"{'叶子节点' if node.is_leaf else '内部节点'})"
+                    )
+                    self.add_operation_step(step, TraceLevel.SUMMARY)
+                return node
+        return None
 
     def _get_partial_tree_data(self, root: Optional[HuffmanNode]) -> dict:
         """
@@ -634,33 +725,10 @@ class HuffmanTree(TreeStructureBase):
                 'height': 0,
             }
 
-        def _copy_subtree(node: Optional[HuffmanNode]) -> Optional[dict]:
-            if node is None:
-                return None
-            return {
-                'value': node.value,
-                'weight': node.weight,
-                'is_leaf': node.is_leaf,
-                'node_id': node.node_id,
-                'left': _copy_subtree(node.left),
-                'right': _copy_subtree(node.right)
-            }
-
-        # 计算子树大小与高度（辅助统计）
-        def _count_nodes(n: Optional[HuffmanNode]) -> int:
-            if n is None:
-                return 0
-            return 1 + _count_nodes(n.left) + _count_nodes(n.right)
-
-        def _get_height(n: Optional[HuffmanNode]) -> int:
-            if n is None:
-                return 0
-            return 1 + max(_get_height(n.left), _get_height(n.right))
-
         return {
-            'root': _copy_subtree(root),
-            'size': _count_nodes(root),
-            'height': _get_height(root)
+            'root': self._node_to_dict_huffman(root),
+            'size': sum(1 for _ in self._iter_preorder(root)),
+            'height': self._height_of(root)
         }
 
 
@@ -0,0 +1,379 @@
+from .binary_search_tree import BinarySearchTree
+from .base import TreeNode
+from ..operation.operation import OperationStep, OperationType, TraceLevel
+from typing import Optional, Any, List, Tuple
+
+RED = 'red'
+BLACK = 'black'
+
+
+class RBNode(TreeNode):
+    """红黑树节点：在 TreeNode 上增加颜色，改颜色同样会清掉快照缓存"""
+    __slots__ = ('_color',)
+
+    def __init__(self, value: Any, color: str = RED):
+        super().__init__(value)
+        self._color = color  # 新节点默认为红色
+
+    @property
+    def color(self) -> str:
+        return self._color
+
+    @color.setter
+    def color(self, color: str) -> None:
+        if color != self._color:
+            self._color = color
+            self._invalidate()
+
+
+class RedBlackTree(BinarySearchTree):
+    """
+    红黑树实现（自平衡二叉搜索树）
+    插入/删除先按 BST 规则完成，再自下而上修复颜色：大多数情况只需变色，
+    插入最多旋转 2 次、删除最多旋转 3 次，比 AVL 的再平衡步骤少
+    节点带颜色字段，只支持普通节点对象存储
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._inserted_node: Optional[RBNode] = None
+        self._rotations = 0  # 🔥 累计旋转次数
+        self._recolors = 0  # 🔥 累计变色节点数
+        if self._tracing():
+            step = OperationStep(
+                OperationType.INIT,
+                description="初始化红黑树",
+                code_template='rbt_insert',
+                code_line=1,
+                code_highlight=[1]
+            )
+            self.add_operation_step(step)
+
+    def _new_node(self, value: Any) -> RBNode:
+        node = self._register_node(RBNode(value))
+        self._inserted_node = node  # insert 结束后从这里开始向上修复
+        return node
+
+    @staticmethod
+    def _is_red(node: Optional[RBNode]) -> bool:
+        """空节点视为黑色"""
+        return node is not None and node.color == RED
+
+    def get_rebalance_stats(self) -> dict:
+        """累计的旋转次数与变色节点数"""
+        return {'rotations': self._rotations, 'recolors': self._recolors}
+
+    # ==================== 插入 ====================
+
+    def insert(self, value: Any) -> bool:
+        """插入节点：BST 插入（新节点为红色）后修复连续红节点"""
+        self._inserted_node = None
+        rotations, recolors = self._rotations, self._recolors
+        super().insert(value)
+        node = self._inserted_node
+        if node is None:
+            return True  # 值已存在
+
+        self._insert_fixup(node)
+        if self._tracing(TraceLevel.SUMMARY):
+            step = OperationStep(
+                OperationType.INSERT,
+                value=value,
+                description=f"节点{value}插入完成：变色 {self._recolors - recolors} 个节点，"
+                            f"旋转 {self._rotations - rotations} 次",
+                node_id=node.node_id,
+                highlight_indices=[node.node_id],
+                tree_snapshot=self._get_tree_snapshot(TraceLevel.SUMMARY),
+                code_template='rbt_insert',
+                code_line=36,
+                code_highlight=[36]
+            )
+            self.add_operation_step(step, TraceLevel.SUMMARY)
+        return True
+
+    def _insert_fixup(self, node: RBNode) -> None:
+        """自下而上消除"红节点的父节点也是红色"，最后把根染黑"""
+        while node is not self._root and self._is_red(node.parent):
+            parent = node.parent
+            grand = parent.parent  # 父节点为红色，一定不是根，祖父存在
+            left_side = parent is grand.left
+            uncle = grand.right if left_side else grand.left
+
+            if self._is_red(uncle):
+                # 情况1：叔节点为红 —— 只变色，问题上移到祖父
+                self._recolor([(parent, BLACK), (uncle, BLACK), (grand, RED)],
+                              f"叔节点{uncle.value}为红色：父节点{parent.value}、叔节点变黑，"
+                              f"祖父{grand.value}变红，继续检查祖父",
+                              code_line=10, code_highlight=[8, 9, 10, 11, 12, 13])
+                node = grand
+                continue
+
+            if node is (parent.right if left_side else parent.left):
+                # 情况2：新节点在内侧 —— 先绕父节点旋转成外侧
+                self._add_fixup_step(f"节点{node.value}在内侧，先绕父节点{parent.value}旋转",
+                                     node, code_line=16 if left_side else 25)
+                if left_side:
+                    self._rotate_left(parent)
+                else:
+                    self._rotate_right(parent)
+                node, parent = parent, node
+
+            # 情况3：新节点在外侧 —— 父节点变黑、祖父变红，绕祖父旋转后结束
+            self._recolor([(parent, BLACK), (grand, RED)],
+                          f"叔节点为黑色：父节点{parent.value}变黑、祖父{grand.value}变红",
+                          code_line=21 if left_side else 30,
+                          code_highlight=[21, 22] if left_side else [30, 31])
+            if left_side:
+                self._rotate_right(grand)
+            else:
+                self._rotate_left(grand)
+
+        if self._root.color != BLACK:
+            self._recolor([(self._root, BLACK)], f"根节点{self._root.value}染成黑色",
+                          code_line=36, code_highlight=[36])
+
+    # ==================== 删除 ====================
+
+    def _delete_node(self, root: Optional[TreeNode], value: Any) -> Optional[TreeNode]:
+        """
+        查找并摘除节点（两个孩子时先换成后继），摘掉的是黑节点时修复黑高
+        颜色修复通过父指针进行，返回新的根
+        """
+        node = root
+        while node is not None and value != node.value:
+            go_left = value < node.value
+            if self._tracing():
+                step = OperationStep(
+                    OperationType.DELETE,
+                    value=value,
+                    message_id='bst_search_left' if go_left else 'bst_search_right',
+                    message_args={'value': value, 'current': node.value},
+                    node_id=node.node_id,
+                    highlight_indices=[node.node_id],
+                    tree_snapshot=self._get_tree_snapshot(),
+                    code_template='rbt_delete',
+                    code_line=2,
+                    code_highlight=[2, 3]
+                )
+                self.add_operation_step(step)
+            node = node.left if go_left else node.right
+        if node is None:
+            return root
+
+        if node.left is not None and node.right is not None:
+            successor = self._find_min(node.right)
+            self._add_fixup_step(f"节点{value}有两个子节点，用后继{successor.value}的值替换",
+                                 node, code_line=5, code_highlight=[4, 5, 6, 7], code_template='rbt_delete')
+            node.value = successor.value
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+        self._replace_child(parent, node, child)
+        self._forget_node(node)
+        self._size -= 1
+        if self._tracing():
+            step = OperationStep(
+                OperationType.UNLINK_NODE,
+                value=node.value,
+                description=f"摘除{'黑' if node.color == BLACK else '红'}色节点{node.value}"
+                            + ("，需要修复黑高" if node.color == BLACK and not self._is_red(child) else ""),
+                tree_snapshot=self._get_tree_snapshot(),
+                code_template='rbt_delete',
+                code_line=11,
+                code_highlight=[9, 10, 11, 12]
+            )
+            self.add_operation_step(step)
+
+        if node.color == BLACK:
+            self._delete_fixup(child, parent)
+        return self._root
+
+    def _delete_fixup(self, node: Optional[RBNode], parent: Optional[RBNode]) -> None:
+        """
+        node 所在位置少了一个黑节点（node 可能为空，因此同时传入父节点）
+        按兄弟节点的颜色分四种情况，变色/旋转直到补齐黑高
+        """
+        while node is not self._root and not self._is_red(node):
+            left_side = node is parent.left
+            sibling = parent.right if left_side else parent.left  # 黑高至少为 1，兄弟一定存在
+
+            if self._is_red(sibling):
+                # 情况1：兄弟为红 —— 兄弟变黑、父节点变红，绕父节点旋转，转成兄弟为黑的情况
+                self._recolor([(sibling, BLACK), (parent, RED)],
+                              f"兄弟节点{sibling.value}为红色：兄弟变黑、父节点{parent.value}变红",
+                              code_line=21, code_highlight=[20, 21, 22], code_template='rbt_delete')
+                if left_side:
+                    self._rotate_left(parent)
+                else:
+                    self._rotate_right(parent)
+                sibling = parent.right if left_side else parent.left
+
+            near = sibling.left if left_side else sibling.right
+            far = sibling.right if left_side else sibling.left
+            if not self._is_red(near) and not self._is_red(far):
+                # 情况2：兄弟的两个孩子都为黑 —— 兄弟变红，问题上移到父节点
+                self._recolor([(sibling, RED)],
+                              f"兄弟节点{sibling.value}的孩子都是黑色：兄弟变红，继续检查父节点{parent.value}",
+                              code_line=29, code_highlight=[28, 29, 30, 31], code_template='rbt_delete')
+                node, parent = parent, parent.parent
+                continue
+
+            if not self._is_red(far):
+                # 情况3：远侄子为黑、近侄子为红 —— 绕兄弟旋转，转成情况4
+                self._recolor([(near, BLACK), (sibling, RED)],
+                              f"近侄子{near.value}为红色：近侄子变黑、兄弟{sibling.value}变红",
+                              code_line=34, code_highlight=[33, 34, 35], code_template='rbt_delete')
+                if left_side:
+                    self._rotate_right(sibling)
+                else:
+                    self._rotate_left(sibling)
+                sibling = parent.right if left_side else parent.left
+                far = sibling.right if left_side else sibling.left
+
+            # 情况4：远侄子为红 —— 兄弟取父节点颜色，父节点和远侄子变黑，绕父节点旋转后结束
+            self._recolor([(sibling, parent.color), (parent, BLACK), (far, BLACK)],
+                          f"远侄子{far.value}为红色：兄弟{sibling.value}取父节点颜色，父节点和远侄子变黑",
+                          code_line=40, code_highlight=[40, 41, 42], code_template='rbt_delete')
+            if left_side:
+                self._rotate_left(parent)
+            else:
+                self._rotate_right(parent)
+            node = self._root
+
+        if node is not None and node.color != BLACK:
+            self._recolor([(node, BLACK)], f"节点{node.value}染成黑色，黑高恢复",
+                          code_line=47, code_highlight=[47], code_template='rbt_delete')
+
+    # ==================== 旋转与变色 ====================
+
+    def _replace_child(self, parent: Optional[RBNode], old: RBNode, new: Optional[RBNode]) -> None:
+        """把 parent 指向 old 的孩子指针改成 new（parent 为空时 new 成为根）"""
+        if parent is None:
+            self._root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _rotate_left(self, x: RBNode) -> RBNode:
+        """绕 x 左旋：右孩子 y 上移到 x 的位置，返回 y"""
+        y = x.right
+        parent = x.parent
+        x.right = y.left
+        y.left = x
+        self._replace_child(parent, x, y)
+        self._after_rotation(OperationType.ROTATE_LEFT, x, y)
+        return y
+
+    def _rotate_right(self, x: RBNode) -> RBNode:
+        """绕 x 右旋：左孩子 y 上移到 x 的位置，返回 y"""
+        y = x.left
+        parent = x.parent
+        x.left = y.right
+        y.right = x
+        self._replace_child(parent, x, y)
+        self._after_rotation(OperationType.ROTATE_RIGHT, x, y)
+        return y
+
+    def _after_rotation(self, operation: OperationType, x: RBNode, y: RBNode) -> None:
+        self._rotations += 1
+        if not self._tracing():
+            return
+        direction = '左' if operation == OperationType.ROTATE_LEFT else '右'
+        step = OperationStep(
+            operation,
+            description=f"🔄 绕节点{x.value}{direction}旋，{y.value}上移",
+            highlight_indices=[x.node_id, y.node_id],
+            tree_snapshot=self._get_tree_snapshot(),
+            animation_type="rotate",
+            duration=0.8,
+            code_template='rbt_rotate_left' if operation == OperationType.ROTATE_LEFT else 'rbt_rotate_right',
+            code_line=1,
+            code_highlight=[1]
+        )
+        self.add_operation_step(step)
+
+    def _recolor(self, changes: List[Tuple[RBNode, str]], description: str, code_line: int,
+                 code_highlight: List[int], code_template: str = 'rbt_insert') -> None:
+        """一次修复中的若干节点一起变色，记录为一个步骤"""
+        changed = [node for node, color in changes if node.color != color]
+        for node, color in changes:
+            node.color = color
+        self._recolors += len(changed)
+        if changed and self._tracing():
+            step = OperationStep(
+                OperationType.RECOLOR,
+                description=f"🎨 {description}",
+                highlight_indices=[node.node_id for node in changed],
+                tree_snapshot=self._get_tree_snapshot(),
+                animation_type="recolor",
+                duration=0.6,
+                code_template=code_template,
+                code_line=code_line,
+                code_highlight=code_highlight
+            )
+            self.add_operation_step(step)
+
+    def _add_fixup_step(self, description: str, node: RBNode, code_line: int,
+                        code_highlight: Optional[List[int]] = None, code_template: str = 'rbt_insert') -> None:
+        if self._tracing():
+            step = OperationStep(
+                OperationType.UPDATE,
+                description=description,
+                node_id=node.node_id,
+                highlight_indices=[node.node_id],
+                tree_snapshot=self._get_tree_snapshot(),
+                animation_type="warning",
+                duration=0.6,
+                code_template=code_template,
+                code_line=code_line,
+                code_highlight=code_highlight or [code_line]
+            )
+            self.add_operation_step(step)
+
+    # ==================== 平衡构建 / 快照 ====================
+
+    def _on_balanced_node(self, node: RBNode, depth: int, levels: int) -> None:
+        """
+        平衡构建时直接定色：中点划分建出的树所有空位都在最后两层，
+        最深一层染红、其余染黑即满足红黑性质（只有一层时根为黑）
+        """
+        node.color = RED if 0 < depth == levels - 1 else BLACK
+
+    def _node_to_dict(self, node: Optional[TreeNode]) -> Optional[dict]:
+        """在基础节点字典上增加 color 字段（缓存方式同 TreeStructureBase._node_to_dict）"""
+        if node is None:
+            return None
+        for cur in self._iter_postorder(node, prune=lambda n: n._snapshot is not None):
+            cur._snapshot = {
+                'value': cur.value,
+                'node_id': cur.node_id,
+                'left': cur.left._snapshot if cur.left is not None else None,
+                'right': cur.right._snapshot if cur.right is not None else None,
+                'height': cur.height,
+                'color': cur.color
+            }
+        return node._snapshot
+
+    def _tree_data_fields(self) -> dict:
+        """红黑树数据额外带 is_red_black 标记和累计的旋转/变色次数"""
+        fields = super()._tree_data_fields()
+        fields['is_red_black'] = lambda: True
+        fields['rebalance_stats'] = self.get_rebalance_stats
+        return fields
+
+    def check_properties(self) -> bool:
+        """检查红黑性质：根为黑、红节点没有红孩子、每条路径黑节点数相同（测试与调试用）"""
+        if self._is_red(self._root):
+            return False
+        black_height = {}  # 节点 -> 以它为根的子树的黑高（空节点算 1）
+        for node in self._iter_postorder(self._root):
+            left = black_height.pop(node.left) if node.left is not None else 1
+            right = black_height.pop(node.right) if node.right is not None else 1
+            if left != right:
+                return False
+            if self._is_red(node) and (self._is_red(node.left) or self._is_red(node.right)):
+                return False
+            black_height[node] = left + (0 if self._is_red(node) else 1)
+        return True
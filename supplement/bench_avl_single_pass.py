@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+AVL 树单趟插入/删除 vs 递归实现
+
+递归实现（RecursiveAVLTree，复刻改动前的插入/删除）每层回溯都重算高度、检查平衡，
+删除有两个子节点的节点时先找后继，再按后继的值从该节点重新下降一次；
+单趟实现用路径栈只下降一次，高度稳定后立即停止向上调整。
+同一组随机插入/删除（默认 10 万次）在两种实现上不记录步骤执行，比较耗时并核对结果一致；
+另在较小规模上统计完整记录 + delta 快照时的步骤数和轨迹大小（旋转步骤只带局部子树快照）。
+
+用法: python supplement/bench_avl_single_pass.py [N]
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsvision.tree.avl_tree import AVLTree
+
+
+class RecursiveAVLTree(AVLTree):
+    """改动前的递归插入/删除（只保留不记录步骤时执行的部分）"""
+
+    def _insert_path(self, value):
+        self._root = self._insert_recursive(self._root, value)
+
+    def _insert_recursive(self, node, value):
+        if node is None:
+            self._size += 1
+            return self._new_node(value)
+        if value < node.value:
+            node.left = self._insert_recursive(node.left, value)
+        elif value > node.value:
+            node.right = self._insert_recursive(node.right, value)
+        else:
+            return node
+        self._update_height(node)
+        balance = self._get_balance(node)
+        if balance > 1 and value < node.left.value:
+            return self._rotate_right(node)
+        if balance < -1 and value > node.right.value:
+            return self._rotate_left(node)
+        if balance > 1 and value > node.left.value:
+            node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1 and value < node.right.value:
+            node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _delete_node(self, root, value):
+        return self._delete_recursive(root, value)
+
+    def _delete_recursive(self, node, value):
+        if node is None:
+            return None
+        if value < node.value:
+            node.left = self._delete_recursive(node.left, value)
+        elif value > node.value:
+            node.right = self._delete_recursive(node.right, value)
+        else:
+            if node.left is None or node.right is None:
+                self._forget_node(node)
+                self._size -= 1
+                return node.left if node.left is not None else node.right
+            min_node = self._find_min(node.right)
+            node.value = min_node.value
+            node.right = self._delete_recursive(node.right, min_node.value)
+        self._update_height(node)
+        balance = self._get_balance(node)
+        if balance > 1 and self._get_balance(node.left) >= 0:
+            return self._rotate_right(node)
+        if balance > 1:
+            node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1 and self._get_balance(node.right) <= 0:
+            return self._rotate_left(node)
+        if balance < -1:
+            node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+
+def random_ops(n):
+    """先插入 n/2 个值，再随机插入/删除 n/2 次"""
+    random.seed(n)
+    ops = [('insert', random.randrange(n * 4)) for _ in range(n // 2)]
+    for _ in range(n - n // 2):
+        ops.append((random.choice(('insert', 'delete')), random.randrange(n * 4)))
+    return ops
+
+
+def run_untraced(tree_class, ops, storage):
+    tree = tree_class(storage)
+    tree.set_trace_level('off')
+    start = time.perf_counter()
+    for name, value in ops:
+        getattr(tree, name)(value)
+    return time.perf_counter() - start, tree
+
+
+def run_traced(tree_class, ops):
+    tree = tree_class()
+    tree.set_snapshot_mode('delta')
+    steps, size = 0, 0
+
+    def sink(step):
+        nonlocal steps, size
+        steps += 1
+        size += len(json.dumps(step.to_dict(), ensure_ascii=False, default=str))
+
+    with tree.stream_steps(sink):
+        for name, value in ops:
+            getattr(tree, name)(value)
+    return steps, size
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    ops = random_ops(n)
+    print(f"{n} 次随机插入/删除（不记录步骤）")
+    print(f"{'存储':<10}{'递归(ms)':>12}{'单趟(ms)':>12}{'加速':>8}{'节点数':>10}{'高度':>6}")
+    for storage in ('object', 'arena'):
+        old_time, old_tree = run_untraced(RecursiveAVLTree, ops, storage)
+        new_time, new_tree = run_untraced(AVLTree, ops, storage)
+        assert list(new_tree.iter_values('inorder')) == list(old_tree.iter_values('inorder'))
+        print(f"{storage:<10}{old_time * 1000:>12.1f}{new_time * 1000:>12.1f}{old_time / new_time:>7.2f}x"
+              f"{new_tree.size():>10}{new_tree.get_height():>6}")
+
+    small = random_ops(min(n, 2000))
+    steps, size = run_traced(AVLTree, small)
+    print(f"\n{len(small)} 次随机插入/删除（完整记录 + delta 快照）: {steps} 步，轨迹 {size / 1024:.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+宽度优先周游基准
+
+用 build_from_list 建一棵 N 个节点的完全二叉树（不记录步骤），分别测量:
+层序周游、层序插入（要扫过整棵树才能找到空位）、按值搜索不存在的值、按值删除。
+
+用法: python supplement/bench_level_order.py [N]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsvision.tree.binary_tree import BinaryTree
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    print(f"  {label:<12} {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    tree = BinaryTree()
+    print(f"完全二叉树 N={n}")
+    with tree.trace_scope('off'):
+        timed("构建", lambda: tree.build_from_list(list(range(n))))
+        timed("层序周游", tree.level_order_traversal)
+        timed("层序插入", lambda: tree.insert(n))
+        timed("搜索(不存在)", lambda: tree.search(-1))
+        timed("删除根", lambda: tree.delete(0))
+    assert tree.size() == n
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+链表批量操作基准
+
+N 个元素（默认 50000）:
+  initlist            不记录步骤 / 精简记录
+  尾部追加            逐个 insert(size(), v)，不记录步骤
+  顺序 get            get(0) .. get(N-1)
+  完整记录 initlist   每步都带 data_snapshot，元素较多时步骤本身就很大，只取 N/25 个元素
+
+用法: python supplement/bench_linked_list.py [N]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsvision.linear.linked_list import LinearLinkedList
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    print(f"  {label:<20} {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+
+def appends(n):
+    linked = LinearLinkedList()
+    with linked.trace_scope('off'):
+        for value in range(n):
+            linked.insert(linked.size(), value)
+    assert linked.size() == n
+
+
+def initlist(values, level):
+    linked = LinearLinkedList()
+    with linked.trace_scope(level):
+        linked.initlist(values)
+    return linked
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    values = list(range(n))
+    print(f"链表 N={n}")
+    timed("initlist (off)", lambda: initlist(values, 'off'))
+    timed("initlist (summary)", lambda: initlist(values, 'summary'))
+    timed("尾部追加 (off)", lambda: appends(n))
+
+    linked = initlist(values, 'off')
+    timed("顺序 get", lambda: [linked.get(i) for i in range(n)])
+
+    small = values[:max(n // 25, 1)]
+    timed(f"initlist (full, {len(small)})", lambda: initlist(small, 'full'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+OperationStep 内存/构造时间基准
+
+构造 10k 个步骤（混合只有描述的步骤、带高亮的树步骤、带快照的线性步骤），
+输出每步平均字节数和构造耗时。快照对象在步骤间共享，只统计步骤本身的开销。
+
+用法: python supplement/bench_operation_step.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsvision.operation.operation import OperationStep, OperationType
+
+N_STEPS = 10_000
+SHARED_SNAPSHOT = list(range(32))
+SHARED_TREE = {'root': None, 'size': 0, 'height': 0}
+
+
+def build_trace(n: int):
+    steps = []
+    for i in range(n):
+        kind = i % 3
+        if kind == 0:
+            steps.append(OperationStep(
+                OperationType.COMPARE,
+                description="比较",
+                value=i,
+                code_template='bst_insert',
+                code_line=3
+            ))
+        elif kind == 1:
+            steps.append(OperationStep(
+                OperationType.ROTATE_LEFT,
+                description="旋转",
+                highlight_indices=[i, i + 1],
+                tree_snapshot=SHARED_TREE,
+                animation_type="rotate",
+                code_template='avl_rotate_left',
+                code_line=2,
+                code_highlight=[2, 3]
+            ))
+        else:
+            steps.append(OperationStep(
+                OperationType.INSERT,
+                description="插入",
+                index=i,
+                value=i,
+                data_snapshot=SHARED_SNAPSHOT,
+                animation_type="move"
+            ))
+    return steps
+
+
+def main():
+    # 预热
+    build_trace(1000)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    steps = build_trace(N_STEPS)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    rounds = 5
+    start = time.perf_counter()
+    for _ in range(rounds):
+        build_trace(N_STEPS)
+    elapsed = (time.perf_counter() - start) / rounds
+
+    print(f"步骤数: {len(steps)}")
+    print(f"每步平均内存: {(after - before) / N_STEPS:.1f} bytes")
+    print(f"构造 {N_STEPS} 步耗时: {elapsed * 1000:.2f} ms ({elapsed / N_STEPS * 1e6:.2f} us/步)")
+
+    start = time.perf_counter()
+    for step in steps:
+        step.to_dict()
+    print(f"to_dict 全部步骤耗时: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+红黑树 vs AVL 树：再平衡开销与步骤记录量
+
+同一组操作分别在 RedBlackTree 和 AVLTree 上执行（完整记录 + delta 快照，步骤流式交给计数器，不保存历史），
+统计旋转次数、变色步骤数、总步骤数和序列化后的轨迹大小，以及不记录步骤时的耗时。
+
+用法: python supplement/bench_rbtree_vs_avl.py [N]
+"""
+
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsvision.operation.operation import OperationType
+from dsvision.tree.avl_tree import AVLTree
+from dsvision.tree.red_black_tree import RedBlackTree
+
+ROTATIONS = (OperationType.ROTATE_LEFT, OperationType.ROTATE_RIGHT)
+
+
+def workloads(n):
+    """(名称, [(操作, 值), ...])"""
+    random.seed(n)
+    values = random.sample(range(n * 10), n)
+    mixed = [('insert', v) for v in values[:n // 2]]
+    for _ in range(n // 2):
+        if random.random() < 0.5:
+            mixed.append(('insert', random.randrange(n * 10)))
+        else:
+            mixed.append(('delete', random.choice(values[:n // 2])))
+    return [
+        ('随机插入', [('insert', v) for v in values]),
+        ('有序插入', [('insert', v) for v in range(n)]),
+        ('插入后删除一半', [('insert', v) for v in values] + [('delete', v) for v in values[::2]]),
+        ('随机插入/删除', mixed),
+    ]
+
+
+def run_traced(tree_class, ops):
+    tree = tree_class()
+    tree.set_snapshot_mode('delta')
+    counts, size = Counter(), 0
+
+    def sink(step):
+        nonlocal size
+        counts[step.operation] += 1
+        size += len(json.dumps(step.to_dict(), ensure_ascii=False, default=str))
+
+    with tree.stream_steps(sink):
+        for name, value in ops:
+            getattr(tree, name)(value)
+    steps = sum(counts.values())
+    rotations = sum(counts[op] for op in ROTATIONS)
+    return steps, rotations, counts[OperationType.RECOLOR], size, tree.get_height()
+
+
+def run_untraced(tree_class, ops):
+    tree = tree_class()
+    tree.set_trace_level('off')
+    start = time.perf_counter()
+    for name, value in ops:
+        getattr(tree, name)(value)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f"{'负载':<12}{'结构':<14}{'步骤数':>8}{'旋转':>8}{'变色步骤':>10}{'轨迹大小(KB)':>14}{'高度':>6}{'无记录耗时(ms)':>16}")
+    for label, ops in workloads(n):
+        for tree_class in (AVLTree, RedBlackTree):
+            steps, rotations, recolors, size, height = run_traced(tree_class, ops)
+            elapsed = run_untraced(tree_class, ops)
+            print(f"{label:<12}{tree_class.__name__:<14}{steps:>8}{rotations:>8}{recolors:>10}"
+                  f"{size / 1024:>14.1f}{height:>6}{elapsed * 1000:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+树节点存储基准：对象存储 vs arena 存储
+
+用 build_balanced 建 N 个节点的 AVL 树（不记录步骤），比较 tracemalloc 统计的内存占用，
+以及之后 1000 次随机插入/删除的耗时（arena 每次访问字段都要经过句柄，单次操作会慢一些）。
+
+用法: python supplement/bench_tree_arena.py [N ...]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsvision.tree.avl_tree import AVLTree
+
+OPS = 1000
+
+
+def build(n, storage):
+    tracemalloc.start()
+    tree = AVLTree(storage=storage)
+    tree.set_trace_level('off')
+    tree.build_balanced(range(n))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tree, current
+
+
+def churn(tree, n):
+    random.seed(n)
+    start = time.perf_counter()
+    for _ in range(OPS):
+        value = random.randrange(n * 2)
+        if random.random() < 0.5:
+            tree.insert(value)
+        else:
+            tree.delete(value)
+    return time.perf_counter() - start
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100000, 1000000]
+    for n in sizes:
+        results = {}
+        for storage in ('object', 'arena'):
+            tree, memory = build(n, storage)
+            results[storage] = (memory, churn(tree, n))
+            del tree
+        (obj_mem, obj_time), (arena_mem, arena_time) = results['object'], results['arena']
+        print(f"N={n:<8} 内存: object {obj_mem / n:6.1f} B/节点, arena {arena_mem / n:6.1f} B/节点 "
+              f"({arena_mem / obj_mem:.0%}); {OPS} 次插入/删除: object {obj_time * 1000:7.1f} ms, "
+              f"arena {arena_time * 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
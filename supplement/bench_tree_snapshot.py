@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+树快照构造基准
+
+逐个插入 N 个随机值（完整记录级别，每步都生成 tree_snapshot），
+输出总耗时以及 delta 模式下平均每步的增量节点数。
+
+用法: python supplement/bench_tree_snapshot.py [N]
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsvision.tree.avl_tree import AVLTree
+from dsvision.tree.binary_search_tree import BinarySearchTree
+
+
+def run(cls, values, mode):
+    tree = cls()
+    tree.set_snapshot_mode(mode)
+    delta_nodes = steps = 0
+    start = time.perf_counter()
+    for value in values:
+        tree.clear_operation_history()
+        tree.insert(value)
+        for step in tree.get_operation_history():
+            steps += 1
+            if step.snapshot_delta and 'tree' in step.snapshot_delta:
+                delta_nodes += len(step.snapshot_delta['tree']['nodes'])
+    return time.perf_counter() - start, steps, delta_nodes
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    random.seed(0)
+    values = random.sample(range(n * 10), n)
+
+    for cls in (BinarySearchTree, AVLTree):
+        for mode in ('full', 'delta'):
+            # 树代码中的调试输出不计入
+            with contextlib.redirect_stdout(io.StringIO()):
+                elapsed, steps, delta_nodes = run(cls, values, mode)
+            line = f"{cls.__name__:<18} {mode:<6} {n} 次插入: {elapsed * 1000:8.1f} ms, {steps} 步"
+            if mode == 'delta':
+                line += f", 平均每步增量节点 {delta_nodes / max(steps, 1):.1f}"
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+/tree/<id>/state 延迟基准
+
+对几千个节点的 BST，测量一次状态请求的耗时（有 Flask 时走 test_client，
+否则直接执行路由里的 get_tree_data + 序列化）。树代码的标准输出重定向到 /dev/null，
+模拟服务端把调试输出写进日志文件的开销。
+
+用法: python supplement/bench_tree_state.py [N ...]
+"""
+
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsvision.tree.binary_search_tree import BinarySearchTree
+
+ROUNDS = 20
+
+
+def build_tree(n):
+    tree = BinarySearchTree()
+    random.seed(n)
+    with tree.trace_scope('off'):
+        for value in random.sample(range(n * 10), n):
+            tree.insert(value)
+    return tree
+
+
+def state_via_flask(tree):
+    """返回一个执行单次状态请求的函数；Flask 不可用时返回 None"""
+    try:
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'controller'))
+        import app as flask_app
+    except ImportError:
+        return None
+    flask_app.structures['bench'] = tree
+    client = flask_app.app.test_client()
+    return lambda: client.get('/tree/bench/state')
+
+
+def state_direct(tree):
+    return lambda: json.dumps({
+        'tree_data': tree.get_tree_data(),
+        'size': tree.size(),
+        'is_empty': tree.is_empty(),
+        'operation_history': tree.history_to_dicts()
+    })
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 2000, 5000]
+    for n in sizes:
+        tree = build_tree(n)
+        request = state_via_flask(tree)
+        via = 'flask' if request else 'direct'
+        request = request or state_direct(tree)
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            request()  # 预热快照缓存
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                request()
+            elapsed = (time.perf_counter() - start) / ROUNDS
+
+            # 每次请求前插入一个新节点，快照缓存只剩部分可用
+            start = time.perf_counter()
+            for i in range(ROUNDS):
+                with tree.trace_scope('off'):
+                    tree.insert(n * 10 + i)
+                request()
+            after_insert = (time.perf_counter() - start) / ROUNDS
+
+        print(f"N={n:<6} ({via}) 状态请求: {elapsed * 1000:8.2f} ms, 插入后首次请求: {after_insert * 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
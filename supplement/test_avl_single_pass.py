@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+AVL 单趟插入/删除测试脚本
+验证随机插入/删除后平衡性与记录的高度正确（对象存储与紧凑存储）、高度稳定后不再逐层确认、
+旋转步骤的快照是整棵树、带旋转和删除的 delta 快照回放与 full 模式一致，以及截断历史后的回放
+"""
+
+import random
+
+from dsvision.operation.snapshot import materialize_history, rebase_history
+from dsvision.tree.avl_tree import AVLTree
+
+
+def _check(node):
+    """返回重新计算的子树高度，同时检查记录的高度、平衡因子和父指针"""
+    if node is None:
+        return 0
+    left, right = _check(node.left), _check(node.right)
+    assert abs(left - right) <= 1, f"节点{node.value}失衡"
+    assert node.height == 1 + max(left, right), f"节点{node.value}高度记录错误"
+    for child in (node.left, node.right):
+        assert child is None or child._parent is node
+    return node.height
+
+
+def test_random_invariants():
+    """随机插入/删除：每步之后 AVL 性质、高度、节点数与有序集合一致"""
+    print("=" * 60)
+    print("测试 1: 随机插入/删除后的平衡性")
+    print("=" * 60)
+
+    for storage in ('object', 'arena'):
+        random.seed(23)
+        tree, expected = AVLTree(storage), set()
+        tree.set_trace_level('off')
+        for _ in range(3000):
+            value = random.randint(0, 400)
+            if random.random() < 0.55:
+                tree.insert(value)
+                expected.add(value)
+            else:
+                tree.delete(value)
+                expected.discard(value)
+            _check(tree._root)
+        assert list(tree.iter_values('inorder')) == sorted(expected) and tree.size() == len(expected)
+
+        for value in sorted(expected):
+            tree.delete(value)
+            _check(tree._root)
+        assert tree.is_empty() and tree.size() == 0
+        print(f"{storage}: 通过")
+    return True
+
+
+def test_early_stop():
+    """新叶子的父节点原本有一个孩子时高度不变，只确认一次、不逐层向上"""
+    print("\n" + "=" * 60)
+    print("测试 2: 高度稳定后停止")
+    print("=" * 60)
+
+    tree = AVLTree()
+    for value in (50, 20, 80, 10, 30, 70, 90, 5):
+        tree.insert(value)
+    tree.insert(15)
+    confirms = [step for step in tree.get_operation_history() if step.animation_type == 'confirm']
+    print("\n".join(step.description for step in confirms))
+    assert len(confirms) == 1 and '节点10平衡因子' in confirms[0].description
+    _check(tree._root)
+    return True
+
+
+def _count(node):
+    return 0 if node is None else 1 + _count(node['left']) + _count(node['right'])
+
+
+def test_delta_roundtrip_with_deletes():
+    """插入和删除（含双旋转、删除有两个子节点的节点）：旋转步骤也是整棵树的快照，delta 回放与 full 模式逐步一致"""
+    print("\n" + "=" * 60)
+    print("测试 3: 旋转步骤快照与 delta 快照回放")
+    print("=" * 60)
+
+    random.seed(7)
+    ops = [('insert', v) for v in random.sample(range(200), 60)] + \
+          [(random.choice(('insert', 'delete')), random.randrange(200)) for _ in range(80)]
+    full, delta = AVLTree(), AVLTree()
+    delta.set_snapshot_mode('delta')
+    full_steps, delta_steps = [], []
+    with full.stream_steps(full_steps.append), delta.stream_steps(delta_steps.append):
+        for name, value in ops:
+            getattr(full, name)(value)
+            getattr(delta, name)(value)
+
+    expected = [step.to_dict()['tree_snapshot'] for step in full_steps]
+    assert [step['tree_snapshot'] for step in materialize_history(delta_steps)] == expected
+
+    # 前端直接用 tree_snapshot 替换整棵树：旋转的开始/移动/完成步骤都必须包含全部节点
+    rotation_steps = [i for i, step in enumerate(full_steps)
+                      if step.code_template in ('avl_rotate_left', 'avl_rotate_right')
+                      or step.animation_type in ('move', 'settle')]
+    print(f"步骤数: {len(expected)}，其中旋转步骤 {len(rotation_steps)} 步")
+    assert rotation_steps
+    for snapshot in expected:
+        if snapshot:
+            assert _count(snapshot['root']) == snapshot['size'], "快照不是整棵树"
+
+    # 从旋转步骤处截断，保留部分仍能独立回放
+    start = next(i for i in rotation_steps if i >= len(expected) // 2)
+    rebase_history(delta_steps, start)
+    assert [step['tree_snapshot'] for step in materialize_history(delta_steps[start:])] == expected[start:]
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_random_invariants(), test_early_stop(), test_delta_roundtrip_with_deletes()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
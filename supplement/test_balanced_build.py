@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+平衡构建测试脚本
+验证 build_balanced 从有序/无序输入建出高度最小的树、AVL 高度与平衡因子正确、DSL build ... balanced
+"""
+
+import random
+
+from dsvision.extend1_dsl.interpreter import Interpreter, SimpleStructureManager
+from dsvision.extend1_dsl.lexer import Lexer
+from dsvision.extend1_dsl.parser import Parser
+from dsvision.tree.avl_tree import AVLTree
+from dsvision.tree.binary_search_tree import BinarySearchTree
+
+
+def _check_avl_heights(tree):
+    """每个节点保存的 height 等于实际高度，平衡因子在 [-1, 1]"""
+    for node in tree._iter_postorder(tree._root):
+        left = node.left.height if node.left else 0
+        right = node.right.height if node.right else 0
+        assert node.height == 1 + max(left, right)
+        assert abs(left - right) <= 1
+
+
+def test_sorted_input():
+    """100000 个有序值：高度为 ⌈log2(n+1)⌉，AVL 无需旋转"""
+    print("=" * 60)
+    print("测试 1: 有序输入")
+    print("=" * 60)
+
+    n = 100000
+    for tree_class in (BinarySearchTree, AVLTree):
+        tree = tree_class()
+        tree.clear_operation_history()
+        with tree.trace_scope('summary'):
+            assert tree.build_from_list(list(range(n)), balanced=True)
+        print(f"{tree_class.__name__}: {tree.size()} 个节点, 高度 {tree.get_height()}")
+        assert tree.size() == n
+        assert tree.get_height() == n.bit_length()
+        assert tree.inorder_traversal() == list(range(n))
+        assert len(tree.get_operation_history()) == 1
+        _check_avl_heights(tree)
+    return True
+
+
+def test_unsorted_merge():
+    """无序、含重复的输入与已有节点合并；之后的 AVL 插入删除照常平衡"""
+    print("\n" + "=" * 60)
+    print("测试 2: 无序输入与已有节点合并")
+    print("=" * 60)
+
+    random.seed(17)
+    values = [random.randint(0, 500) for _ in range(300)]
+    tree = AVLTree()
+    with tree.trace_scope('off'):
+        tree.insert(1000)
+        tree.build_balanced([str(v) for v in values])
+        expected = sorted(set(values) | {1000})
+        assert tree.inorder_traversal() == expected
+        _check_avl_heights(tree)
+
+        for value in random.sample(expected, 100):
+            tree.delete(value)
+        for value in range(2000, 2100):
+            tree.insert(value)
+    _check_avl_heights(tree)
+    print(f"AVL: {tree.size()} 个节点, 高度 {tree.get_height()}")
+
+    bst = BinarySearchTree()
+    with bst.trace_scope('full'):
+        bst.build_balanced([5, 1, 3, 3, 9, 7])
+    picks = [step for step in bst.get_operation_history() if step.message_id == 'bst_balanced_pick']
+    assert [step.value for step in picks] == [5, 1, 3, 7, 9]
+    assert bst.preorder_traversal() == [5, 1, 3, 7, 9]
+    return True
+
+
+def test_dsl_build_balanced():
+    """DSL: build [...] balanced"""
+    print("\n" + "=" * 60)
+    print("测试 3: DSL build balanced")
+    print("=" * 60)
+
+    code = """
+BST t {
+    build [1, 2, 3, 4, 5, 6, 7] balanced
+}
+"""
+    interpreter = Interpreter(SimpleStructureManager())
+    interpreter.execute(Parser(Lexer(code).tokenize()).parse())
+    tree = interpreter.context.structures['t']['instance']
+    print(f"前序: {tree.preorder_traversal()}")
+    assert tree.preorder_traversal() == [4, 2, 1, 3, 6, 5, 7]
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_sorted_input(), test_unsorted_merge(), test_dsl_build_balanced()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
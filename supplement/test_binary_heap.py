@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+二叉堆测试脚本
+验证最小堆/最大堆的随机操作与 heapq 一致、自底向上建堆的交换次数为 O(n)、
+步骤同时带数组与树两种快照且 delta 回放一致、哈夫曼树改用 BinaryHeap 后仍是最优编码，以及 DSL 中的 Heap/MaxHeap
+"""
+
+import heapq
+import random
+
+from dsvision.extend1_dsl.interpreter import Interpreter, SimpleStructureManager
+from dsvision.extend1_dsl.lexer import Lexer
+from dsvision.extend1_dsl.parser import Parser
+from dsvision.operation.snapshot import materialize_history
+from dsvision.tree.heap import BinaryHeap
+from dsvision.tree.huffman import HuffmanTree
+
+
+def _check_heap(heap):
+    """每个父节点都不比孩子离堆顶更远"""
+    data = heap.to_list()
+    for i in range(1, len(data)):
+        assert not heap._before(data[i], data[(i - 1) // 2]), f"下标{i}违反堆序"
+
+
+def test_random_against_heapq():
+    """随机 push/pop/replace/decrease_key/delete：每步之后堆序成立，弹出顺序与 heapq 一致"""
+    print("=" * 60)
+    print("测试 1: 与 heapq 对比")
+    print("=" * 60)
+
+    for kind, sign in (('min', 1), ('max', -1)):
+        random.seed(24)
+        heap, expected = BinaryHeap(kind), []
+        heap.set_trace_level('off')
+        for _ in range(3000):
+            roll = random.random()
+            if roll < 0.45 or not expected:
+                value = random.randint(0, 1000)
+                heap.push(value)
+                heapq.heappush(expected, sign * value)
+            elif roll < 0.65:
+                assert heap.pop() == sign * heapq.heappop(expected)
+            elif roll < 0.75:
+                value = random.randint(0, 1000)
+                assert heap.replace(value) == sign * heapq.heapreplace(expected, sign * value)
+            elif roll < 0.9:
+                index = random.randrange(heap.size())
+                old = heap.to_list()[index]
+                value = old - sign * random.randint(0, 50)
+                assert heap.decrease_key(index, value)
+                expected.remove(sign * old)
+                heapq.heappush(expected, sign * value)
+                heapq.heapify(expected)
+            else:
+                index = random.randrange(heap.size())
+                value = heap.delete(index)
+                expected.remove(sign * value)
+                heapq.heapify(expected)
+            _check_heap(heap)
+            assert heap.size() == len(expected)
+            assert heap.peek() == sign * expected[0] if expected else heap.peek() is None
+
+        drained = [heap.pop() for _ in range(heap.size())]
+        assert drained == [sign * v for v in sorted(expected)]
+        assert heap.pop() is None and heap.is_empty()
+        print(f"{kind}: 通过")
+
+    # 失败情况：越界、方向错误
+    heap = BinaryHeap()
+    heap.heapify([3, 5, 8])
+    assert not heap.decrease_key(3, 0) and not heap.decrease_key(0, 4)
+    assert heap.delete(-1) is None and heap.to_list() == [3, 5, 8]
+    assert heap.search(8) == 2 and heap.search(9) == -1
+    return True
+
+
+def test_heapify_linear():
+    """自底向上建堆：交换次数不超过 n，结果满足堆序"""
+    print("\n" + "=" * 60)
+    print("测试 2: 建堆的交换次数")
+    print("=" * 60)
+
+    for n in (1, 10, 1000, 100000):
+        for values in (list(range(n)), list(range(n, 0, -1)), random.sample(range(n * 2), n)):
+            heap = BinaryHeap('max')
+            heap.set_trace_level('summary' if n > 1000 else 'full')
+            heap.heapify(values)
+            _check_heap(heap)
+            done = heap.get_operation_history()[-1]
+            assert done.message_id == 'heap_heapify_done'
+            swaps = done.message_args['swaps']
+            assert swaps <= n, f"n={n} 时交换 {swaps} 次"
+        print(f"n={n}: 最后一组交换 {swaps} 次")
+
+    heap = BinaryHeap()
+    heap.heapify([5, 1])
+    heap.extend([4, 0, 3])
+    _check_heap(heap)
+    assert sorted(heap.to_list()) == [0, 1, 3, 4, 5] and heap.peek() == 0
+
+    # 导入时对导出的数组重新建堆：已满足堆序的数组保持原样
+    for kind in ('min', 'max'):
+        exported = BinaryHeap(kind)
+        exported.set_trace_level('off')
+        for value in random.sample(range(500), 200):
+            exported.push(value)
+        imported = BinaryHeap(kind)
+        imported.heapify(exported.to_list())
+        assert imported.to_list() == exported.to_list()
+    return True
+
+
+def test_dual_snapshots_and_delta():
+    """每个步骤同时带数组快照和树快照；树快照的节点 id 就是数组下标；delta 回放与 full 一致"""
+    print("\n" + "=" * 60)
+    print("测试 3: 数组/树双视图与 delta 回放")
+    print("=" * 60)
+
+    heap = BinaryHeap()
+    heap.heapify([9, 4, 7, 1, 8, 2])
+    snapshot_steps = [step for step in heap.get_operation_history() if step.data_snapshot]
+    assert len(snapshot_steps) >= 3
+    for step in snapshot_steps:
+        assert step.tree_snapshot is not None
+
+    tree = heap.get_tree_data()
+    assert tree['array'] == heap.to_list() and tree['height'] == 3
+    root = tree['root']
+    assert root['node_id'] == 0 and root['left']['node_id'] == 1 and root['right']['node_id'] == 2
+    assert root['left']['left']['value'] == heap.to_list()[3]
+
+    random.seed(5)
+    full, delta = BinaryHeap(), BinaryHeap()
+    delta.set_snapshot_mode('delta')
+    full_steps, delta_steps = [], []
+    with full.stream_steps(full_steps.append), delta.stream_steps(delta_steps.append):
+        for _ in range(200):
+            name = random.choice(('push', 'push', 'pop'))
+            args = (random.randint(0, 99),) if name == 'push' else ()
+            getattr(full, name)(*args)
+            getattr(delta, name)(*args)
+
+    expected = [step.to_dict() for step in full_steps]
+    replayed = materialize_history(delta_steps)
+    assert [s['data_snapshot'] for s in replayed] == [s['data_snapshot'] for s in expected]
+    assert [s['tree_snapshot'] for s in replayed] == [s['tree_snapshot'] for s in expected]
+    print(f"步骤数: {len(expected)}")
+    return True
+
+
+def test_huffman_uses_heap():
+    """哈夫曼树的带权路径长度仍与 heapq 两两合并的结果相同"""
+    print("\n" + "=" * 60)
+    print("测试 4: 哈夫曼树")
+    print("=" * 60)
+
+    random.seed(9)
+    for _ in range(20):
+        weights = {chr(65 + i): random.randint(1, 50) for i in range(random.randint(2, 20))}
+        tree = HuffmanTree()
+        tree.build_from_weights(weights)
+        codes = tree.get_huffman_codes()
+        wpl = sum(weights[c] * len(code) for c, code in codes.items())
+
+        queue = list(weights.values())
+        heapq.heapify(queue)
+        optimal = 0
+        while len(queue) > 1:
+            merged = heapq.heappop(queue) + heapq.heappop(queue)
+            optimal += merged
+            heapq.heappush(queue, merged)
+        assert wpl == optimal, f"{weights}: {wpl} != {optimal}"
+    print("20 组随机权重: 带权路径长度最优")
+    return True
+
+
+def test_dsl():
+    """DSL 中的 Heap / MaxHeap 与 decrease_key"""
+    print("\n" + "=" * 60)
+    print("测试 5: DSL")
+    print("=" * 60)
+
+    code = """
+Heap h {
+    build [9, 4, 7, 1, 8, 2]
+    insert 3
+    decrease_key 5 0
+    pop
+}
+MaxHeap m {
+    build [3, 1, 4, 1, 5]
+    insert 9
+}
+"""
+    interpreter = Interpreter(SimpleStructureManager())
+    interpreter.execute(Parser(Lexer(code).tokenize()).parse())
+    heap = interpreter.context.structures['h']['instance']
+    max_heap = interpreter.context.structures['m']['instance']
+    print(f"Heap: {heap.to_list()}  MaxHeap: {max_heap.to_list()}")
+    assert heap.get_kind() == 'min' and sorted(heap.to_list()) == [1, 2, 3, 4, 8, 9] and heap.peek() == 1
+    assert max_heap.get_kind() == 'max' and max_heap.peek() == 9
+    _check_heap(heap)
+    _check_heap(max_heap)
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_random_against_heapq(), test_heapify_linear(), test_dual_snapshots_and_delta(),
+               test_huffman_uses_heap(), test_dsl()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+批量操作测试脚本
+验证 extend / bulk_insert / bulk_delete 与逐个插入删除的结果一致，且只记录一个汇总步骤
+"""
+
+import random
+
+from dsvision.extend1_dsl.interpreter import Interpreter, SimpleStructureManager
+from dsvision.extend1_dsl.lexer import Lexer
+from dsvision.extend1_dsl.parser import Parser
+from dsvision.linear.capacity import CapacityPolicy
+from dsvision.linear.circular_linked_list import CircularLinkedList
+from dsvision.linear.doubly_linked_list import DoublyLinkedList
+from dsvision.linear.linked_list import LinearLinkedList
+from dsvision.linear.queue import SequentialQueue
+from dsvision.linear.sequential_list import SequentialList
+from dsvision.linear.stack import SequentialStack
+from dsvision.tree.avl_tree import AVLTree
+from dsvision.tree.binary_search_tree import BinarySearchTree
+
+
+def _items(structure):
+    if isinstance(structure, SequentialList):
+        return structure.to_list()[:structure.size()]
+    if isinstance(structure, SequentialQueue):
+        return [structure.get(i) if structure.is_circular() else structure.to_list()[structure.get_front_index() + i]
+                for i in range(structure.size())]
+    return structure.to_list()
+
+
+def test_list_bulk_ops():
+    """顺序表和三种链表：随机位置整段插入、整段删除，与 Python 列表对照"""
+    print("=" * 60)
+    print("测试 1: 顺序表 / 链表")
+    print("=" * 60)
+
+    random.seed(16)
+    for structure in (SequentialList(capacity=4), LinearLinkedList(), DoublyLinkedList(), CircularLinkedList()):
+        expected = []
+        for round_no in range(60):
+            if random.random() < 0.6 or not expected:
+                index = random.randint(0, len(expected))
+                values = [round_no * 100 + k for k in range(random.randint(0, 8))]
+                assert structure.bulk_insert(index, values)
+                expected[index:index] = values
+            else:
+                index = random.randrange(len(expected))
+                count = random.randint(1, 6)
+                assert structure.bulk_delete(index, count) == expected[index:index + count]
+                del expected[index:index + count]
+            assert _items(structure) == expected
+        structure.clear_operation_history()
+        structure.extend([1, 2, 3])
+        history = structure.get_operation_history()
+        print(f"{type(structure).__name__}: {structure.size()} 个元素, extend 步骤数 {len(history)}")
+        assert len(history) == 1 and history[0].message_id == 'linear_bulk_insert'
+    return True
+
+
+def test_stack_queue_bulk_ops():
+    """栈、队列：批量入栈/出栈、入队/出队，容量一次扩到位"""
+    print("\n" + "=" * 60)
+    print("测试 2: 栈 / 队列")
+    print("=" * 60)
+
+    stack = SequentialStack(capacity=2, policy=CapacityPolicy(growth_factor=2))
+    assert stack.extend(range(10))
+    assert stack.get_capacity_stats()['expansions'] == 1 and stack.get_capacity() == 16
+    assert stack.bulk_delete(0, 3) == [9, 8, 7]
+    assert stack.to_list() == list(range(7))
+
+    for queue in (SequentialQueue(capacity=4), SequentialQueue(capacity=4, circular=True)):
+        with queue.trace_scope('off'):
+            queue.initlist([0, 1, 2])
+            queue.dequeue()
+        assert queue.extend([3, 4, 5])
+        assert queue.bulk_delete(0, 2) == [1, 2]
+        assert _items(queue) == [3, 4, 5]
+        assert queue.front() == 3 and queue.rear() == 5
+
+    bounded = SequentialStack(capacity=2, policy=CapacityPolicy(max_capacity=5))
+    assert not bounded.extend(range(8))
+    assert bounded.to_list() == [0, 1, 2, 3, 4]
+    print(f"栈: {stack.to_list()}, 有上限的栈: {bounded.to_list()}")
+    return True
+
+
+def test_tree_bulk_ops():
+    """树：bulk_insert / bulk_delete 与逐个插入结果一致，summary 级别只有一个步骤"""
+    print("\n" + "=" * 60)
+    print("测试 3: BST / AVL")
+    print("=" * 60)
+
+    random.seed(160)
+    values = random.sample(range(10000), 500)
+    for tree_class in (BinarySearchTree, AVLTree):
+        bulk, single = tree_class(), tree_class()
+        with bulk.trace_scope('summary'):
+            bulk.clear_operation_history()
+            assert bulk.bulk_insert(values + values[:5]) is False  # 重复值被跳过
+            assert len(bulk.get_operation_history()) == 1
+        with single.trace_scope('off'):
+            for value in values:
+                single.insert(value)
+        assert bulk.inorder_traversal() == single.inorder_traversal() == sorted(values)
+        assert bulk.preorder_traversal() == single.preorder_traversal()
+
+        assert bulk.bulk_delete(values[:250])
+        assert bulk.inorder_traversal() == sorted(values[250:])
+        print(f"{tree_class.__name__}: 剩余 {bulk.size()} 个节点, 高度 {bulk.get_height()}")
+
+        with single.trace_scope('summary'):
+            single.clear()
+            single.build_from_list(values)
+        assert len(single.get_operation_history()) == 1
+    return True
+
+
+def test_dsl_tree_init():
+    """DSL: 树的 init 整批插入"""
+    print("\n" + "=" * 60)
+    print("测试 4: DSL init")
+    print("=" * 60)
+
+    code = """
+AVL t {
+    init [5, 3, 8, 1, 4, 7, 9]
+}
+"""
+    interpreter = Interpreter(SimpleStructureManager())
+    interpreter.execute(Parser(Lexer(code).tokenize()).parse())
+    tree = interpreter.context.structures['t']['instance']
+    print(f"中序: {tree.inorder_traversal()}")
+    assert tree.inorder_traversal() == [1, 3, 4, 5, 7, 8, 9]
+    assert [step.message_id for step in tree.get_operation_history()] == ['tree_bulk_insert']
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_list_bulk_ops(), test_stack_queue_bulk_ops(), test_tree_bulk_ops(), test_dsl_tree_init()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
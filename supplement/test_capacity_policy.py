@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+容量策略测试脚本
+验证顺序表 / 栈 / 队列共用的扩容倍数、缩容阈值、最大容量，以及均摊复制代价统计
+"""
+
+from dsvision.linear.capacity import CapacityPolicy
+from dsvision.linear.queue import SequentialQueue
+from dsvision.linear.sequential_list import SequentialList
+from dsvision.linear.stack import SequentialStack
+from dsvision.operation.operation import OperationType
+
+
+def test_amortized_copies():
+    """按倍数扩容时，每次插入的均摊复制次数有常数上界"""
+    print("=" * 60)
+    print("测试 1: 均摊复制代价")
+    print("=" * 60)
+
+    policy = CapacityPolicy(growth_factor=2)
+    for structure, push in ((SequentialList(capacity=1, policy=policy), lambda s, v: s.insert(s.size(), v)),
+                            (SequentialStack(capacity=1, policy=policy), lambda s, v: s.push(v)),
+                            (SequentialQueue(capacity=1, policy=policy), lambda s, v: s.enqueue(v))):
+        with structure.trace_scope('off'):
+            for value in range(1000):
+                push(structure, value)
+        stats = structure.get_capacity_stats()
+        print(f"{type(structure).__name__}: {stats}")
+        assert stats['total_inserts'] == 1000
+        assert stats['capacity'] == 1024
+        assert stats['expansions'] == 10
+        assert stats['amortized_copies'] < 2  # 1 + 2 + ... + 512 = 1023 次复制
+    return True
+
+
+def test_shrink_and_max_capacity():
+    """删除后低于阈值缩容，且不会在临界点来回扩缩；达到上限后不再扩容"""
+    print("\n" + "=" * 60)
+    print("测试 2: 缩容与最大容量")
+    print("=" * 60)
+
+    stack = SequentialStack(capacity=4, policy=CapacityPolicy(growth_factor=2, shrink_threshold=0.25))
+    with stack.trace_scope('off'):
+        for value in range(64):
+            stack.push(value)
+        assert stack.get_capacity_stats()['capacity'] == 64
+        for expected in range(63, 0, -1):
+            assert stack.pop() == expected
+    stats = stack.get_capacity_stats()
+    print(f"栈缩容后: {stats}")
+    assert stats['shrinks'] > 0 and stats['capacity'] < 64
+    assert stack.to_list() == [0]
+
+    queue = SequentialQueue(capacity=2, circular=True, policy=CapacityPolicy(max_capacity=3))
+    for value in range(3):
+        assert queue.enqueue(value)
+    assert not queue.enqueue(3)
+    assert queue.get_capacity() == 3
+    assert any('最大容量' in step.description for step in queue.get_operation_history())
+
+    sequential = SequentialList(capacity=8, policy=CapacityPolicy(shrink_threshold=0.5))
+    sequential.initlist(list(range(4)))
+    sequential.delete(0)
+    assert any(step.operation == OperationType.SHRINK for step in sequential.get_operation_history())
+    assert sequential.to_list()[:sequential.size()] == [1, 2, 3]
+
+    try:
+        CapacityPolicy(growth_factor=2, shrink_threshold=0.5)
+    except ValueError as e:
+        print(f"拒绝会来回扩缩的配置: {e}")
+    else:
+        raise AssertionError("shrink_threshold * growth_factor >= 1 应当报错")
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_amortized_copies(), test_shrink_and_max_capacity()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
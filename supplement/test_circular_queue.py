@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+循环队列测试脚本
+验证 front/rear 取模回绕、持续入队出队时容量不变、存满后扩容保持元素顺序
+"""
+
+import random
+from collections import deque
+
+from dsvision.extend1_dsl.interpreter import Interpreter, SimpleStructureManager
+from dsvision.extend1_dsl.lexer import Lexer
+from dsvision.extend1_dsl.parser import Parser
+from dsvision.linear.queue import SequentialQueue
+
+
+def test_steady_traffic():
+    """生产者/消费者交替：普通队列不断扩容，循环队列容量不变"""
+    print("=" * 60)
+    print("测试 1: 持续入队出队")
+    print("=" * 60)
+
+    linear = SequentialQueue(capacity=5)
+    ring = SequentialQueue(capacity=5, circular=True)
+    for queue in (linear, ring):
+        with queue.trace_scope('off'):
+            queue.initlist([-2, -1])  # 队列中始终积压两个元素
+            for value in range(1000):
+                queue.enqueue(value)
+                assert queue.dequeue() == value - 2
+
+    print(f"普通队列容量: {linear.get_capacity()}, 循环队列容量: {ring.get_capacity()}")
+    assert linear.get_capacity() > 5
+    assert ring.get_capacity() == 5
+    return True
+
+
+def test_wrap_and_expand():
+    """随机操作与 deque 对照；回绕时步骤带 wrap 提示"""
+    print("\n" + "=" * 60)
+    print("测试 2: 回绕与扩容")
+    print("=" * 60)
+
+    random.seed(14)
+    queue = SequentialQueue(capacity=4, circular=True)
+    expected = deque()
+    wraps = 0
+    for value in range(500):
+        if random.random() < 0.55:
+            queue.enqueue(value)
+            expected.append(value)
+        elif expected:
+            assert queue.dequeue() == expected.popleft()
+        wraps += sum(1 for step in queue.get_operation_history() if step.visual_hints.get('wrap'))
+        assert [queue.get(i) for i in range(queue.size())] == list(expected)
+        if expected:
+            assert queue.front() == expected[0] and queue.rear() == expected[-1]
+
+    print(f"最终容量: {queue.get_capacity()}, 元素数: {queue.size()}, 回绕次数: {wraps}")
+    assert wraps > 0
+    assert queue.get_capacity() >= queue.size()
+    return True
+
+
+def test_dsl_circular():
+    """DSL: init [...] capacity N circular"""
+    print("\n" + "=" * 60)
+    print("测试 3: DSL circular 参数")
+    print("=" * 60)
+
+    code = """
+Queue q {
+    init [1, 2, 3] capacity 3 circular
+    dequeue
+    enqueue 4
+}
+"""
+    interpreter = Interpreter(SimpleStructureManager())
+    interpreter.execute(Parser(Lexer(code).tokenize()).parse())
+    queue = interpreter.context.structures['q']['instance']
+    print(f"数组: {queue.to_list()}, front={queue.get_front_index()}, rear={queue.get_rear_index()}")
+    assert queue.is_circular()
+    assert queue.to_list() == [4, 2, 3]
+    assert queue.get_capacity() == 3
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_steady_traffic(), test_wrap_and_expand(), test_dsl_circular()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
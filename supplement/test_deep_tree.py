@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+深度退化树测试脚本
+有序输入建成的BST退化为链，验证插入/搜索/删除/周游/序列化都不受 Python 递归深度限制
+"""
+
+import json
+
+from dsvision.operation.snapshot import build_tree, flatten_tree
+from dsvision.tree.binary_search_tree import BinarySearchTree
+
+DEEP_SIZE = 100_000
+
+
+def build_chain(n):
+    """
+    直接链接出 0..n-1 的右斜链，结构与按顺序逐个 insert 相同
+    （逐个插入退化树是 O(n²)，十万个节点太慢）
+    """
+    tree = BinarySearchTree()
+    nodes = [tree._new_node(value) for value in range(n)]
+    for parent, child in zip(nodes, nodes[1:]):
+        parent.right = child
+    tree._root = nodes[0]
+    tree._size = n
+    return tree
+
+
+def test_sorted_insert():
+    """有序插入超过默认递归深度的节点数"""
+    print("=" * 60)
+    print("测试 1: 有序插入 1500 个节点")
+    print("=" * 60)
+
+    tree = BinarySearchTree()
+    with tree.trace_scope('off'):
+        for value in range(1500):
+            tree.insert(value)
+        assert tree.search(1499) is not None
+        assert tree.delete(700)
+        assert tree.search(700) is None
+
+    print(f"节点数: {tree.size()}, 高度: {tree.get_height()}")
+    assert tree.size() == 1499
+    assert tree.get_height() == 1499
+    return True
+
+
+def test_deep_tree_serialize():
+    """十万节点链状树：周游、tree_data 生成与扁平化序列化"""
+    print("\n" + "=" * 60)
+    print(f"测试 2: {DEEP_SIZE} 个节点的链状BST")
+    print("=" * 60)
+
+    tree = build_chain(DEEP_SIZE)
+    data = tree.get_tree_data()
+    assert data['size'] == DEEP_SIZE
+    assert data['height'] == DEEP_SIZE
+    assert data['traversals']['inorder'] == list(range(DEEP_SIZE))
+    assert data['traversals']['postorder'] == list(range(DEEP_SIZE - 1, -1, -1))
+
+    # 嵌套字典超出 json 编码器的深度限制，按扁平节点表序列化（与 delta 快照格式相同）
+    root_id, nodes, meta = flatten_tree({'root': data['root'], 'size': data['size'], 'height': data['height']})
+    payload = json.dumps({'root': root_id, 'nodes': list(nodes.values()), 'meta': meta})
+    print(f"扁平化节点数: {len(nodes)}, JSON 长度: {len(payload)}")
+    assert len(nodes) == DEEP_SIZE
+
+    restored = build_tree(root_id, nodes, meta)
+    assert restored['root']['value'] == 0
+    return True
+
+
+def test_deep_tree_operations():
+    """十万节点链状树：搜索、删除、遍历动画自动改用非递归"""
+    print("\n" + "=" * 60)
+    print("测试 3: 链状BST上的搜索/删除/遍历动画")
+    print("=" * 60)
+
+    tree = build_chain(DEEP_SIZE)
+    with tree.trace_scope('summary'):
+        assert tree.search(DEEP_SIZE - 1) is not None
+        assert tree.delete(DEEP_SIZE // 2)
+        result = tree.traverse_with_animation('inorder', use_recursion=True)
+
+    descriptions = [step.description for step in tree.get_operation_history()]
+    print(descriptions[0])
+    assert any('改用非递归' in d for d in descriptions)
+    assert len(result) == DEEP_SIZE - 1
+    assert tree.get_height() == DEEP_SIZE - 1
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_sorted_insert(), test_deep_tree_serialize(), test_deep_tree_operations()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+哈夫曼树双队列构建测试脚本
+验证双队列与最小堆构建的带权路径长度都最优、auto 按输入是否有序选择构建方式，
+以及双队列步骤中两个队列的内容（合并队列始终有序、每轮选中的是全局最小的两个权重）
+"""
+
+import heapq
+import random
+
+from dsvision.tree.huffman import HuffmanTree
+
+
+def _optimal_cost(weights):
+    """heapq 两两合并得到的最优带权路径长度"""
+    queue = list(weights)
+    heapq.heapify(queue)
+    cost = 0
+    while len(queue) > 1:
+        merged = heapq.heappop(queue) + heapq.heappop(queue)
+        cost += merged
+        heapq.heappush(queue, merged)
+    return cost
+
+
+def _cost(tree, weights):
+    codes = tree.get_huffman_codes()
+    return sum(len(codes[key]) * weight for key, weight in weights.items())
+
+
+def _used_two_queue(tree):
+    return any(step.visual_hints and 'leaf_queue' in step.visual_hints for step in tree.get_operation_history())
+
+
+def test_optimal_cost():
+    """随机权重（有序/无序）× 三种构建方式：带权路径长度都等于最优值"""
+    print("=" * 60)
+    print("测试 1: 带权路径长度")
+    print("=" * 60)
+
+    random.seed(25)
+    for _ in range(200):
+        values = [random.randint(1, 30) for _ in range(random.randint(2, 40))]
+        if random.random() < 0.5:
+            values.sort()
+        weights = dict(enumerate(values))
+        expected = _optimal_cost(values) if len(values) > 1 else 0
+        for method in ('auto', 'heap', 'two_queue'):
+            tree = HuffmanTree()
+            tree.set_trace_level('summary')
+            assert tree.build_from_weights(weights, mode='number', method=method)
+            assert _cost(tree, weights) == expected, f"{method} {values}"
+            assert tree._root.weight == sum(values) and tree._size == 2 * len(values) - 1
+    print("200 组随机权重: 全部最优")
+
+    tree = HuffmanTree()
+    assert tree.build_from_weights({'a': 4}, method='two_queue') and tree.get_huffman_codes() == {'a': '0'}
+    try:
+        tree.build_from_weights({'a': 1}, method='quick')
+        assert False, "未知的构建方式应抛出 ValueError"
+    except ValueError:
+        pass
+    return True
+
+
+def test_auto_method():
+    """auto：有序输入（含 build_from_numbers 的升序数字）用双队列，无序输入用最小堆"""
+    print("\n" + "=" * 60)
+    print("测试 2: 自动选择构建方式")
+    print("=" * 60)
+
+    tree = HuffmanTree()
+    tree.build_from_numbers([2, 4, 6, 8, 8, 13])
+    assert _used_two_queue(tree)
+
+    tree.build_from_numbers([8, 2, 6, 4])
+    assert not _used_two_queue(tree)
+
+    tree.build_from_numbers([8, 2, 6, 4], method='two_queue')
+    assert _used_two_queue(tree) and _cost(tree, {'2': 2, '4': 4, '6': 6, '8': 8}) == _optimal_cost([2, 4, 6, 8])
+
+    tree.build_from_string("aaabbc")
+    assert not _used_two_queue(tree)
+    print("通过")
+    return True
+
+
+def test_queue_trace():
+    """每一轮：合并队列非递减、选中的两个权重就是两个队列中最小的两个、选中个数合计为 2"""
+    print("\n" + "=" * 60)
+    print("测试 3: 双队列步骤")
+    print("=" * 60)
+
+    random.seed(3)
+    numbers = sorted(random.sample(range(1, 200), 30))
+    tree, steps = HuffmanTree(), []
+    with tree.stream_steps(steps.append):  # 树的操作历史只保留最近 50 步
+        tree.build_from_numbers(numbers)
+
+    picks = [step for step in steps if step.message_id == 'huffman_two_queue_pick']
+    assert len(picks) == len(numbers) - 1
+    for step in picks:
+        hints = step.visual_hints
+        leaf_queue, merged_queue = hints['leaf_queue'], hints['merged_queue']
+        assert leaf_queue == sorted(leaf_queue) and merged_queue == sorted(merged_queue)
+        assert hints['frequency_list'] == sorted(leaf_queue + merged_queue)
+        heads = hints['selected_heads']
+        assert heads['leaf'] + heads['merged'] == 2
+        assert sorted(hints['selected_weights']) == hints['frequency_list'][:2]
+        assert sorted(hints['selected_weights']) == sorted([step.message_args['left_weight'],
+                                                            step.message_args['right_weight']])
+
+    print(picks[0].description)
+    print(picks[-1].description)
+    appends = [step for step in steps if step.message_id == 'huffman_two_queue_append']
+    assert appends[-1].visual_hints['merged_queue'] == [sum(numbers)] and appends[-1].visual_hints['leaf_queue'] == []
+    assert all(step.code_template == 'huffman_build_two_queue' for step in picks + appends)
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_optimal_cost(), test_auto_method(), test_queue_trace()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
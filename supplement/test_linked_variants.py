@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+双向链表 / 循环链表测试脚本
+随机插入删除后与 Python 列表对照，并检查 prev / tail / 环的指针是否一致
+"""
+
+import random
+
+from dsvision.linear.circular_linked_list import CircularLinkedList
+from dsvision.linear.doubly_linked_list import DoublyLinkedList
+
+
+def _check_links(linked, expected):
+    """正向、反向各走一遍，与期望值列表对照"""
+    assert linked.to_list() == expected
+    backward, node = [], linked._tail
+    for _ in range(len(expected)):
+        backward.append(node.value)
+        node = node.prev
+    assert backward[::-1] == expected
+    if expected:
+        ring = isinstance(linked, CircularLinkedList)
+        assert (linked._tail.next is linked._head) == ring
+        assert (linked._head.prev is linked._tail) == ring
+
+
+def test_random_operations():
+    """随机操作与列表对照"""
+    print("=" * 60)
+    print("测试 1: 随机插入/删除/搜索")
+    print("=" * 60)
+
+    random.seed(13)
+    for cls in (DoublyLinkedList, CircularLinkedList):
+        for level in ('full', 'off'):
+            linked = cls()
+            linked.set_trace_level(level)
+            expected = [1, 2, 3]
+            linked.initlist(list(expected))
+            for _ in range(300):
+                choice = random.random()
+                if choice < 0.45:
+                    index, value = random.randint(0, len(expected)), random.randint(0, 30)
+                    assert linked.insert(index, value)
+                    expected.insert(index, value)
+                elif choice < 0.75 and expected:
+                    index = random.randint(0, len(expected) - 1)
+                    assert linked.delete(index) == expected.pop(index)
+                else:
+                    value = random.randint(0, 30)
+                    assert linked.search(value) == (expected.index(value) if value in expected else -1)
+                _check_links(linked, expected)
+        print(f"{cls.__name__}: 最终 {linked.to_list()}")
+    return True
+
+
+def test_tail_delete_steps():
+    """删除尾节点经 tail 指针完成，不产生遍历步骤"""
+    print("\n" + "=" * 60)
+    print("测试 2: O(1) 删除尾节点")
+    print("=" * 60)
+
+    for cls in (DoublyLinkedList, CircularLinkedList):
+        linked = cls()
+        linked.initlist(list(range(50)))
+        assert linked.delete(49) == 49
+        descriptions = [step.description for step in linked.get_operation_history()]
+        for description in descriptions:
+            print(f"  {description}")
+        assert not any('current' in d for d in descriptions)
+        assert linked.get_operation_history()[-1].pointers == {"head": 0, "tail": 48}
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_random_operations(), test_tail_delete_steps()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+node_id 索引测试脚本
+验证插入/删除/旋转后索引与树中实际节点一致，按 id 插入和删除可用
+"""
+
+import random
+
+from dsvision.tree.avl_tree import AVLTree
+from dsvision.tree.binary_search_tree import BinarySearchTree
+from dsvision.tree.binary_tree import BinaryTree
+
+
+def _tree_ids(tree):
+    return {node.node_id for node in tree._iter_preorder(tree._root)}
+
+
+def test_index_matches_tree():
+    """随机插入删除后，索引中的节点恰好是树中的节点，父指针正确"""
+    print("=" * 60)
+    print("测试 1: BST / AVL 索引一致性")
+    print("=" * 60)
+
+    random.seed(7)
+    for cls in (BinarySearchTree, AVLTree):
+        tree = cls()
+        with tree.trace_scope('off'):
+            for value in random.sample(range(500), 200):
+                tree.insert(value)
+            for value in random.sample(range(500), 200):
+                tree.delete(value)
+
+        assert set(tree._nodes) == _tree_ids(tree)
+        for node in tree._iter_preorder(tree._root):
+            for child in (node.left, node.right):
+                if child is not None:
+                    assert tree.get_parent(child.node_id) is node
+        print(f"{cls.__name__}: {tree.size()} 个节点，索引一致")
+    return True
+
+
+def test_binary_tree_by_id():
+    """普通二叉树按父节点 id 插入、按节点 id 删除"""
+    print("\n" + "=" * 60)
+    print("测试 2: 二叉树按 id 插入/删除")
+    print("=" * 60)
+
+    tree = BinaryTree()
+    tree.build_from_list([1, 2, 3])
+    root_id = tree._root.node_id
+    right_id = tree._root.right.node_id
+
+    assert tree.insert(4, parent_id=right_id, direction='left')
+    assert tree.get_parent(tree._root.right.left.node_id).node_id == right_id
+    assert not tree.insert(5, parent_id=right_id, direction='left')  # 位置已被占用
+
+    # 值重复时按 id 只删指定节点
+    tree.insert(2, parent_id=right_id, direction='right')
+    duplicate_id = tree._root.right.right.node_id
+    assert tree.delete_by_id(duplicate_id)
+    assert tree.get_node_by_id(duplicate_id) is None
+    assert tree.level_order_traversal() == [1, 2, 3, 4]
+
+    assert tree.delete_by_id(root_id)
+    assert not tree.delete_by_id(-1)
+    print(f"层序: {tree.level_order_traversal()}")
+    assert set(tree._nodes) == _tree_ids(tree)
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_index_matches_tree(), test_binary_tree_by_id()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+顺序统计测试脚本
+验证 BST / AVL / 红黑树（含紧凑存储）随机修改后 select / rank / count_range 与有序列表一致、
+缓存的子树大小只沿修改路径失效、下降步骤的记录，以及 DSL 中的 select / rank / count_range
+"""
+
+import bisect
+import random
+
+from dsvision.extend1_dsl.interpreter import Interpreter, SimpleStructureManager
+from dsvision.extend1_dsl.lexer import Lexer
+from dsvision.extend1_dsl.parser import Parser
+from dsvision.operation.operation import OperationType
+from dsvision.tree.avl_tree import AVLTree
+from dsvision.tree.binary_search_tree import BinarySearchTree
+from dsvision.tree.red_black_tree import RedBlackTree
+
+FACTORIES = (BinarySearchTree, AVLTree, RedBlackTree, lambda: AVLTree(storage='arena'))
+
+
+def test_random_queries():
+    """随机插入/删除穿插查询：结果与有序列表上的 bisect 一致"""
+    print("=" * 60)
+    print("测试 1: 随机修改后的顺序统计查询")
+    print("=" * 60)
+
+    for factory in FACTORIES:
+        random.seed(21)
+        tree, expected = factory(), []
+        tree.set_trace_level('off')
+        for _ in range(1500):
+            value = random.randint(0, 300)
+            if random.random() < 0.6:
+                tree.insert(value)
+                if value not in expected:
+                    bisect.insort(expected, value)
+            else:
+                tree.delete(value)
+                if value in expected:
+                    expected.remove(value)
+
+            k = random.randint(-1, len(expected))
+            assert tree.select(k) == (expected[k] if 0 <= k < len(expected) else None)
+            probe = random.randint(-10, 310)
+            assert tree.rank(probe) == bisect.bisect_left(expected, probe)
+            lo, hi = sorted(random.sample(range(-10, 310), 2))
+            assert tree.count_range(lo, hi) == bisect.bisect_right(expected, hi) - bisect.bisect_left(expected, lo)
+
+        assert tree.count_range(10, 5) == 0
+        assert tree.median() == expected[(len(expected) - 1) // 2]
+        assert all(tree.select(tree.rank(v)) == v for v in expected)
+        print(f"{type(tree).__name__}/{tree.get_storage()}: {len(expected)} 个值，中位数 {tree.median()}")
+    return True
+
+
+def test_size_cache_invalidation():
+    """查询后再插入一个值：只有新节点到根的路径（加上旋转中换了孩子的节点）上的子树大小需要重新计算"""
+    print("\n" + "=" * 60)
+    print("测试 2: 子树大小缓存")
+    print("=" * 60)
+
+    tree = AVLTree()
+    tree.build_balanced(range(0, 2000, 2))
+    assert tree.select(500) == 1000 and tree._size_of(tree._root) == 1000
+    assert all(node._subtree_size is not None for node in tree._iter_preorder(tree._root))
+
+    tree.insert(1001)
+    stale = [node for node in tree._iter_preorder(tree._root) if node._subtree_size is None]
+    assert 0 < len(stale) <= tree.get_height() + 1
+    assert tree.rank(1001) == 501 and tree._size_of(tree._root) == 1001
+
+    tree.delete(0)
+    tree.delete(1000)
+    assert tree.select(0) == 2 and tree.select(499) == 1001 and tree._size_of(tree._root) == 999
+    return True
+
+
+def test_descent_steps():
+    """完整记录时每经过一个节点一步，精简记录只剩结果步骤"""
+    print("\n" + "=" * 60)
+    print("测试 3: 下降步骤")
+    print("=" * 60)
+
+    tree = BinarySearchTree()
+    tree.build_balanced([20, 30, 40, 50, 60, 70, 80])
+    assert tree.select(2) == 40
+    history = tree.get_operation_history()
+    print("\n".join(step.description for step in history))
+    assert [step.operation for step in history] == [
+        OperationType.TRAVERSE_LEFT, OperationType.TRAVERSE_RIGHT, OperationType.SEARCH]
+    assert history[-1].code_template == 'bst_select'
+
+    assert tree.count_range(30, 70) == 5
+    assert len(tree.get_operation_history()) == 2 * tree.get_height() + 1
+
+    with tree.trace_scope('summary'):
+        assert tree.rank(60) == 4
+        assert [step.operation for step in tree.get_operation_history()] == [OperationType.SEARCH]
+        assert tree.select(7) is None
+        assert tree.get_operation_history()[0].message_id == 'bst_select_out_of_range'
+    return True
+
+
+def test_dsl():
+    """DSL 中的 select / rank / count_range"""
+    print("\n" + "=" * 60)
+    print("测试 4: DSL")
+    print("=" * 60)
+
+    code = """
+AVL t {
+    build [50, 30, 70, 20, 40, 60, 80] balanced
+    select 2
+    rank 60
+    count_range 30 70
+}
+"""
+    interpreter = Interpreter(SimpleStructureManager())
+    interpreter.execute(Parser(Lexer(code).tokenize()).parse())
+    results = [record['details']['result'] for record in interpreter.operation_history[1:]]
+    print(f"结果: {results}")
+    assert results == [40, 4, 5]
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_random_queries(), test_size_cache_invalidation(), test_descent_steps(), test_dsl()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
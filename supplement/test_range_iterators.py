@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+惰性范围查询测试脚本
+验证 range / floor / ceiling / predecessor / successor 与有序列表一致、按 after 游标翻页，
+以及取前 k 个值时只访问 O(log n + k) 个节点
+"""
+
+import bisect
+import random
+from itertools import islice
+
+from dsvision.tree.avl_tree import AVLTree
+from dsvision.tree.base import TreeNode
+from dsvision.tree.binary_search_tree import BinarySearchTree
+from dsvision.tree.red_black_tree import RedBlackTree
+
+
+class CountingNode(TreeNode):
+    """统计 value 被读取的次数"""
+    __slots__ = ()
+    reads = 0
+
+    @property
+    def value(self):
+        CountingNode.reads += 1
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self._invalidate()
+
+
+class CountingAVLTree(AVLTree):
+    def _new_node(self, value):
+        return self._register_node(CountingNode(value))
+
+
+def test_against_sorted_list():
+    """随机树上的各种查询与 bisect 结果一致"""
+    print("=" * 60)
+    print("测试 1: 与有序列表对比")
+    print("=" * 60)
+
+    for factory in (BinarySearchTree, AVLTree, RedBlackTree, lambda: AVLTree(storage='arena')):
+        random.seed(22)
+        tree = factory()
+        tree.set_trace_level('off')
+        expected = sorted(set(random.randint(0, 500) for _ in range(300)))
+        tree.bulk_insert(random.sample(expected, len(expected)))
+
+        assert list(tree.range()) == expected == list(tree.iter_values('inorder'))
+        for _ in range(200):
+            lo, hi = sorted(random.sample(range(-10, 510), 2))
+            assert list(tree.range(lo, hi)) == expected[bisect.bisect_left(expected, lo):bisect.bisect_right(expected, hi)]
+            probe = random.randint(-10, 510)
+            i, j = bisect.bisect_left(expected, probe), bisect.bisect_right(expected, probe)
+            assert tree.floor(probe) == (expected[j - 1] if j else None)
+            assert tree.ceiling(probe) == (expected[i] if i < len(expected) else None)
+            assert tree.predecessor(probe) == (expected[i - 1] if i else None)
+            assert tree.successor(probe) == (expected[j] if j < len(expected) else None)
+        assert list(tree.range(10, 5)) == []
+        print(f"{type(tree).__name__}/{tree.get_storage()}: {len(expected)} 个值")
+
+    assert BinarySearchTree().floor(1) is None and list(BinarySearchTree().range()) == []
+    return True
+
+
+def test_cursor_pagination():
+    """按 after 游标逐页取出全部值：页与页之间不重不漏"""
+    print("\n" + "=" * 60)
+    print("测试 2: after 游标翻页")
+    print("=" * 60)
+
+    tree = AVLTree()
+    tree.build_balanced(range(0, 100, 3))
+    pages, after = [], None
+    while True:
+        page = list(islice(tree.range(10, 80, after=after), 5 + 1))
+        pages.append(page[:5])
+        if len(page) <= 5:
+            break
+        after = page[4]
+    print(f"分页: {pages}")
+    assert [v for page in pages for v in page] == list(range(12, 81, 3))
+    assert list(tree.range(after=96)) == [99]
+    return True
+
+
+def test_touches_few_nodes():
+    """十万节点的树上取前 10 个值 / 区间内 10 个值：读取的节点值个数与树高同阶"""
+    print("\n" + "=" * 60)
+    print("测试 3: 访问的节点数")
+    print("=" * 60)
+
+    tree = CountingAVLTree()
+    tree.build_balanced(range(100000))
+    height = tree.get_height()
+
+    for lo in (None, 0, 54321, 99995):
+        CountingNode.reads = 0
+        first = list(islice(tree.range(lo), 10))
+        print(f"range({lo}) 前 10 个: 读取 {CountingNode.reads} 次节点值（高度 {height}）")
+        assert first == list(range(lo or 0, min((lo or 0) + 10, 100000)))
+        assert CountingNode.reads <= 4 * (height + 10)
+
+    CountingNode.reads = 0
+    assert tree.floor(54321.5) == 54321 and tree.successor(54321) == 54322
+    assert CountingNode.reads <= 8 * height
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_against_sorted_list(), test_cursor_pagination(), test_touches_few_nodes()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+红黑树测试脚本
+验证随机插入/删除后红黑性质始终成立、变色/旋转步骤与快照中的颜色、平衡构建定色，以及 DSL RBTree
+"""
+
+import random
+
+from dsvision.extend1_dsl.interpreter import Interpreter, SimpleStructureManager
+from dsvision.extend1_dsl.lexer import Lexer
+from dsvision.extend1_dsl.parser import Parser
+from dsvision.operation.operation import OperationType
+from dsvision.tree.red_black_tree import BLACK, RED, RedBlackTree
+
+
+def test_random_operations():
+    """随机插入删除：每一步后都满足红黑性质，中序与集合一致，高度不超过 2log2(n+1)"""
+    print("=" * 60)
+    print("测试 1: 随机插入/删除")
+    print("=" * 60)
+
+    random.seed(20)
+    tree, expected = RedBlackTree(), set()
+    tree.set_trace_level('off')
+    for _ in range(4000):
+        value = random.randint(0, 600)
+        if random.random() < 0.55:
+            tree.insert(value)
+            expected.add(value)
+        else:
+            assert tree.delete(value) == (value in expected)
+            expected.discard(value)
+        assert tree.check_properties()
+    assert tree.inorder_traversal() == sorted(expected)
+    assert tree.get_height() <= 2 * (len(expected) + 1).bit_length()
+    print(f"节点数 {tree.size()}, 高度 {tree.get_height()}, {tree.get_rebalance_stats()}")
+
+    with tree.trace_scope('off'):
+        for value in list(expected):
+            tree.delete(value)
+    assert tree.is_empty() and tree.check_properties()
+    return True
+
+
+def test_recolor_and_rotate_steps():
+    """插入 10, 20, 30：两个节点变色 + 一次左旋；快照中带颜色"""
+    print("\n" + "=" * 60)
+    print("测试 2: 变色与旋转步骤")
+    print("=" * 60)
+
+    tree = RedBlackTree()
+    tree.insert(10)
+    tree.insert(20)
+    tree.clear_operation_history()
+    tree.insert(30)
+    operations = [step.operation for step in tree.get_operation_history()]
+    print(f"插入 30 的步骤: {[op.value for op in operations]}")
+    assert operations.count(OperationType.RECOLOR) == 1
+    assert operations.count(OperationType.ROTATE_LEFT) == 1
+
+    root = tree.get_tree_data()['root']
+    assert (root['value'], root['color']) == (20, BLACK)
+    assert root['left']['color'] == root['right']['color'] == RED
+
+    # 精简记录：只剩 BST 的创建节点步骤和修复后的结果步骤
+    with tree.trace_scope('summary'):
+        tree.clear_operation_history()
+        tree.insert(15)
+        summary = tree.get_operation_history()
+        assert [step.operation for step in summary] == [OperationType.CREATE_NODE, OperationType.INSERT]
+        assert summary[-1].tree_snapshot['root']['left']['color'] == BLACK
+        tree.delete(10)
+    assert tree.check_properties() and tree.inorder_traversal() == [15, 20, 30]
+    return True
+
+
+def test_balanced_build_and_dsl():
+    """平衡构建直接定色；DSL 中的 RBTree 声明、insert / delete / build balanced"""
+    print("\n" + "=" * 60)
+    print("测试 3: 平衡构建与 DSL")
+    print("=" * 60)
+
+    for n in (1, 2, 7, 8, 100, 1023):
+        tree = RedBlackTree()
+        tree.build_balanced(range(n))
+        assert tree.check_properties() and tree.inorder_traversal() == list(range(n))
+        assert tree.get_rebalance_stats() == {'rotations': 0, 'recolors': 0}
+        tree.insert(n)
+        assert tree.check_properties()
+
+    code = """
+RBTree t {
+    build [1, 2, 3, 4, 5, 6, 7, 8] balanced
+    insert 9
+    delete 4
+}
+"""
+    interpreter = Interpreter(SimpleStructureManager())
+    interpreter.execute(Parser(Lexer(code).tokenize()).parse())
+    tree = interpreter.context.structures['t']['instance']
+    print(f"层序: {tree.level_order_traversal()}")
+    assert isinstance(tree, RedBlackTree)
+    assert tree.inorder_traversal() == [1, 2, 3, 5, 6, 7, 8, 9]
+    assert tree.check_properties()
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_random_operations(), test_recolor_and_rotate_steps(), test_balanced_build_and_dsl()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+delta 快照模式测试脚本
+验证增量编码后回放得到的完整快照与 full 模式逐步一致
+"""
+
+import json
+
+from dsvision.linear.sequential_list import SequentialList
+from dsvision.tree.avl_tree import AVLTree
+
+
+def _full_and_delta(factory, run):
+    """分别在 full / delta 模式下执行同样的操作，返回两份序列化历史"""
+    full = factory()
+    run(full)
+    delta = factory()
+    delta.set_snapshot_mode('delta')
+    run(delta)
+    return full.history_to_dicts(), delta.history_to_dicts(materialize=True), delta.history_to_dicts()
+
+
+def test_sequential_delta_roundtrip():
+    """顺序表 initlist + 扩容插入"""
+    print("=" * 60)
+    print("测试 1: 顺序表 delta 快照回放")
+    print("=" * 60)
+
+    def run(seq):
+        seq.initlist(list(range(20)))
+        seq.insert(2, 99)
+
+    full, materialized, compact = _full_and_delta(lambda: SequentialList(capacity=20), run)
+    print(f"步骤数: {len(full)}, full 大小: {len(json.dumps(full))}, delta 大小: {len(json.dumps(compact))}")
+
+    assert len(full) == len(materialized)
+    for a, b in zip(full, materialized):
+        assert a['data_snapshot'] == b['data_snapshot']
+    assert len(json.dumps(compact)) < len(json.dumps(full))
+    return True
+
+
+def test_avl_delta_roundtrip():
+    """AVL 插入（含旋转）"""
+    print("\n" + "=" * 60)
+    print("测试 2: AVL 树 delta 快照回放")
+    print("=" * 60)
+
+    def run(avl):
+        for value in [10, 20, 30, 25, 28, 27, 5, 4]:
+            avl.insert(value)
+
+    full, materialized, compact = _full_and_delta(AVLTree, run)
+    print(f"步骤数: {len(full)}, full 大小: {len(json.dumps(full))}, delta 大小: {len(json.dumps(compact))}")
+
+    assert len(full) == len(materialized)
+    for a, b in zip(full, materialized):
+        if a['tree_snapshot'] is None:
+            assert b['tree_snapshot'] is None
+            continue
+        # node_id 按创建顺序分配，两棵树的快照应完全相同
+        assert a['tree_snapshot'] == b['tree_snapshot']
+        assert _shape(a['tree_snapshot']['root']) == _shape(b['tree_snapshot']['root'])
+    return True
+
+
+def _shape(node):
+    if node is None:
+        return None
+    return (node['value'], node['height'], _shape(node['left']), _shape(node['right']))
+
+
+if __name__ == '__main__':
+    results = [test_sequential_delta_roundtrip(), test_avl_delta_roundtrip()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
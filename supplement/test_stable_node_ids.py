@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+稳定节点 id 测试脚本
+验证 node_id 按结构内创建顺序分配、不复用、同样的操作得到同样的快照，以及导出/导入（restore_node_ids）后 id 保持不变
+"""
+
+import json
+
+from dsvision.linear.circular_linked_list import CircularLinkedList
+from dsvision.linear.linked_list import LinearLinkedList
+from dsvision.tree.avl_tree import AVLTree
+from dsvision.tree.binary_search_tree import BinarySearchTree
+from dsvision.tree.binary_tree import BinaryTree
+from dsvision.tree.huffman import HuffmanTree
+
+
+def _ids(tree):
+    return [node.node_id for node in tree._iter_preorder(tree._root)]
+
+
+def _run(tree):
+    for value in [50, 30, 70, 20, 40, 60, 80, 35]:
+        tree.insert(value)
+    tree.delete(30)
+    tree.insert(45)
+
+
+def test_deterministic_ids():
+    """两个结构执行同样的操作：id 从 1 开始、快照 JSON 完全相同；删除节点的 id 不再分配"""
+    print("=" * 60)
+    print("测试 1: 确定性的 node_id")
+    print("=" * 60)
+
+    for factory in (BinarySearchTree, AVLTree, lambda: AVLTree(storage='arena'), BinaryTree):
+        a, b = factory(), factory()
+        _run(a)
+        _run(b)
+        history_a = json.dumps(a.history_to_dicts(), ensure_ascii=False)
+        assert history_a == json.dumps(b.history_to_dicts(), ensure_ascii=False)
+        assert a.get_tree_data()['root'] == b.get_tree_data()['root']
+        ids = _ids(a)
+        assert len(set(ids)) == len(ids) and max(ids) <= 9
+        assert a.get_tree_data()['next_node_id'] == 10
+        print(f"{type(a).__name__}: ids {sorted(ids)}")
+
+    tree = BinarySearchTree()
+    tree.insert(1)
+    removed = tree._root.node_id
+    tree.delete(1)
+    tree.insert(1)
+    assert tree._root.node_id == removed + 1  # 清空树后 id 也不回退
+
+    huffman = HuffmanTree()
+    huffman.build_from_string("abracadabra")
+    assert sorted(_ids(huffman)) == list(range(1, huffman.size() + 1))
+    return True
+
+
+def test_linked_list_ids():
+    """链表节点 id 与 to_list 一一对应，删除后新节点拿到新的 id"""
+    print("\n" + "=" * 60)
+    print("测试 2: 链表节点 id")
+    print("=" * 60)
+
+    for structure in (LinearLinkedList(), CircularLinkedList()):
+        structure.initlist([1, 2, 3])
+        structure.insert(1, 9)
+        assert structure.get_node_ids() == [1, 4, 2, 3]
+        structure.delete(index=0)
+        structure.bulk_insert(0, [7, 8])
+        print(f"{type(structure).__name__}: {structure.to_list()} ids {structure.get_node_ids()}")
+        assert structure.to_list() == [7, 8, 9, 2, 3]
+        assert structure.get_node_ids() == [5, 6, 4, 2, 3]
+        assert structure.get_next_node_id() == 7
+    return True
+
+
+def test_restore_after_import():
+    """按导入流程（层序重新插入）重建后恢复 id：树数据与原结构完全一致，之后新建节点的 id 也一致"""
+    print("\n" + "=" * 60)
+    print("测试 3: 导出/导入后恢复 node_id")
+    print("=" * 60)
+
+    for factory in (BinarySearchTree, AVLTree, lambda: AVLTree(storage='arena')):
+        original = factory()
+        with original.trace_scope('off'):
+            for value in range(1, 40):
+                original.insert(value)
+            for value in range(1, 40, 3):
+                original.delete(value)
+        exported = json.loads(json.dumps(original.get_tree_data()))
+
+        restored = factory()
+        with restored.trace_scope('off'):
+            for value in exported['traversals']['levelorder']:
+                restored.insert(value)
+        assert _ids(restored) != _ids(original)
+        restored.restore_node_ids(exported['root'], exported['next_node_id'])
+        assert restored.get_tree_data()['root'] == original.get_tree_data()['root']
+        for node_id in _ids(original):
+            assert restored.get_node_by_id(node_id).value == original.get_node_by_id(node_id).value
+
+        original.insert(100)
+        restored.insert(100)
+        assert restored.search(100).node_id == original.search(100).node_id == exported['next_node_id']
+        print(f"{type(original).__name__}/{original.get_storage()}: 下一个 id {exported['next_node_id']}")
+
+    linked = LinearLinkedList()
+    linked.initlist([1, 2, 3])
+    linked.delete(index=1)
+    copy = LinearLinkedList()
+    copy.initlist(linked.to_list())
+    copy.restore_node_ids(linked.get_node_ids(), linked.get_next_node_id())
+    assert copy.get_node_ids() == linked.get_node_ids() == [1, 3]
+    copy.insert(0, 5)
+    assert copy.get_node_ids()[0] == 4
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_deterministic_ids(), test_linked_list_ids(), test_restore_after_import()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
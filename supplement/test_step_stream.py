@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+流式步骤输出测试脚本
+验证 stream_steps 推送的步骤与普通记录一致，且不写入操作历史
+"""
+
+from dsvision.linear.sequential_list import SequentialList
+from dsvision.operation.snapshot import materialize_history
+from dsvision.tree.avl_tree import AVLTree
+
+
+def test_stream_matches_history():
+    """顺序表 initlist：流式输出的步骤与记录在历史中的步骤相同"""
+    print("=" * 60)
+    print("测试 1: 流式步骤与操作历史一致")
+    print("=" * 60)
+
+    recorded = SequentialList(capacity=50)
+    recorded.clear_operation_history()
+    recorded.initlist(list(range(30)))
+    expected = recorded.history_to_dicts()
+
+    streamed = SequentialList(capacity=50)
+    streamed.clear_operation_history()
+    received = []
+    with streamed.stream_steps(lambda step: received.append(step.to_dict())):
+        streamed.initlist(list(range(30)))
+
+    print(f"记录步骤数: {len(expected)}, 流式步骤数: {len(received)}")
+    assert [s['description'] for s in received] == [s['description'] for s in expected]
+    assert [s['data_snapshot'] for s in received] == [s['data_snapshot'] for s in expected]
+    assert streamed.get_operation_history() == []
+    assert streamed.to_list() == recorded.to_list()
+    return True
+
+
+def test_stream_delta_chain():
+    """delta 模式下流式输出的增量链可以独立回放"""
+    print("\n" + "=" * 60)
+    print("测试 2: delta 模式流式回放")
+    print("=" * 60)
+
+    avl = AVLTree()
+    avl.set_snapshot_mode('delta')
+    received = []
+    with avl.stream_steps(received.append):
+        for value in [10, 20, 30, 25, 28]:
+            avl.insert(value)
+
+    replayed = materialize_history(received)
+    last_tree = [s['tree_snapshot'] for s in replayed if s['tree_snapshot']][-1]
+    print(f"流式步骤数: {len(received)}, 最终树大小: {last_tree['size']}")
+    assert last_tree['size'] == 5
+    assert avl.get_operation_history() == []
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_stream_matches_history(), test_stream_delta_chain()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+记录级别测试脚本
+验证 off 级别下各结构的插入/删除/查找等操作不构造任何 OperationStep，
+以及 summary 级别只保留 full 级别步骤中的一部分、结果状态与 full 一致
+"""
+
+import random
+
+from dsvision.linear.circular_linked_list import CircularLinkedList
+from dsvision.linear.doubly_linked_list import DoublyLinkedList
+from dsvision.linear.linked_list import LinearLinkedList
+from dsvision.linear.queue import SequentialQueue
+from dsvision.linear.sequential_list import SequentialList
+from dsvision.linear.stack import SequentialStack
+from dsvision.operation.operation import OperationStep
+from dsvision.tree.avl_tree import AVLTree
+from dsvision.tree.binary_search_tree import BinarySearchTree
+from dsvision.tree.binary_tree import BinaryTree
+from dsvision.tree.heap import BinaryHeap
+from dsvision.tree.huffman import HuffmanTree
+from dsvision.tree.red_black_tree import RedBlackTree
+
+
+random.seed(4)
+VALUES = random.sample(range(1000), 120)
+
+
+def _tree_ops(tree):
+    for value in VALUES:
+        tree.insert(value)
+    for value in VALUES[:40]:
+        tree.search(value)
+        tree.search(-value - 1)
+    for value in VALUES[:60]:
+        tree.delete(value)
+    tree.delete(-5)
+    tree.traverse_with_animation('inorder', False)
+
+
+def _bst_ops(tree):
+    _tree_ops(tree)
+    tree.select(3)
+    tree.rank(500)
+    tree.count_range(100, 800)
+    tree.build_balanced(VALUES)
+
+
+def _linear_ops(structure):
+    structure.initlist(VALUES[:20])
+    for i, value in enumerate(VALUES[:40]):
+        structure.insert(i % 10, value)
+    for value in VALUES[:20]:
+        structure.search(value)
+    for _ in range(20):
+        structure.delete(0)
+
+
+def _stack_ops(stack):
+    for value in VALUES[:50]:
+        stack.push(value)
+    for _ in range(20):
+        stack.pop()
+        stack.peek()
+
+
+def _queue_ops(queue):
+    for value in VALUES[:50]:
+        queue.enqueue(value)
+    for _ in range(20):
+        queue.dequeue()
+        queue.front()
+        queue.rear()
+
+
+def _heap_ops(heap):
+    for value in VALUES:
+        heap.push(value)
+    for _ in range(30):
+        heap.pop()
+    heap.heapify(VALUES)
+    heap.decrease_key(5, -1)
+    heap.delete(3)
+    heap.replace(4)
+
+
+def _huffman_ops(tree):
+    tree.build_from_numbers(sorted(VALUES))
+    tree.build_from_numbers(VALUES)
+    tree.build_from_string("abracadabra")
+    tree.encode("abra")
+    tree.decode("0101")
+
+
+CASES = [
+    ('BST', BinarySearchTree, _bst_ops),
+    ('AVL', AVLTree, _bst_ops),
+    ('RBTree', RedBlackTree, _bst_ops),
+    ('BinaryTree', BinaryTree, _tree_ops),
+    ('Heap', BinaryHeap, _heap_ops),
+    ('Huffman', HuffmanTree, _huffman_ops),
+    ('Sequential', lambda: SequentialList(capacity=200), _linear_ops),
+    ('Linked', LinearLinkedList, _linear_ops),
+    ('Doubly', DoublyLinkedList, _linear_ops),
+    ('Circular', CircularLinkedList, _linear_ops),
+    ('Stack', lambda: SequentialStack(capacity=None), _stack_ops),
+    ('Queue', lambda: SequentialQueue(capacity=100), _queue_ops),
+    ('CircularQueue', lambda: SequentialQueue(capacity=100, circular=True), _queue_ops),
+]
+
+
+def test_off_allocates_no_steps():
+    """off 级别：整组操作中 OperationStep 的构造次数为 0"""
+    print("=" * 60)
+    print("测试 1: off 级别不构造步骤")
+    print("=" * 60)
+
+    original_init = OperationStep.__init__
+    created = []
+
+    def counting_init(step, *args, **kwargs):
+        created.append(step)
+        original_init(step, *args, **kwargs)
+
+    try:
+        for name, factory, ops in CASES:
+            structure = factory()
+            structure.set_trace_level('off')
+            created.clear()
+            OperationStep.__init__ = counting_init
+            try:
+                ops(structure)
+            finally:
+                OperationStep.__init__ = original_init
+            print(f"{name}: 构造 {len(created)} 个步骤")
+            assert not created, f"{name}: off 级别构造了 {len(created)} 个步骤"
+    finally:
+        OperationStep.__init__ = original_init
+    return True
+
+
+def test_summary_subset_of_full():
+    """summary 级别的步骤数不超过 full，且三种级别执行后的结果状态相同"""
+    print("\n" + "=" * 60)
+    print("测试 2: summary / full 级别")
+    print("=" * 60)
+
+    for name, factory, ops in CASES:
+        counts, states = {}, {}
+        for level in ('off', 'summary', 'full'):
+            structure, steps = factory(), []
+            structure.set_trace_level(level)
+            with structure.stream_steps(steps.append):
+                ops(structure)
+            counts[level] = len(steps)
+            states[level] = structure.to_list() if hasattr(structure, 'to_list') else structure.preorder_traversal()
+        print(f"{name}: off {counts['off']} / summary {counts['summary']} / full {counts['full']}")
+        assert counts['off'] == 0 < counts['summary'] <= counts['full']
+        assert states['off'] == states['summary'] == states['full']
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_off_allocates_no_steps(), test_summary_subset_of_full()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
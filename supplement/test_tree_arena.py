@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+紧凑存储（arena）测试脚本
+验证 storage='arena' 的 BST / AVL 与普通节点对象的树行为一致、node_id 单调且稳定、压缩后仍能按 id 查找
+"""
+
+import random
+
+from dsvision.tree.arena import COMPACT_MIN_FREE
+from dsvision.tree.avl_tree import AVLTree
+from dsvision.tree.binary_search_tree import BinarySearchTree
+
+
+def test_same_behaviour():
+    """随机插入删除：两种存储的树形状、高度完全相同"""
+    print("=" * 60)
+    print("测试 1: 与对象存储对照")
+    print("=" * 60)
+
+    random.seed(18)
+    for tree_class in (BinarySearchTree, AVLTree):
+        plain, compact = tree_class(), tree_class(storage='arena')
+        assert compact.get_storage() == 'arena'
+        for tree in (plain, compact):
+            tree.set_trace_level('off')
+        for _ in range(3000):
+            value, insert = random.randint(0, 800), random.random() < 0.6
+            for tree in (plain, compact):
+                if insert:
+                    tree.insert(value)
+                else:
+                    tree.delete(value)
+        assert compact.preorder_traversal() == plain.preorder_traversal()
+        assert compact.get_height() == plain.get_height()
+        assert compact.size() == plain.size() == len(compact._arena)
+        print(f"{tree_class.__name__}: {compact.size()} 个节点, 高度 {compact.get_height()}")
+
+    # 完整记录下快照照常生成，node_id 是小整数
+    tree = AVLTree(storage='arena')
+    for value in [30, 20, 10, 25, 40, 50]:
+        tree.insert(value)
+    snapshot = tree.get_operation_history()[-1].tree_snapshot
+    assert snapshot['root']['value'] == 30
+    assert tree.get_tree_data()['root']['node_id'] <= 6
+    return True
+
+
+def test_stable_ids_and_compaction():
+    """node_id 按创建顺序分配，删除过半触发压缩后剩余节点的 id 不变、仍可按 id 查找"""
+    print("\n" + "=" * 60)
+    print("测试 2: node_id 与压缩")
+    print("=" * 60)
+
+    n = COMPACT_MIN_FREE * 4
+    tree = AVLTree(storage='arena')
+    tree.set_trace_level('off')
+    tree.build_balanced(range(n))
+    ids = {node.value: node.node_id for node in tree._iter_inorder(tree._root)}
+    assert sorted(ids.values()) == list(range(1, n + 1))
+
+    for value in range(0, n, 4):
+        tree.delete(value)
+    for value in range(1, n, 4):
+        tree.delete(value)
+    assert tree._arena._free == n // 2
+    tree.insert(n)  # 空闲过半，分配前压缩
+    assert tree._arena._free == 0 and len(tree._arena.values) == n // 2 + 1
+
+    for node in tree._iter_inorder(tree._root):
+        if node.value < n:
+            assert node.node_id == ids[node.value]
+        assert tree.get_node_by_id(node.node_id) is node
+    assert tree.get_node_by_id(ids[0]) is None
+    assert tree.get_node_by_id(tree.get_node_by_id(ids[2]).node_id).value == 2
+    assert tree.inorder_traversal() == [v for v in range(n) if v % 4 >= 2] + [n]
+    print(f"压缩后槽位数: {len(tree._arena.values)}, 新节点 id: {tree.search(n).node_id}")
+    assert tree.search(n).node_id == n + 1
+    return True
+
+
+if __name__ == '__main__':
+    results = [test_same_behaviour(), test_stable_ids_and_compaction()]
+    print("\n✓ 全部通过" if all(results) else "\n✗ 存在失败")
@@ -37,6 +37,46 @@ apiClient.interceptors.response.use(
 );
 
 
+/**
+ * 以流式方式调用操作接口（?stream=ndjson）
+ * 每收到一个步骤调用 onStep(step)，返回 Promise，resolve 为最后的 done 事件数据
+ */
+export async function streamOperation(path, payload, onStep) {
+  const response = await fetch(`${API_BASE_URL}${path}?stream=ndjson`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(payload)
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`流式请求失败: ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let result = null;
+
+  const handleLine = (line) => {
+    if (!line.trim()) return;
+    const { event, data } = JSON.parse(line);
+    if (event === 'step') onStep(data);
+    else if (event === 'done') result = data;
+    else if (event === 'error') throw new Error(data.error);
+  };
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split('\n');
+    buffer = lines.pop();
+    lines.forEach(handleLine);
+  }
+  handleLine(buffer);
+  return result;
+}
+
+
 export default{
   //健康检查
   checkHealth(){
@@ -44,11 +84,14 @@ export default{
   },
 
   //创建数据结构
-  createStructure(type,capacity = null) {
+  createStructure(type,capacity = null, circular = false) {
     const payload = { type }
     if (capacity !== undefined) {
       payload.capacity = capacity
     }
+    if (circular) {
+      payload.circular = true  // 仅队列：循环队列
+    }
     return apiClient.post('/structure/create', payload);
   },
 
@@ -65,6 +108,11 @@ export default{
     });
   },
 
+  // 流式批量初始化：边执行边接收步骤
+  initBatchStream(structureId, values, onStep) {
+    return streamOperation(`/structure/${structureId}/init_batch`, { values }, onStep);
+  },
+
   //插入元素
   insertElement(structureId,index,value){
     return apiClient.post(`/structure/${structureId}/insert`,{index,
@@ -116,8 +164,10 @@ export default{
     });
   },
   // 获取树数据结构状态
-  getTreeState(structureId) {
-    return apiClient.get(`/tree/${structureId}/state`);
+  // fields: 可选，只取 tree_data 的部分字段，如 ['root', 'height']
+  getTreeState(structureId, fields = null) {
+    const params = fields ? { fields: fields.join(',') } : {}
+    return apiClient.get(`/tree/${structureId}/state`, { params });
   },
 
   // 插入树节点
@@ -128,11 +178,17 @@ export default{
     return apiClient.post(`/tree/${structureId}/insert`, payload);
   },
 
+  // 流式插入树节点
+  insertTreeNodeStream(structureId, value, onStep) {
+    return streamOperation(`/tree/${structureId}/insert`, { value }, onStep);
+  },
+
   // 删除树节点
-  deleteTreeNode(structureId, value) {
-    return apiClient.post(`/tree/${structureId}/delete`, {
-      value
-    });
+  // nodeId: 可选，普通二叉树按节点 id 删除（值可能重复）
+  deleteTreeNode(structureId, value, nodeId = null) {
+    const payload = { value }
+    if (nodeId !== null) payload.node_id = nodeId
+    return apiClient.post(`/tree/${structureId}/delete`, payload);
   },
 
   // 搜索树节点
@@ -0,0 +1,80 @@
+// utils/snapshotDelta.js - delta 快照模式的回放工具
+// 后端以 snapshot_mode: 'delta' 创建结构时，每个步骤只携带 snapshot_delta，
+// 这里按顺序回放增量，还原出每一步完整的 data_snapshot / tree_snapshot
+
+const CHILD_KEYS = ['left', 'right']
+
+function applyListDelta(prev, delta) {
+  const result = prev.slice(0, delta.length)
+  while (result.length < delta.length) result.push(null)
+  for (const [index, value] of delta.changes) {
+    result[index] = value
+  }
+  return result
+}
+
+function applyTreeDelta(prevNodes, delta) {
+  const nodes = new Map(prevNodes)
+  for (const nodeId of delta.removed) nodes.delete(nodeId)
+  for (const entry of delta.nodes) nodes.set(entry.node_id, entry)
+  return nodes
+}
+
+function buildTree(rootId, nodes, meta) {
+  const snapshot = { ...meta, root: null }
+  if (rootId === null || rootId === undefined) return snapshot
+
+  const copy = (nodeId) => {
+    const node = { ...nodes.get(nodeId) }
+    CHILD_KEYS.forEach((key) => { if (key in node) node[key] = null })
+    return node
+  }
+
+  snapshot.root = copy(rootId)
+  const stack = [snapshot.root]
+  while (stack.length) {
+    const node = stack.pop()
+    const entry = nodes.get(node.node_id)
+    for (const key of CHILD_KEYS) {
+      if (entry[key] !== null && entry[key] !== undefined) {
+        node[key] = copy(entry[key])
+        stack.push(node[key])
+      }
+    }
+  }
+  return snapshot
+}
+
+/**
+ * 创建逐步回放器：每传入一个步骤就原地填充它的完整快照
+ * 用于流式接收步骤（SSE / NDJSON）时边收边还原
+ */
+export function createStepMaterializer() {
+  let currentList = []
+  let currentNodes = new Map()
+
+  return (step) => {
+    const delta = step && step.snapshot_delta
+    if (!delta) return step
+
+    if (delta.data) {
+      currentList = applyListDelta(delta.data.base ? [] : currentList, delta.data)
+      step.data_snapshot = currentList
+    }
+    if (delta.tree) {
+      currentNodes = applyTreeDelta(delta.tree.base ? new Map() : currentNodes, delta.tree)
+      step.tree_snapshot = buildTree(delta.tree.root, currentNodes, delta.tree.meta)
+    }
+    return step
+  }
+}
+
+/**
+ * 把增量编码的 operation_history 还原为完整快照（原地填充 data_snapshot / tree_snapshot）
+ * 对完整快照模式的历史不做任何改动
+ */
+export function materializeSteps(steps) {
+  const materialize = createStepMaterializer()
+  for (const step of steps || []) materialize(step)
+  return steps
+}